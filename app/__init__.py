@@ -1,35 +1,87 @@
 from flask import Flask
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
-from flask_socketio import SocketIO
 from flask_wtf.csrf import CSRFError, CSRFProtect
+from werkzeug.exceptions import RequestEntityTooLarge
+from app.utils.db_routing import RoutingSession, init_db_routing
 from config import Config
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
-migrate = Migrate()
-
-socketio = SocketIO()
 csrf = CSRFProtect()
 limiter = Limiter(key_func=get_remote_address, default_limits=[])
 
-def create_app(config_class=Config):
+
+def _lazy_extension(name):
+    # Flask-Migrate and Flask-SocketIO are only imported by profiles that use them.
+    if name not in globals():
+        if name == "migrate":
+            from flask_migrate import Migrate
+            globals()[name] = Migrate()
+        elif name == "socketio":
+            from flask_socketio import SocketIO
+            globals()[name] = SocketIO()
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
+
+
+def __getattr__(name):
+    return _lazy_extension(name)
+
+
+def create_app(config_class=Config, profile=None):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    profile = profile or app.config.get("APP_PROFILE", "full")
+    app.config["APP_PROFILE"] = profile
 
     db.init_app(app)
-    migrate.init_app(app, db)
-    socketio.init_app(app, cors_allowed_origins="*", async_mode="threading")
+    init_db_routing(app)
+    if profile != "serverless":
+        _lazy_extension("migrate").init_app(app, db)
+        _lazy_extension("socketio").init_app(
+            app,
+            cors_allowed_origins="*",
+            async_mode=app.config["SOCKETIO_ASYNC_MODE"],
+            message_queue=app.config["SOCKETIO_MESSAGE_QUEUE"] or None,
+        )
     csrf.init_app(app)
+    from app.utils import ratelimit_storage  # registers the sqlite:// limiter storage scheme
     limiter.init_app(app)
 
+    from app.services.metrics_service import init_metrics
+    from app.services.profiling_service import init_profiling
+    init_metrics(app)
+    init_profiling(app)
+
     @app.errorhandler(CSRFError)
     def handle_csrf_error(error):
         return f"CSRF validation failed: {error.description}", 400
+
+    @app.errorhandler(RequestEntityTooLarge)
+    def handle_upload_too_large(error):
+        limit_mb = app.config["MAX_CONTENT_LENGTH"] // (1024 * 1024)
+        return f"Upload too large. Photos must be under {limit_mb} MB.", 413
     
-    from app.models import allocation, complaint, event, review, surplus, user
+    from app.models import affinity, allocation, archive, complaint, demand, event, mail, otp, review, surplus, trust, user, weather
+
+    from app.services.image_service import photo_url
+    app.jinja_env.globals["photo_url"] = photo_url
+    app.jinja_env.globals["realtime_enabled"] = profile != "serverless"
+
+    if profile == "serverless":
+        from app.serverless import load_manifest, manifest_is_current, register_lazy_views, use_precompiled_templates
+
+        build_dir = app.config["SERVERLESS_BUILD_DIR"]
+        manifest = load_manifest(build_dir)
+        if manifest is not None and manifest_is_current(app, manifest):
+            register_lazy_views(app, manifest)
+            use_precompiled_templates(app, build_dir)
+            return app
+        # A stale build would miss new endpoints and shadow edited templates.
+        app.logger.warning("Serverless build in %s is missing or stale; registering blueprints eagerly.", build_dir)
 
     # Register Blueprints
     from app.routes.auth_routes import auth
@@ -47,4 +99,8 @@ def create_app(config_class=Config):
     from app.routes.common_routes import common
     app.register_blueprint(common)
 
+    if profile != "serverless":
+        from app.cli import register_commands
+        register_commands(app)
+
     return app
\ No newline at end of file
@@ -0,0 +1,258 @@
+from datetime import datetime
+
+import click
+from flask import current_app
+
+from app.ml.demand_model import refresh_demand_table
+from app.ml.predict import forecast_upcoming_events
+from app.ml.train_model import DEFAULT_CHUNK_SIZE, save_model, train_surplus_model
+from app.models.surplus import Surplus
+from app.serverless import build_serverless_artifacts
+from app.services.affinity_service import rebuild_affinity
+from app.services.archive_service import archive_completed, archive_counts
+from app.services.dataset_service import DEFAULT_BATCH_SIZE, DatasetSpec, generate_dataset
+from app.services.image_service import generate_variants
+from app.services.mail_service import MailWorker, SMTPConnection, deliver_due_emails, mail_queue_depth
+from app.services.otp_service import sweep_expired_challenges
+from app.services.trust_service import find_trust_drift, rebuild_trust_stats
+from app.services.user_purge_service import pending_purge_count, purge_deleted_users
+from app.services.weather_service import prefetch_open_surplus_weather
+
+
+def register_commands(app):
+	@app.cli.command("rebuild-affinity")
+	def rebuild_affinity_command():
+		"""Recompute provider/NGO affinity scores from full history."""
+		pairs = rebuild_affinity()
+		click.echo(f"Rebuilt affinity for {pairs} provider/NGO pair(s).")
+
+	@app.cli.group("trust")
+	def trust_group():
+		"""Maintain per-user trust statistics."""
+
+	@trust_group.command("rebuild")
+	def trust_rebuild_command():
+		"""Recompute every user's trust stats from reviews and complaints."""
+		users = rebuild_trust_stats()
+		click.echo(f"Rebuilt trust stats for {users} user(s).")
+
+	@trust_group.command("check")
+	@click.option("--fix", is_flag=True, help="Rebuild stats when drift is found.")
+	def trust_check_command(fix):
+		"""Report users whose stored trust stats differ from source tables."""
+		drift = find_trust_drift()
+		if not drift:
+			click.echo("Trust stats are consistent.")
+			return
+
+		for user_id, field, stored, expected in drift:
+			click.echo(f"user {user_id}: {field} stored={stored} expected={expected}")
+
+		if fix:
+			users = rebuild_trust_stats()
+			click.echo(f"Rebuilt trust stats for {users} user(s).")
+			return
+		raise SystemExit(1)
+
+	@app.cli.group("weather")
+	def weather_group():
+		"""Maintain the weather risk tile cache."""
+
+	@weather_group.command("prefetch")
+	@click.option("--force", is_flag=True, help="Refetch tiles that are still fresh.")
+	def weather_prefetch_command(force):
+		"""Fetch weather for every tile with open surplus."""
+		tiles = prefetch_open_surplus_weather(force=force)
+		click.echo(f"Fetched weather for {tiles} tile(s).")
+
+	@app.cli.group("ml")
+	def ml_group():
+		"""Train and run the surplus forecast model."""
+
+	@ml_group.command("train")
+	@click.option("--chunk-size", default=DEFAULT_CHUNK_SIZE, show_default=True, help="Rows fetched per database round trip.")
+	def ml_train_command(chunk_size):
+		"""Fit the surplus forecast model from event history and save it."""
+		model = train_surplus_model(chunk_size=chunk_size)
+		path = save_model(model, current_app.config["SURPLUS_FORECAST_MODEL_PATH"])
+		click.echo(f"Trained on {model['rows']} event(s), RMSE {model['rmse_kg']} kg. Saved to {path}.")
+
+	@ml_group.command("forecast")
+	def ml_forecast_command():
+		"""Print surplus forecasts for all upcoming events."""
+		forecasts = forecast_upcoming_events(path=current_app.config["SURPLUS_FORECAST_MODEL_PATH"])
+		if not forecasts:
+			click.echo("No forecasts (train a model first or add upcoming events).")
+			return
+		for event_id, kg in sorted(forecasts.items()):
+			click.echo(f"event {event_id}: {kg} kg")
+
+	@ml_group.command("refresh-demand")
+	def ml_refresh_demand_command():
+		"""Rebuild the per-NGO hour-of-week demand forecast table."""
+		ngos = refresh_demand_table()
+		click.echo(f"Refreshed demand forecast for {ngos} NGO(s).")
+
+	@app.cli.group("images")
+	def images_group():
+		"""Manage uploaded surplus photos."""
+
+	@images_group.command("backfill")
+	def images_backfill_command():
+		"""Generate WebP variants for every stored photo."""
+		done = 0
+		failed = 0
+		paths = Surplus.query.with_entities(Surplus.photo_path).filter(Surplus.photo_path.isnot(None)).distinct()
+		for (photo_path,) in paths:
+			try:
+				if generate_variants(current_app.static_folder, photo_path):
+					done += 1
+			except (OSError, ValueError) as exc:
+				failed += 1
+				click.echo(f"{photo_path}: {exc}")
+		click.echo(f"Generated variants for {done} photo(s), {failed} failed.")
+
+	@app.cli.group("mail")
+	def mail_group():
+		"""Operate the outbound email queue."""
+
+	@mail_group.command("drain")
+	def mail_drain_command():
+		"""Send every email that is currently due, then exit."""
+		connection = SMTPConnection(current_app.config)
+		total_sent = 0
+		total_failed = 0
+		try:
+			while True:
+				sent, failed = deliver_due_emails(connection)
+				if not sent and not failed:
+					break
+				total_sent += sent
+				total_failed += failed
+		finally:
+			connection.close()
+		click.echo(f"Sent {total_sent} email(s), gave up on {total_failed}. {mail_queue_depth()} still queued.")
+
+	@mail_group.command("worker")
+	def mail_worker_command():
+		"""Run the mail worker in the foreground (for a dedicated process)."""
+		worker = MailWorker(current_app._get_current_object())
+		click.echo("Mail worker running. Press Ctrl+C to stop.")
+		worker.start()
+		try:
+			while worker.is_alive():
+				worker.join(1)
+		except KeyboardInterrupt:
+			worker.stop()
+			worker.join()
+
+	@app.cli.group("otp")
+	def otp_group():
+		"""Maintain server-side OTP challenges."""
+
+	@otp_group.command("sweep")
+	def otp_sweep_command():
+		"""Delete expired OTP challenges."""
+		deleted = sweep_expired_challenges()
+		click.echo(f"Deleted {deleted} expired OTP challenge(s).")
+
+	@app.cli.group("serverless")
+	def serverless_group():
+		"""Build artifacts for the serverless (api/index.py) profile."""
+
+	@serverless_group.command("build")
+	def serverless_build_command():
+		"""Write the lazy route manifest and precompiled templates."""
+		build_dir = current_app.config["SERVERLESS_BUILD_DIR"]
+		routes, templates = build_serverless_artifacts(current_app, build_dir)
+		click.echo(f"Wrote {routes} route(s) and {templates} compiled template(s) to {build_dir}.")
+
+	@app.cli.group("archive")
+	def archive_group():
+		"""Move finished surplus and allocations into archive tables."""
+
+	@archive_group.command("run")
+	@click.option("--older-than-days", type=int, default=None, help="Archive batches finished before this many days ago (default: ARCHIVE_AFTER_DAYS).")
+	@click.option("--batch-size", type=int, default=None, help="Surplus batches moved per transaction (default: ARCHIVE_BATCH_SIZE).")
+	@click.option("--max-batches", type=int, default=None, help="Stop after this many transactions; the next run resumes.")
+	def archive_run_command(older_than_days, batch_size, max_batches):
+		"""Archive completed batches and their allocations."""
+		config = current_app.config
+		totals = archive_completed(
+			older_than_days if older_than_days is not None else config["ARCHIVE_AFTER_DAYS"],
+			batch_size=batch_size or config["ARCHIVE_BATCH_SIZE"],
+			max_batches=max_batches,
+			progress=lambda done: click.echo(f"{done['surplus']} batch(es), {done['allocations']} allocation(s) archived"),
+		)
+		click.echo(f"Archived {totals['surplus']} surplus batch(es) and {totals['allocations']} allocation(s) in {totals['batches']} transaction(s).")
+
+	@archive_group.command("status")
+	def archive_status_command():
+		"""Show hot and archived row counts."""
+		for table, count in archive_counts().items():
+			click.echo(f"{table}: {count}")
+
+	@app.cli.group("users")
+	def users_group():
+		"""Maintain user accounts."""
+
+	@users_group.command("purge")
+	@click.option("--batch-size", type=int, default=None, help="Rows deleted per transaction (default: USER_PURGE_BATCH_SIZE).")
+	def users_purge_command(batch_size):
+		"""Hard-delete soft-deleted users, their rows and their photos."""
+		totals = purge_deleted_users(
+			batch_size=batch_size or current_app.config["USER_PURGE_BATCH_SIZE"],
+			progress=lambda user_id, done: click.echo(f"user {user_id}: {done['rows']} row(s), {done['photos']} photo file(s)"),
+		)
+		click.echo(f"Purged {totals['users']} user(s), {totals['rows']} row(s) and {totals['photos']} photo file(s).")
+		if totals["failed"]:
+			click.echo(f"{totals['failed']} user(s) failed and were left for the next run; see the log.")
+
+	@users_group.command("status")
+	def users_status_command():
+		"""Show how many deleted users are waiting to be purged."""
+		click.echo(f"{pending_purge_count()} user(s) awaiting purge.")
+
+	@app.cli.group("dataset")
+	def dataset_group():
+		"""Generate synthetic data for scale testing."""
+
+	@dataset_group.command("generate")
+	@click.option("--scale", default=1.0, show_default=True, help="Multiplier for provider, NGO and event counts.")
+	@click.option("--providers", default=DatasetSpec.providers, show_default=True)
+	@click.option("--ngos", default=DatasetSpec.ngos, show_default=True)
+	@click.option("--events", default=DatasetSpec.events, show_default=True)
+	@click.option("--batches-per-event", default=DatasetSpec.batches_per_event, show_default=True, help="Average surplus batches per past event.")
+	@click.option("--review-rate", default=DatasetSpec.review_rate, show_default=True, help="Share of completed pickups that get a review.")
+	@click.option("--complaint-rate", default=DatasetSpec.complaint_rate, show_default=True, help="Share of completed pickups that get a complaint.")
+	@click.option("--days", default=DatasetSpec.days, show_default=True, help="Days of history before the anchor date.")
+	@click.option("--seed", default=DatasetSpec.seed, show_default=True)
+	@click.option("--anchor", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="Date the history ends at (default: today, UTC).")
+	@click.option("--batch-size", default=DEFAULT_BATCH_SIZE, show_default=True, help="Rows per bulk insert.")
+	@click.option("--skip-rollups", is_flag=True, help="Do not rebuild trust stats and affinity afterwards.")
+	def dataset_generate_command(scale, providers, ngos, events, batches_per_event, review_rate, complaint_rate, days, seed, anchor, batch_size, skip_rollups):
+		"""Bulk-insert users, events, surplus, allocations, reviews and complaints."""
+		spec = DatasetSpec(
+			providers=providers,
+			ngos=ngos,
+			events=events,
+			batches_per_event=batches_per_event,
+			review_rate=review_rate,
+			complaint_rate=complaint_rate,
+			days=days,
+			seed=seed,
+			anchor=anchor,
+		).scaled(scale)
+		started = datetime.utcnow()
+		written = generate_dataset(
+			spec,
+			batch_size=batch_size,
+			progress=lambda done, total: click.echo(f"{done}/{total} event(s)"),
+		)
+		seconds = (datetime.utcnow() - started).total_seconds()
+		click.echo(", ".join(f"{count} {table}" for table, count in written.items()) + f" in {seconds:.1f}s.")
+
+		if not skip_rollups:
+			users = rebuild_trust_stats()
+			pairs = rebuild_affinity()
+			click.echo(f"Rebuilt trust stats for {users} user(s) and affinity for {pairs} pair(s).")
@@ -0,0 +1,166 @@
+"""Batched surplus forecasts for upcoming events.
+
+The model JSON is read lazily on first use and re-read only when the file
+changes. Forecasts are cached per event. The whole cache is dropped when the
+model changes, when this process commits a write to events, surplus or
+completed allocations, and after FORECAST_CACHE_MAX_AGE_SECONDS so other
+workers' writes are picked up; checking it costs no query.
+"""
+from datetime import datetime
+import json
+import os
+import threading
+import time
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app import db
+from app.ml.train_model import DEFAULT_MODEL_PATH, build_feature_vector, provider_completion_rates, provider_food_types
+from app.models.allocation import Allocation
+from app.models.archive import SurplusHistory
+from app.models.event import Event
+from app.models.surplus import Surplus
+
+
+FORECAST_CACHE_MAX_AGE_SECONDS = 300
+
+_lock = threading.Lock()
+_model = None
+_model_stamp = None
+_forecast_cache = {}
+_cache_stamp = None
+_cache_built_at = 0.0
+_data_version = 0
+
+
+def load_model(path: str = DEFAULT_MODEL_PATH):
+	"""Return the parsed model, or None when no model has been trained yet."""
+	global _model, _model_stamp
+
+	try:
+		stamp = (path, os.path.getmtime(path))
+	except OSError:
+		return None
+
+	with _lock:
+		if _model is None or _model_stamp != stamp:
+			with open(path, "r", encoding="utf-8") as handle:
+				_model = json.load(handle)
+			_model_stamp = stamp
+		return _model
+
+
+def _affects_forecasts(obj):
+	if isinstance(obj, (Event, Surplus)):
+		return True
+	return isinstance(obj, Allocation) and (obj.status or "").lower() == "completed"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_forecast_writes(session, flush_context):
+	if any(_affects_forecasts(obj) for obj in (*session.new, *session.dirty, *session.deleted)):
+		session.info["forecast_data_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_forecast_writes(orm_execute_state):
+	if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+		mapper = orm_execute_state.bind_arguments.get("mapper")
+		if mapper is not None and mapper.class_ in (Event, Surplus, Allocation):
+			orm_execute_state.session.info["forecast_data_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_version(session):
+	global _data_version
+	if session.info.pop("forecast_data_changed", False):
+		with _lock:
+			_data_version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_forecast_writes(session):
+	session.info.pop("forecast_data_changed", None)
+
+
+def _provider_history(provider_ids):
+	event_totals = (
+		db.session.query(
+			Event.provider_id.label("provider_id"),
+			Event.id.label("event_id"),
+			func.coalesce(func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)), 0.0).label("total_kg"),
+		)
+		.outerjoin(SurplusHistory, SurplusHistory.event_id == Event.id)
+		.filter(Event.provider_id.in_(list(provider_ids)), Event.event_date < datetime.utcnow())
+		.group_by(Event.provider_id, Event.id)
+		.subquery()
+	)
+	rows = (
+		db.session.query(event_totals.c.provider_id, func.count(event_totals.c.event_id), func.avg(event_totals.c.total_kg))
+		.group_by(event_totals.c.provider_id)
+		.all()
+	)
+	return {provider_id: (int(count or 0), float(mean_kg or 0)) for provider_id, count, mean_kg in rows}
+
+
+def predict_events(events, model):
+	"""Forecast surplus kg for (id, provider_id, event_date, guest_count) rows in one batch."""
+	if not events:
+		return {}
+
+	provider_ids = {row[1] for row in events}
+	history = _provider_history(provider_ids)
+	completion_rates = provider_completion_rates(provider_ids)
+	food_types = provider_food_types(provider_ids)
+	coefficients = model["coefficients"]
+
+	forecasts = {}
+	for event_id, provider_id, event_date, guest_count in events:
+		event_count, mean_kg = history.get(provider_id, (0, 0.0))
+		features = build_feature_vector(
+			guest_count,
+			event_date,
+			mean_kg,
+			event_count,
+			completion_rates.get(provider_id, 0.0),
+			food_types.get(provider_id),
+		)
+		value = sum(weight * feature for weight, feature in zip(coefficients, features))
+		forecasts[event_id] = round(max(0.0, value), 1)
+	return forecasts
+
+
+def forecast_upcoming_events(event_ids=None, path: str = DEFAULT_MODEL_PATH):
+	"""Return {event_id: forecast_kg} for upcoming events, served from cache when fresh."""
+	global _cache_stamp, _cache_built_at
+
+	model = load_model(path)
+	if model is None:
+		return {}
+
+	with _lock:
+		stamp = (_model_stamp, _data_version)
+		now = time.monotonic()
+		if stamp != _cache_stamp or now - _cache_built_at > FORECAST_CACHE_MAX_AGE_SECONDS:
+			_forecast_cache.clear()
+			_cache_stamp = stamp
+			_cache_built_at = now
+		cached = dict(_forecast_cache)
+
+	query = db.session.query(Event.id, Event.provider_id, Event.event_date, Event.guest_count).filter(
+		Event.event_date >= datetime.utcnow()
+	)
+	if event_ids is not None:
+		query = query.filter(Event.id.in_(list(event_ids)))
+	upcoming = query.all()
+
+	missing = [row for row in upcoming if row[0] not in cached]
+	fresh = predict_events(missing, model)
+	if fresh:
+		with _lock:
+			if _cache_stamp == stamp:
+				_forecast_cache.update(fresh)
+		cached.update(fresh)
+
+	return {row[0]: cached[row[0]] for row in upcoming if row[0] in cached}
@@ -0,0 +1,217 @@
+"""Surplus-volume forecasting: feature building and streaming ridge training.
+
+Each past event is one training row whose target is the total surplus kg
+posted for it. Rows are streamed from the database in chunks and folded
+into the normal equations (X^T X, X^T y), so memory stays constant no
+matter how much history there is. The fitted coefficients are written as
+a small JSON file that predict.py loads.
+"""
+from datetime import datetime
+import json
+from math import cos, log1p, pi, sin, sqrt
+import os
+import tempfile
+import zlib
+
+from sqlalchemy import case, func
+
+from app import db
+from app.models.archive import AllocationHistory, SurplusHistory
+from app.models.event import Event
+
+
+MODEL_VERSION = 1
+FOOD_TYPE_BUCKETS = 8
+RIDGE_PENALTY = 1.0
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "surplus_forecast.json")
+
+FEATURE_NAMES = (
+	["intercept", "guest_count", "log_guest_count"]
+	+ [f"weekday_{day}" for day in range(7)]
+	+ ["month_sin", "month_cos", "provider_mean_kg", "log_provider_events", "provider_completion_rate"]
+	+ [f"food_type_{bucket}" for bucket in range(FOOD_TYPE_BUCKETS)]
+)
+
+
+def food_type_bucket(food_type: str) -> int:
+	return zlib.crc32((food_type or "").strip().lower().encode("utf-8")) % FOOD_TYPE_BUCKETS
+
+
+def build_feature_vector(guest_count, event_date, provider_mean_kg, provider_event_count, provider_completion_rate, food_type):
+	guests = float(guest_count or 0)
+	event_date = event_date or datetime.utcnow()
+	month_angle = 2 * pi * (event_date.month - 1) / 12
+
+	weekday = [0.0] * 7
+	weekday[event_date.weekday()] = 1.0
+	food = [0.0] * FOOD_TYPE_BUCKETS
+	if food_type:
+		food[food_type_bucket(food_type)] = 1.0
+
+	return (
+		[1.0, guests, log1p(guests)]
+		+ weekday
+		+ [sin(month_angle), cos(month_angle), float(provider_mean_kg or 0), log1p(provider_event_count or 0), float(provider_completion_rate or 0)]
+		+ food
+	)
+
+
+def provider_completion_rates(provider_ids=None):
+	query = db.session.query(
+		AllocationHistory.provider_id,
+		func.count(AllocationHistory.id),
+		func.sum(case((func.lower(AllocationHistory.status) == "completed", 1), else_=0)),
+	)
+	if provider_ids is not None:
+		query = query.filter(AllocationHistory.provider_id.in_(list(provider_ids)))
+
+	rates = {}
+	for provider_id, total, completed in query.group_by(AllocationHistory.provider_id).all():
+		rates[provider_id] = float(completed or 0) / float(total) if total else 0.0
+	return rates
+
+
+def provider_food_types(provider_ids=None):
+	"""Each provider's most frequent dish over its surplus history (ties: first by name).
+
+	Training and prediction both use this for the food_type feature, since
+	an upcoming event has no surplus rows to take its own dish from.
+	"""
+	query = db.session.query(SurplusHistory.provider_id, SurplusHistory.food_type, func.count(SurplusHistory.id))
+	if provider_ids is not None:
+		query = query.filter(SurplusHistory.provider_id.in_(list(provider_ids)))
+
+	dominant = {}
+	for provider_id, food_type, count in query.group_by(SurplusHistory.provider_id, SurplusHistory.food_type).all():
+		best = dominant.get(provider_id)
+		if best is None or count > best[1] or (count == best[1] and food_type < best[0]):
+			dominant[provider_id] = (food_type, count)
+	return {provider_id: food_type for provider_id, (food_type, _) in dominant.items()}
+
+
+def iter_event_history(chunk_size: int = DEFAULT_CHUNK_SIZE, until=None):
+	"""Yield (id, provider_id, event_date, guest_count, total_kg) rows for
+	past events, oldest first, fetched chunk_size rows at a time."""
+	until = until or datetime.utcnow()
+	surplus_totals = (
+		db.session.query(
+			SurplusHistory.event_id.label("event_id"),
+			func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)).label("total_kg"),
+		)
+		.group_by(SurplusHistory.event_id)
+		.subquery()
+	)
+	rows = (
+		db.session.query(
+			Event.id,
+			Event.provider_id,
+			Event.event_date,
+			Event.guest_count,
+			func.coalesce(surplus_totals.c.total_kg, 0.0),
+		)
+		.outerjoin(surplus_totals, surplus_totals.c.event_id == Event.id)
+		.filter(Event.event_date < until)
+		.order_by(Event.event_date.asc(), Event.id.asc())
+		.yield_per(chunk_size)
+	)
+	for row in rows:
+		yield row
+
+
+def _solve(matrix, vector):
+	"""Gaussian elimination with partial pivoting for the small normal equations."""
+	size = len(vector)
+	augmented = [list(matrix[i]) + [vector[i]] for i in range(size)]
+
+	for col in range(size):
+		pivot = max(range(col, size), key=lambda row: abs(augmented[row][col]))
+		if abs(augmented[pivot][col]) < 1e-12:
+			continue
+		augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+		pivot_row = augmented[col]
+		for row in range(size):
+			if row == col:
+				continue
+			factor = augmented[row][col] / pivot_row[col]
+			if factor:
+				target = augmented[row]
+				for k in range(col, size + 1):
+					target[k] -= factor * pivot_row[k]
+
+	return [
+		augmented[i][size] / augmented[i][i] if abs(augmented[i][i]) >= 1e-12 else 0.0
+		for i in range(size)
+	]
+
+
+def train_surplus_model(chunk_size: int = DEFAULT_CHUNK_SIZE, ridge_penalty: float = RIDGE_PENALTY):
+	"""Fit the forecast model from history. Returns the model dict (not saved)."""
+	size = len(FEATURE_NAMES)
+	xtx = [[0.0] * size for _ in range(size)]
+	xty = [0.0] * size
+	yty = 0.0
+	rows = 0
+
+	completion_rates = provider_completion_rates()
+	food_types = provider_food_types()
+	provider_state = {}
+
+	for _, provider_id, event_date, guest_count, total_kg in iter_event_history(chunk_size):
+		events_seen, kg_seen = provider_state.get(provider_id, (0, 0.0))
+		features = build_feature_vector(
+			guest_count,
+			event_date,
+			kg_seen / events_seen if events_seen else 0.0,
+			events_seen,
+			completion_rates.get(provider_id, 0.0),
+			food_types.get(provider_id),
+		)
+		target = float(total_kg or 0)
+
+		for i, value_i in enumerate(features):
+			if not value_i:
+				continue
+			xty[i] += value_i * target
+			row_i = xtx[i]
+			for j in range(i, size):
+				row_i[j] += value_i * features[j]
+		yty += target * target
+		rows += 1
+		provider_state[provider_id] = (events_seen + 1, kg_seen + target)
+
+	for i in range(size):
+		for j in range(i):
+			xtx[i][j] = xtx[j][i]
+		if i:
+			xtx[i][i] += ridge_penalty
+
+	coefficients = _solve(xtx, xty) if rows else [0.0] * size
+
+	# Residual sum of squares from the sufficient statistics: y'y - 2b'X'y + b'X'Xb.
+	fitted = sum(coefficients[i] * xty[i] for i in range(size))
+	quadratic = sum(
+		coefficients[i] * coefficients[j] * (xtx[i][j] - (ridge_penalty if i == j and i else 0.0))
+		for i in range(size)
+		for j in range(size)
+	)
+	rmse = sqrt(max(0.0, yty - 2 * fitted + quadratic) / rows) if rows else None
+
+	return {
+		"version": MODEL_VERSION,
+		"trained_at": datetime.utcnow().isoformat(),
+		"rows": rows,
+		"rmse_kg": round(rmse, 3) if rmse is not None else None,
+		"feature_names": FEATURE_NAMES,
+		"coefficients": [round(value, 8) for value in coefficients],
+	}
+
+
+def save_model(model, path: str = DEFAULT_MODEL_PATH):
+	directory = os.path.dirname(os.path.abspath(path))
+	os.makedirs(directory, exist_ok=True)
+	handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+	with os.fdopen(handle, "w", encoding="utf-8") as output:
+		json.dump(model, output, separators=(",", ":"))
+	os.replace(temp_path, path)
+	return path
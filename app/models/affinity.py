@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from app import db
+
+
+class ProviderNgoAffinity(db.Model):
+	__tablename__ = "provider_ngo_affinity"
+
+	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+	ngo_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True, index=True)
+	completed_pickups = db.Column(db.Integer, nullable=False, default=0)
+	rating_sum = db.Column(db.Integer, nullable=False, default=0)
+	rating_count = db.Column(db.Integer, nullable=False, default=0)
+	complaint_count = db.Column(db.Integer, nullable=False, default=0)
+	recent_handover_minutes = db.Column(db.JSON, nullable=False, default=list)
+	median_handover_minutes = db.Column(db.Float, nullable=True)
+	score = db.Column(db.Float, nullable=False, default=0.0)
+	updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -5,12 +5,24 @@ from app import db
 
 class Allocation(db.Model):
 	__tablename__ = "allocations"
+	# Archived and purged ids must never be handed out again; on SQLite that takes AUTOINCREMENT.
+	__table_args__ = {"sqlite_autoincrement": True}
 
 	id = db.Column(db.Integer, primary_key=True)
-	surplus_id = db.Column(db.Integer, db.ForeignKey("surplus.id"), nullable=False)
-	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-	ngo_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-	status = db.Column(db.String(30), nullable=False, default="requested")
+	surplus_id = db.Column(db.Integer, db.ForeignKey("surplus.id"), nullable=False, index=True)
+	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	ngo_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	quantity_kg = db.Column(db.Float, nullable=True)
+	status = db.Column(db.String(30), nullable=False, default="requested", index=True)
 	pickup_time = db.Column(db.DateTime, nullable=True)
 	otp_code = db.Column(db.String(6), nullable=True)
 	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+	completed_at = db.Column(db.DateTime, nullable=True)
+
+	@property
+	def claimed_kg(self):
+		if self.quantity_kg is not None:
+			return self.quantity_kg
+		if not self.surplus:
+			return 0
+		return self.surplus.quantity if self.surplus.quantity is not None else self.surplus.quantity_kg
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from sqlalchemy import false, select, true, union_all
+from sqlalchemy.orm import foreign
+
+from app import db
+from app.models.allocation import Allocation
+from app.models.surplus import Surplus
+from app.models.user import User
+
+
+class ArchivedSurplus(db.Model):
+	__tablename__ = "archived_surplus"
+
+	id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=True, index=True)
+	event_name = db.Column(db.String(150), nullable=False)
+	mahal_name = db.Column(db.String(160), nullable=True)
+	provider_name = db.Column(db.String(120), nullable=False)
+	food_type = db.Column(db.String(150), nullable=False)
+	quantity = db.Column(db.Float, nullable=False)
+	quantity_kg = db.Column(db.Float, nullable=False, default=0)
+	remaining_kg = db.Column(db.Float, nullable=True)
+	estimated_expiry = db.Column(db.String(80), nullable=True)
+	distance_km = db.Column(db.Float, nullable=True)
+	provider_location = db.Column(db.String(180), nullable=True)
+	provider_latitude = db.Column(db.Float, nullable=True)
+	provider_longitude = db.Column(db.Float, nullable=True)
+	photo_path = db.Column(db.String(255), nullable=True)
+	status = db.Column(db.String(30), nullable=False)
+	created_at = db.Column(db.DateTime, nullable=False)
+	archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+class ArchivedAllocation(db.Model):
+	__tablename__ = "archived_allocations"
+
+	id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+	surplus_id = db.Column(db.Integer, db.ForeignKey("archived_surplus.id"), nullable=False, index=True)
+	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	ngo_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+	quantity_kg = db.Column(db.Float, nullable=True)
+	status = db.Column(db.String(30), nullable=False)
+	pickup_time = db.Column(db.DateTime, nullable=True)
+	otp_code = db.Column(db.String(6), nullable=True)
+	created_at = db.Column(db.DateTime, nullable=False)
+	completed_at = db.Column(db.DateTime, nullable=True)
+	archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+def _history_of(hot, archived):
+	"""UNION ALL of a hot table and its archive, with an `archived` flag."""
+	columns = [column.name for column in hot.columns]
+	return union_all(
+		select(*[hot.c[name] for name in columns], false().label("archived")),
+		select(*[archived.c[name] for name in columns], true().label("archived")),
+	).subquery(f"{hot.name}_history")
+
+
+class SurplusHistory(db.Model):
+	"""Read-only view over live and archived surplus batches."""
+
+	__table__ = _history_of(Surplus.__table__, ArchivedSurplus.__table__)
+
+	@property
+	def available_kg(self):
+		if self.remaining_kg is not None:
+			return self.remaining_kg
+		return self.quantity if self.quantity is not None else self.quantity_kg
+
+
+class AllocationHistory(db.Model):
+	"""Read-only view over live and archived allocations, for history pages and rollups."""
+
+	__table__ = _history_of(Allocation.__table__, ArchivedAllocation.__table__)
+
+	surplus = db.relationship(
+		SurplusHistory,
+		primaryjoin=foreign(__table__.c.surplus_id) == SurplusHistory.id,
+		viewonly=True,
+		lazy=True,
+	)
+	allocation_provider = db.relationship(User, primaryjoin=foreign(__table__.c.provider_id) == User.id, viewonly=True, lazy=True)
+	ngo = db.relationship(User, primaryjoin=foreign(__table__.c.ngo_id) == User.id, viewonly=True, lazy=True)
+
+	@property
+	def claimed_kg(self):
+		if self.quantity_kg is not None:
+			return self.quantity_kg
+		if not self.surplus:
+			return 0
+		return self.surplus.quantity if self.surplus.quantity is not None else self.surplus.quantity_kg
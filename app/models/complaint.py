@@ -11,7 +11,7 @@ class Complaint(db.Model):
 	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
 	issue_type = db.Column(db.String(80), nullable=False)
 	description = db.Column(db.Text, nullable=False)
-	status = db.Column(db.String(30), nullable=False, default="Under Review")
+	status = db.Column(db.String(30), nullable=False, default="Under Review", index=True)
 	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 	ngo_user = db.relationship("User", foreign_keys=[ngo_id], lazy="joined")
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from app import db
+
+
+class NgoDemandForecast(db.Model):
+	__tablename__ = "ngo_demand_forecast"
+
+	ngo_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+	hour_of_week = db.Column(db.Integer, primary_key=True, index=True)
+	request_rate = db.Column(db.Float, nullable=False, default=0.0)
+	completion_rate = db.Column(db.Float, nullable=False, default=0.0)
+	score = db.Column(db.Float, nullable=False, default=0.0)
+	refreshed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from app import db
+
+
+class OutboundEmail(db.Model):
+	__tablename__ = "outbound_emails"
+	__table_args__ = (db.Index("ix_outbound_emails_status_next_attempt", "status", "next_attempt_at"),)
+
+	id = db.Column(db.Integer, primary_key=True)
+	recipient = db.Column(db.String(255), nullable=False)
+	subject = db.Column(db.String(255), nullable=False)
+	body = db.Column(db.Text, nullable=False, default="")
+	status = db.Column(db.String(20), nullable=False, default="queued")
+	attempts = db.Column(db.Integer, nullable=False, default=0)
+	next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+	claimed_at = db.Column(db.DateTime, nullable=True)
+	last_error = db.Column(db.String(500), nullable=True)
+	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+	sent_at = db.Column(db.DateTime, nullable=True)
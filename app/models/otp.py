@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from app import db
+
+
+class OtpChallenge(db.Model):
+	__tablename__ = "otp_challenges"
+
+	id = db.Column(db.String(64), primary_key=True)
+	purpose = db.Column(db.String(20), nullable=False)
+	email = db.Column(db.String(255), nullable=False)
+	otp_hash = db.Column(db.String(128), nullable=False)
+	payload = db.Column(db.Text, nullable=False, default="{}")
+	attempts = db.Column(db.Integer, nullable=False, default=0)
+	expires_at = db.Column(db.DateTime, nullable=False, index=True)
+	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -5,9 +5,11 @@ from app import db
 
 class Surplus(db.Model):
 	__tablename__ = "surplus"
+	# Archived and purged ids must never be handed out again; on SQLite that takes AUTOINCREMENT.
+	__table_args__ = {"sqlite_autoincrement": True}
 
 	id = db.Column(db.Integer, primary_key=True)
-	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+	provider_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
 	event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=True)
 	event_name = db.Column(db.String(150), nullable=False)
 	mahal_name = db.Column(db.String(160), nullable=True)
@@ -15,13 +17,20 @@ class Surplus(db.Model):
 	food_type = db.Column(db.String(150), nullable=False)
 	quantity = db.Column(db.Float, nullable=False)
 	quantity_kg = db.Column(db.Float, nullable=False, default=0)
+	remaining_kg = db.Column(db.Float, nullable=True)
 	estimated_expiry = db.Column(db.String(80), nullable=True)
 	distance_km = db.Column(db.Float, nullable=True)
 	provider_location = db.Column(db.String(180), nullable=True)
 	provider_latitude = db.Column(db.Float, nullable=True)
 	provider_longitude = db.Column(db.Float, nullable=True)
 	photo_path = db.Column(db.String(255), nullable=True)
-	status = db.Column(db.String(30), nullable=False, default="available")
+	status = db.Column(db.String(30), nullable=False, default="available", index=True)
 	created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 	allocations = db.relationship("Allocation", backref="surplus", lazy=True)
+
+	@property
+	def available_kg(self):
+		if self.remaining_kg is not None:
+			return self.remaining_kg
+		return self.quantity if self.quantity is not None else self.quantity_kg
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from app import db
+
+
+class UserTrustStats(db.Model):
+	__tablename__ = "user_trust_stats"
+
+	user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+	received_rating_sum = db.Column(db.Integer, nullable=False, default=0)
+	received_rating_count = db.Column(db.Integer, nullable=False, default=0)
+	given_rating_sum = db.Column(db.Integer, nullable=False, default=0)
+	given_rating_count = db.Column(db.Integer, nullable=False, default=0)
+	complaint_count = db.Column(db.Integer, nullable=False, default=0)
+	trust_score = db.Column(db.Float, nullable=False, default=0.0)
+	updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+	@property
+	def average_received_rating(self):
+		if not self.received_rating_count:
+			return 0.0
+		return self.received_rating_sum / self.received_rating_count
+
+	@property
+	def average_given_rating(self):
+		if not self.given_rating_count:
+			return 0.0
+		return self.given_rating_sum / self.given_rating_count
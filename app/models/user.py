@@ -12,6 +12,9 @@ class User(db.Model):
     role = db.Column(db.String(50), nullable=False)
     phone_number = db.Column(db.String(20), unique=True, nullable=True)
     phone_verified = db.Column(db.Boolean, nullable=False, default=False)
+    capacity_kg = db.Column(db.Float, nullable=True)
+    # Set when an admin deletes the account; the rows are purged later by user_purge_service.
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)
 
     provided_events = db.relationship("Event", backref="provider", lazy=True)
     provided_surplus = db.relationship("Surplus", foreign_keys="Surplus.provider_id", backref="provider", lazy=True)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from app import db
+
+
+class WeatherTile(db.Model):
+	__tablename__ = "weather_tiles"
+
+	tile_key = db.Column(db.String(32), primary_key=True)
+	latitude = db.Column(db.Float, nullable=False)
+	longitude = db.Column(db.Float, nullable=False)
+	temperature_c = db.Column(db.Float, nullable=True)
+	humidity_pct = db.Column(db.Float, nullable=True)
+	precipitation_mm = db.Column(db.Float, nullable=True)
+	risk_factor = db.Column(db.Float, nullable=False, default=1.0)
+	fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
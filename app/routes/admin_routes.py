@@ -1,24 +1,34 @@
 from collections import defaultdict
 from datetime import datetime, timedelta
-import os
-from urllib.parse import urlparse
 
-from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
+from flask import Blueprint, Response, current_app, flash, jsonify, redirect, render_template, request, session, stream_with_context, url_for
 from sqlalchemy import func
 
 from app import db
+from app.ml.predict import forecast_upcoming_events
 from app.models.allocation import Allocation
+from app.models.archive import AllocationHistory, SurplusHistory
 from app.models.complaint import Complaint
 from app.models.event import Event
-from app.models.review import Review
 from app.models.surplus import Surplus
 from app.models.user import User
+from app.services.diagnostics_service import collect_diagnostics
+from app.services.export_service import EXPORT_STATEMENT_TIMEOUT_MS, FORMATS, ExportError, export_chunks, parse_filters
+from app.services.matching_service import rank_ngos_for_batch
+from app.services.profiling_service import profiling_snapshot, reset_profiling
 from app.services.realtime_service import publish_platform_update
+from app.services.rollup_service import record_complaint_status_change
+from app.services.trust_service import platform_average_rating, trust_stats_for_users
+from app.services.user_purge_service import soft_delete_user, start_purge_worker
+from app.utils.db_routing import read_replica, statement_timeout
 from app.utils.decorators import role_required
 
 
 admin = Blueprint("admin", __name__)
 
+# Page views that aggregate over the whole history on the primary.
+ADMIN_AGGREGATE_TIMEOUT_MS = 15 * 1000
+
 
 def _safe_rate(numerator, denominator):
 	if not denominator:
@@ -27,13 +37,13 @@ def _safe_rate(numerator, denominator):
 
 
 def _build_dashboard_metrics():
-	total_providers = User.query.filter_by(role="provider").count()
-	total_ngos = User.query.filter_by(role="ngo").count()
+	total_providers = User.query.filter_by(role="provider", deleted_at=None).count()
+	total_ngos = User.query.filter_by(role="ngo", deleted_at=None).count()
 	total_events = Event.query.count()
 	total_surplus_kg = db.session.query(
-		func.coalesce(func.sum(func.coalesce(Surplus.quantity, Surplus.quantity_kg)), 0.0)
+		func.coalesce(func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)), 0.0)
 	).scalar() or 0
-	total_allocations = Allocation.query.count()
+	total_allocations = AllocationHistory.query.count()
 	active_complaints = Complaint.query.filter(Complaint.status.in_(["Under Review", "Escalated"])).count()
 
 	return {
@@ -47,9 +57,9 @@ def _build_dashboard_metrics():
 
 
 def _build_operational_insights(metrics):
-	completed_allocations = Allocation.query.filter(func.lower(Allocation.status) == "completed").count()
+	completed_allocations = AllocationHistory.query.filter(func.lower(AllocationHistory.status) == "completed").count()
 	pending_allocations = Allocation.query.filter(func.lower(Allocation.status) != "completed").count()
-	avg_trust_score = db.session.query(func.avg(Review.rating)).scalar() or 0
+	avg_trust_score = platform_average_rating()
 	high_risk_batches = Surplus.query.filter(func.lower(func.coalesce(Surplus.estimated_expiry, "")).like("%1%")).count()
 	open_complaints = Complaint.query.filter(func.lower(Complaint.status).in_(["under review", "escalated"])).count()
 	unallocated_surplus = db.session.query(Surplus.id).outerjoin(Allocation, Allocation.surplus_id == Surplus.id).filter(Allocation.id.is_(None)).count()
@@ -77,8 +87,8 @@ def _build_analytics_payload(metrics):
 		month_labels.append(reference.strftime("%b %Y"))
 
 	start_window = now - timedelta(days=190)
-	surplus_rows = Surplus.query.filter(Surplus.created_at >= start_window).all()
-	allocation_rows = Allocation.query.filter(Allocation.created_at >= start_window).all()
+	surplus_rows = SurplusHistory.query.filter(SurplusHistory.created_at >= start_window).all()
+	allocation_rows = AllocationHistory.query.filter(AllocationHistory.created_at >= start_window).all()
 
 	monthly_surplus_map = defaultdict(float)
 	for row in surplus_rows:
@@ -107,28 +117,28 @@ def _build_analytics_payload(metrics):
 	top_providers = (
 		db.session.query(
 			User.full_name,
-			func.coalesce(func.sum(func.coalesce(Surplus.quantity, Surplus.quantity_kg)), 0.0).label("donated_kg"),
+			func.coalesce(func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)), 0.0).label("donated_kg"),
 		)
-		.join(Surplus, Surplus.provider_id == User.id)
+		.join(SurplusHistory, SurplusHistory.provider_id == User.id)
 		.filter(User.role == "provider")
 		.group_by(User.id, User.full_name)
-		.order_by(func.coalesce(func.sum(func.coalesce(Surplus.quantity, Surplus.quantity_kg)), 0.0).desc())
+		.order_by(func.coalesce(func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)), 0.0).desc())
 		.limit(5)
 		.all()
 	)
 
 	top_ngos = (
-		db.session.query(User.full_name, func.count(Allocation.id).label("completed_pickups"))
-		.join(Allocation, Allocation.ngo_id == User.id)
-		.filter(User.role == "ngo", func.lower(Allocation.status) == "completed")
+		db.session.query(User.full_name, func.count(AllocationHistory.id).label("completed_pickups"))
+		.join(AllocationHistory, AllocationHistory.ngo_id == User.id)
+		.filter(User.role == "ngo", func.lower(AllocationHistory.status) == "completed")
 		.group_by(User.id, User.full_name)
-		.order_by(func.count(Allocation.id).desc())
+		.order_by(func.count(AllocationHistory.id).desc())
 		.limit(5)
 		.all()
 	)
 
-	avg_trust_score = db.session.query(func.avg(Review.rating)).scalar() or 0
-	completed_allocations = Allocation.query.filter(func.lower(Allocation.status) == "completed").count()
+	avg_trust_score = platform_average_rating()
+	completed_allocations = AllocationHistory.query.filter(func.lower(AllocationHistory.status) == "completed").count()
 	allocation_efficiency = _safe_rate(completed_allocations, metrics["total_allocations"])
 
 	return {
@@ -199,6 +209,7 @@ def _status_class(status_value: str) -> str:
 
 @admin.route("/admin/dashboard")
 @role_required("admin")
+@statement_timeout(ADMIN_AGGREGATE_TIMEOUT_MS)
 def admin_dashboard():
 	metrics = _build_dashboard_metrics()
 	recent_activity = _build_recent_activity(limit=8)
@@ -208,6 +219,7 @@ def admin_dashboard():
 
 @admin.route("/admin/dashboard/live")
 @role_required("admin")
+@read_replica()
 def admin_dashboard_live():
 	metrics = _build_dashboard_metrics()
 	recent_activity = _build_recent_activity(limit=8)
@@ -230,11 +242,12 @@ def admin_dashboard_live():
 
 @admin.route("/admin/users")
 @role_required("admin")
+@statement_timeout(ADMIN_AGGREGATE_TIMEOUT_MS)
 def admin_users():
 	search = (request.args.get("search") or "").strip().lower()
 	role = (request.args.get("role") or "").strip().lower()
 
-	query = User.query
+	query = User.query.filter(User.deleted_at.is_(None))
 	if role in {"provider", "ngo", "admin"}:
 		query = query.filter(User.role == role)
 
@@ -245,11 +258,17 @@ def admin_users():
 
 	users = query.order_by(User.id.desc()).all()
 
-	provider_ratings = dict(
-		db.session.query(Review.provider_id, func.avg(Review.rating)).group_by(Review.provider_id).all()
-	)
+	provider_ratings = {
+		user_id: stats.average_received_rating
+		for user_id, stats in trust_stats_for_users([item.id for item in users if item.role == "provider"]).items()
+	}
 
-	role_summary_rows = db.session.query(User.role, func.count(User.id)).group_by(User.role).all()
+	role_summary_rows = (
+		db.session.query(User.role, func.count(User.id))
+		.filter(User.deleted_at.is_(None))
+		.group_by(User.role)
+		.all()
+	)
 	role_summary = {row[0]: row[1] for row in role_summary_rows}
 	users_count = len(users)
 
@@ -272,26 +291,12 @@ def admin_delete_user(user_id):
 		flash("You cannot delete your own admin account while logged in.", "warning")
 		return redirect(url_for("admin.admin_users"))
 
-	target_user = User.query.get_or_404(user_id)
-
-	Allocation.query.filter(
-		(Allocation.provider_id == user_id) | (Allocation.ngo_id == user_id)
-	).delete(synchronize_session=False)
-
-	Review.query.filter(
-		(Review.provider_id == user_id) | (Review.ngo_id == user_id)
-	).delete(synchronize_session=False)
-
-	Complaint.query.filter(
-		(Complaint.provider_id == user_id) | (Complaint.ngo_id == user_id)
-	).delete(synchronize_session=False)
+	target_user = User.query.filter(User.id == user_id, User.deleted_at.is_(None)).first_or_404()
 
-	Surplus.query.filter_by(provider_id=user_id).delete(synchronize_session=False)
-	Event.query.filter_by(provider_id=user_id).delete(synchronize_session=False)
-
-	db.session.delete(target_user)
-	db.session.commit()
+	soft_delete_user(target_user)
 	publish_platform_update(scope="user", action="deleted", actor_role="admin")
+	if current_app.config.get("USER_PURGE_WORKER_ENABLED", True):
+		start_purge_worker(current_app._get_current_object())
 
 	flash("User deleted successfully.", "success")
 	return redirect(url_for("admin.admin_users"))
@@ -299,6 +304,7 @@ def admin_delete_user(user_id):
 
 @admin.route("/admin/events")
 @role_required("admin")
+@read_replica()
 def admin_events():
 	events = Event.query.order_by(Event.created_at.desc()).limit(50).all()
 	event_insights = {
@@ -306,11 +312,16 @@ def admin_events():
 		"total_expected_guests": sum((item.guest_count or 0) for item in events),
 		"events_with_surplus": sum(1 for item in events if item.surplus_batches),
 	}
-	return render_template("admin/events.html", events=events, event_insights=event_insights)
+	forecasts = forecast_upcoming_events(
+		event_ids=[item.id for item in events],
+		path=current_app.config["SURPLUS_FORECAST_MODEL_PATH"],
+	)
+	return render_template("admin/events.html", events=events, event_insights=event_insights, forecasts=forecasts)
 
 
 @admin.route("/admin/allocations")
 @role_required("admin")
+@read_replica()
 def admin_allocations():
 	allocations = Allocation.query.order_by(Allocation.created_at.desc()).limit(60).all()
 	status_totals = defaultdict(int)
@@ -327,8 +338,21 @@ def admin_allocations():
 	return render_template("admin/allocations.html", allocations=allocations, allocation_insights=allocation_insights, status_class=_status_class)
 
 
+@admin.route("/admin/surplus/<int:surplus_id>/candidate-ngos")
+@role_required("admin")
+def admin_surplus_candidate_ngos(surplus_id):
+	surplus = Surplus.query.get_or_404(surplus_id)
+	candidates = rank_ngos_for_batch(surplus, limit=10)
+	return jsonify({
+		"surplus_id": surplus.id,
+		"open_kg": surplus.available_kg,
+		"candidates": candidates,
+	})
+
+
 @admin.route("/admin/complaints")
 @role_required("admin")
+@read_replica()
 def admin_complaints():
 	complaints = Complaint.query.order_by(Complaint.created_at.desc()).limit(60).all()
 	status_totals = defaultdict(int)
@@ -355,7 +379,9 @@ def admin_update_complaint_status(complaint_id):
 		flash("Invalid complaint status selected.", "error")
 		return redirect(url_for("admin.admin_complaints"))
 
+	previous_status = complaint.status
 	complaint.status = next_status
+	record_complaint_status_change(complaint, previous_status)
 	db.session.commit()
 	publish_platform_update(scope="complaint", action="status-updated", actor_role="admin")
 	flash("Complaint status updated successfully.", "success")
@@ -364,6 +390,7 @@ def admin_update_complaint_status(complaint_id):
 
 @admin.route("/admin/analytics")
 @role_required("admin")
+@read_replica()
 def admin_analytics():
 	metrics = _build_dashboard_metrics()
 	analytics = _build_analytics_payload(metrics)
@@ -375,30 +402,44 @@ def admin_analytics():
 	)
 
 
+@admin.route("/admin/export")
+@admin.route("/admin/export/<kind>")
+@role_required("admin")
+@read_replica(statement_timeout_ms=EXPORT_STATEMENT_TIMEOUT_MS)
+def admin_export(kind=None):
+	kind = kind or request.args.get("kind", "")
+	fmt = (request.args.get("format") or "csv").lower()
+	gzip = request.args.get("gzip", "").lower() in {"1", "true", "yes"}
+	try:
+		chunks = export_chunks(kind, parse_filters(request.args), fmt=fmt, gzip=gzip)
+	except ExportError as exc:
+		return jsonify({"ok": False, "message": str(exc)}), 400
+
+	filename = f"kalyana-{kind}-{datetime.utcnow():%Y%m%d-%H%M%S}.{fmt}" + (".gz" if gzip else "")
+	response = Response(stream_with_context(chunks), mimetype="application/gzip" if gzip else FORMATS[fmt])
+	response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+	response.headers["Cache-Control"] = "no-store"
+	# Let nginx pass chunks through instead of buffering the whole export.
+	response.headers["X-Accel-Buffering"] = "no"
+	return response
+
+
+@admin.route("/admin/profiling")
+@role_required("admin")
+def admin_profiling():
+	return render_template("admin/profiling.html", profile=profiling_snapshot())
+
+
+@admin.route("/admin/profiling/reset", methods=["POST"])
+@role_required("admin")
+def admin_profiling_reset():
+	reset_profiling()
+	flash("Profiling counters cleared.", "success")
+	return redirect(url_for("admin.admin_profiling"))
+
+
 @admin.route("/admin/system/health")
 @role_required("admin")
 def admin_system_health():
-	try:
-		db_url = os.getenv("DATABASE_URL", "")
-		parsed = urlparse(db_url) if db_url else None
-		host = parsed.hostname if parsed else ""
-		database = (parsed.path or "").lstrip("/") if parsed else ""
-
-		users_exists = db.session.execute(db.text("select to_regclass('public.users') is not null")).scalar()
-		columns = db.session.execute(
-			db.text(
-				"select column_name from information_schema.columns "
-				"where table_schema='public' and table_name='users' order by ordinal_position"
-			)
-		).scalars().all()
-
-		return jsonify(
-			{
-				"database_host": host,
-				"database_name": database,
-				"users_table_exists": bool(users_exists),
-				"users_columns": columns,
-			},
-		)
-	except Exception as exc:
-		return jsonify({"ok": False, "error": str(exc)}), 500
+	report = collect_diagnostics()
+	return jsonify(report), 503 if report["status"] == "down" else 200
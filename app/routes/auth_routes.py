@@ -1,14 +1,16 @@
-import os
 import re
 
 from werkzeug.security import generate_password_hash
 
-from flask import Blueprint, abort, current_app, flash, redirect, render_template, request, send_from_directory, session, url_for
+from flask import Blueprint, abort, current_app, flash, redirect, render_template, request, session, url_for
 
 from app import db
 from app import limiter
 from app.models.user import User
+from app.services.media_service import send_media
+from app.services.otp_service import consume_otp_challenge, create_otp_challenge, get_otp_challenge, record_failed_attempt
 from app.services.realtime_service import publish_platform_update
+from app.utils.decorators import mark_account_checked
 from app.utils.otp_generator import generate_otp, hash_otp, is_otp_expired, otp_expiry, send_otp_email, verify_hashed_otp
 
 auth = Blueprint("auth", __name__)
@@ -16,6 +18,7 @@ auth = Blueprint("auth", __name__)
 REGISTER_OTP_SESSION_KEY = "register_otp_context"
 FORGOT_OTP_SESSION_KEY = "forgot_otp_context"
 OTP_MAX_ATTEMPTS = 5
+OTP_PURPOSES = {REGISTER_OTP_SESSION_KEY: "register", FORGOT_OTP_SESSION_KEY: "forgot"}
 
 
 def _mask_email(email: str) -> str:
@@ -42,6 +45,23 @@ def _build_otp_context(email: str, **extra):
     return otp, payload
 
 
+def _save_otp_context(session_key: str, context: dict):
+    # The cookie only carries an opaque id; the context itself lives in otp_challenges.
+    consume_otp_challenge(session.get(session_key))
+    session[session_key] = create_otp_challenge(OTP_PURPOSES[session_key], context)
+
+
+def _load_otp_context(session_key: str):
+    context = get_otp_challenge(session.get(session_key), OTP_PURPOSES[session_key])
+    if context is None:
+        session.pop(session_key, None)
+    return context
+
+
+def _discard_otp_context(session_key: str):
+    consume_otp_challenge(session.pop(session_key, None))
+
+
 def _is_valid_email(email: str) -> bool:
     return bool(re.fullmatch(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", (email or "").strip()))
 
@@ -74,6 +94,7 @@ def register():
         phone_number = (request.form.get("phone_number") or "").strip()
         password = request.form.get("password")
         role = request.form.get("role")
+        capacity_text = (request.form.get("capacity_kg") or "").strip()
 
         if role not in {"provider", "ngo"}:
             flash("Invalid role selected.", "error")
@@ -95,6 +116,16 @@ def register():
             flash("Enter a valid 10-digit phone number.", "warning")
             return redirect(url_for("auth.register"))
 
+        capacity_kg = None
+        if role == "ngo" and capacity_text:
+            try:
+                capacity_kg = float(capacity_text)
+            except ValueError:
+                capacity_kg = -1
+            if capacity_kg <= 0:
+                flash("Pickup capacity must be a positive number of kg.", "warning")
+                return redirect(url_for("auth.register"))
+
         existing_user = User.query.filter_by(email=email).first()
         if existing_user:
             flash("Email already registered.", "warning")
@@ -110,6 +141,7 @@ def register():
             full_name=full_name,
             phone_number=phone_number,
             role=role,
+            capacity_kg=capacity_kg,
             password_hash=generate_password_hash(password),
         )
 
@@ -118,7 +150,7 @@ def register():
             flash("Unable to send OTP email right now. Please check SMTP settings and try again.", "error")
             return redirect(url_for("auth.register"))
 
-        session[REGISTER_OTP_SESSION_KEY] = otp_context
+        _save_otp_context(REGISTER_OTP_SESSION_KEY, otp_context)
         flash("OTP sent to your email. Enter it to complete registration.", "success")
         return redirect(url_for("auth.register_verify_otp"))
 
@@ -128,7 +160,7 @@ def register():
 @auth.route("/register/verify-otp", methods=["GET", "POST"])
 @limiter.limit("10 per minute", methods=["POST"])
 def register_verify_otp():
-    context = session.get(REGISTER_OTP_SESSION_KEY)
+    context = _load_otp_context(REGISTER_OTP_SESSION_KEY)
     if not context:
         flash("Registration session not found. Please register again.", "warning")
         return redirect(url_for("auth.register"))
@@ -144,6 +176,7 @@ def register_verify_otp():
                 full_name=context.get("full_name"),
                 phone_number=context.get("phone_number"),
                 role=context.get("role"),
+                capacity_kg=context.get("capacity_kg"),
                 password_hash=context.get("password_hash"),
             )
             sent = send_otp_email(current_app, email, otp, "registration")
@@ -151,7 +184,7 @@ def register_verify_otp():
                 flash("Unable to resend OTP email right now.", "error")
                 return redirect(url_for("auth.register_verify_otp"))
 
-            session[REGISTER_OTP_SESSION_KEY] = next_context
+            _save_otp_context(REGISTER_OTP_SESSION_KEY, next_context)
             flash("A new OTP has been sent to your email.", "info")
             return redirect(url_for("auth.register_verify_otp"))
 
@@ -161,17 +194,14 @@ def register_verify_otp():
             return redirect(url_for("auth.register_verify_otp"))
 
         if is_otp_expired(context.get("expires_at")):
-            session.pop(REGISTER_OTP_SESSION_KEY, None)
+            _discard_otp_context(REGISTER_OTP_SESSION_KEY)
             flash("OTP expired. Please register again.", "warning")
             return redirect(url_for("auth.register"))
 
         if not verify_hashed_otp(context.get("otp_hash"), entered_otp, email, current_app.config.get("SECRET_KEY", "")):
-            attempts = int(context.get("attempts", 0)) + 1
-            context["attempts"] = attempts
-            session[REGISTER_OTP_SESSION_KEY] = context
-
-            if attempts >= OTP_MAX_ATTEMPTS:
-                session.pop(REGISTER_OTP_SESSION_KEY, None)
+            attempts = record_failed_attempt(session[REGISTER_OTP_SESSION_KEY])
+            if attempts is None or attempts >= OTP_MAX_ATTEMPTS:
+                _discard_otp_context(REGISTER_OTP_SESSION_KEY)
                 flash("Too many invalid OTP attempts. Please register again.", "error")
                 return redirect(url_for("auth.register"))
 
@@ -179,21 +209,22 @@ def register_verify_otp():
             flash(f"Invalid OTP. {remaining} attempt(s) remaining.", "error")
             return redirect(url_for("auth.register_verify_otp"))
 
+        if not consume_otp_challenge(session.pop(REGISTER_OTP_SESSION_KEY, None)):
+            flash("Registration session not found. Please register again.", "warning")
+            return redirect(url_for("auth.register"))
+
         existing_user = User.query.filter_by(email=email).first()
         if existing_user:
-            session.pop(REGISTER_OTP_SESSION_KEY, None)
             flash("Email already registered. Please login.", "warning")
             return redirect(url_for("auth.login"))
 
         phone_number = (context.get("phone_number") or "").strip()
         if not _is_valid_phone(phone_number):
-            session.pop(REGISTER_OTP_SESSION_KEY, None)
             flash("Invalid phone number in registration session. Please register again.", "error")
             return redirect(url_for("auth.register"))
 
         existing_phone = User.query.filter_by(phone_number=phone_number).first()
         if existing_phone:
-            session.pop(REGISTER_OTP_SESSION_KEY, None)
             flash("Phone number already registered. Please login.", "warning")
             return redirect(url_for("auth.login"))
 
@@ -203,13 +234,13 @@ def register_verify_otp():
             phone_number=phone_number,
             phone_verified=True,
             role=context.get("role") or "ngo",
+            capacity_kg=context.get("capacity_kg"),
         )
         user.password_hash = context.get("password_hash")
         db.session.add(user)
         db.session.commit()
         publish_platform_update(scope="user", action="created", actor_role=user.role)
 
-        session.pop(REGISTER_OTP_SESSION_KEY, None)
         flash("Registration verified successfully. Please login.", "success")
         return redirect(url_for("auth.login"))
 
@@ -224,11 +255,12 @@ def login():
         password = request.form.get("password")
         identifier = (identifier or "").strip().lower()
 
-        user = User.query.filter_by(email=identifier).first()
+        user = User.query.filter_by(email=identifier, deleted_at=None).first()
 
         if user and user.check_password(password):
             session["user_id"] = user.id
             session["role"] = user.role
+            mark_account_checked()
 
             if user.role == "provider":
                 return redirect(url_for("provider.provider_dashboard"))
@@ -250,7 +282,7 @@ def login():
 def forgot_password():
     if request.method == "POST":
         email = (request.form.get("email") or "").strip().lower()
-        user = User.query.filter_by(email=email).first()
+        user = User.query.filter_by(email=email, deleted_at=None).first()
         if not user:
             flash("Email not found.", "error")
             return redirect(url_for("auth.forgot_password"))
@@ -263,7 +295,7 @@ def forgot_password():
 
         session.pop("reset_user_id", None)
         session.pop("reset_verified", None)
-        session[FORGOT_OTP_SESSION_KEY] = context
+        _save_otp_context(FORGOT_OTP_SESSION_KEY, context)
 
         flash("OTP sent to your email. Verify it to continue password reset.", "success")
         return redirect(url_for("auth.forgot_password_verify_otp"))
@@ -274,7 +306,7 @@ def forgot_password():
 @auth.route("/forgot-password/verify-otp", methods=["GET", "POST"])
 @limiter.limit("10 per minute", methods=["POST"])
 def forgot_password_verify_otp():
-    context = session.get(FORGOT_OTP_SESSION_KEY)
+    context = _load_otp_context(FORGOT_OTP_SESSION_KEY)
     if not context:
         flash("Password reset session not found. Start again.", "warning")
         return redirect(url_for("auth.forgot_password"))
@@ -291,7 +323,7 @@ def forgot_password_verify_otp():
                 flash("Unable to resend OTP email right now.", "error")
                 return redirect(url_for("auth.forgot_password_verify_otp"))
 
-            session[FORGOT_OTP_SESSION_KEY] = next_context
+            _save_otp_context(FORGOT_OTP_SESSION_KEY, next_context)
             flash("A new OTP has been sent to your email.", "info")
             return redirect(url_for("auth.forgot_password_verify_otp"))
 
@@ -301,17 +333,14 @@ def forgot_password_verify_otp():
             return redirect(url_for("auth.forgot_password_verify_otp"))
 
         if is_otp_expired(context.get("expires_at")):
-            session.pop(FORGOT_OTP_SESSION_KEY, None)
+            _discard_otp_context(FORGOT_OTP_SESSION_KEY)
             flash("OTP expired. Please restart forgot password.", "warning")
             return redirect(url_for("auth.forgot_password"))
 
         if not verify_hashed_otp(context.get("otp_hash"), entered_otp, email, current_app.config.get("SECRET_KEY", "")):
-            attempts = int(context.get("attempts", 0)) + 1
-            context["attempts"] = attempts
-            session[FORGOT_OTP_SESSION_KEY] = context
-
-            if attempts >= OTP_MAX_ATTEMPTS:
-                session.pop(FORGOT_OTP_SESSION_KEY, None)
+            attempts = record_failed_attempt(session[FORGOT_OTP_SESSION_KEY])
+            if attempts is None or attempts >= OTP_MAX_ATTEMPTS:
+                _discard_otp_context(FORGOT_OTP_SESSION_KEY)
                 flash("Too many invalid OTP attempts. Please restart forgot password.", "error")
                 return redirect(url_for("auth.forgot_password"))
 
@@ -319,9 +348,12 @@ def forgot_password_verify_otp():
             flash(f"Invalid OTP. {remaining} attempt(s) remaining.", "error")
             return redirect(url_for("auth.forgot_password_verify_otp"))
 
+        if not consume_otp_challenge(session.pop(FORGOT_OTP_SESSION_KEY, None)):
+            flash("Password reset session not found. Start again.", "warning")
+            return redirect(url_for("auth.forgot_password"))
+
         session["reset_user_id"] = context.get("user_id")
         session["reset_verified"] = True
-        session.pop(FORGOT_OTP_SESSION_KEY, None)
         flash("OTP verified. You can now reset your password.", "success")
         return redirect(url_for("auth.reset_password"))
 
@@ -336,7 +368,7 @@ def reset_password():
         return redirect(url_for("auth.forgot_password"))
 
     user = User.query.get(session["reset_user_id"])
-    if not user:
+    if not user or user.deleted_at:
         flash("User not found.", "error")
         return redirect(url_for("auth.forgot_password"))
 
@@ -374,13 +406,6 @@ def logout():
 @auth.route("/media/<path:filename>")
 def media_file(filename):
     normalized = (filename or "").replace("\\", "/").lstrip("/")
-
-    primary_root = current_app.static_folder
-    if os.path.exists(os.path.join(primary_root, normalized)):
-        return send_from_directory(primary_root, normalized)
-
-    legacy_root = os.path.join(current_app.root_path, "routes", "static")
-    if os.path.exists(os.path.join(legacy_root, normalized)):
-        return send_from_directory(legacy_root, normalized)
-
-    return abort(404)
\ No newline at end of file
+    if not normalized:
+        return abort(404)
+    return send_media(normalized)
\ No newline at end of file
@@ -1,11 +1,30 @@
-from flask import Blueprint, jsonify, request
+import hmac
 
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+from app import limiter
+from app.services.cluster_service import surplus_grid_index
 from app.services.maps_service import geocode_place, suggest_places
+from app.services.metrics_service import render_metrics
+from app.utils.db_routing import read_replica
+from app.utils.decorators import api_login_required
 
 
 common = Blueprint("common", __name__)
 
 
+@common.route("/metrics")
+@limiter.limit("30 per minute")
+def metrics():
+    # Opt-in and always token-protected: the output is operational detail, and each scrape runs aggregate queries.
+    token = current_app.config["METRICS_TOKEN"]
+    if not current_app.config["METRICS_ENABLED"] or not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        abort(401)
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+
 @common.route("/location/suggest")
 def location_suggest():
     query = (request.args.get("q") or "").strip()
@@ -20,3 +39,24 @@ def location_geocode():
         return jsonify({"ok": False, "message": "Location not found"}), 404
 
     return jsonify({"ok": True, "location": geo})
+
+
+
+@common.route("/api/v1/map/clusters")
+@api_login_required
+@read_replica()
+def map_clusters():
+    try:
+        min_lat = float(request.args["min_lat"])
+        min_lon = float(request.args["min_lon"])
+        max_lat = float(request.args["max_lat"])
+        max_lon = float(request.args["max_lon"])
+        zoom = int(request.args.get("zoom") or 10)
+    except (KeyError, ValueError):
+        return jsonify({"ok": False, "message": "min_lat, min_lon, max_lat, max_lon and zoom are required"}), 400
+
+    if min_lat > max_lat or min_lon > max_lon:
+        return jsonify({"ok": False, "message": "Invalid bounding box"}), 400
+
+    zoom, clusters = surplus_grid_index.clusters(min_lat, min_lon, max_lat, max_lon, zoom)
+    return jsonify({"ok": True, "zoom": zoom, "clusters": clusters})
@@ -1,18 +1,29 @@
+import base64
+import binascii
 from datetime import datetime, timedelta
 import secrets
 
-from flask import Blueprint, flash, redirect, render_template, request, session, url_for
-from sqlalchemy import func
+from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, session, url_for
 
 from app import db
 from app.models.allocation import Allocation
+from app.models.archive import AllocationHistory
 from app.models.complaint import Complaint
 from app.models.review import Review
 from app.models.surplus import Surplus
 from app.models.user import User
-from app.services.matching_service import filter_surplus_by_location
+from app.services.allocation_service import claim_surplus_quantity, suggested_claim_kg
+from app.services.image_service import photo_url
+from app.services.maps_service import geocode_place
+from app.services.matching_service import filter_surplus_by_location, nearby_available_rows
 from app.services.realtime_service import publish_platform_update
-from app.utils.decorators import role_required
+from app.services.rollup_service import record_complaint, record_review
+from app.services.route_service import plan_pickup_route
+from app.services.trust_service import trust_stats_for
+from app.services.weather_service import risk_factors_for
+from app.utils.db_routing import read_replica
+from app.utils.decorators import api_role_required, role_required
+from app.utils.expiry import expiry_deadline
 
 
 ngo = Blueprint("ngo", __name__)
@@ -36,6 +47,38 @@ def _generate_unique_pickup_code() -> str:
 			return code
 
 
+def _encode_nearby_cursor(distance_km: float, surplus_id: int) -> str:
+	raw = f"{distance_km:.6f}:{surplus_id}".encode("utf-8")
+	return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_nearby_cursor(cursor: str):
+	try:
+		padded = cursor + "=" * (-len(cursor) % 4)
+		distance_text, id_text = base64.urlsafe_b64decode(padded).decode("utf-8").split(":", 1)
+		return round(float(distance_text), 6), int(id_text)
+	except (ValueError, binascii.Error, UnicodeDecodeError):
+		return None
+
+
+def _resolve_receiver_point():
+	receiver_location = (request.args.get("receiver_location") or "").strip()
+	try:
+		lat = float(request.args["lat"])
+		lon = float(request.args["lon"])
+		return {"display_name": receiver_location or f"{lat:.5f}, {lon:.5f}", "lat": lat, "lon": lon}, None
+	except (KeyError, ValueError):
+		pass
+
+	if not receiver_location:
+		return None, (jsonify({"ok": False, "message": "receiver_location or lat/lon is required"}), 400)
+
+	geo = geocode_place(receiver_location)
+	if not geo:
+		return None, (jsonify({"ok": False, "message": "Location not found"}), 404)
+	return geo, None
+
+
 @ngo.route("/ngo/dashboard")
 @role_required("ngo")
 def ngo_dashboard():
@@ -45,8 +88,8 @@ def ngo_dashboard():
 		Allocation.ngo_id == ngo_id,
 		Allocation.status.in_(["requested", "allocated"]),
 	).count()
-	completed_pickups_count = Allocation.query.filter_by(ngo_id=ngo_id, status="completed").count()
-	trust_score = db.session.query(func.avg(Review.rating)).filter_by(ngo_id=ngo_id).scalar() or 0
+	completed_pickups_count = AllocationHistory.query.filter_by(ngo_id=ngo_id, status="completed").count()
+	trust_score = trust_stats_for(ngo_id).average_given_rating
 
 	recent_surplus = (
 		Surplus.query.filter_by(status="available")
@@ -55,8 +98,11 @@ def ngo_dashboard():
 		.all()
 	)
 
+	current_ngo = User.query.get(ngo_id)
+
 	return render_template(
 		"ngo/dashboard.html",
+		capacity_kg=current_ngo.capacity_kg if current_ngo else None,
 		available_surplus_count=available_surplus_count,
 		active_pickups_count=active_pickups_count,
 		completed_pickups_count=completed_pickups_count,
@@ -65,8 +111,33 @@ def ngo_dashboard():
 	)
 
 
+@ngo.route("/ngo/capacity", methods=["POST"])
+@role_required("ngo")
+def ngo_update_capacity():
+	ngo_id = _ngo_id_from_session()
+	capacity_text = (request.form.get("capacity_kg") or "").strip()
+
+	capacity_kg = None
+	if capacity_text:
+		try:
+			capacity_kg = float(capacity_text)
+		except ValueError:
+			flash("Capacity must be a valid number.", "error")
+			return redirect(url_for("ngo.ngo_dashboard"))
+		if capacity_kg <= 0:
+			flash("Capacity must be greater than zero.", "warning")
+			return redirect(url_for("ngo.ngo_dashboard"))
+
+	current_ngo = User.query.get_or_404(ngo_id)
+	current_ngo.capacity_kg = capacity_kg
+	db.session.commit()
+	flash("Pickup capacity updated.", "success")
+	return redirect(url_for("ngo.ngo_dashboard"))
+
+
 @ngo.route("/ngo/nearby-surplus")
 @role_required("ngo")
+@read_replica()
 def ngo_nearby_surplus():
 	receiver_location = (request.args.get("receiver_location") or "").strip()
 	radius_km_raw = (request.args.get("radius_km") or "8").strip()
@@ -84,22 +155,91 @@ def ngo_nearby_surplus():
 
 	resolved_location = None
 	if receiver_location:
-		filtered, resolved_location = filter_surplus_by_location(all_available, receiver_location, radius_km)
+		filtered, resolved_location = filter_surplus_by_location(
+			all_available,
+			receiver_location,
+			radius_km,
+			ngo_id=_ngo_id_from_session(),
+		)
 		available_surplus = filtered
 		if resolved_location is None:
 			flash("Could not find that location. Try a nearby place name.", "warning")
 	else:
 		available_surplus = []
 
+	current_ngo = User.query.get(_ngo_id_from_session())
+
 	return render_template(
 		"ngo/nearby_surplus.html",
 		available_surplus=available_surplus,
+		capacity_kg=current_ngo.capacity_kg if current_ngo else None,
 		receiver_location=receiver_location,
 		radius_km=radius_km,
 		resolved_location=resolved_location,
+		suggested_claim_kg=suggested_claim_kg,
 	)
 
 
+@ngo.route("/api/v1/ngo/nearby-surplus")
+@api_role_required("ngo")
+@read_replica()
+def api_ngo_nearby_surplus():
+	try:
+		radius_km = float((request.args.get("radius_km") or "8").strip())
+	except ValueError:
+		radius_km = 8.0
+
+	default_page_size = current_app.config.get("NEARBY_API_PAGE_SIZE", 20)
+	max_page_size = current_app.config.get("NEARBY_API_MAX_PAGE_SIZE", 100)
+	try:
+		page_size = int(request.args.get("limit") or default_page_size)
+	except ValueError:
+		page_size = default_page_size
+	page_size = max(1, min(page_size, max_page_size))
+
+	cursor_raw = (request.args.get("cursor") or "").strip()
+	cursor = _decode_nearby_cursor(cursor_raw) if cursor_raw else None
+	if cursor_raw and cursor is None:
+		return jsonify({"ok": False, "message": "Invalid cursor"}), 400
+
+	geo, error_response = _resolve_receiver_point()
+	if error_response:
+		return error_response
+
+	ranked = [
+		(round(distance, 6), row.id, row)
+		for distance, row in nearby_available_rows(geo["lat"], geo["lon"], radius_km)
+	]
+	ranked.sort(key=lambda item: (item[0], item[1]))
+	if cursor:
+		ranked = [item for item in ranked if (item[0], item[1]) > cursor]
+
+	page = ranked[:page_size]
+	items = [
+		{
+			"id": row.id,
+			"mahal": row.mahal_name,
+			"food_type": row.food_type,
+			"kg": row.remaining_kg if row.remaining_kg is not None else (row.quantity if row.quantity is not None else row.quantity_kg),
+			"distance_km": round(distance, 1),
+			"expiry": row.estimated_expiry,
+			"thumbnail_url": photo_url(row.photo_path, "thumb"),
+		}
+		for distance, _, row in page
+	]
+	next_cursor = None
+	if len(ranked) > page_size:
+		last_distance, last_id, _ = page[-1]
+		next_cursor = _encode_nearby_cursor(last_distance, last_id)
+
+	return jsonify({
+		"ok": True,
+		"location": geo,
+		"items": items,
+		"next_cursor": next_cursor,
+	})
+
+
 @ngo.route("/ngo/request-food/<int:surplus_id>", methods=["POST"])
 @role_required("ngo")
 def ngo_request_food(surplus_id):
@@ -114,17 +254,55 @@ def ngo_request_food(surplus_id):
 		flash("Photo is required before applying for food.", "warning")
 		return redirect(url_for("ngo.ngo_nearby_surplus"))
 
+	existing_request = Allocation.query.filter(
+		Allocation.surplus_id == surplus.id,
+		Allocation.ngo_id == ngo_id,
+		Allocation.status.in_(["requested", "allocated"]),
+	).first()
+	if existing_request:
+		flash("You already have an active pickup for this batch.", "info")
+		return redirect(url_for("ngo.ngo_nearby_surplus"))
+
+	current_ngo = User.query.get(ngo_id)
+	capacity_kg = current_ngo.capacity_kg if current_ngo else None
+	quantity_text = (request.form.get("quantity_kg") or "").strip()
+	if quantity_text:
+		try:
+			quantity_kg = float(quantity_text)
+		except ValueError:
+			flash("Quantity must be a valid number.", "error")
+			return redirect(url_for("ngo.ngo_nearby_surplus"))
+	else:
+		quantity_kg = suggested_claim_kg(surplus.available_kg, capacity_kg)
+
+	if quantity_kg <= 0:
+		flash("Quantity must be greater than zero.", "warning")
+		return redirect(url_for("ngo.ngo_nearby_surplus"))
+
+	if capacity_kg and quantity_kg > capacity_kg:
+		flash(f"Your declared capacity is {capacity_kg:g} kg. Request a smaller quantity.", "warning")
+		return redirect(url_for("ngo.ngo_nearby_surplus"))
+
+	if surplus.remaining_kg is None:
+		surplus.remaining_kg = surplus.available_kg
+		db.session.flush()
+
+	if not claim_surplus_quantity(surplus.id, quantity_kg):
+		db.session.rollback()
+		flash("Only part of this batch is left. Refresh and request a smaller quantity.", "warning")
+		return redirect(url_for("ngo.ngo_nearby_surplus"))
+
 	allocation = Allocation(
 		surplus_id=surplus.id,
 		provider_id=surplus.provider_id,
 		ngo_id=ngo_id,
+		quantity_kg=quantity_kg,
 		status="requested",
 		pickup_time=datetime.utcnow() + timedelta(hours=2),
 		otp_code=_generate_unique_pickup_code(),
 	)
 
 	db.session.add(allocation)
-	surplus.status = "requested"
 	db.session.commit()
 	publish_platform_update(scope="allocation", action="requested", actor_role="ngo")
 
@@ -137,23 +315,83 @@ def ngo_request_food(surplus_id):
 def ngo_allocations():
 	ngo_id = _ngo_id_from_session()
 	allocations = (
-		Allocation.query.filter_by(ngo_id=ngo_id)
-		.order_by(Allocation.created_at.desc())
+		AllocationHistory.query.filter_by(ngo_id=ngo_id)
+		.order_by(AllocationHistory.created_at.desc())
 		.all()
 	)
 	return render_template("ngo/allocations.html", allocations=allocations)
 
 
+@ngo.route("/api/v1/ngo/pickup-route")
+@api_role_required("ngo")
+def api_ngo_pickup_route():
+	ngo_id = _ngo_id_from_session()
+	geo, error_response = _resolve_receiver_point()
+	if error_response:
+		return error_response
+
+	rows = (
+		db.session.query(
+			Allocation.id,
+			Allocation.surplus_id,
+			Surplus.mahal_name,
+			Surplus.provider_location,
+			Surplus.provider_latitude,
+			Surplus.provider_longitude,
+			Surplus.estimated_expiry,
+			Surplus.created_at,
+		)
+		.join(Surplus, Surplus.id == Allocation.surplus_id)
+		.filter(
+			Allocation.ngo_id == ngo_id,
+			Allocation.status.in_(["requested", "allocated"]),
+			Surplus.provider_latitude.isnot(None),
+			Surplus.provider_longitude.isnot(None),
+		)
+		.all()
+	)
+
+	now = datetime.utcnow()
+	weather_risk = risk_factors_for([(row.provider_latitude, row.provider_longitude) for row in rows])
+	stops = []
+	for row in rows:
+		deadline = expiry_deadline(row.created_at, row.estimated_expiry)
+		risk = weather_risk[(row.provider_latitude, row.provider_longitude)]
+		stops.append({
+			"allocation_id": row.id,
+			"surplus_id": row.surplus_id,
+			"mahal": row.mahal_name,
+			"location": row.provider_location,
+			"lat": row.provider_latitude,
+			"lon": row.provider_longitude,
+			"expires_at": deadline.isoformat() if deadline else None,
+			"weather_risk": risk,
+			"deadline_minutes": (deadline - now).total_seconds() / 60 / risk if deadline else None,
+		})
+
+	speed_kmph = float(current_app.config.get("PICKUP_AVG_SPEED_KMPH", 20))
+	route = plan_pickup_route((geo["lat"], geo["lon"]), stops, speed_kmph=speed_kmph)
+	for stop in route:
+		stop.pop("deadline_minutes", None)
+
+	return jsonify({
+		"ok": True,
+		"start": geo,
+		"stops": route,
+		"total_km": route[-1]["cumulative_km"] if route else 0.0,
+	})
+
+
 @ngo.route("/ngo/history")
 @role_required("ngo")
 def ngo_history():
 	ngo_id = _ngo_id_from_session()
 	history_allocations = (
-		Allocation.query.filter_by(ngo_id=ngo_id, status="completed")
-		.order_by(Allocation.created_at.desc())
+		AllocationHistory.query.filter_by(ngo_id=ngo_id, status="completed")
+		.order_by(AllocationHistory.created_at.desc())
 		.all()
 	)
-	total_meals_served = sum(int(((a.surplus.quantity if a.surplus and a.surplus.quantity is not None else (a.surplus.quantity_kg if a.surplus else 0)) * 2.5)) for a in history_allocations)
+	total_meals_served = sum(int((a.claimed_kg or 0) * 2.5) for a in history_allocations)
 	return render_template("ngo/history.html", history_allocations=history_allocations, total_meals_served=total_meals_served)
 
 
@@ -163,13 +401,14 @@ def ngo_reviews():
 	ngo_id = _ngo_id_from_session()
 
 	provider_ids = (
-		db.session.query(Allocation.provider_id)
-		.filter(Allocation.ngo_id == ngo_id)
+		db.session.query(AllocationHistory.provider_id)
+		.filter(AllocationHistory.ngo_id == ngo_id)
 		.distinct()
 		.all()
 	)
 	provider_ids = [provider_id for (provider_id,) in provider_ids if provider_id]
-	providers = User.query.filter(User.id.in_(provider_ids)).all() if provider_ids else []
+	providers = User.query.filter(User.id.in_(provider_ids), User.deleted_at.is_(None)).all() if provider_ids else []
+	provider_ids = [provider.id for provider in providers]
 
 	if request.method == "POST":
 		action_type = request.form.get("action_type")
@@ -201,6 +440,7 @@ def ngo_reviews():
 				comment=comment,
 			)
 			db.session.add(review)
+			record_review(review)
 			db.session.commit()
 			publish_platform_update(scope="review", action="created", actor_role="ngo")
 			flash("Review submitted successfully.", "success")
@@ -220,6 +460,7 @@ def ngo_reviews():
 				status="Under Review",
 			)
 			db.session.add(complaint)
+			record_complaint(complaint)
 			db.session.commit()
 			publish_platform_update(scope="complaint", action="created", actor_role="ngo")
 			flash("Complaint submitted.", "success")
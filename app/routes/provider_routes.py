@@ -1,6 +1,4 @@
-import os
 from datetime import datetime
-from uuid import uuid4
 
 from flask import Blueprint, current_app, flash, redirect, render_template, request, session, url_for
 from sqlalchemy import func
@@ -8,13 +6,18 @@ from werkzeug.utils import secure_filename
 
 from app import db
 from app.models.allocation import Allocation
+from app.models.archive import AllocationHistory, SurplusHistory
 from app.models.complaint import Complaint
 from app.models.event import Event
 from app.models.review import Review
 from app.models.surplus import Surplus
 from app.models.user import User
+from app.services.affinity_service import record_completed_pickup
+from app.services.image_service import enqueue_variants
 from app.services.maps_service import geocode_place
+from app.services.media_service import UploadError, store_upload
 from app.services.realtime_service import publish_platform_update
+from app.services.trust_service import trust_stats_for
 from app.utils.decorators import role_required
 
 provider = Blueprint("provider", __name__)
@@ -39,16 +42,16 @@ def provider_dashboard():
     provider_id = _provider_id_from_session()
 
     total_events = Event.query.filter_by(provider_id=provider_id).count()
-    total_food_donated = db.session.query(func.coalesce(func.sum(func.coalesce(Surplus.quantity, Surplus.quantity_kg)), 0.0)).filter_by(provider_id=provider_id).scalar()
+    total_food_donated = db.session.query(func.coalesce(func.sum(func.coalesce(SurplusHistory.quantity, SurplusHistory.quantity_kg)), 0.0)).filter(SurplusHistory.provider_id == provider_id).scalar()
     active_allocations = Allocation.query.filter(
         Allocation.provider_id == provider_id,
         Allocation.status.in_(["requested", "allocated"]),
     ).count()
-    average_rating = db.session.query(func.avg(Review.rating)).filter_by(provider_id=provider_id).scalar() or 0
+    average_rating = trust_stats_for(provider_id).average_received_rating
 
     recent_allocations = (
-        Allocation.query.filter_by(provider_id=provider_id)
-        .order_by(Allocation.created_at.desc())
+        AllocationHistory.query.filter_by(provider_id=provider_id)
+        .order_by(AllocationHistory.created_at.desc())
         .limit(6)
         .all()
     )
@@ -104,6 +107,7 @@ def provider_add_surplus():
                 return redirect(url_for("provider.provider_add_surplus"))
 
         saved_photo_path = None
+        photo_is_new = False
         if photo_file and photo_file.filename:
             if not _is_allowed_image(photo_file.filename):
                 flash("Only PNG, JPG, JPEG, WEBP images are allowed.", "error")
@@ -111,14 +115,11 @@ def provider_add_surplus():
 
             original_name = secure_filename(photo_file.filename)
             extension = original_name.rsplit(".", 1)[1].lower()
-            new_filename = f"surplus_{uuid4().hex}.{extension}"
-
-            upload_dir = os.path.join(current_app.static_folder, "uploads", "food_images")
-            os.makedirs(upload_dir, exist_ok=True)
-            file_path = os.path.join(upload_dir, new_filename)
-            photo_file.save(file_path)
-
-            saved_photo_path = f"uploads/food_images/{new_filename}"
+            try:
+                saved_photo_path, photo_is_new = store_upload(photo_file, current_app.static_folder, extension)
+            except UploadError as exc:
+                flash(str(exc), "error")
+                return redirect(url_for("provider.provider_add_surplus"))
 
         event = Event.query.filter_by(provider_id=provider_id, event_name=event_name).first()
         if not event:
@@ -135,6 +136,7 @@ def provider_add_surplus():
             food_type=food_type,
             quantity=quantity_kg,
             quantity_kg=quantity_kg,
+            remaining_kg=quantity_kg,
             estimated_expiry=estimated_expiry,
             distance_km=distance_km,
             provider_location=geo["display_name"],
@@ -146,6 +148,8 @@ def provider_add_surplus():
 
         db.session.add(surplus)
         db.session.commit()
+        if photo_is_new:
+            enqueue_variants(saved_photo_path)
         publish_platform_update(scope="surplus", action="created", actor_role="provider")
         flash("Surplus added. Mark it as Ready to allow receiver pickup requests.", "success")
         return redirect(url_for("provider.provider_add_surplus"))
@@ -193,13 +197,13 @@ def provider_events():
 def provider_allocations():
     provider_id = _provider_id_from_session()
     allocations = (
-        Allocation.query.filter_by(provider_id=provider_id)
-        .order_by(Allocation.created_at.desc())
+        AllocationHistory.query.filter_by(provider_id=provider_id)
+        .order_by(AllocationHistory.created_at.desc())
         .all()
     )
     completed_count = sum(1 for item in allocations if item.status == "completed")
     pending_count = len(allocations) - completed_count
-    total_meals_served = sum((((item.surplus.quantity if item.surplus and item.surplus.quantity is not None else (item.surplus.quantity_kg if item.surplus else 0))) * 2.5) for item in allocations)
+    total_meals_served = sum(((item.claimed_kg or 0) * 2.5) for item in allocations)
 
     return render_template(
         "provider/allocations.html",
@@ -231,8 +235,17 @@ def provider_verify_pickup(allocation_id):
         return redirect(url_for("provider.provider_allocations"))
 
     allocation.status = "completed"
-    if allocation.surplus:
-        allocation.surplus.status = "completed"
+    allocation.completed_at = datetime.utcnow()
+    record_completed_pickup(allocation)
+    surplus = allocation.surplus
+    if surplus and not (surplus.remaining_kg or 0) > 0:
+        open_allocations = Allocation.query.filter(
+            Allocation.surplus_id == surplus.id,
+            Allocation.id != allocation.id,
+            Allocation.status.in_(["requested", "allocated"]),
+        ).count()
+        if not open_allocations:
+            surplus.status = "completed"
 
     db.session.commit()
     publish_platform_update(scope="allocation", action="completed", actor_role="provider")
@@ -248,11 +261,12 @@ def provider_reviews():
     reviews = Review.query.filter_by(provider_id=provider_id).order_by(Review.created_at.desc()).all()
     complaints = Complaint.query.filter_by(provider_id=provider_id).order_by(Complaint.created_at.desc()).all()
 
-    avg_rating = db.session.query(func.avg(Review.rating)).filter_by(provider_id=provider_id).scalar() or 0
+    trust_stats = trust_stats_for(provider_id)
 
     return render_template(
         "provider/reviews.html",
         reviews=reviews,
         complaints=complaints,
-        avg_rating=round(float(avg_rating), 2),
+        avg_rating=round(float(trust_stats.average_received_rating), 2),
+        trust_score=trust_stats.trust_score,
     )
\ No newline at end of file
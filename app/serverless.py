@@ -0,0 +1,156 @@
+"""Serverless app profile: lazily imported views and precompiled templates.
+
+``flask serverless build`` (run with the full profile) writes two artifacts
+under SERVERLESS_BUILD_DIR:
+
+- routes.json: every URL rule with its endpoint and the dotted path of its
+  view, so the serverless app can register the rules without importing the
+  route modules. Each view module is imported on the first request that
+  hits one of its endpoints (Flask's lazy-view pattern). url_for keeps
+  working because every endpoint exists from the start.
+- templates/: Jinja templates compiled to Python modules, loaded ahead of
+  the source templates.
+
+routes.json also records two fingerprints. ``fingerprint`` covers the
+resolved route table and template sources, so ``benchmarks.cold_start``
+can fail when the artifacts are stale. ``source_fingerprint`` only hashes
+the bytes of app/routes/*.py and the template files; it is cheap enough
+for create_app to check on every cold start, and a mismatch makes the
+serverless app ignore the build and register the blueprints eagerly.
+"""
+import hashlib
+import json
+import os
+
+from jinja2 import ChoiceLoader, ModuleLoader
+from werkzeug.utils import cached_property, import_string
+
+
+MANIFEST_NAME = "routes.json"
+TEMPLATES_DIRNAME = "templates"
+
+
+class LazyView:
+	def __init__(self, import_name):
+		self.import_name = import_name
+		# Same names as the real view, so Flask-Limiter and CSRF exemptions match it.
+		self.__module__, self.__name__ = import_name.rsplit(".", 1)
+		self.__qualname__ = self.__name__
+
+	@cached_property
+	def view(self):
+		return import_string(self.import_name)
+
+	def __call__(self, *args, **kwargs):
+		return self.view(*args, **kwargs)
+
+
+def _view_import_name(view_func):
+	import_name = f"{view_func.__module__}.{view_func.__name__}"
+	if import_string(import_name) is not view_func:
+		raise RuntimeError(f"View {import_name} is not importable by name; decorate it with functools.wraps")
+	return import_name
+
+
+def route_manifest(app):
+	routes = []
+	for rule in sorted(app.url_map.iter_rules(), key=lambda item: (item.rule, item.endpoint)):
+		if rule.endpoint == "static":
+			continue
+		routes.append({
+			"rule": rule.rule,
+			"endpoint": rule.endpoint,
+			"methods": sorted(rule.methods - {"HEAD", "OPTIONS"}),
+			"defaults": rule.defaults,
+			"strict_slashes": rule.strict_slashes,
+			"view": _view_import_name(app.view_functions[rule.endpoint]),
+		})
+	return routes
+
+
+def _template_sources(app):
+	loader = app.jinja_env.loader
+	for name in sorted(app.jinja_env.list_templates()):
+		source, _, _ = loader.get_source(app.jinja_env, name)
+		yield name, source
+
+
+def build_fingerprint(app):
+	digest = hashlib.sha256()
+	digest.update(json.dumps(route_manifest(app), sort_keys=True).encode("utf-8"))
+	for name, source in _template_sources(app):
+		digest.update(name.encode("utf-8"))
+		digest.update(source.encode("utf-8"))
+	return digest.hexdigest()
+
+
+def source_fingerprint(app):
+	"""Hash of the route modules and template files, read straight from disk."""
+	digest = hashlib.sha256()
+	routes_dir = os.path.join(app.root_path, "routes")
+	paths = [os.path.join(routes_dir, name) for name in sorted(os.listdir(routes_dir)) if name.endswith(".py")]
+	template_dir = os.path.join(app.root_path, app.template_folder)
+	for directory, dirnames, filenames in os.walk(template_dir):
+		dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+		paths.extend(os.path.join(directory, name) for name in sorted(filenames))
+	for path in paths:
+		digest.update(os.path.relpath(path, app.root_path).replace(os.sep, "/").encode("utf-8"))
+		with open(path, "rb") as handle:
+			digest.update(handle.read())
+	return digest.hexdigest()
+
+
+def build_serverless_artifacts(app, build_dir):
+	"""Write routes.json and compiled templates. Returns (routes, templates)."""
+	os.makedirs(build_dir, exist_ok=True)
+	routes = route_manifest(app)
+	templates = [name for name, _ in _template_sources(app)]
+
+	app.jinja_env.compile_templates(
+		os.path.join(build_dir, TEMPLATES_DIRNAME),
+		zip=None,
+		ignore_errors=False,
+	)
+	with open(os.path.join(build_dir, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+		json.dump(
+			{"fingerprint": build_fingerprint(app), "source_fingerprint": source_fingerprint(app), "routes": routes},
+			handle,
+			indent=1,
+			sort_keys=True,
+		)
+	return len(routes), len(templates)
+
+
+def load_manifest(build_dir):
+	path = os.path.join(build_dir, MANIFEST_NAME)
+	if not os.path.exists(path):
+		return None
+	with open(path, "r", encoding="utf-8") as handle:
+		return json.load(handle)
+
+
+def manifest_is_current(app, manifest):
+	return manifest.get("source_fingerprint") == source_fingerprint(app)
+
+
+def register_lazy_views(app, manifest):
+	views = {}
+	for route in manifest["routes"]:
+		# One LazyView per endpoint: Flask rejects a second function for an endpoint with several rules.
+		view = views.setdefault(route["endpoint"], LazyView(route["view"]))
+		app.add_url_rule(
+			route["rule"],
+			endpoint=route["endpoint"],
+			view_func=view,
+			methods=route["methods"],
+			defaults=route["defaults"],
+			strict_slashes=route["strict_slashes"],
+		)
+
+
+def use_precompiled_templates(app, build_dir):
+	compiled = os.path.join(build_dir, TEMPLATES_DIRNAME)
+	if os.path.isdir(compiled):
+		app.jinja_env.loader = ChoiceLoader([ModuleLoader(compiled), app.jinja_env.loader])
+		return True
+	return False
@@ -0,0 +1,31 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'register.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'register.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_csrf_token = resolve('csrf_token')
+    pass
+    yield '\n\n<div class="auth-container">\n    <div class="auth-card">\n        <h2>Create Account</h2>\n\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n\n            <div class="form-group">\n                <label>Full Name</label>\n                <input type="text" name="full_name" required>\n            </div>\n\n            <div class="form-group">\n                <label>Email</label>\n                <input type="email" name="email" required>\n            </div>\n\n            <div class="form-group">\n                <label>Phone Number</label>\n                <input type="text" name="phone_number" maxlength="10" pattern="[0-9]{10}" placeholder="10-digit mobile number" required>\n            </div>\n\n            <div class="form-group">\n                <label>Password</label>\n                <input type="password" name="password" required>\n            </div>\n\n            <div class="form-group">\n                <label>Role</label>\n                <select name="role" required>\n                    <option value="">Select Role</option>\n                    <option value="provider">Wedding Hall / Caterer</option>\n                    <option value="ngo">NGO / Shelter</option>\n                </select>\n            </div>\n\n            <div class="form-group">\n                <label>Pickup Capacity in kg (NGO only, optional)</label>\n                <input type="number" step="0.5" min="1" name="capacity_kg" placeholder="e.g., 50">\n            </div>\n\n            <button type="submit" class="auth-button">Register</button>\n        </form>\n\n        <div class="auth-footer">\n            Already have an account? <a href="/login">Login</a>\n        </div>\n    </div>\n</div>\n\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&10=27'
\ No newline at end of file
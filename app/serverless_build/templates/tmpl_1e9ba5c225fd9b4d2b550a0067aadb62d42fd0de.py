@@ -0,0 +1,120 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'provider/allocations.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'provider/allocations.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">MAIN MENU</div>\n\n<a href="/provider/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/provider/add-surplus" class="nav-item">\n    <span class="nav-icon">◉</span>\n    <span>Add Surplus</span>\n</a>\n<a href="/provider/events" class="nav-item">\n    <span class="nav-icon">☰</span>\n    <span>My Events</span>\n</a>\n<a href="/provider/allocations" class="nav-item active">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/provider/reviews" class="nav-item">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nFood Allocations\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_allocations = resolve('allocations')
+    l_0_completed_count = resolve('completed_count')
+    l_0_pending_count = resolve('pending_count')
+    l_0_total_meals_served = resolve('total_meals_served')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n\n<div class="card">\n    <div class="section-header">\n        <h3>Active Allocations</h3>\n        <span class="muted">Receiver self-pickup verification</span>\n    </div>\n\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Event</th>\n                <th>NGO</th>\n                <th>Quantity (kg)</th>\n                <th>Distance</th>\n                <th>Status</th>\n                <th>Pickup Time</th>\n                <th>Receiver Code</th>\n                <th class="no-sort">Verify Handover</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+            l_1_url_for = resolve('url_for')
+            l_1_csrf_token = resolve('csrf_token')
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'event_name') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'ngo'), 'full_name') if environment.getattr(l_1_item, 'ngo') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'claimed_kg'))
+            yield ' kg</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km') if (environment.getattr(l_1_item, 'surplus') and (not t_2(environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km')))) else '-'))
+            if (environment.getattr(l_1_item, 'surplus') and (not t_2(environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km')))):
+                pass
+                yield ' km'
+            yield '</td>\n                    <td>\n                        '
+            if (environment.getattr(l_1_item, 'status') == 'completed'):
+                pass
+                yield '\n                            <span class="status completed">Completed</span>\n                        '
+            else:
+                pass
+                yield '\n                            <span class="status pending">On the way</span>\n                        '
+            yield '\n                    </td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'pickup_time'), 'strftime'), '%I:%M %p', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'pickup_time') else '-'))
+            yield '</td>\n                    <td><span class="muted">Ask receiver at pickup</span></td>\n                    <td>\n                        '
+            if (environment.getattr(l_1_item, 'status') != 'completed'):
+                pass
+                yield '\n                            <form method="POST" action="'
+                yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'provider.provider_verify_pickup', allocation_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+                yield '" class="inline-form" style="display:flex; gap:8px; align-items:center;">\n                                <input type="hidden" name="csrf_token" value="'
+                yield escape(context.call((undefined(name='csrf_token') if l_1_csrf_token is missing else l_1_csrf_token), _loop_vars=_loop_vars))
+                yield '">\n                                <input type="text" name="pickup_code" placeholder="Enter receiver 6-digit code" maxlength="6" required style="max-width:180px;">\n                                <button type="submit" class="btn-link">Verify</button>\n                            </form>\n                        '
+            else:
+                pass
+                yield '\n                            <span class="muted">Verified</span>\n                        '
+            yield '\n                    </td>\n                </tr>\n                '
+        l_1_item = l_1_url_for = l_1_csrf_token = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="8">No allocations available.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Allocation Summary</h3>\n        <span class="muted">This month performance</span>\n    </div>\n\n    <div class="stats-grid">\n        <div class="stat-card">\n            <h4>Total Allocations</h4>\n            <p>'
+    yield escape(t_1((undefined(name='allocations') if l_0_allocations is missing else l_0_allocations)))
+    yield '</p>\n        </div>\n\n        <div class="stat-card">\n            <h4>Completed</h4>\n            <p>'
+    yield escape((undefined(name='completed_count') if l_0_completed_count is missing else l_0_completed_count))
+    yield '</p>\n        </div>\n\n        <div class="stat-card">\n            <h4>Pending</h4>\n            <p>'
+    yield escape((undefined(name='pending_count') if l_0_pending_count is missing else l_0_pending_count))
+    yield '</p>\n        </div>\n\n        <div class="stat-card">\n            <h4>Total Meals Served</h4>\n            <p>'
+    yield escape((undefined(name='total_meals_served') if l_0_total_meals_served is missing else l_0_total_meals_served))
+    yield '</p>\n        </div>\n\n        <div class="stat-card">\n            <h4>Average Pickup Time</h4>\n            <p>'
+    yield escape(('Live' if (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations) else '-'))
+    yield '</p>\n        </div>\n    </div>\n</div>\n\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&39=37&61=62&62=65&64=71&65=73&66=75&67=77&69=82&75=89&78=91&79=94&80=96&106=108&111=110&116=112&121=114&126=116'
\ No newline at end of file
@@ -0,0 +1,86 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'dashboard_base.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_realtime_enabled = resolve('realtime_enabled')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Dashboard - KalyanaKonnection</title>\n\n    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/dashboard.css'))
+    yield '">\n</head>\n<body>\n<div class="dashboard-bg"></div>\n\n<div class="dashboard-container">\n\n    <aside class="sidebar">\n        <a href="/" class="sidebar-logo" aria-label="KalyanaKonnection home">KalyanaKonnection</a>\n\n        <nav>\n            '
+    yield from context.blocks['sidebar'][0](context)
+    yield '\n        </nav>\n    </aside>\n\n    <main class="main-content">\n\n        <header class="topbar">\n            <div class="topbar-left">\n                <button type="button" class="menu-toggle" id="menuToggle" aria-label="Toggle navigation" aria-expanded="false">☰</button>\n                <h1 class="page-title">\n                    '
+    yield from context.blocks['page_title'][0](context)
+    yield '\n                </h1>\n            </div>\n\n            <div class="topbar-right">\n                <div class="live-indicator" id="liveIndicator">Live updates on</div>\n                <div class="user-info">\n                    KalyanaKonnection Control Panel\n                </div>\n            </div>\n        </header>\n\n        <section class="content-area">\n            '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n                '
+    if l_1_messages:
+        pass
+        yield '\n                    <div class="alert-stack" aria-live="polite" aria-atomic="true">\n                        '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n                            <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '" role="status">\n                                <span>'
+            yield escape(l_2_message)
+            yield '</span>\n                                <button type="button" class="alert-close" aria-label="Dismiss message">×</button>\n                            </div>\n                        '
+        l_2_category = l_2_message = missing
+        yield '\n                    </div>\n                '
+    yield '\n            '
+    l_1_messages = missing
+    yield '\n            '
+    yield from context.blocks['content'][0](context)
+    yield '\n        </section>\n\n    </main>\n\n</div>\n\n'
+    if (undefined(name='realtime_enabled') if l_0_realtime_enabled is missing else l_0_realtime_enabled):
+        pass
+        yield '\n<script src="https://cdn.socket.io/4.7.5/socket.io.min.js"></script>\n'
+    yield '\n<script>\n    (() => {\n        const sidebar = document.querySelector(\'.sidebar\');\n        const menuToggle = document.getElementById(\'menuToggle\');\n        const liveIndicator = document.getElementById(\'liveIndicator\');\n\n        const updateLiveIndicator = () => {\n            if (!liveIndicator) return;\n            const now = new Date();\n            const text = now.toLocaleTimeString([], { hour: \'2-digit\', minute: \'2-digit\' });\n            liveIndicator.textContent = `Live updates on · ${text}`;\n        };\n\n        updateLiveIndicator();\n\n        if (sidebar && menuToggle) {\n            menuToggle.addEventListener(\'click\', () => {\n                const isOpen = sidebar.classList.toggle(\'is-open\');\n                menuToggle.setAttribute(\'aria-expanded\', isOpen ? \'true\' : \'false\');\n            });\n\n            document.addEventListener(\'click\', (event) => {\n                if (window.innerWidth > 768) return;\n                if (!sidebar.classList.contains(\'is-open\')) return;\n                if (sidebar.contains(event.target) || menuToggle.contains(event.target)) return;\n                sidebar.classList.remove(\'is-open\');\n                menuToggle.setAttribute(\'aria-expanded\', \'false\');\n            });\n\n            window.addEventListener(\'resize\', () => {\n                if (window.innerWidth > 768) {\n                    sidebar.classList.remove(\'is-open\');\n                    menuToggle.setAttribute(\'aria-expanded\', \'false\');\n                }\n            });\n        }\n\n        if (typeof io === \'undefined\') return;\n        const socket = io({ transports: [\'websocket\', \'polling\'] });\n        let refreshTimeout = null;\n\n        socket.on(\'platform_update\', () => {\n            if (refreshTimeout) return;\n            refreshTimeout = setTimeout(() => {\n                updateLiveIndicator();\n                window.location.reload();\n            }, 500);\n        });\n    })();\n\n    (() => {\n        const categoryMap = {\n            success: \'completed\',\n            info: \'active\',\n            warning: \'pending\',\n            error: \'failed\'\n        };\n\n        document.querySelectorAll(\'.alert\').forEach((alert) => {\n            const match = Array.from(alert.classList).find((name) => name.startsWith(\'alert-\'));\n            if (!match) return;\n            const category = match.replace(\'alert-\', \'\').toLowerCase();\n            const mapped = categoryMap[category];\n            if (!mapped) return;\n            alert.classList.add(`alert-${mapped}`);\n        });\n\n        document.querySelectorAll(\'.alert-close\').forEach((button) => {\n            button.addEventListener(\'click\', () => {\n                const alert = button.closest(\'.alert\');\n                if (!alert) return;\n                alert.classList.add(\'is-dismissed\');\n                setTimeout(() => alert.remove(), 220);\n            });\n        });\n\n        const getComparableValue = (text) => {\n            const normalized = (text || \'\').trim();\n            const numeric = parseFloat(normalized.replace(/[^0-9.\\-]/g, \'\'));\n            if (!Number.isNaN(numeric) && /\\d/.test(normalized)) return numeric;\n            const dateValue = Date.parse(normalized);\n            if (!Number.isNaN(dateValue)) return dateValue;\n            return normalized.toLowerCase();\n        };\n\n        const enhanceTable = (table) => {\n            if (table.dataset.enhanced === \'true\') return;\n            const tbody = table.querySelector(\'tbody\');\n            if (!tbody) return;\n\n            const wrapper = document.createElement(\'div\');\n            wrapper.className = \'table-scroll\';\n            table.parentNode.insertBefore(wrapper, table);\n            wrapper.appendChild(table);\n\n            const toolbar = document.createElement(\'div\');\n            toolbar.className = \'table-tools\';\n            toolbar.innerHTML = \'<input type="text" class="table-search" placeholder="Search in table..." aria-label="Search table"><span class="table-meta">Click column headers to sort</span>\';\n            wrapper.parentNode.insertBefore(toolbar, wrapper);\n\n            const searchInput = toolbar.querySelector(\'.table-search\');\n            const headers = Array.from(table.querySelectorAll(\'thead th\'));\n            const dataRows = () => Array.from(tbody.querySelectorAll(\'tr\')).filter((row) => !row.querySelector(\'td[colspan]\'));\n            const emptyRows = () => Array.from(tbody.querySelectorAll(\'tr\')).filter((row) => row.querySelector(\'td[colspan]\'));\n\n            const applyFilter = () => {\n                const query = (searchInput.value || \'\').trim().toLowerCase();\n                let visibleCount = 0;\n\n                dataRows().forEach((row) => {\n                    const text = row.innerText.toLowerCase();\n                    const match = !query || text.includes(query);\n                    row.style.display = match ? \'\' : \'none\';\n                    if (match) visibleCount += 1;\n                });\n\n                emptyRows().forEach((row) => {\n                    const colSpanCell = row.querySelector(\'td[colspan]\');\n                    if (colSpanCell && query) {\n                        colSpanCell.textContent = \'No records match your search.\';\n                    }\n                    row.style.display = visibleCount === 0 ? \'\' : \'none\';\n                });\n            };\n\n            headers.forEach((header, index) => {\n                if (header.classList.contains(\'no-sort\')) return;\n                header.classList.add(\'sortable\');\n                header.setAttribute(\'role\', \'button\');\n                header.setAttribute(\'tabindex\', \'0\');\n\n                const sortTable = () => {\n                    const currentDirection = header.dataset.direction === \'asc\' ? \'desc\' : \'asc\';\n                    headers.forEach((item) => {\n                        item.dataset.direction = \'\';\n                        item.classList.remove(\'sorted-asc\', \'sorted-desc\');\n                    });\n\n                    header.dataset.direction = currentDirection;\n                    header.classList.add(currentDirection === \'asc\' ? \'sorted-asc\' : \'sorted-desc\');\n\n                    const rows = dataRows();\n                    rows.sort((a, b) => {\n                        const aText = (a.children[index]?.innerText || \'\').trim();\n                        const bText = (b.children[index]?.innerText || \'\').trim();\n                        const aValue = getComparableValue(aText);\n                        const bValue = getComparableValue(bText);\n                        if (aValue < bValue) return currentDirection === \'asc\' ? -1 : 1;\n                        if (aValue > bValue) return currentDirection === \'asc\' ? 1 : -1;\n                        return 0;\n                    });\n\n                    rows.forEach((row) => tbody.appendChild(row));\n                    applyFilter();\n                };\n\n                header.addEventListener(\'click\', sortTable);\n                header.addEventListener(\'keydown\', (event) => {\n                    if (event.key === \'Enter\' || event.key === \' \') {\n                        event.preventDefault();\n                        sortTable();\n                    }\n                });\n            });\n\n            searchInput.addEventListener(\'input\', applyFilter);\n            applyFilter();\n            table.dataset.enhanced = \'true\';\n        };\n\n        document.querySelectorAll(\'.data-table\').forEach(enhanceTable);\n\n        document.querySelectorAll(\'.section-header h3\').forEach((heading) => {\n            heading.setAttribute(\'role\', \'heading\');\n            heading.setAttribute(\'aria-level\', \'2\');\n        });\n\n        const normalizeStatusClass = (text) => {\n            const value = (text || \'\').trim().toLowerCase();\n            if ([\'completed\', \'resolved\', \'successful\', \'verified\', \'available\', \'tracked\', \'active\'].includes(value)) return \'completed\';\n            if ([\'pending\', \'requested\', \'allocated\', \'open\', \'in transit\', \'under review\', \'scheduled\'].includes(value)) return \'pending\';\n            if ([\'escalated\', \'failed\', \'rejected\', \'cancelled\', \'invalid\'].includes(value)) return \'failed\';\n            return \'active\';\n        };\n\n        document.querySelectorAll(\'.status\').forEach((element) => {\n            const mappedClass = normalizeStatusClass(element.textContent);\n            element.classList.remove(\'active\', \'completed\', \'escalated\', \'pending\', \'failed\', \'requested\', \'open\', \'allocated\', \'in-transit\', \'cancelled\', \'rejected\');\n            element.classList.add(mappedClass);\n        });\n\n        const clearFieldError = (field) => {\n            field.classList.remove(\'is-invalid\');\n            field.removeAttribute(\'aria-invalid\');\n            const next = field.nextElementSibling;\n            if (next && next.classList.contains(\'field-error\')) {\n                next.remove();\n            }\n        };\n\n        const showFieldError = (field, message) => {\n            clearFieldError(field);\n            field.classList.add(\'is-invalid\');\n            field.setAttribute(\'aria-invalid\', \'true\');\n            const error = document.createElement(\'div\');\n            error.className = \'field-error\';\n            error.textContent = message || \'This field is required.\';\n            field.insertAdjacentElement(\'afterend\', error);\n        };\n\n        document.querySelectorAll(\'form\').forEach((form) => {\n            const fields = Array.from(form.querySelectorAll(\'input, select, textarea\')).filter((field) => {\n                if (field.type === \'hidden\' || field.type === \'submit\' || field.type === \'button\') return false;\n                return field.hasAttribute(\'required\');\n            });\n\n            fields.forEach((field) => {\n                field.addEventListener(\'input\', () => {\n                    if (field.checkValidity()) {\n                        clearFieldError(field);\n                    }\n                });\n            });\n\n            form.addEventListener(\'submit\', (event) => {\n                let hasError = false;\n                fields.forEach((field) => {\n                    if (!field.checkValidity()) {\n                        hasError = true;\n                        const message = field.validationMessage || \'Please fill this field correctly.\';\n                        showFieldError(field, message);\n                    } else {\n                        clearFieldError(field);\n                    }\n                });\n\n                if (hasError) {\n                    event.preventDefault();\n                    return;\n                }\n\n                const submitButton = form.querySelector(\'button[type="submit"], input[type="submit"]\');\n                if (submitButton && !form.classList.contains(\'inline-form\')) {\n                    const originalText = submitButton.tagName === \'BUTTON\' ? submitButton.textContent : submitButton.value;\n                    submitButton.dataset.originalText = originalText;\n                    if (submitButton.tagName === \'BUTTON\') {\n                        submitButton.textContent = \'Processing...\';\n                    } else {\n                        submitButton.value = \'Processing...\';\n                    }\n                    submitButton.disabled = true;\n                    submitButton.classList.add(\'is-loading\');\n                }\n            });\n        });\n    })();\n</script>\n'
+    yield from context.blocks['scripts'][0](context)
+    yield '\n\n</body>\n</html>'
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content, 'scripts': block_scripts}
+debug_info = '9=15&20=17&30=19&44=24&46=27&47=31&48=33&55=40&62=42&322=46&20=49&30=58&55=67&322=76'
\ No newline at end of file
@@ -0,0 +1,166 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'ngo/nearby_surplus.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'ngo/nearby_surplus.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">NGO PANEL</div>\n\n<a href="/ngo/dashboard" class="nav-item">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n<a href="/ngo/nearby-surplus" class="nav-item active">\n\t<span class="nav-icon">◎</span>\n\t<span>Nearby Surplus</span>\n</a>\n<a href="/ngo/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n<a href="/ngo/history" class="nav-item">\n\t<span class="nav-icon">☰</span>\n\t<span>Pickup History</span>\n</a>\n<a href="/ngo/reviews" class="nav-item">\n\t<span class="nav-icon">★</span>\n\t<span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Nearby Surplus'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_url_for = resolve('url_for')
+    l_0_receiver_location = resolve('receiver_location')
+    l_0_radius_km = resolve('radius_km')
+    l_0_resolved_location = resolve('resolved_location')
+    l_0_available_surplus = resolve('available_surplus')
+    try:
+        t_1 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Find Nearby Food</h3>\n\t\t<span class="muted">Search by your pickup location and preferred radius</span>\n\t</div>\n\n\t<div class="filter-panel">\n\t\t<div class="filter-panel-head">\n\t\t\t<span class="muted">Tip: Start with your area name and expand radius if no results appear.</span>\n\t\t\t<a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'ngo.ngo_nearby_surplus', _block_vars=_block_vars))
+    yield '" class="clear-filter">Clear filters</a>\n\t\t</div>\n\t\t<form method="GET" class="admin-toolbar" style="margin-bottom: 0;">\n\t\t\t<div style="flex: 1; min-width: 220px;">\n\t\t\t\t<input type="text" name="receiver_location" id="receiver_location" list="receiver_location_suggestions" value="'
+    yield escape(((undefined(name='receiver_location') if l_0_receiver_location is missing else l_0_receiver_location) or ''))
+    yield '" placeholder="Enter your location (e.g., Nungambakkam)" required>\n\t\t\t\t<div class="form-help">Use a locality/area name for better matching.</div>\n\t\t\t</div>\n\t\t\t<datalist id="receiver_location_suggestions"></datalist>\n\t\t\t<div style="min-width: 140px;">\n\t\t\t\t<input type="number" step="0.5" min="1" name="radius_km" value="'
+    yield escape(((undefined(name='radius_km') if l_0_radius_km is missing else l_0_radius_km) or 8))
+    yield '" placeholder="Radius (km)">\n\t\t\t\t<div class="form-help">Radius in km</div>\n\t\t\t</div>\n\t\t\t<button type="submit" class="auth-button" style="width:auto;">Find Nearby</button>\n\t\t</form>\n\t</div>\n\n\t'
+    if (undefined(name='resolved_location') if l_0_resolved_location is missing else l_0_resolved_location):
+        pass
+        yield '\n\t\t<div class="muted" style="margin-bottom:10px;">Showing matches near: '
+        yield escape(environment.getattr((undefined(name='resolved_location') if l_0_resolved_location is missing else l_0_resolved_location), 'display_name'))
+        yield ' within '
+        yield escape((undefined(name='radius_km') if l_0_radius_km is missing else l_0_radius_km))
+        yield ' km</div>\n\t'
+    yield '\n\n\t<div class="section-header">\n\t\t<h3>Available Batches</h3>\n\t\t<span class="muted">Only matching or nearby locations are shown</span>\n\t</div>\n\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th>Event</th>\n\t\t\t\t<th>Mahal</th>\n\t\t\t\t<th>Provider</th>\n\t\t\t\t<th>Provider Phone</th>\n\t\t\t\t<th>Mahal Location</th>\n\t\t\t\t<th>Food Type</th>\n\t\t\t\t<th class="no-sort">Photo</th>\n\t\t\t\t<th>Quantity</th>\n\t\t\t\t<th>Distance</th>\n\t\t\t\t<th>Estimated Expiry</th>\n\t\t\t\t<th class="no-sort">Request</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if (undefined(name='available_surplus') if l_0_available_surplus is missing else l_0_available_surplus):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in (undefined(name='available_surplus') if l_0_available_surplus is missing else l_0_available_surplus):
+            l_1_photo_url = resolve('photo_url')
+            l_1_csrf_token = resolve('csrf_token')
+            l_1_suggested_claim_kg = resolve('suggested_claim_kg')
+            l_1_capacity_kg = resolve('capacity_kg')
+            l_1_claim_kg = resolve('claim_kg')
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'event_name'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(l_1_item, 'mahal_name') or '-'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'provider_name'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'provider'), 'phone_number') if (environment.getattr(l_1_item, 'provider') and environment.getattr(environment.getattr(l_1_item, 'provider'), 'phone_number')) else '-'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(l_1_item, 'provider_location') or '-'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'food_type'))
+            yield '</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if environment.getattr(l_1_item, 'photo_path'):
+                pass
+                yield '\n\t\t\t\t\t\t\t<a href="'
+                yield escape(context.call((undefined(name='photo_url') if l_1_photo_url is missing else l_1_photo_url), environment.getattr(l_1_item, 'photo_path'), 'medium', _loop_vars=_loop_vars))
+                yield '" target="_blank" rel="noopener">\n\t\t\t\t\t\t\t\t<img src="'
+                yield escape(context.call((undefined(name='photo_url') if l_1_photo_url is missing else l_1_photo_url), environment.getattr(l_1_item, 'photo_path'), 'thumb', _loop_vars=_loop_vars))
+                yield '" alt="Food photo" class="food-thumb" loading="lazy" width="78" height="58">\n\t\t\t\t\t\t\t</a>\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="muted">No photo</span>\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'available_kg'))
+            yield ' kg</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if t_1(environment.getattr(l_1_item, 'computed_distance_km')):
+                pass
+                yield '\n\t\t\t\t\t\t\t'
+                yield escape(environment.getattr(l_1_item, 'computed_distance_km'))
+                yield ' km\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t'
+                yield escape((environment.getattr(l_1_item, 'distance_km') if (not t_2(environment.getattr(l_1_item, 'distance_km'))) else '-'))
+                if (not t_2(environment.getattr(l_1_item, 'distance_km'))):
+                    pass
+                    yield ' km'
+                yield '\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(l_1_item, 'estimated_expiry') or '-'))
+            yield '</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if (environment.getattr(l_1_item, 'photo_path') and (environment.getattr(l_1_item, 'status') == 'available')):
+                pass
+                yield '\n\t\t\t\t\t\t\t<form method="POST" action="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'ngo.ngo_request_food', surplus_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+                yield '" class="inline-form">\n\t\t\t\t\t\t\t\t<input type="hidden" name="csrf_token" value="'
+                yield escape(context.call((undefined(name='csrf_token') if l_1_csrf_token is missing else l_1_csrf_token), _loop_vars=_loop_vars))
+                yield '">\n\t\t\t\t\t\t\t\t'
+                l_1_claim_kg = context.call((undefined(name='suggested_claim_kg') if l_1_suggested_claim_kg is missing else l_1_suggested_claim_kg), environment.getattr(l_1_item, 'available_kg'), (undefined(name='capacity_kg') if l_1_capacity_kg is missing else l_1_capacity_kg), _loop_vars=_loop_vars)
+                _loop_vars['claim_kg'] = l_1_claim_kg
+                yield '\n\t\t\t\t\t\t\t\t<input type="number" step="0.1" min="0.1" max="'
+                yield escape((undefined(name='claim_kg') if l_1_claim_kg is missing else l_1_claim_kg))
+                yield '" name="quantity_kg" value="'
+                yield escape((undefined(name='claim_kg') if l_1_claim_kg is missing else l_1_claim_kg))
+                yield '" style="width:80px;" title="Quantity to collect (kg)">\n\t\t\t\t\t\t\t\t<button type="submit" class="btn-link">Apply for Food</button>\n\t\t\t\t\t\t\t</form>\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="muted">Unavailable</span>\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = l_1_photo_url = l_1_csrf_token = l_1_suggested_claim_kg = l_1_capacity_kg = l_1_claim_kg = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td colspan="11">No matching nearby surplus found. Try increasing radius.</td>\n\t\t\t\t</tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n'
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield "\n<script>\n(() => {\n\tconst input = document.getElementById('receiver_location');\n\tconst list = document.getElementById('receiver_location_suggestions');\n\tif (!input || !list) return;\n\n\tlet timer = null;\n\tinput.addEventListener('input', () => {\n\t\tclearTimeout(timer);\n\t\tconst query = input.value.trim();\n\t\tif (query.length < 3) return;\n\n\t\ttimer = setTimeout(async () => {\n\t\t\tconst response = await fetch(`/location/suggest?q=${encodeURIComponent(query)}`);\n\t\t\tif (!response.ok) return;\n\t\t\tconst data = await response.json();\n\t\t\tlist.innerHTML = '';\n\t\t\t(data.suggestions || []).forEach((label) => {\n\t\t\t\tconst option = document.createElement('option');\n\t\t\t\toption.value = label;\n\t\t\t\tlist.appendChild(option);\n\t\t\t});\n\t\t}, 300);\n\t});\n})();\n</script>\n"
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content, 'scripts': block_scripts}
+debug_info = '1=12&3=17&35=27&37=37&47=63&51=65&56=67&63=69&64=72&89=77&90=80&92=89&93=91&94=93&95=95&96=97&97=99&99=101&100=104&101=106&107=112&109=114&110=117&112=122&115=128&117=130&118=133&119=135&120=137&121=140&140=155'
\ No newline at end of file
@@ -0,0 +1,59 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'verify_otp.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'verify_otp.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Verify OTP'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_masked_email = resolve('masked_email')
+    l_0_csrf_token = resolve('csrf_token')
+    l_0_purpose = resolve('purpose')
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '\n<div class="auth-container">\n    <div class="auth-card">\n        <h2>Email OTP Verification</h2>\n        <p style="margin-top:0; color:#5d6689;">Enter the 6-digit OTP sent to '
+    yield escape((undefined(name='masked_email') if l_0_masked_email is missing else l_0_masked_email))
+    yield '.</p>\n\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <div class="form-group">\n                <label>OTP Code</label>\n                <input type="text" name="otp" inputmode="numeric" pattern="[0-9]{6}" maxlength="6" minlength="6" placeholder="Enter 6-digit OTP" required>\n            </div>\n\n            <button type="submit" class="auth-button">Verify OTP</button>\n        </form>\n\n        <form method="POST" style="margin-top:10px;">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <input type="hidden" name="action" value="resend">\n            <button type="submit" class="auth-button" style="background: linear-gradient(135deg, #6d748f 0%, #565d78 100%);">Resend OTP</button>\n        </form>\n\n        <div class="auth-footer">\n            '
+    if ((undefined(name='purpose') if l_0_purpose is missing else l_0_purpose) == 'register'):
+        pass
+        yield '\n                Need to change details? <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'auth.register', _block_vars=_block_vars))
+        yield '">Back to Register</a>\n            '
+    else:
+        pass
+        yield '\n                Try another email? <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'auth.forgot_password', _block_vars=_block_vars))
+        yield '">Back to Forgot Password</a>\n            '
+    yield '\n        </div>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&9=40&12=42&22=44&28=46&29=49&31=54'
\ No newline at end of file
@@ -0,0 +1,41 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'forgot_password.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'forgot_password.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Forgot Password'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_csrf_token = resolve('csrf_token')
+    pass
+    yield '\n<div class="auth-container">\n    <div class="auth-card">\n        <h2>Forgot Password</h2>\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <div class="form-group">\n                <label>Registered Email</label>\n                <input type="email" name="email" required>\n            </div>\n            <button type="submit" class="auth-button">Continue to Reset</button>\n        </form>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&3=17&5=27&10=37'
\ No newline at end of file
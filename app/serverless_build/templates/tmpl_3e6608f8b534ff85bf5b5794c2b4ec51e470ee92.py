@@ -0,0 +1,110 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/complaints.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/complaints.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n\t<span class="nav-icon">⌘</span>\n\t<span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n\t<span class="nav-icon">◷</span>\n\t<span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item active">\n\t<span class="nav-icon">!</span>\n\t<span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n\t<span class="nav-icon">▦</span>\n\t<span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n\t<span class="nav-icon">◔</span>\n\t<span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Complaints Management'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_complaint_insights = resolve('complaint_insights')
+    l_0_complaints = resolve('complaints')
+    pass
+    yield '\n<div class="stats-grid admin-kpi-grid">\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Total Complaints</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='complaint_insights') if l_0_complaint_insights is missing else l_0_complaint_insights), 'total'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Under Review</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='complaint_insights') if l_0_complaint_insights is missing else l_0_complaint_insights), 'under_review'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Escalated</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='complaint_insights') if l_0_complaint_insights is missing else l_0_complaint_insights), 'escalated'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Resolved</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='complaint_insights') if l_0_complaint_insights is missing else l_0_complaint_insights), 'resolved'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Rejected</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='complaint_insights') if l_0_complaint_insights is missing else l_0_complaint_insights), 'rejected'))
+    yield '</p>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Complaint Resolution Queue</h3>\n\t\t<span class="muted">Update complaint status directly from the admin moderation desk</span>\n\t</div>\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th>ID</th>\n\t\t\t\t<th>Reported By</th>\n\t\t\t\t<th>Against</th>\n\t\t\t\t<th>Issue Type</th>\n\t\t\t\t<th>Description</th>\n\t\t\t\t<th>Status</th>\n\t\t\t\t<th class="no-sort">Update</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if (undefined(name='complaints') if l_0_complaints is missing else l_0_complaints):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in (undefined(name='complaints') if l_0_complaints is missing else l_0_complaints):
+            l_1_status_class = resolve('status_class')
+            l_1_url_for = resolve('url_for')
+            l_1_csrf_token = resolve('csrf_token')
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>#'
+            yield escape(environment.getattr(l_1_item, 'id'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'ngo_user'), 'full_name') if environment.getattr(l_1_item, 'ngo_user') else '-'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'provider_user'), 'full_name') if environment.getattr(l_1_item, 'provider_user') else '-'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'issue_type'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'description'))
+            yield '</td>\n\t\t\t\t\t<td><span class="status '
+            yield escape(context.call((undefined(name='status_class') if l_1_status_class is missing else l_1_status_class), environment.getattr(l_1_item, 'status'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(environment.getattr(l_1_item, 'status'))
+            yield '</span></td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t<form method="POST" action="'
+            yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'admin.admin_update_complaint_status', complaint_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+            yield '" class="inline-form" style="display:flex; gap:8px; align-items:center;">\n\t\t\t\t\t\t\t<input type="hidden" name="csrf_token" value="'
+            yield escape(context.call((undefined(name='csrf_token') if l_1_csrf_token is missing else l_1_csrf_token), _loop_vars=_loop_vars))
+            yield '">\n\t\t\t\t\t\t\t<select name="status" style="min-width: 140px;">\n\t\t\t\t\t\t\t\t<option value="Under Review" '
+            if (environment.getattr(l_1_item, 'status') == 'Under Review'):
+                pass
+                yield 'selected'
+            yield '>Under Review</option>\n\t\t\t\t\t\t\t\t<option value="Escalated" '
+            if (environment.getattr(l_1_item, 'status') == 'Escalated'):
+                pass
+                yield 'selected'
+            yield '>Escalated</option>\n\t\t\t\t\t\t\t\t<option value="Resolved" '
+            if (environment.getattr(l_1_item, 'status') == 'Resolved'):
+                pass
+                yield 'selected'
+            yield '>Resolved</option>\n\t\t\t\t\t\t\t\t<option value="Rejected" '
+            if (environment.getattr(l_1_item, 'status') == 'Rejected'):
+                pass
+                yield 'selected'
+            yield '>Rejected</option>\n\t\t\t\t\t\t\t</select>\n\t\t\t\t\t\t\t<button type="submit" class="btn-link secondary" style="border:none;">Save</button>\n\t\t\t\t\t\t</form>\n\t\t\t\t\t</td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = l_1_status_class = l_1_url_for = l_1_csrf_token = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr><td colspan="7">No complaints raised yet.</td></tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&49=48&53=50&57=52&61=54&65=56&87=58&88=61&90=68&91=70&92=72&93=74&94=76&95=78&97=82&98=84&100=86&101=90&102=94&103=98'
\ No newline at end of file
@@ -0,0 +1,136 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/events.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/events.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n    <span class="nav-icon">⌘</span>\n    <span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item active">\n    <span class="nav-icon">◷</span>\n    <span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n    <span class="nav-icon">!</span>\n    <span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n    <span class="nav-icon">▦</span>\n    <span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n    <span class="nav-icon">◔</span>\n    <span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Events Monitoring'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_event_insights = resolve('event_insights')
+    l_0_events = resolve('events')
+    try:
+        t_1 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['sum']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'sum' found.")
+    pass
+    yield '\n<div class="stats-grid admin-kpi-grid">\n    <div class="stat-card admin-kpi">\n        <h4>Total Events Tracked</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='event_insights') if l_0_event_insights is missing else l_0_event_insights), 'total_events'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Expected Guests</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='event_insights') if l_0_event_insights is missing else l_0_event_insights), 'total_expected_guests'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Events With Surplus</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='event_insights') if l_0_event_insights is missing else l_0_event_insights), 'events_with_surplus'))
+    yield '</p>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Monitored Events Table</h3>\n        <span class="muted">Cross-check event execution and downstream redistribution readiness</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Provider</th>\n                <th>Event Date</th>\n                <th>Guest Count</th>\n                <th>Surplus Generated</th>\n                <th>Forecast</th>\n                <th>Allocated To</th>\n                <th>Status</th>\n                <th class="no-sort">View</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='events') if l_0_events is missing else l_0_events):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='events') if l_0_events is missing else l_0_events):
+            l_1_forecasts = resolve('forecasts')
+            l_1_namespace = resolve('namespace')
+            l_1_allocated = missing
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'provider'), 'full_name') if environment.getattr(l_1_item, 'provider') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'event_date'), 'strftime'), '%d %b %Y', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'event_date') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(l_1_item, 'guest_count') or 0))
+            yield '</td>\n                    <td>'
+            yield escape((t_3(environment, environment.getattr(l_1_item, 'surplus_batches'), attribute='quantity') if environment.getattr(l_1_item, 'surplus_batches') else 0))
+            yield ' kg</td>\n                    <td>'
+            yield escape((t_1('%.1f kg', environment.getitem((undefined(name='forecasts') if l_1_forecasts is missing else l_1_forecasts), environment.getattr(l_1_item, 'id'))) if (environment.getattr(l_1_item, 'id') in (undefined(name='forecasts') if l_1_forecasts is missing else l_1_forecasts)) else '-'))
+            yield '</td>\n                    <td>\n                        '
+            l_1_allocated = context.call((undefined(name='namespace') if l_1_namespace is missing else l_1_namespace), name='Pending', _loop_vars=_loop_vars)
+            _loop_vars['allocated'] = l_1_allocated
+            yield '\n                        '
+            if environment.getattr(l_1_item, 'surplus_batches'):
+                pass
+                yield '\n                            '
+                for l_2_batch in environment.getattr(l_1_item, 'surplus_batches'):
+                    l_2_latest = resolve('latest')
+                    _loop_vars = {}
+                    pass
+                    yield '\n                                '
+                    if environment.getattr(l_2_batch, 'allocations'):
+                        pass
+                        yield '\n                                    '
+                        l_2_latest = environment.getitem(environment.getattr(l_2_batch, 'allocations'), -1)
+                        _loop_vars['latest'] = l_2_latest
+                        yield '\n                                    '
+                        if not isinstance(l_1_allocated, Namespace):
+                            raise TemplateRuntimeError("cannot assign attribute on non-namespace object")
+                        l_1_allocated['name'] = (environment.getattr(environment.getattr((undefined(name='latest') if l_2_latest is missing else l_2_latest), 'ngo'), 'full_name') if environment.getattr((undefined(name='latest') if l_2_latest is missing else l_2_latest), 'ngo') else 'NGO')
+                        yield '\n                                '
+                    yield '\n                            '
+                l_2_batch = l_2_latest = missing
+                yield '\n                        '
+            yield '\n                        '
+            yield escape(environment.getattr((undefined(name='allocated') if l_1_allocated is missing else l_1_allocated), 'name'))
+            yield '\n                    </td>\n                    <td>\n                        '
+            if (environment.getattr(l_1_item, 'surplus_batches') and (t_2(environment.getattr(l_1_item, 'surplus_batches')) > 0)):
+                pass
+                yield '\n                            <span class="status completed">Tracked</span>\n                        '
+            else:
+                pass
+                yield '\n                            <span class="status active">Open</span>\n                        '
+            yield '\n                    </td>\n                    <td><span class="muted">Event #'
+            yield escape(environment.getattr(l_1_item, 'id'))
+            yield '</span></td>\n                </tr>\n                '
+        l_1_item = l_1_forecasts = l_1_namespace = l_1_allocated = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="8">No events found.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&49=66&53=68&57=70&80=72&81=75&83=82&84=84&85=86&86=88&87=90&89=92&90=95&91=98&92=103&93=106&94=111&98=117&101=119&107=126'
\ No newline at end of file
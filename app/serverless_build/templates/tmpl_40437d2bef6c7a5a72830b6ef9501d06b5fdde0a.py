@@ -0,0 +1,138 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/dashboard.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item active">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n    <span class="nav-icon">⌘</span>\n    <span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n    <span class="nav-icon">◷</span>\n    <span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n    <span class="nav-icon">!</span>\n    <span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n    <span class="nav-icon">▦</span>\n    <span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n    <span class="nav-icon">◔</span>\n    <span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nAdmin Dashboard\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_metrics = resolve('metrics')
+    l_0_insights = resolve('insights')
+    l_0_recent_activity = resolve('recent_activity')
+    try:
+        t_1 = environment.filters['title']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'title' found.")
+    pass
+    yield '\n<div class="card admin-hero">\n    <div>\n        <h3>Platform Control Center</h3>\n        <p class="muted">Monitor operations, trust, complaints, and fulfillment health in one place.</p>\n    </div>\n    <div class="button-row">\n        <a href="/admin/users" class="btn-link">Manage Users</a>\n        <a href="/admin/complaints" class="btn-link secondary">Handle Complaints</a>\n        <a href="/admin/analytics" class="btn-link secondary">Deep Analytics</a>\n    </div>\n</div>\n\n<div class="stats-grid admin-kpi-grid">\n    <div class="stat-card admin-kpi">\n        <h4>Total Providers</h4>\n        <p id="kpi-providers">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_providers'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Total NGOs</h4>\n        <p id="kpi-ngos">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_ngos'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Total Events</h4>\n        <p id="kpi-events">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_events'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Total Surplus Generated</h4>\n        <p id="kpi-surplus">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_surplus_kg'))
+    yield ' kg</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Total Allocations</h4>\n        <p id="kpi-allocations">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_allocations'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Active Complaints</h4>\n        <p id="kpi-complaints">'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'active_complaints'))
+    yield '</p>\n    </div>\n</div>\n\n<div class="stats-grid admin-kpi-grid">\n    <div class="stat-card admin-kpi">\n        <h4>Completion Rate</h4>\n        <p id="kpi-completion-rate">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'completion_rate'))
+    yield '%</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Pending Allocations</h4>\n        <p id="kpi-pending">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'pending_allocations'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>High-Risk Batches</h4>\n        <p id="kpi-risk">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'high_risk_batches'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Unallocated Surplus</h4>\n        <p id="kpi-unallocated">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'unallocated_surplus'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Avg Trust Score</h4>\n        <p id="kpi-trust">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'avg_trust_score'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Open Complaints</h4>\n        <p id="kpi-open-complaints">'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'open_complaints'))
+    yield '</p>\n    </div>\n</div>\n\n<div class="two-column-grid admin-grid">\n    <div class="card">\n        <div class="section-header">\n            <h3>Activity Timeline</h3>\n            <span class="muted">Auto-refresh every 10 seconds</span>\n        </div>\n        <div class="admin-timeline">\n            '
+    if (undefined(name='recent_activity') if l_0_recent_activity is missing else l_0_recent_activity):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='recent_activity') if l_0_recent_activity is missing else l_0_recent_activity)[:4]:
+            _loop_vars = {}
+            pass
+            yield '\n                <div class="timeline-item">\n                    <strong>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'timestamp'), 'strftime'), '%H:%M', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'timestamp') else '--:--'))
+            yield '</strong>\n                    <span>'
+            yield escape(environment.getattr(l_1_item, 'module'))
+            yield ' · '
+            yield escape(environment.getattr(l_1_item, 'event'))
+            yield ' · '
+            yield escape(environment.getattr(l_1_item, 'actor'))
+            yield '</span>\n                </div>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <div class="timeline-item">\n                    <strong>--:--</strong>\n                    <span>No activity yet.</span>\n                </div>\n            '
+    yield '\n        </div>\n    </div>\n\n    <div class="card admin-heatmap">\n        <div class="section-header">\n            <h3>System Health</h3>\n            <span class="muted">Live operational quality indicators</span>\n        </div>\n        <div class="insight-grid">\n            <div class="insight-item">\n                <strong>Allocation Throughput</strong>\n                <span>'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'completed_allocations'))
+    yield ' completed / '
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_allocations'))
+    yield ' total</span>\n            </div>\n            <div class="insight-item">\n                <strong>Risk Exposure</strong>\n                <span>'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'high_risk_batches'))
+    yield ' batches need urgent pickup prioritization</span>\n            </div>\n            <div class="insight-item">\n                <strong>Trust Health</strong>\n                <span>Average partner trust score: '
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'avg_trust_score'))
+    yield '</span>\n            </div>\n            <div class="insight-item">\n                <strong>Complaint Pressure</strong>\n                <span>'
+    yield escape(environment.getattr((undefined(name='insights') if l_0_insights is missing else l_0_insights), 'open_complaints'))
+    yield ' active complaints pending closure</span>\n            </div>\n        </div>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Recent Platform Activity</h3>\n        <span class="muted">Operational events feed</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Timestamp</th>\n                <th>Module</th>\n                <th>Event</th>\n                <th>Actor</th>\n                <th>Status</th>\n            </tr>\n        </thead>\n        <tbody id="recent-activity-body">\n            '
+    if (undefined(name='recent_activity') if l_0_recent_activity is missing else l_0_recent_activity):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='recent_activity') if l_0_recent_activity is missing else l_0_recent_activity):
+            l_1_status_class = resolve('status_class')
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'timestamp'), 'strftime'), '%d %b %Y, %I:%M %p', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'timestamp') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'module'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'event'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'actor'))
+            yield '</td>\n                    <td><span class="status '
+            yield escape(context.call((undefined(name='status_class') if l_1_status_class is missing else l_1_status_class), environment.getattr(l_1_item, 'status'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(t_1(environment.getattr(l_1_item, 'status')))
+            yield '</span></td>\n                </tr>\n                '
+        l_1_item = l_1_status_class = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="5">No platform activity available yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n\n<script>\n    setInterval(async () => {\n        try {\n            const response = await fetch(\'/admin/dashboard/live\', { headers: { \'X-Requested-With\': \'XMLHttpRequest\' } });\n            if (!response.ok) return;\n            const data = await response.json();\n\n            document.getElementById(\'kpi-providers\').textContent = data.metrics.total_providers;\n            document.getElementById(\'kpi-ngos\').textContent = data.metrics.total_ngos;\n            document.getElementById(\'kpi-events\').textContent = data.metrics.total_events;\n            document.getElementById(\'kpi-surplus\').textContent = `${data.metrics.total_surplus_kg} kg`;\n            document.getElementById(\'kpi-allocations\').textContent = data.metrics.total_allocations;\n            document.getElementById(\'kpi-complaints\').textContent = data.metrics.active_complaints;\n            document.getElementById(\'kpi-completion-rate\').textContent = `${data.insights.completion_rate}%`;\n            document.getElementById(\'kpi-pending\').textContent = data.insights.pending_allocations;\n            document.getElementById(\'kpi-risk\').textContent = data.insights.high_risk_batches;\n            document.getElementById(\'kpi-unallocated\').textContent = data.insights.unallocated_surplus;\n            document.getElementById(\'kpi-trust\').textContent = data.insights.avg_trust_score;\n            document.getElementById(\'kpi-open-complaints\').textContent = data.insights.open_complaints;\n\n            const tbody = document.getElementById(\'recent-activity-body\');\n            if (!tbody) return;\n\n            const statusClass = (value) => {\n                const key = (value || \'\').toLowerCase();\n                if ([\'completed\', \'resolved\', \'successful\', \'active\'].includes(key)) return \'completed\';\n                if ([\'under review\', \'requested\', \'allocated\', \'open\', \'in transit\'].includes(key)) return \'active\';\n                if ([\'escalated\', \'failed\', \'rejected\'].includes(key)) return \'escalated\';\n                return \'active\';\n            };\n\n            const rows = (data.recent_activity || []).map((item) => {\n                const time = item.timestamp ? new Date(item.timestamp).toLocaleString() : \'-\';\n                const klass = statusClass(item.status);\n                const label = item.status ? `${item.status}` : \'-\';\n                return `<tr>\n                    <td>${time}</td>\n                    <td>${item.module || \'-\'}</td>\n                    <td>${item.event || \'-\'}</td>\n                    <td>${item.actor || \'-\'}</td>\n                    <td><span class="status ${klass}">${label}</span></td>\n                </tr>`;\n            }).join(\'\');\n\n            tbody.innerHTML = rows || \'<tr><td colspan="5">No platform activity available yet.</td></tr>\';\n        } catch (error) {\n            console.warn(\'Live refresh failed\', error);\n        }\n    }, 10000);\n</script>\n\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&47=37&63=55&67=57&71=59&75=61&79=63&83=65&90=67&94=69&98=71&102=73&106=75&110=77&121=79&122=82&124=86&125=88&145=100&149=104&153=106&157=108&179=110&180=113&182=118&183=120&184=122&185=124&186=126'
\ No newline at end of file
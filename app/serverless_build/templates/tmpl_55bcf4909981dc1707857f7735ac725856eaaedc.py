@@ -0,0 +1,119 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'ngo/reviews.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'ngo/reviews.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">NGO PANEL</div>\n\n<a href="/ngo/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/ngo/nearby-surplus" class="nav-item">\n    <span class="nav-icon">◎</span>\n    <span>Nearby Surplus</span>\n</a>\n<a href="/ngo/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/ngo/history" class="nav-item">\n    <span class="nav-icon">☰</span>\n    <span>Pickup History</span>\n</a>\n<a href="/ngo/reviews" class="nav-item active">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Reviews & Complaints'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_csrf_token = resolve('csrf_token')
+    l_0_providers = resolve('providers')
+    l_0_reviews = resolve('reviews')
+    l_0_recent_complaints = resolve('recent_complaints')
+    pass
+    yield '\n<div class="two-column-grid">\n    <div class="card">\n        <div class="section-header">\n            <h3>Submit Review</h3>\n            <span class="muted">Rate the provider experience</span>\n        </div>\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <input type="hidden" name="action_type" value="review">\n            <div class="form-group">\n                <label>Select Provider</label>\n                <select name="provider_id" required>\n                    <option value="">Select Provider</option>\n                    '
+    for l_1_provider in (undefined(name='providers') if l_0_providers is missing else l_0_providers):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_provider, 'id'))
+        yield '">'
+        yield escape(environment.getattr(l_1_provider, 'full_name'))
+        yield '</option>\n                    '
+    l_1_provider = missing
+    yield '\n                </select>\n            </div>\n            <div class="form-group">\n                <label>Rating (1-5)</label>\n                <select name="rating" required>\n                    <option value="5">5</option>\n                    <option value="4">4</option>\n                    <option value="3">3</option>\n                    <option value="2">2</option>\n                    <option value="1">1</option>\n                </select>\n            </div>\n            <div class="form-group">\n                <label>Comment</label>\n                <textarea rows="4" name="comment" placeholder="Share pickup quality and coordination details" required></textarea>\n            </div>\n            <button class="auth-button">Submit Review</button>\n        </form>\n    </div>\n\n    <div class="card">\n        <div class="section-header">\n            <h3>Complaint Submission</h3>\n            <span class="muted">Report major issues</span>\n        </div>\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <input type="hidden" name="action_type" value="complaint">\n            <div class="form-group">\n                <label>Against Provider (optional)</label>\n                <select name="provider_id">\n                    <option value="">Select Provider</option>\n                    '
+    for l_1_provider in (undefined(name='providers') if l_0_providers is missing else l_0_providers):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_provider, 'id'))
+        yield '">'
+        yield escape(environment.getattr(l_1_provider, 'full_name'))
+        yield '</option>\n                    '
+    l_1_provider = missing
+    yield '\n                </select>\n            </div>\n            <div class="form-group">\n                <label>Issue Type</label>\n                <select name="issue_type" required>\n                    <option>Food Quality</option>\n                    <option>Delay</option>\n                    <option>Mismatch Quantity</option>\n                    <option>Packaging</option>\n                </select>\n            </div>\n            <div class="form-group">\n                <label>Details</label>\n                <textarea rows="4" name="description" placeholder="Describe the issue clearly" required></textarea>\n            </div>\n            <button class="auth-button">Submit Complaint</button>\n        </form>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Recent Reviews</h3>\n        <span class="muted">Latest NGO feedback entries</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Provider</th>\n                <th>Rating</th>\n                <th>Comment</th>\n                <th>Date</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='reviews') if l_0_reviews is missing else l_0_reviews):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='reviews') if l_0_reviews is missing else l_0_reviews):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'reviewed_provider'), 'full_name') if environment.getattr(l_1_item, 'reviewed_provider') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(('★' * environment.getattr(l_1_item, 'rating')))
+            yield escape(('☆' * (5 - environment.getattr(l_1_item, 'rating'))))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'comment'))
+            yield '</td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'created_at'), 'strftime'), '%d %b %Y', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'created_at') else '-'))
+            yield '</td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="4">No reviews submitted yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Recent Complaints</h3>\n        <span class="muted">Submitted complaint records</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Issue Type</th>\n                <th>Description</th>\n                <th>Status</th>\n                <th>Date</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='recent_complaints') if l_0_recent_complaints is missing else l_0_recent_complaints):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='recent_complaints') if l_0_recent_complaints is missing else l_0_recent_complaints):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'issue_type'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'description'))
+            yield '</td>\n                    <td><span class="status active">'
+            yield escape(environment.getattr(l_1_item, 'status'))
+            yield '</span></td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'created_at'), 'strftime'), '%d %b %Y', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'created_at') else '-'))
+            yield '</td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="4">No complaints submitted yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&37=37&45=50&51=52&52=56&80=62&86=64&87=68&124=74&125=77&127=81&128=83&129=86&130=88&155=96&156=99&158=103&159=105&160=107&161=109'
\ No newline at end of file
@@ -0,0 +1,95 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'provider/events.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'provider/events.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">MAIN MENU</div>\n\n<a href="/provider/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/provider/add-surplus" class="nav-item">\n    <span class="nav-icon">◉</span>\n    <span>Add Surplus</span>\n</a>\n<a href="/provider/events" class="nav-item active">\n    <span class="nav-icon">☰</span>\n    <span>My Events</span>\n</a>\n<a href="/provider/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/provider/reviews" class="nav-item">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nMy Events\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_events = resolve('events')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_3 = environment.filters['sum']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'sum' found.")
+    pass
+    yield '\n<div class="stats-grid">\n    <div class="stat-card">\n        <h4>Upcoming Events</h4>\n        <p>'
+    yield escape(t_1((undefined(name='events') if l_0_events is missing else l_0_events)))
+    yield '</p>\n    </div>\n    <div class="stat-card">\n        <h4>Events Completed</h4>\n        <p>0</p>\n    </div>\n    <div class="stat-card">\n        <h4>Avg. Guests</h4>\n        <p>'
+    if (undefined(name='events') if l_0_events is missing else l_0_events):
+        pass
+        yield escape(t_2((t_3(environment, (undefined(name='events') if l_0_events is missing else l_0_events), attribute='guest_count') / t_1((undefined(name='events') if l_0_events is missing else l_0_events))), 0))
+    else:
+        pass
+        yield '0'
+    yield '</p>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Upcoming Events</h3>\n        <span class="muted">Manage schedule and readiness</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Event</th>\n                <th>Date</th>\n                <th>Location</th>\n                <th>Status</th>\n                <th>Guests</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='events') if l_0_events is missing else l_0_events):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='events') if l_0_events is missing else l_0_events):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'event_name'))
+            yield '</td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'event_date'), 'strftime'), '%d %b %Y', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'event_date') else '-'))
+            yield '</td>\n                    <td>-</td>\n                    <td><span class="status active">Scheduled</span></td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'guest_count'))
+            yield '</td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="5">No events created yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&39=37&43=65&51=67&71=74&72=77&74=81&75=83&78=85'
\ No newline at end of file
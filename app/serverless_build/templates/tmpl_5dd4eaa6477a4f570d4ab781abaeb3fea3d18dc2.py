@@ -0,0 +1,111 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'provider/add_surplus.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'provider/add_surplus.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">MAIN MENU</div>\n\n<a href="/provider/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/provider/add-surplus" class="nav-item active">\n    <span class="nav-icon">◉</span>\n    <span>Add Surplus</span>\n</a>\n<a href="/provider/events" class="nav-item">\n    <span class="nav-icon">☰</span>\n    <span>My Events</span>\n</a>\n<a href="/provider/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/provider/reviews" class="nav-item">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nAdd Surplus Food\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_csrf_token = resolve('csrf_token')
+    l_0_recent_surplus = resolve('recent_surplus')
+    try:
+        t_1 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n\n<div class="two-column-grid">\n    <div class="card">\n        <div class="section-header">\n            <h3>Submit Surplus Batch</h3>\n            <span class="muted">Fill accurate details for better matching</span>\n        </div>\n        <form method="POST" enctype="multipart/form-data">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <div class="form-group">\n                <label>Event Name</label>\n                <input type="text" name="event_name" placeholder="Wedding - 12 June" required>\n                <div class="form-help">Use a short, recognizable event label.</div>\n            </div>\n\n            <div class="form-group">\n                <label>Provider Name</label>\n                <input type="text" name="provider_name" placeholder="Your organization name">\n            </div>\n\n            <div class="form-group">\n                <label>Mahal Name</label>\n                <input type="text" name="mahal_name" placeholder="e.g., Sri Lakshmi Mahal" required>\n                <div class="form-help">This name is shown to receivers for pickup.</div>\n            </div>\n\n            <div class="form-group">\n                <label>Food Type</label>\n                <input type="text" name="food_type" placeholder="Rice, Curry, Sweets..." required>\n                <div class="form-help">Mention key items to help NGOs prioritize pickup.</div>\n            </div>\n\n            <div class="form-group">\n                <label>Quantity (kg)</label>\n                <input type="number" step="0.1" name="quantity_kg" placeholder="e.g., 120" required>\n            </div>\n\n            <div class="form-group">\n                <label>Distance (km)</label>\n                <input type="number" step="0.1" name="distance_km" placeholder="e.g., 4.2">\n            </div>\n\n            <div class="form-group">\n                <label>Mahal Location</label>\n                <input type="text" name="mahal_location" id="provider_location" list="provider_location_suggestions" placeholder="Type exact area/address of the mahal" required>\n                <datalist id="provider_location_suggestions"></datalist>\n                <div class="form-help">Type at least 3 letters and select a suggested locality.</div>\n            </div>\n\n            <div class="form-group">\n                <label>Estimated Expiry</label>\n                <input type="text" name="estimated_expiry" placeholder="e.g., 3 hours">\n            </div>\n\n            <div class="form-group">\n                <label>Food Photo</label>\n                <input type="file" name="food_photo" accept=".png,.jpg,.jpeg,.webp" required>\n            </div>\n\n            <button class="auth-button">Submit Surplus</button>\n        </form>\n    </div>\n\n    <div class="card">\n        <div class="section-header">\n            <h3>Recent Submissions</h3>\n            <span class="muted">Today and yesterday</span>\n        </div>\n        <table class="data-table compact">\n            <thead>\n                <tr>\n                    <th>Event</th>\n                    <th>Mahal</th>\n                    <th>Qty</th>\n                    <th>Status</th>\n                    <th class="no-sort">Action</th>\n                </tr>\n            </thead>\n            <tbody>\n                '
+    if (undefined(name='recent_surplus') if l_0_recent_surplus is missing else l_0_recent_surplus):
+        pass
+        yield '\n                    '
+        for l_1_item in (undefined(name='recent_surplus') if l_0_recent_surplus is missing else l_0_recent_surplus):
+            l_1_url_for = resolve('url_for')
+            _loop_vars = {}
+            pass
+            yield '\n                    <tr>\n                        <td>'
+            yield escape(environment.getattr(l_1_item, 'event_name'))
+            yield '</td>\n                        <td>'
+            yield escape((environment.getattr(l_1_item, 'mahal_name') or '-'))
+            yield '</td>\n                        <td>'
+            yield escape((environment.getattr(l_1_item, 'quantity') if (not t_1(environment.getattr(l_1_item, 'quantity'))) else environment.getattr(l_1_item, 'quantity_kg')))
+            yield ' kg</td>\n                        <td>\n                            '
+            if (environment.getattr(l_1_item, 'status') == 'available'):
+                pass
+                yield '\n                                <span class="status completed">Available</span>\n                            '
+            elif (environment.getattr(l_1_item, 'status') == 'pending'):
+                pass
+                yield '\n                                <span class="status active">Pending Ready</span>\n                            '
+            else:
+                pass
+                yield '\n                                <span class="status active">'
+                yield escape(environment.getattr(l_1_item, 'status'))
+                yield '</span>\n                            '
+            yield '\n                        </td>\n                        <td>\n                            '
+            if (environment.getattr(l_1_item, 'status') == 'pending'):
+                pass
+                yield '\n                                <form method="POST" action="'
+                yield escape(context.call((undefined(name='url_for') if l_1_url_for is missing else l_1_url_for), 'provider.provider_mark_surplus_ready', surplus_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+                yield '" class="inline-form">\n                                    <input type="hidden" name="csrf_token" value="'
+                yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _loop_vars=_loop_vars))
+                yield '">\n                                    <button type="submit" class="btn-link">Mark Ready</button>\n                                </form>\n                            '
+            else:
+                pass
+                yield '\n                                <span class="muted">-</span>\n                            '
+            yield '\n                        </td>\n                    </tr>\n                    '
+        l_1_item = l_1_url_for = missing
+        yield '\n                '
+    else:
+        pass
+        yield '\n                    <tr>\n                        <td colspan="5">No submissions yet.</td>\n                    </tr>\n                '
+    yield '\n            </tbody>\n        </table>\n    </div>\n</div>\n\n'
+
+def block_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield "\n<script>\n(() => {\n    const input = document.getElementById('provider_location');\n    const list = document.getElementById('provider_location_suggestions');\n    if (!input || !list) return;\n\n    let timer = null;\n    input.addEventListener('input', () => {\n        clearTimeout(timer);\n        const query = input.value.trim();\n        if (query.length < 3) return;\n\n        timer = setTimeout(async () => {\n            const response = await fetch(`/location/suggest?q=${encodeURIComponent(query)}`);\n            if (!response.ok) return;\n            const data = await response.json();\n            list.innerHTML = '';\n            (data.suggestions || []).forEach((label) => {\n                const option = document.createElement('option');\n                option.value = label;\n                list.appendChild(option);\n            });\n        }, 300);\n    });\n})();\n</script>\n"
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content, 'scripts': block_scripts}
+debug_info = '1=12&3=17&35=27&39=37&48=54&119=56&120=59&122=64&123=66&124=68&126=70&128=73&131=79&135=82&136=85&137=87&158=100'
\ No newline at end of file
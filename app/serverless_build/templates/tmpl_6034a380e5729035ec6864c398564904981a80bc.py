@@ -0,0 +1,85 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'provider/dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'provider/dashboard.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">MAIN MENU</div>\n\n<a href="/provider/dashboard" class="nav-item active">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n\n<a href="/provider/add-surplus" class="nav-item">\n\t<span class="nav-icon">◉</span>\n\t<span>Add Surplus</span>\n</a>\n\n\n<a href="/provider/events" class="nav-item">\n\t<span class="nav-icon">☰</span>\n\t<span>My Events</span>\n</a>\n\n<a href="/provider/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n\n<a href="/provider/reviews" class="nav-item">\n\t<span class="nav-icon">★</span>\n\t<span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Provider Dashboard'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_total_events = resolve('total_events')
+    l_0_total_food_donated = resolve('total_food_donated')
+    l_0_active_allocations = resolve('active_allocations')
+    l_0_average_rating = resolve('average_rating')
+    l_0_recent_allocations = resolve('recent_allocations')
+    pass
+    yield '\n<div class="stats-grid">\n\t<div class="stat-card">\n\t\t<h4>Total Events</h4>\n\t\t<p>'
+    yield escape((undefined(name='total_events') if l_0_total_events is missing else l_0_total_events))
+    yield '</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Total Food Donated</h4>\n\t\t<p>'
+    yield escape((undefined(name='total_food_donated') if l_0_total_food_donated is missing else l_0_total_food_donated))
+    yield ' kg</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Active Allocations</h4>\n\t\t<p>'
+    yield escape((undefined(name='active_allocations') if l_0_active_allocations is missing else l_0_active_allocations))
+    yield '</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Average Rating</h4>\n\t\t<p>'
+    yield escape((undefined(name='average_rating') if l_0_average_rating is missing else l_0_average_rating))
+    yield '</p>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Quick Actions</h3>\n\t\t<span class="muted">Most used shortcuts</span>\n\t</div>\n\t<div class="button-row">\n\t\t<a href="/provider/add-surplus" class="btn-link">Add Surplus</a>\n\t\t<a href="/provider/events" class="btn-link secondary">View Events</a>\n\t\t<a href="/provider/allocations" class="btn-link secondary">Track Allocations</a>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Recent Activity</h3>\n\t\t<span class="muted">Latest provider operations</span>\n\t</div>\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th class="no-sort">Action</th>\n\t\t\t\t<th>Reference</th>\n\t\t\t\t<th>Status</th>\n\t\t\t\t<th>Updated</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if (undefined(name='recent_allocations') if l_0_recent_allocations is missing else l_0_recent_allocations):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in (undefined(name='recent_allocations') if l_0_recent_allocations is missing else l_0_recent_allocations):
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>Allocation Update</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'event_name') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if (environment.getattr(l_1_item, 'status') == 'completed'):
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="status completed">Completed</span>\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="status pending">On the way</span>\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t\t<td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'created_at'), 'strftime'), '%d %b %Y, %I:%M %p', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'created_at') else '-'))
+            yield '</td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr><td colspan="4">No recent activity yet.</td></tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&40=27&42=37&46=51&50=53&54=55&58=57&89=59&90=62&93=66&95=68&101=75'
\ No newline at end of file
@@ -0,0 +1,31 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'login.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'login.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_csrf_token = resolve('csrf_token')
+    pass
+    yield '\n\n<div class="auth-container">\n    <div class="auth-card">\n        <h2>Login</h2>\n\n        <form method="POST">\n            <input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n            <div class="form-group">\n                <label>Username or Email</label>\n                <input type="text" name="identifier" required>\n            </div>\n\n            <div class="form-group">\n                <label>Password</label>\n                <input type="password" name="password" required>\n            </div>\n\n            <button type="submit" class="auth-button">Login</button>\n        </form>\n\n        <div class="auth-footer">\n            Don\'t have an account? <a href="/register">Register</a>\n        </div>\n\n        <div class="auth-footer">\n            Forgot password? <a href="/forgot-password">Reset password</a>\n        </div>\n    </div>\n</div>\n\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&10=27'
\ No newline at end of file
@@ -0,0 +1,182 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/analytics.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/analytics.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n\t<span class="nav-icon">⌘</span>\n\t<span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n\t<span class="nav-icon">◷</span>\n\t<span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n\t<span class="nav-icon">!</span>\n\t<span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item active">\n\t<span class="nav-icon">▦</span>\n\t<span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n\t<span class="nav-icon">◔</span>\n\t<span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'System Analytics'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_metrics = resolve('metrics')
+    l_0_analytics = resolve('analytics')
+    l_0_range = resolve('range')
+    l_0_url_for = resolve('url_for')
+    l_0_max_surplus = l_0_max_completed = missing
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['max']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'max' found.")
+    try:
+        t_3 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_4 = environment.filters['title']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'title' found.")
+    pass
+    yield '\n<div class="card admin-hero">\n\t<div>\n\t\t<h3>Advanced Analytics Console</h3>\n\t\t<p class="muted">Track trends, identify bottlenecks, and prioritize interventions with data-backed signals.</p>\n\t</div>\n\t<div class="button-row">\n\t\t<a href="/admin/dashboard" class="btn-link">Back to Dashboard</a>\n\t\t<a href="/admin/allocations" class="btn-link secondary">View Allocations</a>\n\t</div>\n</div>\n\n<div class="stats-grid admin-kpi-grid">\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Total Surplus (kg)</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_surplus_kg'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Allocation Efficiency</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'allocation_efficiency'))
+    yield '%</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Avg Trust Score</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'avg_trust_score'))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Total Allocations</h4>\n\t\t<p>'
+    yield escape(environment.getattr((undefined(name='metrics') if l_0_metrics is missing else l_0_metrics), 'total_allocations'))
+    yield '</p>\n\t</div>\n</div>\n\n<div class="two-column-grid admin-grid">\n\t<div class="card">\n\t\t<div class="section-header">\n\t\t\t<h3>Surplus Trend (Last 6 Months)</h3>\n\t\t\t<span class="muted">Monthly generated surplus</span>\n\t\t</div>\n\t\t<div class="trend-bars">\n\t\t\t'
+    l_0_max_surplus = (t_2(environment, environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_surplus')) if environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_surplus') else 1)
+    _block_vars['max_surplus'] = l_0_max_surplus
+    yield '\n\t\t\t'
+    for l_1_idx in context.call((undefined(name='range') if l_0_range is missing else l_0_range), t_1(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'month_labels')), _block_vars=_block_vars):
+        l_1_value = l_1_width = missing
+        _loop_vars = {}
+        pass
+        yield '\n\t\t\t\t'
+        l_1_value = environment.getitem(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_surplus'), l_1_idx)
+        _loop_vars['value'] = l_1_value
+        yield '\n\t\t\t\t'
+        l_1_width = ((((undefined(name='value') if l_1_value is missing else l_1_value) / (undefined(name='max_surplus') if l_0_max_surplus is missing else l_0_max_surplus)) * 100) if (undefined(name='max_surplus') if l_0_max_surplus is missing else l_0_max_surplus) else 0)
+        _loop_vars['width'] = l_1_width
+        yield '\n\t\t\t\t<div class="bar-row">\n\t\t\t\t\t<span class="bar-label">'
+        yield escape(environment.getitem(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'month_labels'), l_1_idx))
+        yield '</span>\n\t\t\t\t\t<div class="bar-track"><div class="bar-fill" style="width: '
+        yield escape(t_3((undefined(name='width') if l_1_width is missing else l_1_width), 1))
+        yield '%;"></div></div>\n\t\t\t\t\t<span class="bar-value">'
+        yield escape((undefined(name='value') if l_1_value is missing else l_1_value))
+        yield ' kg</span>\n\t\t\t\t</div>\n\t\t\t'
+    l_1_idx = l_1_value = l_1_width = missing
+    yield '\n\t\t</div>\n\t</div>\n\t<div class="card">\n\t\t<div class="section-header">\n\t\t\t<h3>Completed Pickups Trend</h3>\n\t\t\t<span class="muted">Monthly completion count</span>\n\t\t</div>\n\t\t<div class="trend-bars">\n\t\t\t'
+    l_0_max_completed = (t_2(environment, environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_completed_allocations')) if environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_completed_allocations') else 1)
+    _block_vars['max_completed'] = l_0_max_completed
+    yield '\n\t\t\t'
+    for l_1_idx in context.call((undefined(name='range') if l_0_range is missing else l_0_range), t_1(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'month_labels')), _block_vars=_block_vars):
+        l_1_value = l_1_width = missing
+        _loop_vars = {}
+        pass
+        yield '\n\t\t\t\t'
+        l_1_value = environment.getitem(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'monthly_completed_allocations'), l_1_idx)
+        _loop_vars['value'] = l_1_value
+        yield '\n\t\t\t\t'
+        l_1_width = ((((undefined(name='value') if l_1_value is missing else l_1_value) / (undefined(name='max_completed') if l_0_max_completed is missing else l_0_max_completed)) * 100) if (undefined(name='max_completed') if l_0_max_completed is missing else l_0_max_completed) else 0)
+        _loop_vars['width'] = l_1_width
+        yield '\n\t\t\t\t<div class="bar-row">\n\t\t\t\t\t<span class="bar-label">'
+        yield escape(environment.getitem(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'month_labels'), l_1_idx))
+        yield '</span>\n\t\t\t\t\t<div class="bar-track"><div class="bar-fill secondary" style="width: '
+        yield escape(t_3((undefined(name='width') if l_1_width is missing else l_1_width), 1))
+        yield '%;"></div></div>\n\t\t\t\t\t<span class="bar-value">'
+        yield escape((undefined(name='value') if l_1_value is missing else l_1_value))
+        yield '</span>\n\t\t\t\t</div>\n\t\t\t'
+    l_1_idx = l_1_value = l_1_width = missing
+    yield '\n\t\t</div>\n\t</div>\n</div>\n\n<div class="two-column-grid admin-grid">\n\t<div class="card">\n\t\t<div class="section-header">\n\t\t\t<h3>Complaint Status Mix</h3>\n\t\t\t<span class="muted">Current complaint lifecycle distribution</span>\n\t\t</div>\n\t\t<table class="data-table compact">\n\t\t\t<thead>\n\t\t\t\t<tr>\n\t\t\t\t\t<th>Status</th>\n\t\t\t\t\t<th>Count</th>\n\t\t\t\t</tr>\n\t\t\t</thead>\n\t\t\t<tbody>\n\t\t\t\t'
+    if environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'complaint_status'):
+        pass
+        yield '\n\t\t\t\t\t'
+        for (l_1_key, l_1_value) in context.call(environment.getattr(environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'complaint_status'), 'items'), _block_vars=_block_vars):
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t\t<tr>\n\t\t\t\t\t\t<td>'
+            yield escape(t_4(l_1_key))
+            yield '</td>\n\t\t\t\t\t\t<td>'
+            yield escape(l_1_value)
+            yield '</td>\n\t\t\t\t\t</tr>\n\t\t\t\t\t'
+        l_1_key = l_1_value = missing
+        yield '\n\t\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t\t<tr><td colspan="2">No complaint data available.</td></tr>\n\t\t\t\t'
+    yield '\n\t\t\t</tbody>\n\t\t</table>\n\t</div>\n\n\t<div class="card">\n\t\t<div class="section-header">\n\t\t\t<h3>Top NGOs by Completed Pickups</h3>\n\t\t\t<span class="muted">Most effective collection partners</span>\n\t\t</div>\n\t\t<table class="data-table compact">\n\t\t\t<thead>\n\t\t\t\t<tr>\n\t\t\t\t\t<th>NGO</th>\n\t\t\t\t\t<th>Completed Pickups</th>\n\t\t\t\t</tr>\n\t\t\t</thead>\n\t\t\t<tbody>\n\t\t\t\t'
+    if environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'top_ngos'):
+        pass
+        yield '\n\t\t\t\t\t'
+        for l_1_item in environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'top_ngos'):
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t\t<tr>\n\t\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'name'))
+            yield '</td>\n\t\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'completed_pickups'))
+            yield '</td>\n\t\t\t\t\t</tr>\n\t\t\t\t\t'
+        l_1_item = missing
+        yield '\n\t\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t\t<tr><td colspan="2">No completed pickup data available.</td></tr>\n\t\t\t\t'
+    yield '\n\t\t\t</tbody>\n\t\t</table>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Top Providers by Donation Volume</h3>\n\t\t<span class="muted">Total surplus contributed (kg)</span>\n\t</div>\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th>Provider</th>\n\t\t\t\t<th>Donated (kg)</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'top_providers'):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in environment.getattr((undefined(name='analytics') if l_0_analytics is missing else l_0_analytics), 'top_providers'):
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'name'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'donated_kg'))
+            yield '</td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr><td colspan="2">No provider contribution data available.</td></tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Data Export</h3>\n\t\t<span class="muted">Streamed download, including archived history</span>\n\t</div>\n\t<form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.admin_export', _block_vars=_block_vars))
+    yield '" class="inline-form" style="display:flex; gap:8px; align-items:center; flex-wrap:wrap;">\n\t\t<select name="kind">\n\t\t\t<option value="allocations">Allocations</option>\n\t\t\t<option value="surplus">Surplus</option>\n\t\t\t<option value="complaints">Complaints</option>\n\t\t</select>\n\t\t<input type="date" name="from" aria-label="From date">\n\t\t<input type="date" name="to" aria-label="To date">\n\t\t<input type="text" name="status" placeholder="Status, e.g. completed" style="min-width: 180px;">\n\t\t<select name="format">\n\t\t\t<option value="csv">CSV</option>\n\t\t\t<option value="ndjson">NDJSON</option>\n\t\t</select>\n\t\t<label class="muted"><input type="checkbox" name="gzip" value="1"> gzip</label>\n\t\t<button type="submit" class="btn-link" style="border:none;">Download</button>\n\t</form>\n</div>\n\n<div class="card chart-placeholder">\n\t<h3>Strategy Notes</h3>\n\t<p>\n\t\tIf completion efficiency is below 60%, prioritize reducing unallocated surplus and accelerating high-risk batch pickups.\n\t\tIf complaint escalations increase, focus on provider quality audits and NGO handoff SLA enforcement.\n\t</p>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&60=75&64=77&68=79&72=81&83=83&84=86&85=91&86=94&88=97&89=99&90=101&101=105&102=108&103=113&104=116&106=119&107=121&108=123&129=127&130=130&132=134&133=136&156=144&157=147&159=151&160=153&184=161&185=164&187=168&188=170&203=178'
\ No newline at end of file
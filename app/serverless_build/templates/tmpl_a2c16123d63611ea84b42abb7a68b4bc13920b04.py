@@ -0,0 +1,116 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'provider/reviews.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'provider/reviews.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">MAIN MENU</div>\n\n<a href="/provider/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/provider/add-surplus" class="nav-item">\n    <span class="nav-icon">◉</span>\n    <span>Add Surplus</span>\n</a>\n<a href="/provider/events" class="nav-item">\n    <span class="nav-icon">☰</span>\n    <span>My Events</span>\n</a>\n<a href="/provider/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/provider/reviews" class="nav-item active">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nReviews & Feedback\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_avg_rating = resolve('avg_rating')
+    l_0_reviews = resolve('reviews')
+    l_0_complaints = resolve('complaints')
+    l_0_trust_score = resolve('trust_score')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    pass
+    yield '\n\n<div class="stats-grid">\n\n    <div class="stat-card">\n        <h4>Average Rating</h4>\n        <p>'
+    yield escape((undefined(name='avg_rating') if l_0_avg_rating is missing else l_0_avg_rating))
+    yield ' / 5</p>\n    </div>\n\n    <div class="stat-card">\n        <h4>Total Reviews</h4>\n        <p>'
+    yield escape(t_1((undefined(name='reviews') if l_0_reviews is missing else l_0_reviews)))
+    yield '</p>\n    </div>\n\n    <div class="stat-card">\n        <h4>Complaints</h4>\n        <p>'
+    yield escape(t_1((undefined(name='complaints') if l_0_complaints is missing else l_0_complaints)))
+    yield '</p>\n    </div>\n\n    <div class="stat-card">\n        <h4>Trust Score</h4>\n        <p>'
+    yield escape((undefined(name='trust_score') if l_0_trust_score is missing else l_0_trust_score))
+    yield '</p>\n    </div>\n\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Recent Feedback</h3>\n        <span class="muted">Latest NGO comments</span>\n    </div>\n\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>NGO</th>\n                <th>Rating</th>\n                <th>Comment</th>\n                <th>Date</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='reviews') if l_0_reviews is missing else l_0_reviews):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='reviews') if l_0_reviews is missing else l_0_reviews):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'ngo_reviewer'), 'full_name') if environment.getattr(l_1_item, 'ngo_reviewer') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(('★' * environment.getattr(l_1_item, 'rating')))
+            yield escape(('☆' * (5 - environment.getattr(l_1_item, 'rating'))))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'comment'))
+            yield '</td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'created_at'), 'strftime'), '%d %b %Y', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'created_at') else '-'))
+            yield '</td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="4">No reviews yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Reported Issues</h3>\n        <span class="muted">Quality and packaging escalations</span>\n    </div>\n\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>NGO</th>\n                <th>Issue</th>\n                <th>Status</th>\n                <th>Details</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='complaints') if l_0_complaints is missing else l_0_complaints):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='complaints') if l_0_complaints is missing else l_0_complaints):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'ngo_user'), 'full_name') if environment.getattr(l_1_item, 'ngo_user') else environment.getattr(l_1_item, 'ngo_id')))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'issue_type'))
+            yield '</td>\n                    <td>\n                        '
+            if (environment.getattr(l_1_item, 'status') == 'Resolved'):
+                pass
+                yield '\n                            <span class="status completed">Resolved</span>\n                        '
+            else:
+                pass
+                yield '\n                            <span class="status active">'
+                yield escape(environment.getattr(l_1_item, 'status'))
+                yield '</span>\n                        '
+            yield '\n                    </td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'description'))
+            yield '</td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="4">No issues reported.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&39=37&45=56&50=58&55=60&60=62&81=64&82=67&84=71&85=73&86=76&87=78&113=86&114=89&116=93&117=95&119=97&122=103&125=106'
\ No newline at end of file
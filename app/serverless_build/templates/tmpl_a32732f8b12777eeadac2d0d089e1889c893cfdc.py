@@ -0,0 +1,105 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'ngo/dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'ngo/dashboard.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">NGO PANEL</div>\n\n<a href="/ngo/dashboard" class="nav-item active">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n<a href="/ngo/nearby-surplus" class="nav-item">\n\t<span class="nav-icon">◎</span>\n\t<span>Nearby Surplus</span>\n</a>\n<a href="/ngo/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n<a href="/ngo/history" class="nav-item">\n\t<span class="nav-icon">☰</span>\n\t<span>Pickup History</span>\n</a>\n<a href="/ngo/reviews" class="nav-item">\n\t<span class="nav-icon">★</span>\n\t<span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'NGO Dashboard'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_available_surplus_count = resolve('available_surplus_count')
+    l_0_active_pickups_count = resolve('active_pickups_count')
+    l_0_completed_pickups_count = resolve('completed_pickups_count')
+    l_0_trust_score = resolve('trust_score')
+    l_0_url_for = resolve('url_for')
+    l_0_csrf_token = resolve('csrf_token')
+    l_0_capacity_kg = resolve('capacity_kg')
+    l_0_recent_surplus = resolve('recent_surplus')
+    try:
+        t_1 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="stats-grid">\n\t<div class="stat-card">\n\t\t<h4>Available Surplus Nearby</h4>\n\t\t<p>'
+    yield escape((undefined(name='available_surplus_count') if l_0_available_surplus_count is missing else l_0_available_surplus_count))
+    yield '</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Active Pickups</h4>\n\t\t<p>'
+    yield escape((undefined(name='active_pickups_count') if l_0_active_pickups_count is missing else l_0_active_pickups_count))
+    yield '</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Completed Pickups</h4>\n\t\t<p>'
+    yield escape((undefined(name='completed_pickups_count') if l_0_completed_pickups_count is missing else l_0_completed_pickups_count))
+    yield '</p>\n\t</div>\n\t<div class="stat-card">\n\t\t<h4>Trust Score</h4>\n\t\t<p>'
+    yield escape((undefined(name='trust_score') if l_0_trust_score is missing else l_0_trust_score))
+    yield '</p>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Pickup Capacity</h3>\n\t\t<span class="muted">Large batches are shared between NGOs up to each one\'s capacity</span>\n\t</div>\n\t<form method="POST" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'ngo.ngo_update_capacity', _block_vars=_block_vars))
+    yield '" class="admin-toolbar" style="margin-bottom: 0;">\n\t\t<input type="hidden" name="csrf_token" value="'
+    yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+    yield '">\n\t\t<div style="min-width: 200px;">\n\t\t\t<input type="number" step="0.5" min="1" name="capacity_kg" value="'
+    yield escape(((undefined(name='capacity_kg') if l_0_capacity_kg is missing else l_0_capacity_kg) if (not t_1((undefined(name='capacity_kg') if l_0_capacity_kg is missing else l_0_capacity_kg))) else ''))
+    yield '" placeholder="Vehicle / storage capacity (kg)">\n\t\t\t<div class="form-help">Leave empty for no limit</div>\n\t\t</div>\n\t\t<button type="submit" class="auth-button" style="width:auto;">Save Capacity</button>\n\t</form>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>Recently Available Surplus</h3>\n\t\t<span class="muted">Fast pickup opportunities</span>\n\t</div>\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th>Event Name</th>\n\t\t\t\t<th>Quantity</th>\n\t\t\t\t<th>Distance</th>\n\t\t\t\t<th>Spoilage Risk</th>\n\t\t\t\t<th class="no-sort">Action</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if (undefined(name='recent_surplus') if l_0_recent_surplus is missing else l_0_recent_surplus):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in (undefined(name='recent_surplus') if l_0_recent_surplus is missing else l_0_recent_surplus):
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'event_name'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'available_kg'))
+            yield ' kg</td>\n\t\t\t\t\t<td>'
+            yield escape((environment.getattr(l_1_item, 'distance_km') if (not t_1(environment.getattr(l_1_item, 'distance_km'))) else '-'))
+            if (not t_1(environment.getattr(l_1_item, 'distance_km'))):
+                pass
+                yield ' km'
+            yield '</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if (environment.getattr(l_1_item, 'estimated_expiry') and ('1' in environment.getattr(l_1_item, 'estimated_expiry'))):
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="status active">High</span>\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="status completed">Low</span>\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t\t<td><a href="/ngo/nearby-surplus" class="btn-link">Request Pickup</a></td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr><td colspan="5">No available surplus right now.</td></tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&37=37&41=60&45=62&49=64&53=66&62=68&63=70&65=72&88=74&89=77&91=81&92=83&93=85&95=90'
\ No newline at end of file
@@ -0,0 +1,114 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/allocations.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/allocations.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n    <span class="nav-icon">⌘</span>\n    <span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n    <span class="nav-icon">◷</span>\n    <span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item active">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n    <span class="nav-icon">!</span>\n    <span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n    <span class="nav-icon">▦</span>\n    <span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n    <span class="nav-icon">◔</span>\n    <span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Allocation Oversight'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_allocation_insights = resolve('allocation_insights')
+    l_0_allocations = resolve('allocations')
+    try:
+        t_1 = environment.filters['title']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'title' found.")
+    try:
+        t_2 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n<div class="stats-grid admin-kpi-grid">\n    <div class="stat-card admin-kpi">\n        <h4>Total Allocations</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='allocation_insights') if l_0_allocation_insights is missing else l_0_allocation_insights), 'total'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Completed</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='allocation_insights') if l_0_allocation_insights is missing else l_0_allocation_insights), 'completed'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Requested</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='allocation_insights') if l_0_allocation_insights is missing else l_0_allocation_insights), 'requested'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Allocated</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='allocation_insights') if l_0_allocation_insights is missing else l_0_allocation_insights), 'allocated'))
+    yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>In Transit</h4>\n        <p>'
+    yield escape(environment.getattr((undefined(name='allocation_insights') if l_0_allocation_insights is missing else l_0_allocation_insights), 'in_transit'))
+    yield '</p>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Allocation Risk & Fulfillment Monitor</h3>\n        <span class="muted">Identify stalled requests, risky pickups, and completion performance</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Event</th>\n                <th>Provider</th>\n                <th>NGO</th>\n                <th>Quantity</th>\n                <th>Distance</th>\n                <th>Status</th>\n                <th>Spoilage Risk</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+            l_1_status_class = resolve('status_class')
+            _loop_vars = {}
+            pass
+            yield '\n                <tr class="'
+            if ((environment.getattr(l_1_item, 'surplus') and environment.getattr(environment.getattr(l_1_item, 'surplus'), 'estimated_expiry')) and ('1' in environment.getattr(environment.getattr(l_1_item, 'surplus'), 'estimated_expiry'))):
+                pass
+                yield 'risk-high'
+            yield '">\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'event_name') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'allocation_provider'), 'full_name') if environment.getattr(l_1_item, 'allocation_provider') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'ngo'), 'full_name') if environment.getattr(l_1_item, 'ngo') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'claimed_kg'))
+            yield ' kg</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km') if (environment.getattr(l_1_item, 'surplus') and (not t_2(environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km')))) else '-'))
+            if (environment.getattr(l_1_item, 'surplus') and (not t_2(environment.getattr(environment.getattr(l_1_item, 'surplus'), 'distance_km')))):
+                pass
+                yield ' km'
+            yield '</td>\n                    <td><span class="status '
+            yield escape(context.call((undefined(name='status_class') if l_1_status_class is missing else l_1_status_class), environment.getattr(l_1_item, 'status'), _loop_vars=_loop_vars))
+            yield '">'
+            yield escape(t_1(environment.getattr(l_1_item, 'status')))
+            yield '</span></td>\n                    <td>\n                        '
+            if ((environment.getattr(l_1_item, 'surplus') and environment.getattr(environment.getattr(l_1_item, 'surplus'), 'estimated_expiry')) and ('1' in environment.getattr(environment.getattr(l_1_item, 'surplus'), 'estimated_expiry'))):
+                pass
+                yield '\n                            High\n                        '
+            else:
+                pass
+                yield '\n                            Low\n                        '
+            yield '\n                    </td>\n                </tr>\n                '
+        l_1_item = l_1_status_class = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="7">No allocations available.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&49=60&53=62&57=64&61=66&65=68&87=70&88=73&89=78&90=82&91=84&92=86&93=88&94=90&95=95&97=99'
\ No newline at end of file
@@ -0,0 +1,216 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/profiling.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/profiling.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item">\n    <span class="nav-icon">⌘</span>\n    <span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n    <span class="nav-icon">◷</span>\n    <span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n    <span class="nav-icon">!</span>\n    <span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n    <span class="nav-icon">▦</span>\n    <span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item active">\n    <span class="nav-icon">◔</span>\n    <span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Request Profiling'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_profile = resolve('profile')
+    l_0_url_for = resolve('url_for')
+    l_0_csrf_token = resolve('csrf_token')
+    try:
+        t_1 = environment.filters['int']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'int' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['round']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'round' found.")
+    try:
+        t_4 = environment.filters['truncate']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'truncate' found.")
+    pass
+    yield '\n\n'
+    if (not environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'enabled')):
+        pass
+        yield '\n<div class="card">\n    <div class="section-header">\n        <h3>Profiling is off</h3>\n    </div>\n    <p class="muted">Set <code>PROFILING_ENABLED=true</code> and restart to record per-endpoint timings, SQL counts and slow requests. When off, no hooks are installed.</p>\n</div>\n'
+    else:
+        pass
+        yield '\n<div class="stats-grid admin-kpi-grid">\n    <div class="stat-card admin-kpi">\n        <h4>Recording Since</h4>\n        <p>'
+        yield escape((context.call(environment.getattr(environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'since'), 'strftime'), '%d %b %H:%M', _block_vars=_block_vars) if environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'since') else '-'))
+        yield ' UTC</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Endpoints Seen</h4>\n        <p>'
+        yield escape(t_2(environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'endpoints')))
+        yield '</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Slow Request Threshold</h4>\n        <p>'
+        yield escape(t_1(t_3(environment.getattr(environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'settings'), 'slow_request_ms'))))
+        yield ' ms</p>\n    </div>\n    <div class="stat-card admin-kpi">\n        <h4>Slow Query Threshold</h4>\n        <p>'
+        yield escape(t_1(t_3(environment.getattr(environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'settings'), 'slow_query_ms'))))
+        yield ' ms</p>\n    </div>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Endpoints</h3>\n        <form method="POST" action="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.admin_profiling_reset', _block_vars=_block_vars))
+        yield '" class="inline-form">\n            <input type="hidden" name="csrf_token" value="'
+        yield escape(context.call((undefined(name='csrf_token') if l_0_csrf_token is missing else l_0_csrf_token), _block_vars=_block_vars))
+        yield '">\n            <button type="submit" class="btn-link secondary" style="border:none;">Reset counters</button>\n        </form>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Endpoint</th>\n                <th>Requests</th>\n                <th>Total ms</th>\n                <th>Avg ms</th>\n                <th>Max ms</th>\n                <th>Avg SQL</th>\n                <th>Avg DB ms</th>\n                <th>Avg HTTP ms</th>\n                <th>Avg Template ms</th>\n                <th>Slow</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+        t_5 = 1
+        for l_1_row in environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'endpoints'):
+            _loop_vars = {}
+            pass
+            yield '\n            <tr>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'endpoint'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'count'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'total_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'avg_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'max_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'avg_sql'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'avg_db_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'avg_http_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'avg_template_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_row, 'slow'))
+            yield '</td>\n            </tr>\n            '
+            t_5 = 0
+        l_1_row = missing
+        if t_5:
+            pass
+            yield '\n            <tr><td colspan="10">No requests recorded yet.</td></tr>\n            '
+        yield '\n        </tbody>\n    </table>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Slow Requests</h3>\n        <span class="muted">Newest first; query values are redacted</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Time (UTC)</th>\n                <th>Request</th>\n                <th>Status</th>\n                <th>Wall ms</th>\n                <th>SQL</th>\n                <th>DB ms</th>\n                <th>HTTP ms</th>\n                <th>Template ms</th>\n                <th>Slowest Statements</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+        l_1_loop = missing
+        t_6 = 1
+        for l_1_item, l_1_loop in LoopContext(environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'slow_requests'), undefined):
+            _loop_vars = {}
+            pass
+            yield '\n            <tr>\n                <td>'
+            yield escape(context.call(environment.getattr(environment.getattr(l_1_item, 'at'), 'strftime'), '%d %b %H:%M:%S', _loop_vars=_loop_vars))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'method'))
+            yield ' '
+            yield escape(environment.getattr(l_1_item, 'path'))
+            if environment.getattr(l_1_item, 'args'):
+                pass
+                yield '?'
+                l_2_loop = missing
+                for (l_2_key, l_2_value), l_2_loop in LoopContext(context.call(environment.getattr(environment.getattr(l_1_item, 'args'), 'items'), _loop_vars=_loop_vars), undefined):
+                    _loop_vars = {}
+                    pass
+                    yield escape(l_2_key)
+                    yield '='
+                    yield escape(l_2_value)
+                    if (not environment.getattr(l_2_loop, 'last')):
+                        pass
+                        yield '&amp;'
+                l_2_loop = l_2_key = l_2_value = missing
+            yield '<br><span class="muted">'
+            yield escape(environment.getattr(l_1_item, 'endpoint'))
+            yield '</span></td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'status'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'wall_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'sql_count'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'db_ms'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'http_ms'))
+            for (l_2_service, l_2_calls) in context.call(environment.getattr(environment.getattr(l_1_item, 'http_calls'), 'items'), _loop_vars=_loop_vars):
+                _loop_vars = {}
+                pass
+                yield '<br><span class="muted">'
+                yield escape(l_2_service)
+                yield ' &times;'
+                yield escape(l_2_calls)
+                yield '</span>'
+            l_2_service = l_2_calls = missing
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'template_ms'))
+            yield '</td>\n                <td>\n                    '
+            t_7 = 1
+            for l_2_statement in environment.getattr(l_1_item, 'slow_statements'):
+                _loop_vars = {}
+                pass
+                yield '\n                    <div><strong>'
+                yield escape(environment.getattr(l_2_statement, 'duration_ms'))
+                yield ' ms</strong> <code>'
+                yield escape(t_4(environment, environment.getattr(l_2_statement, 'statement'), 160))
+                yield '</code></div>\n                    '
+                t_7 = 0
+            l_2_statement = missing
+            if t_7:
+                pass
+                yield '\n                    -\n                    '
+            yield '\n                </td>\n            </tr>\n            '
+            t_6 = 0
+        l_1_loop = l_1_item = missing
+        if t_6:
+            pass
+            yield '\n            <tr><td colspan="9">No slow requests recorded.</td></tr>\n            '
+        yield '\n        </tbody>\n    </table>\n</div>\n\n<div class="card">\n    <div class="section-header">\n        <h3>Slow Queries</h3>\n        <span class="muted">Statements over the threshold; bound parameters are never stored</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Time (UTC)</th>\n                <th>Endpoint</th>\n                <th>Duration ms</th>\n                <th>Statement</th>\n                <th>Parameters</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+        t_8 = 1
+        for l_1_item in environment.getattr((undefined(name='profile') if l_0_profile is missing else l_0_profile), 'slow_queries'):
+            _loop_vars = {}
+            pass
+            yield '\n            <tr>\n                <td>'
+            yield escape(context.call(environment.getattr(environment.getattr(l_1_item, 'at'), 'strftime'), '%d %b %H:%M:%S', _loop_vars=_loop_vars))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'endpoint'))
+            yield '</td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'duration_ms'))
+            yield '</td>\n                <td><code>'
+            yield escape(environment.getattr(l_1_item, 'statement'))
+            yield '</code></td>\n                <td>'
+            yield escape(environment.getattr(l_1_item, 'parameters'))
+            yield '</td>\n            </tr>\n            '
+            t_8 = 0
+        l_1_item = missing
+        if t_8:
+            pass
+            yield '\n            <tr><td colspan="5">No slow queries recorded.</td></tr>\n            '
+        yield '\n        </tbody>\n    </table>\n</div>\n'
+    yield '\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&47=73&58=79&62=81&66=83&70=85&77=87&78=89&98=92&100=96&101=98&102=100&103=102&104=104&105=106&106=108&107=110&108=112&109=114&138=124&140=128&141=130&142=150&143=152&144=154&145=156&146=158&147=169&149=172&150=176&179=193&181=197&182=199&183=201&184=203&185=205'
\ No newline at end of file
@@ -0,0 +1,85 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'ngo/allocations.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'ngo/allocations.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">NGO PANEL</div>\n\n<a href="/ngo/dashboard" class="nav-item">\n    <span class="nav-icon">◻</span>\n    <span>Dashboard</span>\n</a>\n<a href="/ngo/nearby-surplus" class="nav-item">\n    <span class="nav-icon">◎</span>\n    <span>Nearby Surplus</span>\n</a>\n<a href="/ngo/allocations" class="nav-item active">\n    <span class="nav-icon">⇄</span>\n    <span>Allocations</span>\n</a>\n<a href="/ngo/history" class="nav-item">\n    <span class="nav-icon">☰</span>\n    <span>Pickup History</span>\n</a>\n<a href="/ngo/reviews" class="nav-item">\n    <span class="nav-icon">★</span>\n    <span>Reviews</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n    <span class="nav-icon">↩</span>\n    <span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Active Allocations'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_allocations = resolve('allocations')
+    pass
+    yield '\n<div class="card">\n    <div class="section-header">\n        <h3>Active Pickup Allocations</h3>\n        <span class="muted">Come in person and provide this code to lender</span>\n    </div>\n    <table class="data-table">\n        <thead>\n            <tr>\n                <th>Event</th>\n                <th>Mahal</th>\n                <th>Provider</th>\n                <th>Provider Phone</th>\n                <th>Mahal Location</th>\n                <th>Quantity</th>\n                <th>Pickup Time</th>\n                <th>Your Pickup Code</th>\n                <th>Status</th>\n            </tr>\n        </thead>\n        <tbody>\n            '
+    if (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+        pass
+        yield '\n                '
+        for l_1_item in (undefined(name='allocations') if l_0_allocations is missing else l_0_allocations):
+            _loop_vars = {}
+            pass
+            yield '\n                <tr>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'event_name') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'mahal_name') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'allocation_provider'), 'full_name') if environment.getattr(l_1_item, 'allocation_provider') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'allocation_provider'), 'phone_number') if (environment.getattr(l_1_item, 'allocation_provider') and environment.getattr(environment.getattr(l_1_item, 'allocation_provider'), 'phone_number')) else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(environment.getattr(l_1_item, 'surplus'), 'provider_location') if environment.getattr(l_1_item, 'surplus') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape(environment.getattr(l_1_item, 'claimed_kg'))
+            yield ' kg</td>\n                    <td>'
+            yield escape((context.call(environment.getattr(environment.getattr(l_1_item, 'pickup_time'), 'strftime'), '%I:%M %p', _loop_vars=_loop_vars) if environment.getattr(l_1_item, 'pickup_time') else '-'))
+            yield '</td>\n                    <td>'
+            yield escape((environment.getattr(l_1_item, 'otp_code') or '-'))
+            yield '</td>\n                    <td>\n                        '
+            if (environment.getattr(l_1_item, 'status') == 'completed'):
+                pass
+                yield '\n                            <span class="status completed">Received</span>\n                        '
+            else:
+                pass
+                yield '\n                            <span class="status pending">On the way</span>\n                        '
+            yield '\n                    </td>\n                </tr>\n                '
+        l_1_item = missing
+        yield '\n            '
+    else:
+        pass
+        yield '\n                <tr><td colspan="9">No allocations yet.</td></tr>\n            '
+    yield '\n        </tbody>\n    </table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&35=27&37=37&58=47&59=50&61=54&62=56&63=58&64=60&65=62&66=64&67=66&68=68&70=70'
\ No newline at end of file
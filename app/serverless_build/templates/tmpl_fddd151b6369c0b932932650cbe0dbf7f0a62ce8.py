@@ -0,0 +1,60 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'base.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>'
+    yield from context.blocks['title'][0](context)
+    yield '</title>\n\n    <!-- Google Font -->\n    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">\n\n    <link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='css/style.css'))
+    yield '">\n</head>\n<body>\n    <div class="bg-orb orb-1"></div>\n    <div class="bg-orb orb-2"></div>\n\n    <nav class="navbar glass">\n        <div class="nav-inner">\n            <a class="logo" href="/">KalyanaKonnection</a>\n            <div class="nav-links">\n                <a href="/">Home</a>\n                <a href="/login">Login</a>\n                <a class="nav-cta" href="/register">Register</a>\n            </div>\n        </div>\n    </nav>\n\n    <main class="page-shell">\n        <div class="container">\n            '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n                '
+    if l_1_messages:
+        pass
+        yield '\n                    <div class="flash-wrap">\n                        '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n                            <div class="flash-message flash-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n                        '
+        l_2_category = l_2_message = missing
+        yield '\n                    </div>\n                '
+    yield '\n            '
+    l_1_messages = missing
+    yield '\n\n            '
+    yield from context.blocks['content'][0](context)
+    yield '\n        </div>\n    </main>\n\n</body>\n</html>'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'KalyanaKonnection'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '6=14&11=16&31=21&33=24&34=28&40=37&6=40&40=50'
\ No newline at end of file
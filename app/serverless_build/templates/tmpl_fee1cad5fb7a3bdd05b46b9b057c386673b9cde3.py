@@ -0,0 +1,138 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/users.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('dashboard_base.html', 'admin/users.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_sidebar(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="sidebar-section-title">ADMIN CONTROL</div>\n\n<a href="/admin/dashboard" class="nav-item">\n\t<span class="nav-icon">◻</span>\n\t<span>Dashboard</span>\n</a>\n<a href="/admin/users" class="nav-item active">\n\t<span class="nav-icon">⌘</span>\n\t<span>Users</span>\n</a>\n<a href="/admin/events" class="nav-item">\n\t<span class="nav-icon">◷</span>\n\t<span>Events</span>\n</a>\n<a href="/admin/allocations" class="nav-item">\n\t<span class="nav-icon">⇄</span>\n\t<span>Allocations</span>\n</a>\n<a href="/admin/complaints" class="nav-item">\n\t<span class="nav-icon">!</span>\n\t<span>Complaints</span>\n</a>\n<a href="/admin/analytics" class="nav-item">\n\t<span class="nav-icon">▦</span>\n\t<span>Analytics</span>\n</a>\n<a href="/admin/profiling" class="nav-item">\n\t<span class="nav-icon">◔</span>\n\t<span>Profiling</span>\n</a>\n\n<div class="sidebar-divider"></div>\n\n<a href="/logout" class="nav-item logout-item">\n\t<span class="nav-icon">↩</span>\n\t<span>Logout</span>\n</a>\n'
+
+def block_page_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'User Management'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_users_count = resolve('users_count')
+    l_0_role_summary = resolve('role_summary')
+    l_0_url_for = resolve('url_for')
+    l_0_search = resolve('search')
+    l_0_role = resolve('role')
+    l_0_users = resolve('users')
+    try:
+        t_1 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    try:
+        t_2 = environment.filters['title']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'title' found.")
+    pass
+    yield '\n<div class="stats-grid admin-kpi-grid">\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Total Listed Users</h4>\n\t\t<p>'
+    yield escape((undefined(name='users_count') if l_0_users_count is missing else l_0_users_count))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Providers</h4>\n\t\t<p>'
+    yield escape(context.call(environment.getattr((undefined(name='role_summary') if l_0_role_summary is missing else l_0_role_summary), 'get'), 'provider', 0, _block_vars=_block_vars))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>NGOs</h4>\n\t\t<p>'
+    yield escape(context.call(environment.getattr((undefined(name='role_summary') if l_0_role_summary is missing else l_0_role_summary), 'get'), 'ngo', 0, _block_vars=_block_vars))
+    yield '</p>\n\t</div>\n\t<div class="stat-card admin-kpi">\n\t\t<h4>Admins</h4>\n\t\t<p>'
+    yield escape(context.call(environment.getattr((undefined(name='role_summary') if l_0_role_summary is missing else l_0_role_summary), 'get'), 'admin', 0, _block_vars=_block_vars))
+    yield '</p>\n\t</div>\n</div>\n\n<div class="card">\n\t<div class="section-header">\n\t\t<h3>User Control Workspace</h3>\n\t\t<span class="muted">Search, segment, and moderate platform accounts</span>\n\t</div>\n\n\t<div class="filter-panel">\n\t\t<div class="filter-panel-head">\n\t\t\t<span class="muted">Use role and search filters to quickly locate target accounts.</span>\n\t\t\t<a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.admin_users', _block_vars=_block_vars))
+    yield '" class="clear-filter">Reset filters</a>\n\t\t</div>\n\t\t<form method="GET" class="admin-toolbar" style="width:100%; margin-bottom:0;">\n\t\t\t<input type="text" name="search" value="'
+    yield escape((undefined(name='search') if l_0_search is missing else l_0_search))
+    yield '" placeholder="Search by name or email">\n\t\t\t<select name="role">\n\t\t\t\t<option value="" '
+    if (not (undefined(name='role') if l_0_role is missing else l_0_role)):
+        pass
+        yield 'selected'
+    yield '>All Roles</option>\n\t\t\t\t<option value="provider" '
+    if ((undefined(name='role') if l_0_role is missing else l_0_role) == 'provider'):
+        pass
+        yield 'selected'
+    yield '>Provider</option>\n\t\t\t\t<option value="ngo" '
+    if ((undefined(name='role') if l_0_role is missing else l_0_role) == 'ngo'):
+        pass
+        yield 'selected'
+    yield '>NGO</option>\n\t\t\t\t<option value="admin" '
+    if ((undefined(name='role') if l_0_role is missing else l_0_role) == 'admin'):
+        pass
+        yield 'selected'
+    yield '>Admin</option>\n\t\t\t</select>\n\t\t\t<button type="submit" class="auth-button" style="width:auto;">Apply</button>\n\t\t</form>\n\t</div>\n\n\t<table class="data-table">\n\t\t<thead>\n\t\t\t<tr>\n\t\t\t\t<th>ID</th>\n\t\t\t\t<th>Name</th>\n\t\t\t\t<th>Email</th>\n\t\t\t\t<th>Role</th>\n\t\t\t\t<th>Trust Score</th>\n\t\t\t\t<th>Status</th>\n\t\t\t\t<th class="no-sort">Actions</th>\n\t\t\t</tr>\n\t\t</thead>\n\t\t<tbody>\n\t\t\t'
+    if (undefined(name='users') if l_0_users is missing else l_0_users):
+        pass
+        yield '\n\t\t\t\t'
+        for l_1_item in (undefined(name='users') if l_0_users is missing else l_0_users):
+            l_1_provider_ratings = resolve('provider_ratings')
+            l_1_session = resolve('session')
+            l_1_csrf_token = resolve('csrf_token')
+            _loop_vars = {}
+            pass
+            yield '\n\t\t\t\t<tr>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'id'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'full_name'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(environment.getattr(l_1_item, 'email'))
+            yield '</td>\n\t\t\t\t\t<td>'
+            yield escape(t_2(environment.getattr(l_1_item, 'role')))
+            yield '</td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if (environment.getattr(l_1_item, 'role') == 'provider'):
+                pass
+                yield '\n\t\t\t\t\t\t\t'
+                yield escape(t_1('%.2f', (context.call(environment.getattr((undefined(name='provider_ratings') if l_1_provider_ratings is missing else l_1_provider_ratings), 'get'), environment.getattr(l_1_item, 'id'), 0, _loop_vars=_loop_vars) or 0)))
+                yield '\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t-\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t\t<td><span class="status completed">Active</span></td>\n\t\t\t\t\t<td>\n\t\t\t\t\t\t'
+            if (context.call(environment.getattr((undefined(name='session') if l_1_session is missing else l_1_session), 'get'), 'user_id', _loop_vars=_loop_vars) == environment.getattr(l_1_item, 'id')):
+                pass
+                yield '\n\t\t\t\t\t\t\t<span class="muted">Current Admin</span>\n\t\t\t\t\t\t'
+            else:
+                pass
+                yield '\n\t\t\t\t\t\t\t<form method="POST" action="/admin/users/'
+                yield escape(environment.getattr(l_1_item, 'id'))
+                yield '/delete" class="inline-form" onsubmit="return confirm(\'Delete this user and related records?\');">\n\t\t\t\t\t\t\t\t<input type="hidden" name="csrf_token" value="'
+                yield escape(context.call((undefined(name='csrf_token') if l_1_csrf_token is missing else l_1_csrf_token), _loop_vars=_loop_vars))
+                yield '">\n\t\t\t\t\t\t\t\t<button type="submit" class="btn-link secondary" style="border:none; cursor:pointer;">Delete</button>\n\t\t\t\t\t\t\t</form>\n\t\t\t\t\t\t'
+            yield '\n\t\t\t\t\t</td>\n\t\t\t\t</tr>\n\t\t\t\t'
+        l_1_item = l_1_provider_ratings = l_1_session = l_1_csrf_token = missing
+        yield '\n\t\t\t'
+    else:
+        pass
+        yield '\n\t\t\t\t<tr><td colspan="7">No users found for this filter.</td></tr>\n\t\t\t'
+    yield '\n\t\t</tbody>\n\t</table>\n</div>\n'
+
+blocks = {'sidebar': block_sidebar, 'page_title': block_page_title, 'content': block_content}
+debug_info = '1=12&3=17&43=27&45=37&49=64&53=66&57=68&61=70&74=72&77=74&79=76&80=80&81=84&82=88&101=92&102=95&104=102&105=104&106=106&107=108&109=110&110=113&117=119&120=125&121=127'
\ No newline at end of file
@@ -0,0 +1,175 @@
+from collections import defaultdict
+from datetime import datetime
+from statistics import median
+
+from sqlalchemy import func
+
+from app import db
+from app.models.affinity import ProviderNgoAffinity
+from app.models.archive import AllocationHistory
+from app.models.complaint import Complaint
+from app.models.review import Review
+from app.utils.upsert import insert_missing
+
+
+RATING_PRIOR_MEAN = 3.5
+RATING_PRIOR_WEIGHT = 3
+HANDOVER_SAMPLE_SIZE = 25
+HANDOVER_TARGET_MINUTES = 120.0
+
+
+def _clamp(value, low=-1.0, high=1.0):
+	return max(low, min(high, value))
+
+
+def compute_affinity_score(completed_pickups, rating_sum, rating_count, complaint_count, median_handover_minutes):
+	"""Blend pair history into a score in [-1, 1] where 0 means no signal."""
+	smoothed_rating = (rating_sum + RATING_PRIOR_MEAN * RATING_PRIOR_WEIGHT) / (rating_count + RATING_PRIOR_WEIGHT)
+	rating_term = _clamp((smoothed_rating - RATING_PRIOR_MEAN) / 1.5)
+	history_term = min(completed_pickups, 10) / 10.0
+	complaint_term = min(complaint_count, 5) / 5.0
+	speed_term = 0.0
+	if median_handover_minutes is not None:
+		speed_term = _clamp((HANDOVER_TARGET_MINUTES - median_handover_minutes) / HANDOVER_TARGET_MINUTES)
+
+	return round(_clamp(0.4 * rating_term + 0.3 * history_term + 0.2 * speed_term - 0.5 * complaint_term), 4)
+
+
+def _refresh_score(row):
+	row.score = compute_affinity_score(
+		row.completed_pickups or 0,
+		row.rating_sum or 0,
+		row.rating_count or 0,
+		row.complaint_count or 0,
+		row.median_handover_minutes,
+	)
+
+
+def _pair_row(provider_id, ngo_id):
+	"""The pair's rollup row, locked; created first (race-free) if missing."""
+	query = ProviderNgoAffinity.query.filter_by(provider_id=provider_id, ngo_id=ngo_id).with_for_update()
+	row = query.first()
+	if row is None:
+		insert_missing(
+			ProviderNgoAffinity,
+			provider_id=provider_id,
+			ngo_id=ngo_id,
+			completed_pickups=0,
+			rating_sum=0,
+			rating_count=0,
+			complaint_count=0,
+			recent_handover_minutes=[],
+			score=0.0,
+		)
+		row = query.first()
+	return row
+
+
+def record_completed_pickup(allocation):
+	"""Update the pair rollup for a verified pickup. Call before commit."""
+	row = _pair_row(allocation.provider_id, allocation.ngo_id)
+	row.completed_pickups = (row.completed_pickups or 0) + 1
+
+	if allocation.created_at and allocation.completed_at:
+		minutes = round((allocation.completed_at - allocation.created_at).total_seconds() / 60, 1)
+		sample = (list(row.recent_handover_minutes or []) + [minutes])[-HANDOVER_SAMPLE_SIZE:]
+		row.recent_handover_minutes = sample
+		row.median_handover_minutes = median(sample)
+
+	_refresh_score(row)
+
+
+def record_review(review):
+	row = _pair_row(review.provider_id, review.ngo_id)
+	row.rating_sum = (row.rating_sum or 0) + int(review.rating)
+	row.rating_count = (row.rating_count or 0) + 1
+	_refresh_score(row)
+
+
+def record_complaint(complaint, delta: int = 1):
+	if not complaint.provider_id:
+		return
+	row = _pair_row(complaint.provider_id, complaint.ngo_id)
+	row.complaint_count = max(0, (row.complaint_count or 0) + delta)
+	_refresh_score(row)
+
+
+def affinity_scores_for_ngo(ngo_id):
+	"""Load provider_id -> score for one NGO so ranking is a dict lookup per row."""
+	if not ngo_id:
+		return {}
+	rows = (
+		db.session.query(ProviderNgoAffinity.provider_id, ProviderNgoAffinity.score)
+		.filter(ProviderNgoAffinity.ngo_id == ngo_id)
+		.all()
+	)
+	return {provider_id: score for provider_id, score in rows}
+
+
+def rebuild_affinity():
+	"""Recompute every pair from history. Returns the number of pairs written."""
+	pairs = defaultdict(lambda: {
+		"completed_pickups": 0,
+		"rating_sum": 0,
+		"rating_count": 0,
+		"complaint_count": 0,
+		"recent_handover_minutes": [],
+	})
+
+	completed_rows = (
+		db.session.query(AllocationHistory.provider_id, AllocationHistory.ngo_id, AllocationHistory.created_at, AllocationHistory.completed_at)
+		.filter(func.lower(AllocationHistory.status) == "completed")
+		.order_by(AllocationHistory.completed_at.asc(), AllocationHistory.id.asc())
+		.yield_per(1000)
+	)
+	for provider_id, ngo_id, created_at, completed_at in completed_rows:
+		pair = pairs[(provider_id, ngo_id)]
+		pair["completed_pickups"] += 1
+		if created_at and completed_at:
+			minutes = round((completed_at - created_at).total_seconds() / 60, 1)
+			pair["recent_handover_minutes"] = (pair["recent_handover_minutes"] + [minutes])[-HANDOVER_SAMPLE_SIZE:]
+
+	review_rows = (
+		db.session.query(Review.provider_id, Review.ngo_id, func.sum(Review.rating), func.count(Review.id))
+		.group_by(Review.provider_id, Review.ngo_id)
+		.all()
+	)
+	for provider_id, ngo_id, rating_sum, rating_count in review_rows:
+		pair = pairs[(provider_id, ngo_id)]
+		pair["rating_sum"] = int(rating_sum or 0)
+		pair["rating_count"] = int(rating_count or 0)
+
+	complaint_rows = (
+		db.session.query(Complaint.provider_id, Complaint.ngo_id, func.count(Complaint.id))
+		.filter(Complaint.provider_id.isnot(None), Complaint.status != "Rejected")
+		.group_by(Complaint.provider_id, Complaint.ngo_id)
+		.all()
+	)
+	for provider_id, ngo_id, complaint_count in complaint_rows:
+		pairs[(provider_id, ngo_id)]["complaint_count"] = int(complaint_count or 0)
+
+	now = datetime.utcnow()
+	mappings = []
+	for (provider_id, ngo_id), pair in pairs.items():
+		sample = pair["recent_handover_minutes"]
+		median_minutes = median(sample) if sample else None
+		mappings.append({
+			"provider_id": provider_id,
+			"ngo_id": ngo_id,
+			**pair,
+			"median_handover_minutes": median_minutes,
+			"score": compute_affinity_score(
+				pair["completed_pickups"],
+				pair["rating_sum"],
+				pair["rating_count"],
+				pair["complaint_count"],
+				median_minutes,
+			),
+			"updated_at": now,
+		})
+
+	ProviderNgoAffinity.query.delete(synchronize_session=False)
+	if mappings:
+		db.session.bulk_insert_mappings(ProviderNgoAffinity, mappings)
+	db.session.commit()
+	return len(mappings)
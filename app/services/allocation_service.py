@@ -0,0 +1,64 @@
+import math
+
+from sqlalchemy import case, func, update
+
+from app import db
+from app.models.surplus import Surplus
+
+
+QUANTITY_EPSILON_KG = 0.01
+
+
+def suggested_claim_kg(available_kg, capacity_kg):
+	"""Largest share of a batch an NGO can carry in one pickup, rounded down to 0.1 kg.
+
+	Rounding down keeps the default within remaining_kg, so it is never
+	rejected by claim_surplus_quantity.
+	"""
+	share = float(available_kg or 0)
+	if capacity_kg is not None and capacity_kg > 0:
+		share = min(share, float(capacity_kg))
+	# The epsilon absorbs float error, e.g. 2.3 * 10 == 22.999999999999996.
+	return math.floor(share * 10 + 1e-9) / 10
+
+
+def claim_surplus_quantity(surplus_id: int, quantity_kg: float) -> bool:
+	"""Atomically take quantity_kg from an available batch.
+
+	The decrement is a single conditional UPDATE, so two NGOs claiming the
+	last kilos at the same time cannot both succeed. A batch whose remaining
+	quantity drops to zero moves to "requested" in the same statement.
+	"""
+	remaining_after = Surplus.remaining_kg - quantity_kg
+	result = db.session.execute(
+		update(Surplus)
+		.where(
+			Surplus.id == surplus_id,
+			Surplus.status == "available",
+			Surplus.remaining_kg >= quantity_kg - QUANTITY_EPSILON_KG,
+		)
+		.values(
+			remaining_kg=case((remaining_after <= QUANTITY_EPSILON_KG, 0.0), else_=remaining_after),
+			status=case((remaining_after <= QUANTITY_EPSILON_KG, "requested"), else_=Surplus.status),
+		)
+		.execution_options(synchronize_session=False)
+	)
+	return result.rowcount == 1
+
+
+def release_surplus_quantity(surplus_id: int, quantity_kg: float) -> bool:
+	"""Atomically give quantity_kg back to a batch when a claim is cancelled.
+
+	A batch that was fully claimed ("requested") reopens as "available";
+	batches in any other state (pending, completed, withdrawn) are left alone.
+	"""
+	result = db.session.execute(
+		update(Surplus)
+		.where(Surplus.id == surplus_id, Surplus.status.in_(["available", "requested"]))
+		.values(
+			remaining_kg=func.coalesce(Surplus.remaining_kg, 0.0) + quantity_kg,
+			status="available",
+		)
+		.execution_options(synchronize_session=False)
+	)
+	return result.rowcount == 1
@@ -0,0 +1,116 @@
+"""Move finished surplus batches and their allocations into archive tables.
+
+A batch is archivable once it is completed, every allocation on it is
+completed, and its last pickup (or the batch itself, if nobody claimed it)
+is older than the cutoff. A batch always moves together with its
+allocations, so joins on the hot tables never see half a batch.
+
+Rows are copied with INSERT ... SELECT and deleted in the same transaction,
+one batch at a time, so a run can be interrupted anywhere and simply run
+again: every row is either hot or archived, never both or neither.
+
+Archived rows keep their ids. The hot tables never reuse an id, even the
+newest one once it has moved (a sequence on PostgreSQL, AUTOINCREMENT on
+SQLite), so ids stay unique across both tables.
+
+Nothing is recounted. Archiving only moves completed history, so the
+incremental rollups (affinity, trust) are unchanged, and everything that
+rebuilds or reports from history reads AllocationHistory / SurplusHistory,
+which union both tables.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, literal, or_, select
+
+from app import db
+from app.models.allocation import Allocation
+from app.models.archive import ArchivedAllocation, ArchivedSurplus
+from app.models.surplus import Surplus
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _candidate_surplus_ids(cutoff, after_id, limit):
+	unfinished_allocation = (
+		select(Allocation.id)
+		.where(
+			Allocation.surplus_id == Surplus.id,
+			or_(
+				func.lower(Allocation.status) != "completed",
+				Allocation.completed_at.is_(None),
+				Allocation.completed_at >= cutoff,
+			),
+		)
+		.exists()
+	)
+	return db.session.execute(
+		select(Surplus.id)
+		.where(
+			Surplus.id > after_id,
+			Surplus.status == "completed",
+			Surplus.created_at < cutoff,
+			~unfinished_allocation,
+		)
+		.order_by(Surplus.id.asc())
+		.limit(limit)
+		.with_for_update(skip_locked=True)
+	).scalars().all()
+
+
+def _copy_rows(source, target, where, archived_at):
+	columns = [column.name for column in source.columns]
+	result = db.session.execute(
+		insert(target).from_select(
+			columns + ["archived_at"],
+			select(*[source.c[name] for name in columns], literal(archived_at)).where(where),
+		)
+	)
+	return result.rowcount
+
+
+def _move_batch(surplus_ids, archived_at):
+	surplus_table = Surplus.__table__
+	allocation_table = Allocation.__table__
+	in_batch = allocation_table.c.surplus_id.in_(surplus_ids)
+
+	moved_surplus = _copy_rows(surplus_table, ArchivedSurplus.__table__, surplus_table.c.id.in_(surplus_ids), archived_at)
+	moved_allocations = _copy_rows(allocation_table, ArchivedAllocation.__table__, in_batch, archived_at)
+	db.session.execute(delete(allocation_table).where(in_batch))
+	db.session.execute(delete(surplus_table).where(surplus_table.c.id.in_(surplus_ids)))
+	db.session.commit()
+	return moved_surplus, moved_allocations
+
+
+def archive_completed(older_than_days: int, batch_size: int = DEFAULT_BATCH_SIZE, max_batches=None, progress=None):
+	"""Archive batches finished more than older_than_days ago.
+
+	Returns {"surplus": n, "allocations": n, "batches": n}. max_batches bounds
+	one run; the next run continues where it stopped.
+	"""
+	cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+	totals = {"surplus": 0, "allocations": 0, "batches": 0}
+	after_id = 0
+	while max_batches is None or totals["batches"] < max_batches:
+		surplus_ids = _candidate_surplus_ids(cutoff, after_id, batch_size)
+		if not surplus_ids:
+			db.session.rollback()
+			break
+		moved_surplus, moved_allocations = _move_batch(surplus_ids, datetime.utcnow())
+		after_id = surplus_ids[-1]
+		totals["surplus"] += moved_surplus
+		totals["allocations"] += moved_allocations
+		totals["batches"] += 1
+		if progress is not None:
+			progress(totals)
+	return totals
+
+
+def archive_counts():
+	"""Hot and archived row counts for surplus and allocations."""
+	return {
+		"surplus": Surplus.query.count(),
+		"archived_surplus": ArchivedSurplus.query.count(),
+		"allocations": Allocation.query.count(),
+		"archived_allocations": ArchivedAllocation.query.count(),
+	}
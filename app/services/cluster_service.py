@@ -0,0 +1,249 @@
+from math import floor
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, BooleanClauseList
+
+from app import db
+from app.models.surplus import Surplus
+
+
+MIN_ZOOM = 2
+MAX_ZOOM = 18
+CELL_SUBDIVISION = 2
+INDEX_MAX_AGE_SECONDS = 300
+
+
+def _cell_size(zoom: int) -> float:
+	return 360.0 / (2 ** (zoom + CELL_SUBDIVISION))
+
+
+def _cell_key(lat: float, lon: float, size: float):
+	return floor((lat + 90.0) / size), floor((lon + 180.0) / size)
+
+
+def _open_kg(row) -> float:
+	if row.remaining_kg is not None:
+		return float(row.remaining_kg)
+	return float(row.quantity if row.quantity is not None else (row.quantity_kg or 0))
+
+
+class SurplusGridIndex:
+	"""Per-zoom grid of open surplus aggregates (count, kg, coordinate sums).
+
+	Every level is updated on each point change, so a query only touches the
+	cells of one level that intersect the viewport. Bulk UPDATEs that pin
+	their rows by id queue those ids, and the next query re-reads just them.
+	The whole index is rebuilt from the database lazily and after
+	INDEX_MAX_AGE_SECONDS so writes made by other workers are picked up.
+	"""
+
+	def __init__(self):
+		self._lock = threading.RLock()
+		self._points = {}
+		self._levels = {}
+		self._built_at = None
+		self._stale_ids = set()
+
+	def _apply(self, lat, lon, kg, sign):
+		for zoom in range(MIN_ZOOM, MAX_ZOOM + 1):
+			level = self._levels.setdefault(zoom, {})
+			key = _cell_key(lat, lon, _cell_size(zoom))
+			cell = level.get(key)
+			if cell is None:
+				cell = level[key] = [0, 0.0, 0.0, 0.0]
+			cell[0] += sign
+			cell[1] += sign * kg
+			cell[2] += sign * lat
+			cell[3] += sign * lon
+			if cell[0] <= 0:
+				del level[key]
+
+	def upsert(self, surplus_id, lat, lon, kg):
+		with self._lock:
+			self.remove(surplus_id)
+			if lat is None or lon is None:
+				return
+			self._points[surplus_id] = (lat, lon, kg)
+			self._apply(lat, lon, kg, 1)
+
+	def remove(self, surplus_id):
+		with self._lock:
+			point = self._points.pop(surplus_id, None)
+			if point:
+				self._apply(point[0], point[1], point[2], -1)
+
+	def invalidate(self):
+		with self._lock:
+			self._built_at = None
+
+	def mark_stale(self, surplus_ids):
+		"""Re-read these rows on the next query instead of rebuilding everything."""
+		with self._lock:
+			if self._built_at is not None:
+				self._stale_ids.update(surplus_ids)
+
+	def _open_rows(self, *criteria):
+		return (
+			db.session.query(
+				Surplus.id,
+				Surplus.provider_latitude,
+				Surplus.provider_longitude,
+				Surplus.quantity,
+				Surplus.quantity_kg,
+				Surplus.remaining_kg,
+			)
+			.filter(
+				Surplus.status == "available",
+				Surplus.provider_latitude.isnot(None),
+				Surplus.provider_longitude.isnot(None),
+				*criteria,
+			)
+			.all()
+		)
+
+	def rebuild(self):
+		rows = self._open_rows()
+		with self._lock:
+			self._points = {}
+			self._levels = {}
+			self._stale_ids = set()
+			for row in rows:
+				self.upsert(row.id, row.provider_latitude, row.provider_longitude, _open_kg(row))
+			self._built_at = time.monotonic()
+
+	def _reload_stale(self):
+		with self._lock:
+			surplus_ids, self._stale_ids = self._stale_ids, set()
+		open_rows = {row.id: row for row in self._open_rows(Surplus.id.in_(surplus_ids))}
+		with self._lock:
+			for surplus_id in surplus_ids:
+				row = open_rows.get(surplus_id)
+				if row is None:
+					self.remove(surplus_id)
+				else:
+					self.upsert(surplus_id, row.provider_latitude, row.provider_longitude, _open_kg(row))
+
+	def _ensure_fresh(self):
+		if self._built_at is None or time.monotonic() - self._built_at > INDEX_MAX_AGE_SECONDS:
+			self.rebuild()
+		elif self._stale_ids:
+			self._reload_stale()
+
+	def clusters(self, min_lat, min_lon, max_lat, max_lon, zoom):
+		self._ensure_fresh()
+		zoom = max(MIN_ZOOM, min(int(zoom), MAX_ZOOM))
+		size = _cell_size(zoom)
+		low_row, low_col = _cell_key(min_lat, min_lon, size)
+		high_row, high_col = _cell_key(max_lat, max_lon, size)
+
+		with self._lock:
+			level = self._levels.get(zoom, {})
+			viewport_cells = (high_row - low_row + 1) * (high_col - low_col + 1)
+			if viewport_cells <= len(level):
+				candidates = (
+					((row, col), level.get((row, col)))
+					for row in range(low_row, high_row + 1)
+					for col in range(low_col, high_col + 1)
+				)
+			else:
+				candidates = (
+					(key, cell)
+					for key, cell in level.items()
+					if low_row <= key[0] <= high_row and low_col <= key[1] <= high_col
+				)
+
+			output = []
+			for _, cell in candidates:
+				if not cell:
+					continue
+				count, total_kg, lat_sum, lon_sum = cell
+				output.append({
+					"count": count,
+					"total_kg": round(total_kg, 1),
+					"lat": round(lat_sum / count, 5),
+					"lon": round(lon_sum / count, 5),
+				})
+
+		return zoom, output
+
+
+surplus_grid_index = SurplusGridIndex()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_surplus_changes(session, flush_context):
+	touched = session.info.setdefault("cluster_touched_surplus", {})
+	for obj in list(session.new) + list(session.dirty):
+		if isinstance(obj, Surplus):
+			if obj.status == "available":
+				touched[obj.id] = (obj.provider_latitude, obj.provider_longitude, _open_kg(obj))
+			else:
+				touched[obj.id] = None
+	for obj in session.deleted:
+		if isinstance(obj, Surplus):
+			touched[obj.id] = None
+
+
+def _pinned_surplus_ids(clause):
+	"""Ids a WHERE clause limits the rows to (Surplus.id == x or .in_([...]), possibly
+	ANDed with other filters), or None when the rows cannot be told from the clause."""
+	if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+		for criterion in clause.clauses:
+			surplus_ids = _pinned_surplus_ids(criterion)
+			if surplus_ids is not None:
+				return surplus_ids
+		return None
+	if not isinstance(clause, BinaryExpression) or not isinstance(clause.right, BindParameter):
+		return None
+	left = clause.left
+	if getattr(left, "table", None) is not Surplus.__table__ or getattr(left, "key", None) != "id":
+		return None
+	value = clause.right.effective_value
+	if clause.operator is operators.eq:
+		return {value}
+	if clause.operator is operators.in_op:
+		return set(value)
+	return None
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_surplus_writes(orm_execute_state):
+	if orm_execute_state.is_delete or orm_execute_state.is_update:
+		mapper = orm_execute_state.bind_arguments.get("mapper")
+		if mapper is not None and mapper.class_ is Surplus:
+			info = orm_execute_state.session.info
+			surplus_ids = _pinned_surplus_ids(orm_execute_state.statement.whereclause)
+			if surplus_ids is None:
+				info["cluster_index_stale"] = True
+			else:
+				info.setdefault("cluster_reload_surplus", set()).update(surplus_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_surplus_changes(session):
+	touched = session.info.pop("cluster_touched_surplus", None)
+	reload_ids = session.info.pop("cluster_reload_surplus", None)
+	if session.info.pop("cluster_index_stale", False):
+		surplus_grid_index.invalidate()
+		return
+	if surplus_grid_index._built_at is None:
+		return
+
+	for surplus_id, point in (touched or {}).items():
+		if point is None:
+			surplus_grid_index.remove(surplus_id)
+		else:
+			surplus_grid_index.upsert(surplus_id, *point)
+	if reload_ids:
+		surplus_grid_index.mark_stale(reload_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_surplus_changes(session):
+	session.info.pop("cluster_touched_surplus", None)
+	session.info.pop("cluster_reload_surplus", None)
+	session.info.pop("cluster_index_stale", None)
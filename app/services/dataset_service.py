@@ -0,0 +1,384 @@
+"""Synthetic dataset generator for scale testing.
+
+Rows are written with Core bulk inserts (COPY on PostgreSQL) in batches,
+bypassing the ORM unit of work, so millions of rows stay cheap. Primary
+keys are assigned up front past the current MAX(id) (or the id sequence,
+if purged rows took it further) of each table, which lets child rows
+reference their parents without a round trip.
+
+Output depends only on the seed, the counts and the anchor date, so a run
+against an empty database is reproducible. Users are spread over Indian
+cities weighted by size; every city has a handful of dense neighbourhoods
+and providers' mahals sit inside them, the way real demand clusters.
+"""
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import io
+import math
+import random
+
+from sqlalchemy import func, select, text
+from werkzeug.security import generate_password_hash
+
+from app import db
+from app.models.allocation import Allocation
+from app.models.archive import AllocationHistory, SurplusHistory
+from app.models.complaint import Complaint
+from app.models.event import Event
+from app.models.review import Review
+from app.models.surplus import Surplus
+from app.models.user import User
+
+
+SYNTHETIC_PASSWORD = "synthetic123"
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.test"
+DEFAULT_BATCH_SIZE = 5000
+
+# (name, latitude, longitude, relative weight)
+CITIES = (
+	("Mumbai", 19.0760, 72.8777, 20),
+	("Delhi", 28.6139, 77.2090, 20),
+	("Bengaluru", 12.9716, 77.5946, 13),
+	("Hyderabad", 17.3850, 78.4867, 10),
+	("Chennai", 13.0827, 80.2707, 11),
+	("Kolkata", 22.5726, 88.3639, 15),
+	("Pune", 18.5204, 73.8567, 7),
+	("Ahmedabad", 23.0225, 72.5714, 8),
+	("Jaipur", 26.9124, 75.7873, 4),
+	("Lucknow", 26.8467, 80.9462, 4),
+	("Coimbatore", 11.0168, 76.9558, 3),
+	("Madurai", 9.9252, 78.1198, 2),
+	("Kochi", 9.9312, 76.2673, 2),
+)
+NEIGHBOURHOODS_PER_CITY = 8
+NEIGHBOURHOOD_SPREAD_DEG = 0.08
+MAHAL_SPREAD_DEG = 0.012
+
+FIRST_NAMES = ("Arun", "Divya", "Karthik", "Lakshmi", "Meena", "Priya", "Rahul", "Sanjay", "Swathi", "Vijay")
+LAST_NAMES = ("Iyer", "Kumar", "Nair", "Patel", "Reddy", "Sharma", "Singh", "Subramanian")
+NGO_SUFFIXES = ("Food Bank", "Annadanam Trust", "Seva Samithi", "Community Kitchen", "Relief Foundation")
+MAHAL_WORDS = ("Sri", "Lakshmi", "Kalyana", "Royal", "Grand", "Ganesh", "Vasantha", "Padma")
+EVENT_KINDS = ("Wedding", "Reception", "Engagement", "Temple Festival", "Corporate Lunch", "Birthday")
+FOOD_TYPES = ("Veg Biryani", "Sambar Rice", "Curd Rice", "Chapati & Kurma", "Sweets", "Pulao", "Idli & Chutney")
+ISSUE_TYPES = ("Food Quality", "Delay", "Mismatch Quantity", "Packaging")
+COMPLAINT_STATUSES = (("Resolved", 50), ("Under Review", 25), ("Escalated", 10), ("Rejected", 15))
+REVIEW_COMMENTS = (
+	"Food was fresh and well packed.",
+	"Pickup was smooth.",
+	"Quantity matched the listing.",
+	"Slight delay but good food.",
+	"Handover took a while.",
+)
+
+
+@dataclass
+class DatasetSpec:
+	providers: int = 500
+	ngos: int = 1000
+	events: int = 10000
+	batches_per_event: float = 2.0
+	review_rate: float = 0.3
+	complaint_rate: float = 0.03
+	days: int = 365
+	seed: int = 42
+	anchor: datetime = None
+
+	def scaled(self, factor):
+		return DatasetSpec(
+			providers=max(1, int(self.providers * factor)),
+			ngos=max(1, int(self.ngos * factor)),
+			events=max(1, int(self.events * factor)),
+			batches_per_event=self.batches_per_event,
+			review_rate=self.review_rate,
+			complaint_rate=self.complaint_rate,
+			days=self.days,
+			seed=self.seed,
+			anchor=self.anchor,
+		)
+
+
+class _BulkWriter:
+	"""Buffers rows per table and flushes them parents-first."""
+
+	def __init__(self, connection, batch_size):
+		self.connection = connection
+		self.batch_size = batch_size
+		self.tables = [model.__table__ for model in (User, Event, Surplus, Allocation, Review, Complaint)]
+		self.buffers = {table.name: [] for table in self.tables}
+		self.written = dict.fromkeys(self.buffers, 0)
+		self.use_copy = connection.dialect.name == "postgresql"
+
+	def add(self, table_name, row):
+		buffer = self.buffers[table_name]
+		buffer.append(row)
+		if len(buffer) >= self.batch_size:
+			self.flush()
+
+	def flush(self):
+		for table in self.tables:
+			rows = self.buffers[table.name]
+			if not rows:
+				continue
+			if self.use_copy:
+				self._copy(table, rows)
+			else:
+				self.connection.execute(table.insert(), rows)
+			self.written[table.name] += len(rows)
+			self.buffers[table.name] = []
+		self.connection.commit()
+
+	def _copy(self, table, rows):
+		columns = list(rows[0])
+		buffer = io.StringIO()
+		writer = csv.writer(buffer)
+		for row in rows:
+			writer.writerow([row[column] for column in columns])
+		buffer.seek(0)
+		cursor = self.connection.connection.dbapi_connection.cursor()
+		try:
+			cursor.copy_expert(
+				f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+				buffer,
+			)
+		finally:
+			cursor.close()
+
+
+# Archived surplus and allocations keep their ids, so new ids start past both tables.
+_ID_SOURCES = {
+	User: User,
+	Event: Event,
+	Surplus: SurplusHistory,
+	Allocation: AllocationHistory,
+	Review: Review,
+	Complaint: Complaint,
+}
+
+
+def _sequence_value(connection, table):
+	"""Last id the database handed out for the table, including rows since deleted."""
+	if connection.dialect.name == "postgresql":
+		return connection.execute(
+			text("SELECT pg_sequence_last_value(pg_get_serial_sequence(:table, 'id')::regclass)"),
+			{"table": table},
+		).scalar() or 0
+	if connection.dialect.name == "sqlite" and connection.execute(
+		text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'")
+	).scalar():
+		return connection.execute(text("SELECT seq FROM sqlite_sequence WHERE name = :table"), {"table": table}).scalar() or 0
+	return 0
+
+
+def _max_ids(connection):
+	return {
+		model.__tablename__: max(
+			connection.execute(select(func.max(source.id))).scalar() or 0,
+			_sequence_value(connection, model.__tablename__),
+		)
+		for model, source in _ID_SOURCES.items()
+	}
+
+
+def _next_ids(connection):
+	return {table: max_id + 1 for table, max_id in _max_ids(connection).items()}
+
+
+def _reset_sequences(connection):
+	if connection.dialect.name != "postgresql":
+		return
+	for table, max_id in _max_ids(connection).items():
+		connection.execute(
+			text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), :value)"),
+			{"value": max(max_id, 1)},
+		)
+	connection.commit()
+
+
+def _neighbourhoods(rng):
+	spots = []
+	for name, lat, lon, weight in CITIES:
+		for _ in range(NEIGHBOURHOODS_PER_CITY):
+			spots.append((name, lat + rng.gauss(0, NEIGHBOURHOOD_SPREAD_DEG), lon + rng.gauss(0, NEIGHBOURHOOD_SPREAD_DEG), weight))
+	return spots
+
+
+def _point_near(rng, lat, lon, spread):
+	return round(lat + rng.gauss(0, spread), 6), round(lon + rng.gauss(0, spread), 6)
+
+
+def _weighted(rng, options):
+	return rng.choices([option for option, _ in options], weights=[weight for _, weight in options])[0]
+
+
+def generate_dataset(spec, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+	"""Insert a synthetic dataset described by spec. Returns rows written per table."""
+	rng = random.Random(spec.seed)
+	anchor = spec.anchor or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+	password_hash = generate_password_hash(SYNTHETIC_PASSWORD)
+	spots = _neighbourhoods(rng)
+	spot_weights = [spot[3] for spot in spots]
+
+	with db.engine.connect() as connection:
+		ids = _next_ids(connection)
+		writer = _BulkWriter(connection, batch_size)
+
+		def next_id(table_name):
+			value = ids[table_name]
+			ids[table_name] += 1
+			return value
+
+		ngos_by_city = {}
+		for index in range(spec.ngos):
+			user_id = next_id("users")
+			city = rng.choices(CITIES, weights=[city[3] for city in CITIES])[0][0]
+			ngos_by_city.setdefault(city, []).append(user_id)
+			writer.add("users", {
+				"id": user_id,
+				"full_name": f"{city} {rng.choice(NGO_SUFFIXES)} {index + 1}",
+				"email": f"ngo{user_id}@{SYNTHETIC_EMAIL_DOMAIN}",
+				"password_hash": password_hash,
+				"role": "ngo",
+				"phone_number": None,
+				"phone_verified": False,
+				"capacity_kg": float(rng.choice((25, 40, 50, 75, 100, 150))),
+			})
+
+		providers = []
+		for index in range(spec.providers):
+			user_id = next_id("users")
+			spot = rng.choices(spots, weights=spot_weights)[0]
+			mahals = []
+			for _ in range(rng.randint(1, 3)):
+				lat, lon = _point_near(rng, spot[1], spot[2], MAHAL_SPREAD_DEG)
+				mahals.append((f"{rng.choice(MAHAL_WORDS)} {rng.choice(MAHAL_WORDS)} Mahal", spot[0], lat, lon))
+			full_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+			providers.append((user_id, full_name, spot[0], mahals))
+			writer.add("users", {
+				"id": user_id,
+				"full_name": full_name,
+				"email": f"provider{user_id}@{SYNTHETIC_EMAIL_DOMAIN}",
+				"password_hash": password_hash,
+				"role": "provider",
+				"phone_number": None,
+				"phone_verified": False,
+				"capacity_kg": None,
+			})
+
+		all_ngos = [ngo_id for members in ngos_by_city.values() for ngo_id in members]
+		history_minutes = spec.days * 24 * 60
+		for event_index in range(spec.events):
+			provider_id, provider_name, city, mahals = rng.choice(providers)
+			# Mostly past events, with two weeks of upcoming ones.
+			event_date = anchor - timedelta(minutes=rng.randint(-14 * 24 * 60, history_minutes))
+			event_name = f"{rng.choice(EVENT_KINDS)} #{event_index + 1}"
+			guest_count = int(rng.lognormvariate(math.log(400), 0.5))
+			event_id = next_id("events")
+			writer.add("events", {
+				"id": event_id,
+				"provider_id": provider_id,
+				"event_name": event_name,
+				"event_date": event_date,
+				"guest_count": guest_count,
+				"created_at": event_date - timedelta(days=rng.randint(3, 60)),
+			})
+			if event_date > anchor:
+				continue
+
+			batches = int(spec.batches_per_event) + (1 if rng.random() < spec.batches_per_event % 1 else 0)
+			for _ in range(batches):
+				mahal_name, mahal_city, lat, lon = rng.choice(mahals)
+				lat, lon = _point_near(rng, lat, lon, 0.0005)
+				created_at = event_date + timedelta(minutes=rng.randint(30, 240))
+				quantity = round(max(3.0, guest_count * rng.uniform(0.03, 0.12)), 1)
+				age_hours = (anchor - created_at).total_seconds() / 3600
+				surplus_id = next_id("surplus")
+				city_ngos = ngos_by_city.get(city) or all_ngos
+
+				allocations = []
+				if age_hours < 0:
+					status = "pending"
+				elif age_hours < 6:
+					status = rng.choice(("pending", "available", "available", "requested"))
+				else:
+					status = "completed" if rng.random() < 0.85 else "available"
+
+				remaining = quantity
+				if status in ("requested", "completed", "available") and city_ngos:
+					claims = rng.randint(1, 3) if status != "available" else rng.randint(0, 1)
+					for claim_index in range(claims):
+						share = remaining if claim_index == claims - 1 and status != "available" else round(remaining * rng.uniform(0.3, 0.7), 1)
+						if share <= 0:
+							break
+						remaining = round(remaining - share, 1)
+						allocations.append((rng.choice(city_ngos), share))
+				if status == "requested":
+					remaining = 0.0
+
+				writer.add("surplus", {
+					"id": surplus_id,
+					"provider_id": provider_id,
+					"event_id": event_id,
+					"event_name": event_name,
+					"mahal_name": mahal_name,
+					"provider_name": provider_name,
+					"food_type": rng.choice(FOOD_TYPES),
+					"quantity": quantity,
+					"quantity_kg": quantity,
+					"remaining_kg": max(0.0, remaining) if status != "completed" else 0.0,
+					"estimated_expiry": f"{rng.choice((3, 4, 6, 8))} hours",
+					"distance_km": None,
+					"provider_location": f"{mahal_name}, {mahal_city}",
+					"provider_latitude": lat,
+					"provider_longitude": lon,
+					"photo_path": None,
+					"status": status,
+					"created_at": created_at,
+				})
+
+				for ngo_id, share in allocations:
+					requested_at = created_at + timedelta(minutes=rng.randint(5, 90))
+					completed = status == "completed"
+					completed_at = requested_at + timedelta(minutes=rng.randint(20, 180)) if completed else None
+					allocation_id = next_id("allocations")
+					writer.add("allocations", {
+						"id": allocation_id,
+						"surplus_id": surplus_id,
+						"provider_id": provider_id,
+						"ngo_id": ngo_id,
+						"quantity_kg": share,
+						"status": "completed" if completed else rng.choice(("requested", "allocated")),
+						"pickup_time": completed_at,
+						"otp_code": None if completed else f"{rng.randrange(10**6):06d}",
+						"created_at": requested_at,
+						"completed_at": completed_at,
+					})
+					if not completed:
+						continue
+					if rng.random() < spec.review_rate:
+						writer.add("reviews", {
+							"id": next_id("reviews"),
+							"ngo_id": ngo_id,
+							"provider_id": provider_id,
+							"rating": rng.choices((1, 2, 3, 4, 5), weights=(3, 5, 15, 40, 37))[0],
+							"comment": rng.choice(REVIEW_COMMENTS),
+							"created_at": completed_at + timedelta(hours=rng.randint(1, 48)),
+						})
+					if rng.random() < spec.complaint_rate:
+						issue = rng.choice(ISSUE_TYPES)
+						writer.add("complaints", {
+							"id": next_id("complaints"),
+							"ngo_id": ngo_id,
+							"provider_id": provider_id,
+							"issue_type": issue,
+							"description": f"{issue} reported for {event_name}.",
+							"status": _weighted(rng, COMPLAINT_STATUSES),
+							"created_at": completed_at + timedelta(hours=rng.randint(1, 72)),
+						})
+
+			if progress and (event_index + 1) % 10000 == 0:
+				progress(event_index + 1, spec.events)
+
+		writer.flush()
+		_reset_sequences(connection)
+		return writer.written
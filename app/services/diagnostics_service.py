@@ -0,0 +1,261 @@
+"""Dialect-aware system diagnostics for /admin/system/health.
+
+Every probe is cheap by construction: catalog lookups, SELECT 1 or the
+replica lag query, MAX(rowid) on SQLite or pg_class.reltuples on
+PostgreSQL for row estimates, and index-backed counts. Nothing scans a
+table. On PostgreSQL each probe also runs under a short statement_timeout,
+so a locked catalog cannot hang the page. Each probe reports its own
+elapsed time and error, and one failing probe does not hide the others.
+"""
+from datetime import datetime
+import os
+import statistics
+import time
+
+from flask import current_app
+from sqlalchemy import func, inspect, text
+
+from app import db
+from app.models.mail import OutboundEmail
+from app.models.otp import OtpChallenge
+from app.services import image_service, maps_service, otp_service, weather_service
+from app.services.mail_service import mail_queue_depth
+from app.services.metrics_service import counter_values
+from app.services.user_purge_service import pending_purge_count
+from app.utils.db_routing import REPLICA_BIND, replica_health
+
+
+LATENCY_SAMPLES = 3
+PROBE_TIMEOUT_MS = 2000
+
+# (table, leading columns, query it serves)
+HOT_QUERY_INDEXES = (
+	("surplus", ("status",), "open listings and nearby search"),
+	("surplus", ("provider_id",), "provider dashboard"),
+	("allocations", ("surplus_id",), "claims per batch"),
+	("allocations", ("ngo_id",), "NGO dashboard and history"),
+	("allocations", ("provider_id",), "provider pickups"),
+	("allocations", ("status",), "active allocation counts"),
+	("events", ("provider_id",), "provider events"),
+	("complaints", ("status",), "admin complaint queue"),
+	("outbound_emails", ("status", "next_attempt_at"), "mail worker claim"),
+	("otp_challenges", ("expires_at",), "OTP sweep"),
+	("users", ("deleted_at",), "user purge"),
+)
+
+
+def _dialect():
+	return db.engine.dialect.name
+
+
+def _bound_statement_time():
+	if _dialect() == "postgresql":
+		db.session.execute(text(f"SET LOCAL statement_timeout = {int(PROBE_TIMEOUT_MS)}"))
+
+
+def _probe(collect):
+	started = time.perf_counter()
+	try:
+		_bound_statement_time()
+		result = {"ok": True, **collect()}
+	except Exception as exc:
+		result = {"ok": False, "error": str(exc)}
+	finally:
+		db.session.rollback()
+	result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+	return result
+
+
+def _hit_rate(values):
+	hits = sum(value for labels, value in values.items() if labels[-1] == "hit")
+	misses = sum(value for labels, value in values.items() if labels[-1] == "miss")
+	total = hits + misses
+	return {"hits": hits, "misses": misses, "hit_rate": round(hits / total, 3) if total else None}
+
+
+def _database():
+	url = db.engine.url
+	samples = []
+	for _ in range(LATENCY_SAMPLES):
+		started = time.perf_counter()
+		db.session.execute(text("SELECT 1")).scalar()
+		samples.append((time.perf_counter() - started) * 1000)
+	return {
+		"dialect": url.get_backend_name(),
+		"driver": url.get_driver_name(),
+		"host": url.host or "",
+		"database": os.path.basename(url.database or "") if url.get_backend_name() == "sqlite" else (url.database or ""),
+		"round_trip_ms": {
+			"min": round(min(samples), 3),
+			"median": round(statistics.median(samples), 3),
+			"max": round(max(samples), 3),
+		},
+	}
+
+
+def _pool():
+	pools = {}
+	for bind, engine in db.engines.items():
+		pool = engine.pool
+		stats = {"class": type(pool).__name__, "status": pool.status()}
+		for name in ("size", "checkedin", "checkedout", "overflow"):
+			reader = getattr(pool, name, None)
+			if callable(reader):
+				stats[name] = reader()
+		pools[bind or "default"] = stats
+	return {"binds": pools}
+
+
+def _migrations_directory():
+	migrate = current_app.extensions.get("migrate")
+	directory = migrate.directory if migrate is not None else "migrations"
+	# Flask-Migrate's default is relative to the working directory; anchor it at the project root.
+	return directory if os.path.isabs(directory) else os.path.join(os.path.dirname(current_app.root_path), directory)
+
+
+def _migrations():
+	from alembic.config import Config as AlembicConfig
+	from alembic.script import ScriptDirectory
+
+	config = AlembicConfig()
+	config.set_main_option("script_location", _migrations_directory())
+	heads = sorted(ScriptDirectory.from_config(config).get_heads())
+
+	current = []
+	if inspect(db.engine).has_table("alembic_version"):
+		current = sorted(db.session.execute(text("SELECT version_num FROM alembic_version")).scalars().all())
+	return {"heads": heads, "current": current, "up_to_date": bool(current) and current == heads}
+
+
+def _replica():
+	engine = db.engines.get(REPLICA_BIND)
+	if engine is None:
+		return {"configured": False}
+	health = replica_health(engine, force=True)
+	return {
+		"configured": True,
+		"healthy": health["healthy"],
+		"lag_seconds": health["lag_seconds"],
+		"max_lag_seconds": current_app.config["REPLICA_MAX_LAG_SECONDS"],
+		"error": health["error"],
+	}
+
+
+def _row_estimates():
+	tables = sorted(db.metadata.tables)
+	dialect = _dialect()
+	if dialect == "postgresql":
+		rows = db.session.execute(
+			text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relname = ANY(:names)"),
+			{"names": tables},
+		).all()
+		# reltuples is -1 until the first VACUUM/ANALYZE.
+		return {"method": "pg_class.reltuples", "tables": {name: max(int(value), 0) if value >= 0 else None for name, value in rows}}
+	if dialect == "sqlite":
+		existing = set(inspect(db.engine).get_table_names())
+		estimates = {}
+		for name in tables:
+			if name in existing:
+				estimates[name] = db.session.execute(text(f'SELECT MAX(rowid) FROM "{name}"')).scalar() or 0
+		return {"method": "max(rowid)", "tables": estimates}
+	return {"method": None, "tables": {}}
+
+
+def _index_presence():
+	inspector = inspect(db.engine)
+	existing = set(inspector.get_table_names())
+	checks = []
+	for table, columns, purpose in HOT_QUERY_INDEXES:
+		if table not in existing:
+			checks.append({"table": table, "columns": list(columns), "purpose": purpose, "present": False, "index": None})
+			continue
+		candidates = [(index["name"], index["column_names"]) for index in inspector.get_indexes(table)]
+		primary_key = inspector.get_pk_constraint(table).get("constrained_columns") or []
+		candidates.append(("PRIMARY KEY", primary_key))
+		match = next((name for name, indexed in candidates if tuple(indexed[: len(columns)]) == columns), None)
+		checks.append({"table": table, "columns": list(columns), "purpose": purpose, "present": match is not None, "index": match})
+	return {"checks": checks, "missing": sum(1 for item in checks if not item["present"])}
+
+
+def _caches():
+	geocode_info = maps_service._cached_geocode.cache_info()
+	lookups = counter_values("kalyana_cache_lookups_total")
+	return {
+		"geocode": {
+			**_hit_rate(counter_values("kalyana_geocode_cache_total")),
+			"entries": geocode_info.currsize,
+			"max_entries": geocode_info.maxsize,
+		},
+		"otp_challenge": {
+			**_hit_rate({labels: value for labels, value in lookups.items() if labels[0] == "otp_challenge"}),
+			"entries": len(otp_service._cache),
+			"max_entries": otp_service.CACHE_MAX_ENTRIES,
+		},
+		"weather_tile": {
+			**_hit_rate({labels: value for labels, value in lookups.items() if labels[0] == "weather_tile"}),
+			"entries": len(weather_service._memory_cache),
+		},
+		"image_variants": {"known_ready": len(image_service._ready_variants)},
+	}
+
+
+def _queues():
+	now = datetime.utcnow()
+	oldest_due = (
+		db.session.query(func.min(OutboundEmail.next_attempt_at))
+		.filter(OutboundEmail.status == "queued")
+		.scalar()
+	)
+	executor = image_service._executor
+	work_queue = getattr(executor, "_work_queue", None)
+	return {
+		"mail": {
+			"depth": mail_queue_depth(),
+			"oldest_due_seconds": round((now - oldest_due).total_seconds(), 1) if oldest_due else None,
+		},
+		"otp_challenges": {
+			"expired_awaiting_sweep": OtpChallenge.query.filter(OtpChallenge.expires_at < now).count(),
+		},
+		"image_variants": {"pending": work_queue.qsize() if work_queue is not None else 0},
+		"user_purge": {"pending": pending_purge_count()},
+	}
+
+
+def _realtime():
+	socketio = current_app.extensions.get("socketio")
+	connected = sum(counter_values("kalyana_socket_connections_total").values())
+	closed = sum(counter_values("kalyana_socket_disconnections_total").values())
+	return {
+		"enabled": socketio is not None,
+		"async_mode": getattr(socketio, "async_mode", None),
+		"message_queue": bool(current_app.config.get("SOCKETIO_MESSAGE_QUEUE")),
+		"connections_open": connected - closed,
+		"scope": "this process",
+	}
+
+
+def collect_diagnostics():
+	probes = {
+		"database": _probe(_database),
+		"pool": _probe(_pool),
+		"migrations": _probe(_migrations),
+		"replica": _probe(_replica),
+		"row_estimates": _probe(_row_estimates),
+		"indexes": _probe(_index_presence),
+		"caches": _probe(_caches),
+		"queues": _probe(_queues),
+		"realtime": _probe(_realtime),
+	}
+	if not probes["database"]["ok"]:
+		status = "down"
+	elif not all(probe["ok"] for probe in probes.values()):
+		status = "degraded"
+	elif (
+		not probes["migrations"]["up_to_date"]
+		or probes["indexes"]["missing"]
+		or (probes["replica"]["configured"] and not probes["replica"]["healthy"])
+	):
+		status = "attention"
+	else:
+		status = "ok"
+	return {"status": status, "generated_at": datetime.utcnow().isoformat(), "profile": current_app.config.get("APP_PROFILE"), **probes}
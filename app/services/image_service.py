@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import time
+
+from flask import current_app, url_for
+
+
+IMAGE_VARIANTS = {
+	"thumb": 320,
+	"medium": 1280,
+}
+VARIANT_DIRNAME = "variants"
+MISSING_RECHECK_SECONDS = 60
+
+_executor = None
+_executor_lock = threading.Lock()
+_ready_variants = set()
+_missing_variants = {}
+_pillow_modules = None
+
+
+def _pillow():
+	"""(Image, ImageOps), imported on first use so rendering photo_url never loads Pillow."""
+	global _pillow_modules
+	if _pillow_modules is None:
+		try:
+			from PIL import Image, ImageOps
+			_pillow_modules = (Image, ImageOps)
+		except ImportError:  # Pillow missing: photo uploads are rejected, variants are skipped.
+			_pillow_modules = (None, None)
+	return _pillow_modules
+
+
+def variant_path(photo_path: str, variant: str) -> str:
+	"""Relative path of a variant, e.g. uploads/food_images/variants/x.thumb.webp."""
+	directory, filename = os.path.split(photo_path)
+	stem = filename.rsplit(".", 1)[0]
+	return "/".join(part for part in (directory, VARIANT_DIRNAME, f"{stem}.{variant}.webp") if part)
+
+
+def _get_executor(app):
+	global _executor
+	with _executor_lock:
+		if _executor is None:
+			_executor = ThreadPoolExecutor(
+				max_workers=int(app.config.get("IMAGE_WORKERS", 2)),
+				thread_name_prefix="image-variants",
+			)
+		return _executor
+
+
+def strip_metadata(path: str) -> bool:
+	"""Re-encode an image in place without EXIF or other metadata.
+
+	The EXIF orientation is applied first, so the photo still displays the
+	right way up. Returns False, leaving the file untouched, when Pillow is
+	missing or cannot read or re-encode it.
+	"""
+	Image, ImageOps = _pillow()
+	if Image is None:
+		return False
+
+	temp_path = f"{path}.tmp"
+	try:
+		with Image.open(path) as opened:
+			image_format = opened.format or "JPEG"
+			image = ImageOps.exif_transpose(opened)
+			if image.mode not in ("RGB", "RGBA"):
+				image = image.convert("RGB")
+			clean = Image.new(image.mode, image.size)
+			clean.paste(image)
+		clean.save(temp_path, format=image_format, quality=88)
+		os.replace(temp_path, path)
+	except (OSError, ValueError, KeyError, Image.DecompressionBombError):
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		return False
+	return True
+
+
+def generate_variants(static_root: str, photo_path: str) -> bool:
+	"""Write WebP thumb/medium variants. The original was cleaned by store_upload and is not modified."""
+	Image, _ = _pillow()
+	if Image is None:
+		return False
+
+	source = os.path.join(static_root, photo_path)
+	with Image.open(source) as opened:
+		image = opened if opened.mode in ("RGB", "RGBA") else opened.convert("RGB")
+		for variant, max_edge in IMAGE_VARIANTS.items():
+			target = os.path.join(static_root, variant_path(photo_path, variant))
+			os.makedirs(os.path.dirname(target), exist_ok=True)
+			resized = image.copy()
+			resized.thumbnail((max_edge, max_edge))
+			temp_target = f"{target}.tmp"
+			resized.save(temp_target, format="WEBP", quality=78, method=4)
+			os.replace(temp_target, target)
+
+	return True
+
+
+def _run_variants(app, photo_path):
+	try:
+		generate_variants(app.static_folder, photo_path)
+	except Exception as exc:
+		app.logger.error("Image variant generation failed for %s: %s", photo_path, exc)
+
+
+def enqueue_variants(photo_path: str, app=None):
+	app = app or current_app._get_current_object()
+	if _pillow()[0] is None or not photo_path:
+		return None
+	return _get_executor(app).submit(_run_variants, app, photo_path)
+
+
+def remove_photo(static_root: str, photo_path: str) -> int:
+	"""Delete an upload and its variants from the static root. Returns files removed."""
+	root = os.path.realpath(static_root)
+	removed = 0
+	for relative in (photo_path, *(variant_path(photo_path, variant) for variant in IMAGE_VARIANTS)):
+		target = os.path.realpath(os.path.join(root, relative))
+		if os.path.commonpath([root, target]) != root:
+			continue
+		try:
+			os.remove(target)
+			removed += 1
+		except FileNotFoundError:
+			pass
+		_ready_variants.discard(relative)
+		_missing_variants.pop(relative, None)
+	return removed
+
+
+def _variant_ready(static_root: str, path: str) -> bool:
+	if path in _ready_variants:
+		return True
+
+	checked_at = _missing_variants.get(path)
+	if checked_at is not None and time.monotonic() - checked_at < MISSING_RECHECK_SECONDS:
+		return False
+
+	if os.path.exists(os.path.join(static_root, path)):
+		_ready_variants.add(path)
+		_missing_variants.pop(path, None)
+		return True
+
+	_missing_variants[path] = time.monotonic()
+	return False
+
+
+def photo_url(photo_path: str, variant: str = None):
+	"""URL of the requested variant, falling back to the original until it exists."""
+	if not photo_path:
+		return None
+	if variant:
+		candidate = variant_path(photo_path, variant)
+		if _variant_ready(current_app.static_folder, candidate):
+			return url_for("auth.media_file", filename=candidate)
+	return url_for("auth.media_file", filename=photo_path)
@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+import smtplib
+import threading
+import time
+
+from flask import current_app
+
+from app import db
+from app.models.mail import OutboundEmail
+
+
+MAX_SEND_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 15
+BACKOFF_MAX_SECONDS = 30 * 60
+CLAIM_BATCH_SIZE = 20
+STALE_CLAIM_SECONDS = 300
+
+_worker = None
+_worker_lock = threading.Lock()
+_wake = threading.Event()
+
+
+def smtp_configured(app=None) -> bool:
+	app = app or current_app
+	return bool(app.config.get("SMTP_HOST") and (app.config.get("SMTP_FROM_EMAIL") or app.config.get("SMTP_USER")))
+
+
+def retry_delay_seconds(attempts: int) -> int:
+	return min(BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)), BACKOFF_MAX_SECONDS)
+
+
+class SMTPConnection:
+	"""One authenticated SMTP session reused across messages.
+
+	Reconnects when the server drops the session or it has been idle longer
+	than SMTP_IDLE_SECONDS, so STARTTLS and login happen once per burst
+	instead of once per email.
+	"""
+
+	def __init__(self, config):
+		self.host = config.get("SMTP_HOST", "")
+		self.port = int(config.get("SMTP_PORT", 587) or 587)
+		self.username = config.get("SMTP_USER", "")
+		self.password = config.get("SMTP_PASSWORD", "")
+		self.from_email = config.get("SMTP_FROM_EMAIL") or self.username
+		self.use_tls = str(config.get("SMTP_USE_TLS", "true")).lower() == "true"
+		self.idle_seconds = int(config.get("SMTP_IDLE_SECONDS", 60))
+		self._server = None
+		self._last_used = 0.0
+
+	def _connect(self):
+		server = smtplib.SMTP(self.host, self.port, timeout=15)
+		if self.use_tls:
+			server.starttls()
+		if self.username and self.password:
+			server.login(self.username, self.password)
+		self._server = server
+
+	def close(self):
+		if self._server is None:
+			return
+		try:
+			self._server.quit()
+		except (smtplib.SMTPException, OSError):
+			pass
+		self._server = None
+
+	def close_if_idle(self):
+		if self._server is not None and time.monotonic() - self._last_used > self.idle_seconds:
+			self.close()
+
+	def send(self, message):
+		self.close_if_idle()
+		if self._server is None:
+			self._connect()
+		try:
+			self._server.send_message(message)
+		except (smtplib.SMTPServerDisconnected, ConnectionError):
+			# The warm session went away between messages; retry once on a fresh one.
+			self.close()
+			self._connect()
+			self._server.send_message(message)
+		self._last_used = time.monotonic()
+
+
+def enqueue_email(recipient: str, subject: str, body: str):
+	"""Persist an email and hand it to the background worker.
+
+	Serverless functions freeze after the response, so a worker thread would
+	never send; there only this email is sent before returning, and a failure
+	stays queued for `mail worker` to retry. With MAIL_WORKER_ENABLED off the
+	email is only queued, for a separately run `mail worker`.
+	"""
+	row = OutboundEmail(recipient=recipient, subject=subject, body=body, next_attempt_at=datetime.utcnow())
+	db.session.add(row)
+	db.session.commit()
+
+	app = current_app._get_current_object()
+	if app.config.get("APP_PROFILE") == "serverless":
+		_deliver_inline(app, row.id)
+	elif app.config.get("MAIL_WORKER_ENABLED", True):
+		start_mail_worker(app)
+		_wake.set()
+	return row
+
+
+def _deliver_inline(app, email_id):
+	connection = SMTPConnection(app.config)
+	try:
+		claimed = OutboundEmail.query.filter(
+			OutboundEmail.id == email_id,
+			OutboundEmail.status == "queued",
+		).update({"status": "sending", "claimed_at": datetime.utcnow()}, synchronize_session=False)
+		db.session.commit()
+		if claimed:
+			_send_claimed(connection, db.session.get(OutboundEmail, email_id))
+	except Exception as exc:
+		db.session.rollback()
+		app.logger.error("Inline mail delivery failed for email %s: %s", email_id, exc)
+	finally:
+		connection.close()
+
+
+def _claim_due(limit: int):
+	now = datetime.utcnow()
+
+	# Rows left in "sending" by a worker that died are handed back to the queue.
+	OutboundEmail.query.filter(
+		OutboundEmail.status == "sending",
+		OutboundEmail.claimed_at < now - timedelta(seconds=STALE_CLAIM_SECONDS),
+	).update({"status": "queued"}, synchronize_session=False)
+
+	candidate_ids = [
+		email_id
+		for (email_id,) in db.session.query(OutboundEmail.id)
+		.filter(OutboundEmail.status == "queued", OutboundEmail.next_attempt_at <= now)
+		.order_by(OutboundEmail.next_attempt_at.asc(), OutboundEmail.id.asc())
+		.limit(limit)
+	]
+
+	claimed = []
+	for email_id in candidate_ids:
+		updated = OutboundEmail.query.filter(
+			OutboundEmail.id == email_id,
+			OutboundEmail.status == "queued",
+		).update({"status": "sending", "claimed_at": now}, synchronize_session=False)
+		if updated:
+			claimed.append(email_id)
+	db.session.commit()
+
+	if not claimed:
+		return []
+	return OutboundEmail.query.filter(OutboundEmail.id.in_(claimed)).order_by(OutboundEmail.id.asc()).all()
+
+
+def _build_message(row, from_email):
+	message = EmailMessage()
+	message["Subject"] = row.subject
+	message["From"] = from_email
+	message["To"] = row.recipient
+	message.set_content(row.body)
+	return message
+
+
+def _send_claimed(connection, row):
+	"""Send one claimed row and record the outcome. Returns "sent", "failed" or "retry"."""
+	try:
+		connection.send(_build_message(row, connection.from_email))
+	except Exception as exc:
+		row.attempts = (row.attempts or 0) + 1
+		row.last_error = str(exc)[:500]
+		if row.attempts >= MAX_SEND_ATTEMPTS:
+			row.status = "failed"
+			row.body = ""
+			outcome = "failed"
+			current_app.logger.error("Giving up on email %s to %s: %s", row.id, row.recipient, exc)
+		else:
+			row.status = "queued"
+			row.next_attempt_at = datetime.utcnow() + timedelta(seconds=retry_delay_seconds(row.attempts))
+			outcome = "retry"
+		connection.close()
+	else:
+		row.status = "sent"
+		row.sent_at = datetime.utcnow()
+		row.last_error = None
+		# OTP bodies are secrets; nothing needs them once delivered.
+		row.body = ""
+		outcome = "sent"
+	db.session.commit()
+	return outcome
+
+
+def deliver_due_emails(connection, limit: int = CLAIM_BATCH_SIZE):
+	"""Send one batch of due emails over the given connection. Returns (sent, failed)."""
+	sent = 0
+	failed = 0
+
+	for row in _claim_due(limit):
+		outcome = _send_claimed(connection, row)
+		sent += outcome == "sent"
+		failed += outcome == "failed"
+
+	return sent, failed
+
+
+def mail_queue_depth():
+	return OutboundEmail.query.filter(OutboundEmail.status.in_(["queued", "sending"])).count()
+
+
+class MailWorker(threading.Thread):
+	def __init__(self, app):
+		super().__init__(name="mail-worker", daemon=True)
+		self.app = app
+		self.poll_seconds = float(app.config.get("MAIL_POLL_SECONDS", 5))
+		self.stopped = threading.Event()
+
+	def run(self):
+		connection = SMTPConnection(self.app.config)
+		with self.app.app_context():
+			while not self.stopped.is_set():
+				_wake.clear()
+				try:
+					sent, failed = deliver_due_emails(connection)
+				except Exception as exc:
+					db.session.rollback()
+					self.app.logger.error("Mail worker batch failed: %s", exc)
+					sent, failed = 0, 0
+				finally:
+					db.session.remove()
+
+				if sent or failed:
+					continue
+				connection.close_if_idle()
+				_wake.wait(self.poll_seconds)
+		connection.close()
+
+	def stop(self):
+		self.stopped.set()
+		_wake.set()
+
+
+def start_mail_worker(app):
+	global _worker
+	with _worker_lock:
+		if _worker is None or not _worker.is_alive():
+			_worker = MailWorker(app)
+			_worker.start()
+		return _worker
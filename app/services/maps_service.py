@@ -1,31 +1,47 @@
 from functools import lru_cache
+import os
+import threading
 
 import requests
 
+from app.services.metrics_service import inc
+from app.services.profiling_service import external_call
 
-NOMINATIM_BASE = "https://nominatim.openstreetmap.org"
+
+NOMINATIM_BASE = os.getenv("NOMINATIM_BASE_URL", "https://nominatim.openstreetmap.org").rstrip("/")
 USER_AGENT = "kalyana-connection/1.0"
 
+_lookup = threading.local()
+
 
-@lru_cache(maxsize=256)
 def geocode_place(location_query: str):
+	_lookup.missed = False
+	result = _cached_geocode(location_query)
+	inc("kalyana_geocode_cache_total", ("miss" if _lookup.missed else "hit",))
+	return result
+
+
+@lru_cache(maxsize=256)
+def _cached_geocode(location_query: str):
+	_lookup.missed = True
 	query = (location_query or "").strip()
 	if not query:
 		return None
 
 	try:
-		response = requests.get(
-			f"{NOMINATIM_BASE}/search",
-			params={
-				"q": query,
-				"format": "json",
-				"addressdetails": 1,
-				"limit": 1,
-				"countrycodes": "in",
-			},
-			headers={"User-Agent": USER_AGENT},
-			timeout=12,
-		)
+		with external_call("nominatim"):
+			response = requests.get(
+				f"{NOMINATIM_BASE}/search",
+				params={
+					"q": query,
+					"format": "json",
+					"addressdetails": 1,
+					"limit": 1,
+					"countrycodes": "in",
+				},
+				headers={"User-Agent": USER_AGENT},
+				timeout=12,
+			)
 		response.raise_for_status()
 	except requests.RequestException:
 		return None
@@ -48,18 +64,19 @@ def suggest_places(partial_query: str, limit: int = 6):
 		return []
 
 	try:
-		response = requests.get(
-			f"{NOMINATIM_BASE}/search",
-			params={
-				"q": query,
-				"format": "json",
-				"addressdetails": 1,
-				"limit": max(1, min(limit, 10)),
-				"countrycodes": "in",
-			},
-			headers={"User-Agent": USER_AGENT},
-			timeout=12,
-		)
+		with external_call("nominatim"):
+			response = requests.get(
+				f"{NOMINATIM_BASE}/search",
+				params={
+					"q": query,
+					"format": "json",
+					"addressdetails": 1,
+					"limit": max(1, min(limit, 10)),
+					"countrycodes": "in",
+				},
+				headers={"User-Agent": USER_AGENT},
+				timeout=12,
+			)
 		response.raise_for_status()
 	except requests.RequestException:
 		return []
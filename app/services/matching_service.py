@@ -1,15 +1,35 @@
+from app import db
+from app.ml.demand_model import demand_scores_at
+from app.models.surplus import Surplus
+from app.models.user import User
+from app.services.affinity_service import affinity_scores_for_ngo
 from app.services.maps_service import geocode_place
-from app.utils.haversine import haversine_km
+from app.utils.haversine import bounding_box, haversine_km
 
 
-def filter_surplus_by_location(surplus_rows, receiver_location_query: str, radius_km: float):
-	geo = geocode_place(receiver_location_query)
-	if not geo:
-		return [], None
+AFFINITY_WEIGHT = 0.25
 
-	receiver_lat = geo["lat"]
-	receiver_lon = geo["lon"]
-	matched = []
+NEARBY_PROJECTION = (
+	Surplus.id,
+	Surplus.mahal_name,
+	Surplus.food_type,
+	Surplus.quantity,
+	Surplus.quantity_kg,
+	Surplus.remaining_kg,
+	Surplus.estimated_expiry,
+	Surplus.photo_path,
+	Surplus.provider_latitude,
+	Surplus.provider_longitude,
+)
+
+
+def rank_rows_by_distance(surplus_rows, receiver_lat: float, receiver_lon: float, radius_km: float):
+	"""Return (distance_km, row) pairs inside the radius, nearest first.
+
+	Works on ORM objects as well as plain column rows, as long as they expose
+	provider_latitude, provider_longitude and id.
+	"""
+	ranked = []
 
 	for row in surplus_rows:
 		if row.provider_latitude is None or row.provider_longitude is None:
@@ -17,8 +37,80 @@ def filter_surplus_by_location(surplus_rows, receiver_location_query: str, radiu
 
 		distance = haversine_km(receiver_lat, receiver_lon, row.provider_latitude, row.provider_longitude)
 		if distance <= radius_km:
-			row.computed_distance_km = round(distance, 1)
-			matched.append(row)
+			ranked.append((distance, row))
+
+	ranked.sort(key=lambda item: (item[0], item[1].id))
+	return ranked
+
+
+def filter_surplus_by_location(surplus_rows, receiver_location_query: str, radius_km: float, ngo_id=None, affinity_weight: float = AFFINITY_WEIGHT):
+	"""Match surplus near the receiver, optionally nudged by provider affinity.
+
+	With ngo_id, each row's distance is scaled by the precomputed
+	provider/NGO affinity score (one dict lookup per row), so providers the
+	NGO works well with rank slightly ahead of equally distant ones.
+	"""
+	geo = geocode_place(receiver_location_query)
+	if not geo:
+		return [], None
+
+	affinity = affinity_scores_for_ngo(ngo_id) if ngo_id and affinity_weight else {}
+	matched = []
+	for distance, row in rank_rows_by_distance(surplus_rows, geo["lat"], geo["lon"], radius_km):
+		row.computed_distance_km = round(distance, 1)
+		matched.append((distance * (1 - affinity_weight * affinity.get(row.provider_id, 0.0)), row))
+
+	if affinity:
+		matched.sort(key=lambda item: (item[0], item[1].id))
+	return [row for _, row in matched], geo
+
+
+def nearby_available_rows(receiver_lat: float, receiver_lon: float, radius_km: float):
+	"""Load compact column rows of available surplus inside the radius bounding box.
+
+	The box prefilter runs in SQL so only candidates near the receiver are
+	fetched; exact distances are then applied by rank_rows_by_distance.
+	"""
+	min_lat, max_lat, min_lon, max_lon = bounding_box(receiver_lat, receiver_lon, radius_km)
+	rows = (
+		db.session.query(*NEARBY_PROJECTION)
+		.filter(
+			Surplus.status == "available",
+			Surplus.provider_latitude.between(min_lat, max_lat),
+			Surplus.provider_longitude.between(min_lon, max_lon),
+		)
+		.all()
+	)
+	return rank_rows_by_distance(rows, receiver_lat, receiver_lon, radius_km)
+
+
+def rank_ngos_for_batch(surplus, limit: int = 10, moment=None):
+	"""Rank likely recipients for a batch from the materialised demand forecast.
+
+	Scores come from one lookup of the current hour-of-week slot; an NGO whose
+	declared capacity is below the batch's open quantity is scaled down by
+	the share it could carry.
+	"""
+	scores = demand_scores_at(moment)
+	if not scores:
+		return []
+
+	shortlist = sorted(scores, key=scores.get, reverse=True)[: limit * 3]
+	ngos = User.query.filter(User.id.in_(shortlist), User.role == "ngo", User.deleted_at.is_(None)).all()
+	open_kg = float(surplus.available_kg or 0)
+
+	ranked = []
+	for ngo_user in ngos:
+		capacity_fit = 1.0
+		if ngo_user.capacity_kg and open_kg > ngo_user.capacity_kg:
+			capacity_fit = ngo_user.capacity_kg / open_kg
+		ranked.append({
+			"ngo_id": ngo_user.id,
+			"name": ngo_user.full_name,
+			"demand_score": round(scores[ngo_user.id], 4),
+			"capacity_kg": ngo_user.capacity_kg,
+			"rank_score": round(scores[ngo_user.id] * capacity_fit, 4),
+		})
 
-	matched.sort(key=lambda item: item.computed_distance_km)
-	return matched, geo
+	ranked.sort(key=lambda item: (-item["rank_score"], item["ngo_id"]))
+	return ranked[:limit]
@@ -0,0 +1,147 @@
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+
+from flask import Response, current_app, send_from_directory
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+from app.services.image_service import strip_metadata
+
+
+FOOD_IMAGE_DIR = "uploads/food_images"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+CONTENT_ADDRESSED_NAME = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]+)+$")
+EXTENSION_ALIASES = {"jpeg": "jpg"}
+
+_legacy_index = None
+_legacy_index_lock = threading.Lock()
+
+
+class UploadError(ValueError):
+	pass
+
+
+def store_upload(file_storage, static_root: str, extension: str, subdir: str = FOOD_IMAGE_DIR):
+	"""Stream an upload to disk, strip its metadata and store it under its SHA-256 name.
+
+	Returns (relative_path, created). EXIF is removed before hashing, so the
+	name always identifies the bytes that are served and the file is never
+	rewritten afterwards. Identical photos map to the same path, so a
+	duplicate upload only costs the re-encode, the hash and a temp file.
+	Raises UploadError for a file that cannot be cleaned, rather than
+	storing it with its location data.
+	"""
+	extension = EXTENSION_ALIASES.get(extension.lower(), extension.lower())
+	upload_root = os.path.join(static_root, subdir)
+	os.makedirs(upload_root, exist_ok=True)
+
+	handle, temp_path = tempfile.mkstemp(dir=upload_root, suffix=".part")
+	try:
+		with os.fdopen(handle, "wb") as output:
+			while True:
+				chunk = file_storage.stream.read(UPLOAD_CHUNK_SIZE)
+				if not chunk:
+					break
+				output.write(chunk)
+
+		if not strip_metadata(temp_path):
+			raise UploadError("The photo could not be read as an image. Please upload a PNG, JPG or WEBP photo.")
+		digest = hashlib.sha256()
+		with open(temp_path, "rb") as cleaned:
+			for chunk in iter(lambda: cleaned.read(UPLOAD_CHUNK_SIZE), b""):
+				digest.update(chunk)
+
+		name = digest.hexdigest()
+		relative_path = f"{subdir}/{name[:2]}/{name}.{extension}"
+		target = os.path.join(static_root, relative_path)
+		if os.path.exists(target):
+			os.remove(temp_path)
+			return relative_path, False
+
+		os.makedirs(os.path.dirname(target), exist_ok=True)
+		os.replace(temp_path, target)
+		return relative_path, True
+	except BaseException:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
+
+
+def _legacy_root(app):
+	return os.path.join(app.root_path, "routes", "static")
+
+
+def legacy_media_index(app=None):
+	"""Relative paths under the legacy routes/static root, scanned once per process."""
+	global _legacy_index
+	app = app or current_app
+
+	if _legacy_index is None:
+		with _legacy_index_lock:
+			if _legacy_index is None:
+				root = _legacy_root(app)
+				index = set()
+				for directory, _, files in os.walk(root):
+					for filename in files:
+						index.add(os.path.relpath(os.path.join(directory, filename), root).replace(os.sep, "/"))
+				_legacy_index = frozenset(index)
+	return _legacy_index
+
+
+def is_content_addressed(relative_path: str) -> bool:
+	return bool(CONTENT_ADDRESSED_NAME.match(relative_path.rsplit("/", 1)[-1]))
+
+
+def _accel_response(root_label: str, root: str, relative_path: str, immutable: bool):
+	# Same checks send_from_directory applies: no escaping the root, files only.
+	full_path = safe_join(root, relative_path)
+	if full_path is None or not os.path.isfile(full_path):
+		raise NotFound()
+	relative_path = os.path.relpath(full_path, root).replace(os.sep, "/")
+
+	prefix = current_app.config.get("MEDIA_ACCEL_PREFIX", "/_media/").rstrip("/")
+	response = Response(status=200)
+	response.headers["X-Accel-Redirect"] = f"{prefix}/{root_label}/{relative_path}"
+	response.mimetype = mimetypes.guess_type(relative_path)[0] or "application/octet-stream"
+	if immutable:
+		response.cache_control.public = True
+		response.cache_control.max_age = IMMUTABLE_MAX_AGE
+		response.cache_control.immutable = True
+	return response
+
+
+def send_media(relative_path: str):
+	"""Serve an upload from the static root, or the legacy root via the index.
+
+	Content-addressed files get a year-long immutable Cache-Control: they are
+	cleaned before hashing and never rewritten. ETags, range and conditional
+	requests are handled by send_from_directory. With
+	MEDIA_SENDFILE_MODE=x-accel the bytes are left to the reverse proxy
+	(USE_X_SENDFILE covers the x-sendfile mode).
+	"""
+	immutable = is_content_addressed(relative_path)
+
+	if relative_path in legacy_media_index():
+		root_label, root = "legacy", _legacy_root(current_app)
+	else:
+		root_label, root = "static", current_app.static_folder
+
+	if current_app.config.get("MEDIA_SENDFILE_MODE") == "x-accel":
+		return _accel_response(root_label, root, relative_path, immutable)
+
+	response = send_from_directory(
+		root,
+		relative_path,
+		conditional=True,
+		max_age=IMMUTABLE_MAX_AGE if immutable else None,
+	)
+	if immutable:
+		response.cache_control.public = True
+		response.cache_control.immutable = True
+	return response
+
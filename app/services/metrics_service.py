@@ -0,0 +1,244 @@
+"""Prometheus text-format metrics without a client library.
+
+Counters and histograms are recorded into a per-thread shard, so the hot
+path is a thread-local lookup plus a dict update, with no lock. A thread
+takes the registry lock only once, to register its shard. A scrape sums
+all shards. Shards of threads (or gevent greenlets) that have finished
+are folded into a retired shard, so totals never go backwards.
+
+Gauges that describe current state (queue depth, pool usage, open surplus)
+are read from their source on every scrape instead of being tracked.
+"""
+from bisect import bisect_left
+import threading
+import time
+import weakref
+
+from flask import current_app, g, request
+from sqlalchemy import func
+
+from app import db
+from app.models.allocation import Allocation
+from app.models.otp import OtpChallenge
+from app.models.surplus import Surplus
+from app.services.mail_service import mail_queue_depth
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_LIVE_SHARDS = 1024
+
+# name -> (type, help, label names, buckets)
+METRICS = {
+	"kalyana_http_request_duration_seconds": (
+		"histogram", "Request latency by blueprint and route.", ("blueprint", "route", "method", "status"), LATENCY_BUCKETS,
+	),
+	"kalyana_geocode_cache_total": ("counter", "Geocode lookups by cache result.", ("result",), None),
+	"kalyana_cache_lookups_total": ("counter", "In-process cache lookups (OTP challenges, weather tiles) by result.", ("cache", "result"), None),
+	"kalyana_external_request_duration_seconds": (
+		"histogram", "Latency of outbound HTTP calls (Nominatim, Open-Meteo).", ("service",), LATENCY_BUCKETS,
+	),
+	"kalyana_db_read_routing_total": ("counter", "Requests on @read_replica views, by the database that served them.", ("target",), None),
+	"kalyana_socket_connections_total": ("counter", "Socket.IO connections accepted.", (), None),
+	"kalyana_socket_disconnections_total": ("counter", "Socket.IO connections closed.", (), None),
+	"kalyana_socket_events_emitted_total": ("counter", "platform_update events emitted, by scope.", ("scope",), None),
+}
+
+
+class _Shard:
+	__slots__ = ("counters", "histograms")
+
+	def __init__(self):
+		self.counters = {}
+		# key -> [per-bucket counts (last one is +Inf), sum, count]
+		self.histograms = {}
+
+	def merge_into(self, counters, histograms):
+		for key, value in list(self.counters.items()):
+			counters[key] = counters.get(key, 0) + value
+		for key, (buckets, total, count) in list(self.histograms.items()):
+			merged = histograms.get(key)
+			if merged is None:
+				histograms[key] = [list(buckets), total, count]
+				continue
+			merged[0] = [left + right for left, right in zip(merged[0], buckets)]
+			merged[1] += total
+			merged[2] += count
+
+
+_local = threading.local()
+_registry_lock = threading.Lock()
+_live_shards = []
+_retired = _Shard()
+
+
+def _fold_finished_shards():
+	alive = []
+	for thread_ref, shard in _live_shards:
+		thread = thread_ref()
+		if thread is not None and thread.is_alive():
+			alive.append((thread_ref, shard))
+		else:
+			shard.merge_into(_retired.counters, _retired.histograms)
+	_live_shards[:] = alive
+
+
+def _shard():
+	shard = getattr(_local, "shard", None)
+	if shard is None:
+		shard = _local.shard = _Shard()
+		with _registry_lock:
+			if len(_live_shards) >= MAX_LIVE_SHARDS:
+				_fold_finished_shards()
+			_live_shards.append((weakref.ref(threading.current_thread()), shard))
+	return shard
+
+
+def inc(name, labels=(), value=1):
+	counters = _shard().counters
+	key = (name, labels)
+	counters[key] = counters.get(key, 0) + value
+
+
+def observe(name, value, labels=()):
+	histograms = _shard().histograms
+	key = (name, labels)
+	entry = histograms.get(key)
+	if entry is None:
+		entry = histograms[key] = [[0] * (len(METRICS[name][3]) + 1), 0.0, 0]
+	entry[0][bisect_left(METRICS[name][3], value)] += 1
+	entry[1] += value
+	entry[2] += 1
+
+
+def _snapshot():
+	counters = {}
+	histograms = {}
+	with _registry_lock:
+		_fold_finished_shards()
+		_retired.merge_into(counters, histograms)
+		for _, shard in _live_shards:
+			shard.merge_into(counters, histograms)
+	return counters, histograms
+
+
+def counter_values(name):
+	"""{labels: value} for one counter, summed across threads."""
+	counters, _ = _snapshot()
+	return {labels: value for (metric, labels), value in counters.items() if metric == name}
+
+
+def _escape(value):
+	return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names, values, extra=()):
+	pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)] + list(extra)
+	return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value):
+	if value == float("inf"):
+		return "+Inf"
+	if isinstance(value, float) and value.is_integer():
+		return str(int(value))
+	return repr(value) if isinstance(value, float) else str(value)
+
+
+def _gauges():
+	"""(name, help, [(labels dict, value)]) read from the database and services."""
+	pool_rows = []
+	for bind, engine in db.engines.items():
+		checkedout = getattr(engine.pool, "checkedout", None)
+		if checkedout is not None:
+			pool_rows.append(({"bind": bind or "default"}, checkedout()))
+
+	open_kg_expr = func.coalesce(Surplus.remaining_kg, Surplus.quantity, Surplus.quantity_kg)
+	open_count, open_kg = (
+		db.session.query(func.count(Surplus.id), func.coalesce(func.sum(open_kg_expr), 0))
+		.filter(Surplus.status == "available")
+		.one()
+	)
+	active_allocations = Allocation.query.filter(Allocation.status.in_(["requested", "allocated"])).count()
+	pending_otps = OtpChallenge.query.count()
+	db.session.rollback()
+
+	return [
+		("kalyana_mail_queue_depth", "Outbound emails (OTP and others) waiting to be sent.", [({}, mail_queue_depth())]),
+		("kalyana_otp_challenges", "OTP challenges awaiting verification or sweep.", [({}, pending_otps)]),
+		("kalyana_db_pool_checked_out", "Database connections currently checked out of the pool.", pool_rows),
+		("kalyana_open_surplus_batches", "Surplus batches open for requests.", [({}, open_count)]),
+		("kalyana_open_surplus_kg", "Kilograms still unclaimed in open batches.", [({}, float(open_kg or 0))]),
+		("kalyana_active_allocations", "Allocations requested or allocated but not yet picked up.", [({}, active_allocations)]),
+	]
+
+
+def render_metrics():
+	counters, histograms = _snapshot()
+	lines = []
+	for name, (kind, help_text, label_names, buckets) in METRICS.items():
+		lines.append(f"# HELP {name} {help_text}")
+		lines.append(f"# TYPE {name} {kind}")
+		if kind == "counter":
+			for (metric, labels), value in sorted(counters.items()):
+				if metric == name:
+					lines.append(f"{name}{_label_text(label_names, labels)} {_format_number(value)}")
+			continue
+		for (metric, labels), (bucket_counts, total, count) in sorted(histograms.items()):
+			if metric != name:
+				continue
+			running = 0
+			for bound, bucket_count in zip(buckets + (float("inf"),), bucket_counts):
+				running += bucket_count
+				le = f'le="{_format_number(bound)}"'
+				lines.append(f"{name}_bucket{_label_text(label_names, labels, (le,))} {running}")
+			lines.append(f"{name}_sum{_label_text(label_names, labels)} {_format_number(total)}")
+			lines.append(f"{name}_count{_label_text(label_names, labels)} {count}")
+
+	connected = sum(value for (metric, _), value in counters.items() if metric == "kalyana_socket_connections_total")
+	closed = sum(value for (metric, _), value in counters.items() if metric == "kalyana_socket_disconnections_total")
+	gauges = [("kalyana_socket_connections_open", "Socket.IO connections open in this process.", [({}, connected - closed)])]
+	try:
+		gauges.extend(_gauges())
+	except Exception as exc:  # a broken database should not hide the other metrics
+		current_app.logger.warning("Metrics gauges unavailable: %s", exc)
+	for name, help_text, rows in gauges:
+		lines.append(f"# HELP {name} {help_text}")
+		lines.append(f"# TYPE {name} gauge")
+		for labels, value in rows:
+			lines.append(f"{name}{_label_text(tuple(labels), tuple(labels.values()))} {_format_number(value)}")
+	return "\n".join(lines) + "\n"
+
+
+def _start_timer():
+	g._metrics_started = time.perf_counter()
+
+
+def _record_request(response):
+	started = g.pop("_metrics_started", None)
+	if started is not None:
+		rule = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+		observe(
+			"kalyana_http_request_duration_seconds",
+			time.perf_counter() - started,
+			(request.blueprint or "", rule, request.method, str(response.status_code)),
+		)
+	return response
+
+
+def _socket_connected(auth=None):
+	inc("kalyana_socket_connections_total")
+
+
+def _socket_disconnected(*args):
+	inc("kalyana_socket_disconnections_total")
+
+
+def init_metrics(app):
+	if not app.config.get("METRICS_ENABLED"):
+		return
+	app.before_request(_start_timer)
+	app.after_request(_record_request)
+	socketio = app.extensions.get("socketio")
+	if socketio is not None:
+		socketio.on_event("connect", _socket_connected)
+		socketio.on_event("disconnect", _socket_disconnected)
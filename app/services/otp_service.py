@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+import json
+import secrets
+import threading
+import time
+
+from app import db
+from app.models.otp import OtpChallenge
+from app.services.metrics_service import inc
+
+
+CACHE_MAX_ENTRIES = 2048
+SWEEP_INTERVAL_SECONDS = 300
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+def _naive_utc(value: str):
+	parsed = datetime.fromisoformat(value)
+	if parsed.tzinfo is not None:
+		parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+	return parsed
+
+
+def _cache_put(challenge_id, context):
+	with _cache_lock:
+		_cache[challenge_id] = context
+		_cache.move_to_end(challenge_id)
+		while len(_cache) > CACHE_MAX_ENTRIES:
+			_cache.popitem(last=False)
+
+
+def _cache_drop(challenge_id):
+	with _cache_lock:
+		_cache.pop(challenge_id, None)
+
+
+def create_otp_challenge(purpose: str, context: dict) -> str:
+	"""Store an OTP context server-side and return its opaque id for the session."""
+	maybe_sweep_expired_challenges()
+
+	extra = {key: value for key, value in context.items() if key not in {"email", "otp_hash", "expires_at", "attempts"}}
+	challenge_id = secrets.token_urlsafe(32)
+	db.session.add(
+		OtpChallenge(
+			id=challenge_id,
+			purpose=purpose,
+			email=context["email"],
+			otp_hash=context["otp_hash"],
+			payload=json.dumps(extra),
+			attempts=0,
+			expires_at=_naive_utc(context["expires_at"]),
+		)
+	)
+	db.session.commit()
+	_cache_put(challenge_id, (purpose, {**context, "attempts": 0}))
+	return challenge_id
+
+
+def get_otp_challenge(challenge_id, purpose: str):
+	"""Context dict for a live challenge, or None.
+
+	Served from the in-process LRU when possible. The attempt count in a
+	cached copy may lag other workers; enforcement goes through
+	record_failed_attempt, which always hits the database.
+	"""
+	if not isinstance(challenge_id, str) or not challenge_id:
+		return None
+
+	with _cache_lock:
+		cached = _cache.get(challenge_id)
+		if cached is not None:
+			_cache.move_to_end(challenge_id)
+	inc("kalyana_cache_lookups_total", ("otp_challenge", "miss" if cached is None else "hit"))
+	if cached is not None:
+		cached_purpose, context = cached
+		return dict(context) if cached_purpose == purpose else None
+
+	row = db.session.get(OtpChallenge, challenge_id)
+	if row is None or row.purpose != purpose:
+		return None
+
+	context = {
+		**json.loads(row.payload or "{}"),
+		"email": row.email,
+		"otp_hash": row.otp_hash,
+		"expires_at": row.expires_at.replace(tzinfo=timezone.utc).isoformat(),
+		"attempts": row.attempts,
+	}
+	_cache_put(challenge_id, (purpose, context))
+	return dict(context)
+
+
+def record_failed_attempt(challenge_id: str):
+	"""Atomically bump the attempt counter. Returns the new count, or None if the challenge is gone."""
+	updated = OtpChallenge.query.filter_by(id=challenge_id).update(
+		{OtpChallenge.attempts: OtpChallenge.attempts + 1},
+		synchronize_session=False,
+	)
+	if not updated:
+		db.session.commit()
+		_cache_drop(challenge_id)
+		return None
+
+	attempts = db.session.query(OtpChallenge.attempts).filter_by(id=challenge_id).scalar()
+	db.session.commit()
+	return attempts
+
+
+def consume_otp_challenge(challenge_id: str) -> bool:
+	"""Delete the challenge; True only for the one request that actually removed it."""
+	_cache_drop(challenge_id)
+	if not isinstance(challenge_id, str) or not challenge_id:
+		return False
+	deleted = OtpChallenge.query.filter_by(id=challenge_id).delete(synchronize_session=False)
+	db.session.commit()
+	return bool(deleted)
+
+
+def sweep_expired_challenges() -> int:
+	deleted = OtpChallenge.query.filter(OtpChallenge.expires_at < datetime.utcnow()).delete(synchronize_session=False)
+	db.session.commit()
+	return deleted
+
+
+def maybe_sweep_expired_challenges():
+	global _last_sweep
+	now = time.monotonic()
+	if now - _last_sweep < SWEEP_INTERVAL_SECONDS:
+		return 0
+	_last_sweep = now
+	return sweep_expired_challenges()
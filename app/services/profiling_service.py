@@ -0,0 +1,257 @@
+"""Opt-in per-request profiling (PROFILING_ENABLED).
+
+When enabled, every request records wall time, SQL statement count and DB
+time (SQLAlchemy cursor events), external HTTP time (see external_call) and
+template render time (Flask's template signals). Totals are aggregated per
+endpoint in process memory. Requests and statements slower than their
+thresholds go to fixed-size ring buffers for /admin/profiling.
+
+Nothing is stored that could hold user data: query strings keep their
+keys with the values redacted, and statements are kept without their bound
+parameters (only the parameter count).
+
+When disabled, init_profiling registers no hooks at all; external_call
+then only feeds the /metrics latency histogram.
+"""
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+import threading
+import time
+
+from flask import before_render_template, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.services.metrics_service import observe
+
+
+REDACTED = "[redacted]"
+MAX_STATEMENT_CHARS = 600
+SLOW_QUERIES_PER_REQUEST = 5
+
+_enabled = False
+_hooks_installed = False
+_lock = threading.Lock()
+_endpoint_stats = {}
+_slow_requests = deque(maxlen=100)
+_slow_queries = deque(maxlen=100)
+_settings = {"slow_request_ms": 500.0, "slow_query_ms": 100.0}
+_started_at = None
+
+
+class RequestProfile:
+	__slots__ = ("started", "sql_count", "db_ms", "http_ms", "http_calls", "template_ms", "template_stack", "slow_statements")
+
+	def __init__(self):
+		self.started = time.perf_counter()
+		self.sql_count = 0
+		self.db_ms = 0.0
+		self.http_ms = 0.0
+		self.http_calls = {}
+		self.template_ms = 0.0
+		self.template_stack = []
+		self.slow_statements = []
+
+
+def profiling_enabled():
+	return _enabled
+
+
+def _current_profile():
+	if not has_request_context():
+		return None
+	return g.get("_request_profile")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+	conn.info.setdefault("_profile_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+	starts = conn.info.get("_profile_query_start")
+	if not starts:
+		return
+	elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+	profile = _current_profile()
+	if profile is None:
+		return
+
+	profile.sql_count += 1
+	profile.db_ms += elapsed_ms
+	if elapsed_ms < _settings["slow_query_ms"]:
+		return
+
+	if isinstance(parameters, (list, tuple)) and executemany:
+		parameter_count = sum(len(item) for item in parameters)
+	else:
+		parameter_count = len(parameters or ())
+	entry = {
+		"at": datetime.utcnow(),
+		"endpoint": request.endpoint or "-",
+		"duration_ms": round(elapsed_ms, 1),
+		"statement": " ".join(statement.split())[:MAX_STATEMENT_CHARS],
+		"parameters": f"{parameter_count} bound, {REDACTED}",
+	}
+	if len(profile.slow_statements) < SLOW_QUERIES_PER_REQUEST:
+		profile.slow_statements.append(entry)
+	with _lock:
+		_slow_queries.append(entry)
+
+
+def _before_render(sender, template, context, **extra):
+	profile = _current_profile()
+	if profile is not None:
+		profile.template_stack.append(time.perf_counter())
+
+
+def _after_render(sender, template, context, **extra):
+	profile = _current_profile()
+	if profile is not None and profile.template_stack:
+		profile.template_ms += (time.perf_counter() - profile.template_stack.pop()) * 1000
+
+
+@contextmanager
+def external_call(service):
+	"""Time an outbound HTTP call for /metrics and the current request's profile."""
+	started = time.perf_counter()
+	try:
+		yield
+	finally:
+		elapsed = time.perf_counter() - started
+		observe("kalyana_external_request_duration_seconds", elapsed, (service,))
+		profile = _current_profile() if _enabled else None
+		if profile is not None:
+			profile.http_ms += elapsed * 1000
+			profile.http_calls[service] = profile.http_calls.get(service, 0) + 1
+
+
+def _redacted_args():
+	return {key: REDACTED for key in request.args}
+
+
+def _start_request():
+	g._request_profile = RequestProfile()
+
+
+def _finish_request(response):
+	profile = g.pop("_request_profile", None)
+	if profile is None:
+		return response
+
+	wall_ms = (time.perf_counter() - profile.started) * 1000
+	endpoint = request.endpoint or "<unmatched>"
+	with _lock:
+		stats = _endpoint_stats.get(endpoint)
+		if stats is None:
+			stats = _endpoint_stats[endpoint] = {
+				"count": 0,
+				"wall_ms": 0.0,
+				"max_ms": 0.0,
+				"sql_count": 0,
+				"db_ms": 0.0,
+				"http_ms": 0.0,
+				"template_ms": 0.0,
+				"slow": 0,
+			}
+		stats["count"] += 1
+		stats["wall_ms"] += wall_ms
+		stats["max_ms"] = max(stats["max_ms"], wall_ms)
+		stats["sql_count"] += profile.sql_count
+		stats["db_ms"] += profile.db_ms
+		stats["http_ms"] += profile.http_ms
+		stats["template_ms"] += profile.template_ms
+		if wall_ms >= _settings["slow_request_ms"]:
+			stats["slow"] += 1
+			_slow_requests.append({
+				"at": datetime.utcnow(),
+				"method": request.method,
+				"endpoint": endpoint,
+				"path": request.path,
+				"args": _redacted_args(),
+				"status": response.status_code,
+				"wall_ms": round(wall_ms, 1),
+				"sql_count": profile.sql_count,
+				"db_ms": round(profile.db_ms, 1),
+				"http_ms": round(profile.http_ms, 1),
+				"http_calls": dict(profile.http_calls),
+				"template_ms": round(profile.template_ms, 1),
+				"slow_statements": profile.slow_statements,
+			})
+
+	response.headers["Server-Timing"] = (
+		f"db;dur={profile.db_ms:.1f};desc=\"{profile.sql_count} queries\", "
+		f"ext;dur={profile.http_ms:.1f}, tpl;dur={profile.template_ms:.1f}, total;dur={wall_ms:.1f}"
+	)
+	return response
+
+
+def _install_hooks():
+	global _hooks_installed
+	if _hooks_installed:
+		return
+	# Listening on the Engine class covers every bind, including ones created later.
+	event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+	event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+	before_render_template.connect(_before_render)
+	template_rendered.connect(_after_render)
+	_hooks_installed = True
+
+
+def init_profiling(app):
+	global _enabled, _slow_requests, _slow_queries, _started_at
+	if not app.config.get("PROFILING_ENABLED"):
+		return
+
+	with _lock:
+		_settings["slow_request_ms"] = float(app.config["PROFILING_SLOW_REQUEST_MS"])
+		_settings["slow_query_ms"] = float(app.config["PROFILING_SLOW_QUERY_MS"])
+		ring_size = int(app.config["PROFILING_RING_SIZE"])
+		_slow_requests = deque(_slow_requests, maxlen=ring_size)
+		_slow_queries = deque(_slow_queries, maxlen=ring_size)
+		_started_at = _started_at or datetime.utcnow()
+	_install_hooks()
+	app.before_request(_start_request)
+	app.after_request(_finish_request)
+	_enabled = True
+
+
+def profiling_snapshot():
+	"""Copy of the aggregates, newest ring-buffer entries first."""
+	with _lock:
+		endpoints = []
+		for endpoint, stats in _endpoint_stats.items():
+			count = stats["count"] or 1
+			endpoints.append({
+				"endpoint": endpoint,
+				"count": stats["count"],
+				"total_ms": round(stats["wall_ms"], 1),
+				"avg_ms": round(stats["wall_ms"] / count, 1),
+				"max_ms": round(stats["max_ms"], 1),
+				"avg_sql": round(stats["sql_count"] / count, 1),
+				"avg_db_ms": round(stats["db_ms"] / count, 1),
+				"avg_http_ms": round(stats["http_ms"] / count, 1),
+				"avg_template_ms": round(stats["template_ms"] / count, 1),
+				"slow": stats["slow"],
+			})
+		slow_requests = list(reversed(_slow_requests))
+		slow_queries = list(reversed(_slow_queries))
+
+	endpoints.sort(key=lambda row: row["total_ms"], reverse=True)
+	return {
+		"enabled": _enabled,
+		"since": _started_at,
+		"settings": dict(_settings),
+		"endpoints": endpoints,
+		"slow_requests": slow_requests,
+		"slow_queries": slow_queries,
+	}
+
+
+def reset_profiling():
+	global _started_at
+	with _lock:
+		_endpoint_stats.clear()
+		_slow_requests.clear()
+		_slow_queries.clear()
+		_started_at = datetime.utcnow() if _enabled else None
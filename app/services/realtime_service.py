@@ -1,9 +1,15 @@
 from datetime import datetime
 
-from app import socketio
+from flask import current_app
+
+from app.services.metrics_service import inc
 
 
 def publish_platform_update(scope: str, action: str, actor_role: str = "system"):
+    socketio = current_app.extensions.get("socketio")
+    if socketio is None:
+        # Serverless profile: no websocket server, dashboards fall back to polling/refresh.
+        return
     socketio.emit(
         "platform_update",
         {
@@ -13,3 +19,4 @@ def publish_platform_update(scope: str, action: str, actor_role: str = "system")
             "timestamp": datetime.utcnow().isoformat(),
         },
     )
+    inc("kalyana_socket_events_emitted_total", (scope,))
@@ -0,0 +1,35 @@
+"""One hook per review/complaint write for every rollup that counts it.
+
+Routes call these instead of the affinity and trust services directly, so
+a new write path cannot update one rollup and forget the other. Call
+before commit; each hook locks the rows it changes.
+"""
+from app.services import affinity_service, trust_service
+
+
+def record_review(review):
+	affinity_service.record_review(review)
+	trust_service.record_review_trust(review)
+
+
+def record_complaint(complaint, delta: int = 1):
+	affinity_service.record_complaint(complaint, delta=delta)
+	trust_service.record_complaint_trust(complaint, delta=delta)
+
+
+def complaint_count_delta(previous_status: str, status: str) -> int:
+	"""+1/-1 when a status change moves a complaint into/out of the counted set.
+
+	Every status except "Rejected" counts against the provider.
+	"""
+	was_counted = previous_status != "Rejected"
+	is_counted = status != "Rejected"
+	if was_counted == is_counted:
+		return 0
+	return 1 if is_counted else -1
+
+
+def record_complaint_status_change(complaint, previous_status: str):
+	delta = complaint_count_delta(previous_status, complaint.status)
+	if delta:
+		record_complaint(complaint, delta=delta)
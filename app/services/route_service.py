@@ -0,0 +1,125 @@
+from math import asin, cos, radians, sin, sqrt
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def distance_matrix(points):
+	"""Pairwise haversine distances for (lat, lon) points.
+
+	Radians and cosines are computed once per point, so each pair costs a
+	handful of float operations instead of a full haversine_km call.
+	"""
+	lat_rad = [radians(lat) for lat, _ in points]
+	lon_rad = [radians(lon) for _, lon in points]
+	cos_lat = [cos(value) for value in lat_rad]
+	size = len(points)
+	matrix = [[0.0] * size for _ in range(size)]
+
+	for i in range(size):
+		row = matrix[i]
+		for j in range(i + 1, size):
+			d_lat = sin((lat_rad[j] - lat_rad[i]) / 2)
+			d_lon = sin((lon_rad[j] - lon_rad[i]) / 2)
+			value = d_lat * d_lat + cos_lat[i] * cos_lat[j] * d_lon * d_lon
+			distance = 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(value)))
+			row[j] = distance
+			matrix[j][i] = distance
+
+	return matrix
+
+
+def _route_cost(order, matrix, deadlines, speed_kmph):
+	distance = 0.0
+	lateness = 0.0
+	previous = 0
+	for node in order:
+		distance += matrix[previous][node]
+		deadline = deadlines[node]
+		if deadline is not None:
+			lateness += max(0.0, distance / speed_kmph * 60 - deadline)
+		previous = node
+	return lateness, distance
+
+
+def _nearest_neighbour(matrix, size):
+	order = []
+	remaining = set(range(1, size))
+	current = 0
+	while remaining:
+		current = min(remaining, key=lambda node: matrix[current][node])
+		order.append(current)
+		remaining.discard(current)
+	return order
+
+
+def _two_opt(order, matrix, deadlines, speed_kmph):
+	best_cost = _route_cost(order, matrix, deadlines, speed_kmph)
+	count = len(order)
+	improved = True
+
+	while improved:
+		improved = False
+		for i in range(count - 1):
+			before = order[i - 1] if i else 0
+			first = order[i]
+			for j in range(i + 1, count):
+				last = order[j]
+				delta = matrix[before][last] - matrix[before][first]
+				if j + 1 < count:
+					after = order[j + 1]
+					delta += matrix[first][after] - matrix[last][after]
+				if delta >= -1e-9:
+					continue
+
+				candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+				candidate_cost = _route_cost(candidate, matrix, deadlines, speed_kmph)
+				if candidate_cost[0] <= best_cost[0] + 1e-9:
+					order = candidate
+					best_cost = candidate_cost
+					first = order[i]
+					improved = True
+
+	return order
+
+
+def plan_pickup_route(start, stops, speed_kmph: float = 20.0):
+	"""Order pickup stops from a start point, respecting expiry deadlines.
+
+	start is a (lat, lon) tuple. Each stop is a dict with "lat", "lon" and an
+	optional "deadline_minutes" (minutes from now until the batch expires).
+	Returns the stops in visiting order with leg/cumulative distances and ETAs.
+	"""
+	if not stops:
+		return []
+
+	points = [start] + [(stop["lat"], stop["lon"]) for stop in stops]
+	matrix = distance_matrix(points)
+	deadlines = [None] + [stop.get("deadline_minutes") for stop in stops]
+	size = len(points)
+
+	candidates = [
+		_nearest_neighbour(matrix, size),
+		sorted(range(1, size), key=lambda node: (deadlines[node] is None, deadlines[node] or 0, matrix[0][node])),
+	]
+	order = min(candidates, key=lambda item: _route_cost(item, matrix, deadlines, speed_kmph))
+	order = _two_opt(order, matrix, deadlines, speed_kmph)
+
+	planned = []
+	cumulative_km = 0.0
+	previous = 0
+	for node in order:
+		leg_km = matrix[previous][node]
+		cumulative_km += leg_km
+		eta_minutes = cumulative_km / speed_kmph * 60
+		deadline = deadlines[node]
+		planned.append({
+			**stops[node - 1],
+			"leg_km": round(leg_km, 2),
+			"cumulative_km": round(cumulative_km, 2),
+			"eta_minutes": round(eta_minutes, 1),
+			"late": deadline is not None and eta_minutes > deadline,
+		})
+		previous = node
+
+	return planned
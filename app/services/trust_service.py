@@ -0,0 +1,186 @@
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import func
+
+from app import db
+from app.models.complaint import Complaint
+from app.models.review import Review
+from app.models.trust import UserTrustStats
+from app.utils.upsert import insert_missing
+
+
+PRIOR_MEAN_RATING = 3.5
+PRIOR_WEIGHT = 5
+COMPLAINT_PENALTY = 0.25
+MAX_COMPLAINT_PENALTY = 2.0
+
+_COUNTER_FIELDS = (
+	"received_rating_sum",
+	"received_rating_count",
+	"given_rating_sum",
+	"given_rating_count",
+	"complaint_count",
+)
+
+
+def compute_trust_score(received_rating_sum, received_rating_count, complaint_count):
+	"""Bayesian-smoothed rating on a 0-5 scale minus a capped complaint penalty."""
+	smoothed = (received_rating_sum + PRIOR_MEAN_RATING * PRIOR_WEIGHT) / (received_rating_count + PRIOR_WEIGHT)
+	penalty = min(complaint_count * COMPLAINT_PENALTY, MAX_COMPLAINT_PENALTY)
+	return round(max(0.0, min(5.0, smoothed - penalty)), 2)
+
+
+def _empty_stats(user_id):
+	stats = UserTrustStats(user_id=user_id, trust_score=compute_trust_score(0, 0, 0))
+	for field in _COUNTER_FIELDS:
+		setattr(stats, field, 0)
+	return stats
+
+
+def _locked_stats(user_id):
+	"""The user's stats row, locked; created first (race-free) if missing."""
+	query = UserTrustStats.query.filter_by(user_id=user_id).with_for_update()
+	stats = query.first()
+	if stats is None:
+		insert_missing(
+			UserTrustStats,
+			user_id=user_id,
+			trust_score=compute_trust_score(0, 0, 0),
+			**dict.fromkeys(_COUNTER_FIELDS, 0),
+		)
+		stats = query.first()
+	return stats
+
+
+def _refresh_score(stats):
+	stats.trust_score = compute_trust_score(
+		stats.received_rating_sum or 0,
+		stats.received_rating_count or 0,
+		stats.complaint_count or 0,
+	)
+
+
+def trust_stats_for(user_id):
+	"""Stats row for one user; an unsaved zero row if the user has none yet."""
+	stats = db.session.get(UserTrustStats, user_id) if user_id else None
+	return stats or _empty_stats(user_id)
+
+
+def trust_stats_for_users(user_ids):
+	if not user_ids:
+		return {}
+	rows = UserTrustStats.query.filter(UserTrustStats.user_id.in_(list(user_ids))).all()
+	return {row.user_id: row for row in rows}
+
+
+def platform_average_rating():
+	rating_sum, rating_count = db.session.query(
+		func.coalesce(func.sum(UserTrustStats.received_rating_sum), 0),
+		func.coalesce(func.sum(UserTrustStats.received_rating_count), 0),
+	).one()
+	if not rating_count:
+		return 0.0
+	return float(rating_sum) / float(rating_count)
+
+
+def record_review_trust(review):
+	"""Fold a new review into both users' stats. Call before commit."""
+	provider_stats = _locked_stats(review.provider_id)
+	provider_stats.received_rating_sum = (provider_stats.received_rating_sum or 0) + int(review.rating)
+	provider_stats.received_rating_count = (provider_stats.received_rating_count or 0) + 1
+	_refresh_score(provider_stats)
+
+	ngo_stats = _locked_stats(review.ngo_id)
+	ngo_stats.given_rating_sum = (ngo_stats.given_rating_sum or 0) + int(review.rating)
+	ngo_stats.given_rating_count = (ngo_stats.given_rating_count or 0) + 1
+	_refresh_score(ngo_stats)
+
+
+def record_complaint_trust(complaint, delta: int = 1):
+	if not complaint.provider_id:
+		return
+	stats = _locked_stats(complaint.provider_id)
+	stats.complaint_count = max(0, (stats.complaint_count or 0) + delta)
+	_refresh_score(stats)
+
+
+def _expected_counters(user_ids=None):
+	expected = defaultdict(lambda: dict.fromkeys(_COUNTER_FIELDS, 0))
+
+	received = db.session.query(Review.provider_id, func.sum(Review.rating), func.count(Review.id))
+	given = db.session.query(Review.ngo_id, func.sum(Review.rating), func.count(Review.id))
+	complaints = (
+		db.session.query(Complaint.provider_id, func.count(Complaint.id))
+		.filter(Complaint.provider_id.isnot(None), Complaint.status != "Rejected")
+	)
+	if user_ids is not None:
+		received = received.filter(Review.provider_id.in_(user_ids))
+		given = given.filter(Review.ngo_id.in_(user_ids))
+		complaints = complaints.filter(Complaint.provider_id.in_(user_ids))
+
+	for user_id, rating_sum, rating_count in received.group_by(Review.provider_id).all():
+		expected[user_id]["received_rating_sum"] = int(rating_sum or 0)
+		expected[user_id]["received_rating_count"] = int(rating_count or 0)
+	for user_id, rating_sum, rating_count in given.group_by(Review.ngo_id).all():
+		expected[user_id]["given_rating_sum"] = int(rating_sum or 0)
+		expected[user_id]["given_rating_count"] = int(rating_count or 0)
+	for user_id, complaint_count in complaints.group_by(Complaint.provider_id).all():
+		expected[user_id]["complaint_count"] = int(complaint_count or 0)
+
+	return expected
+
+
+def rebuild_trust_stats(user_ids=None):
+	"""Recompute stats from reviews and complaints, for everyone or the given users.
+
+	Does not commit when user_ids is given, so it can run inside the
+	caller's transaction.
+	"""
+	if user_ids is not None:
+		user_ids = [user_id for user_id in set(user_ids) if user_id]
+		if not user_ids:
+			return 0
+
+	expected = _expected_counters(user_ids)
+	stale = UserTrustStats.query
+	if user_ids is not None:
+		stale = stale.filter(UserTrustStats.user_id.in_(user_ids))
+	stale.delete(synchronize_session=False)
+
+	now = datetime.utcnow()
+	mappings = [
+		{
+			"user_id": user_id,
+			**counters,
+			"trust_score": compute_trust_score(
+				counters["received_rating_sum"],
+				counters["received_rating_count"],
+				counters["complaint_count"],
+			),
+			"updated_at": now,
+		}
+		for user_id, counters in expected.items()
+	]
+	if mappings:
+		db.session.bulk_insert_mappings(UserTrustStats, mappings)
+	if user_ids is None:
+		db.session.commit()
+	return len(mappings)
+
+
+def find_trust_drift():
+	"""Compare stored stats with source tables; returns (user_id, field, stored, expected)."""
+	expected = _expected_counters()
+	stored = {row.user_id: row for row in UserTrustStats.query.all()}
+	drift = []
+
+	for user_id in set(expected) | set(stored):
+		row = stored.get(user_id) or _empty_stats(user_id)
+		counters = expected.get(user_id) or dict.fromkeys(_COUNTER_FIELDS, 0)
+		for field in _COUNTER_FIELDS:
+			stored_value = getattr(row, field) or 0
+			if stored_value != counters[field]:
+				drift.append((user_id, field, stored_value, counters[field]))
+
+	return sorted(drift)
@@ -0,0 +1,255 @@
+"""Soft-delete accounts at once and purge their rows later, in small batches.
+
+Deleting an account from the admin panel only stamps users.deleted_at,
+cancels its open claims (returning their kilos to the batch) and
+withdraws the provider's open surplus. Logins, sessions, listings and
+matching skip soft-deleted users, so the account is gone for everyone
+straight away without the request touching the large tables.
+
+purge_deleted_users() does the hard cascade: allocations, reviews,
+complaints, surplus and events are deleted a batch at a time, each batch
+in its own short transaction, then the rollup rows and the user itself.
+It runs in a background thread started by the delete, or from
+`flask users purge`; an interrupted run simply resumes on the next one.
+
+A photo is unlinked, with its variants, once the batch deleting the last
+surplus row using it has committed; a crash in between leaves an orphan
+file for the next cleanup rather than a row without its file. Counterparts' trust
+stats and the demand forecast are rebuilt when the rows are gone.
+"""
+from datetime import datetime
+import threading
+
+from flask import current_app
+from sqlalchemy import delete, or_, select
+
+from app import db
+from app.ml.demand_model import refresh_demand_table
+from app.models.affinity import ProviderNgoAffinity
+from app.models.allocation import Allocation
+from app.models.archive import ArchivedAllocation, ArchivedSurplus, SurplusHistory
+from app.models.complaint import Complaint
+from app.models.demand import NgoDemandForecast
+from app.models.event import Event
+from app.models.review import Review
+from app.models.surplus import Surplus
+from app.models.trust import UserTrustStats
+from app.models.user import User
+from app.services.allocation_service import release_surplus_quantity
+from app.services.image_service import remove_photo
+from app.services.trust_service import rebuild_trust_stats
+
+
+DEFAULT_BATCH_SIZE = 500
+OPEN_SURPLUS_STATUSES = ("pending", "available", "requested")
+OPEN_ALLOCATION_STATUSES = ("requested", "allocated")
+WITHDRAWN_STATUS = "withdrawn"
+CANCELLED_STATUS = "cancelled"
+
+_worker = None
+_worker_lock = threading.Lock()
+_wake = threading.Event()
+
+
+def soft_delete_user(user):
+	"""Hide the account immediately; the purge job removes its data later.
+
+	Open claims on either side are cancelled and their kilos go back to the
+	batch, so food an NGO had claimed is offered again instead of stranded.
+	"""
+	user.deleted_at = datetime.utcnow()
+	open_allocations = Allocation.query.filter(
+		(Allocation.provider_id == user.id) | (Allocation.ngo_id == user.id),
+		Allocation.status.in_(OPEN_ALLOCATION_STATUSES),
+	).all()
+	for allocation in open_allocations:
+		release_surplus_quantity(allocation.surplus_id, allocation.claimed_kg or 0.0)
+		allocation.status = CANCELLED_STATUS
+	Surplus.query.filter(
+		Surplus.provider_id == user.id,
+		Surplus.status.in_(OPEN_SURPLUS_STATUSES),
+	).update({"status": WITHDRAWN_STATUS}, synchronize_session=False)
+	db.session.commit()
+
+
+def pending_purge_count():
+	return User.query.filter(User.deleted_at.isnot(None)).count()
+
+
+def _counterpart_ids(user_id):
+	ids = set()
+	for model in (Review, Complaint):
+		for provider_id, ngo_id in db.session.query(model.provider_id, model.ngo_id).filter(
+			(model.provider_id == user_id) | (model.ngo_id == user_id)
+		):
+			ids.update((provider_id, ngo_id))
+	ids.discard(user_id)
+	return ids
+
+
+def _remove_unreferenced_photos(photo_paths):
+	"""Unlink photos no remaining surplus row (live or archived) points at."""
+	if not photo_paths:
+		return 0
+	still_used = set(
+		db.session.execute(
+			select(SurplusHistory.photo_path).where(SurplusHistory.photo_path.in_(photo_paths)).distinct()
+		).scalars()
+	)
+	static_root = current_app.static_folder
+	return sum(remove_photo(static_root, path) for path in photo_paths - still_used)
+
+
+def _purge_rows(model, condition, batch_size, photos=False):
+	"""Delete matching rows batch_size at a time. Returns (rows, photo files removed).
+
+	Rows are locked with a plain FOR UPDATE: skipping locked rows would end
+	the loop while some still exist, and the user delete would then fail.
+	"""
+	columns = (model.id, model.photo_path) if photos else (model.id,)
+	rows_deleted = 0
+	files_removed = 0
+	while True:
+		rows = db.session.execute(
+			select(*columns)
+			.where(condition)
+			.order_by(model.id.asc())
+			.limit(batch_size)
+			.with_for_update()
+		).all()
+		if not rows:
+			db.session.rollback()
+			return rows_deleted, files_removed
+
+		db.session.execute(
+			delete(model).where(model.id.in_([row[0] for row in rows])).execution_options(synchronize_session=False)
+		)
+		db.session.commit()
+		rows_deleted += len(rows)
+		if photos:
+			files_removed += _remove_unreferenced_photos({row[1] for row in rows if row[1]})
+
+
+def purge_user(user_id, batch_size: int = DEFAULT_BATCH_SIZE):
+	"""Hard-delete one soft-deleted user and everything it owns.
+
+	Returns {"rows": n, "allocations": n, "photos": n}.
+	"""
+	counterpart_ids = _counterpart_ids(user_id)
+	own_surplus = select(Surplus.id).where(Surplus.provider_id == user_id)
+	own_archived_surplus = select(ArchivedSurplus.id).where(ArchivedSurplus.provider_id == user_id)
+
+	steps = (
+		(Allocation, or_(
+			Allocation.provider_id == user_id,
+			Allocation.ngo_id == user_id,
+			Allocation.surplus_id.in_(own_surplus),
+		), False),
+		(ArchivedAllocation, or_(
+			ArchivedAllocation.provider_id == user_id,
+			ArchivedAllocation.ngo_id == user_id,
+			ArchivedAllocation.surplus_id.in_(own_archived_surplus),
+		), False),
+		(Review, (Review.provider_id == user_id) | (Review.ngo_id == user_id), False),
+		(Complaint, (Complaint.provider_id == user_id) | (Complaint.ngo_id == user_id), False),
+		(Surplus, Surplus.provider_id == user_id, True),
+		(ArchivedSurplus, ArchivedSurplus.provider_id == user_id, True),
+		(Event, Event.provider_id == user_id, False),
+	)
+	totals = {"rows": 0, "allocations": 0, "photos": 0}
+	for model, condition, photos in steps:
+		rows, files = _purge_rows(model, condition, batch_size, photos=photos)
+		totals["rows"] += rows
+		totals["photos"] += files
+		if model in (Allocation, ArchivedAllocation):
+			totals["allocations"] += rows
+
+	# Bounded by the user's counterparts (or 168 forecast slots): one statement each.
+	ProviderNgoAffinity.query.filter(
+		(ProviderNgoAffinity.provider_id == user_id) | (ProviderNgoAffinity.ngo_id == user_id)
+	).delete(synchronize_session=False)
+	NgoDemandForecast.query.filter_by(ngo_id=user_id).delete(synchronize_session=False)
+	UserTrustStats.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+	rebuild_trust_stats(counterpart_ids)
+	User.query.filter_by(id=user_id).delete(synchronize_session=False)
+	db.session.commit()
+	return totals
+
+
+def purge_deleted_users(batch_size: int = DEFAULT_BATCH_SIZE, progress=None):
+	"""Purge every soft-deleted user, oldest deletion first.
+
+	Returns {"users": n, "rows": n, "photos": n, "failed": n}. A user whose
+	purge fails is logged and skipped for the rest of the run, so it cannot
+	hold up the others. The demand forecast is refreshed once at the end if
+	any allocations went away, since other NGOs' pickups from a deleted
+	provider count towards their demand.
+	"""
+	totals = {"users": 0, "rows": 0, "photos": 0, "failed": 0}
+	allocations = 0
+	failed_ids = set()
+	while True:
+		user_id = db.session.execute(
+			select(User.id)
+			.where(User.deleted_at.isnot(None), User.id.notin_(failed_ids))
+			.order_by(User.deleted_at.asc(), User.id.asc())
+			.limit(1)
+		).scalar()
+		if user_id is None:
+			db.session.rollback()
+			break
+		try:
+			purged = purge_user(user_id, batch_size=batch_size)
+		except Exception as exc:
+			db.session.rollback()
+			failed_ids.add(user_id)
+			totals["failed"] += 1
+			current_app.logger.error("Purge of user %s failed, continuing with the next: %s", user_id, exc)
+			continue
+		totals["users"] += 1
+		totals["rows"] += purged["rows"]
+		totals["photos"] += purged["photos"]
+		allocations += purged["allocations"]
+		if progress is not None:
+			progress(user_id, purged)
+
+	if allocations:
+		refresh_demand_table()
+	return totals
+
+
+class PurgeWorker(threading.Thread):
+	"""Runs purge_deleted_users until nothing is left, then exits."""
+
+	def __init__(self, app):
+		super().__init__(name="user-purge", daemon=True)
+		self.app = app
+
+	def run(self):
+		global _worker
+		with self.app.app_context():
+			while True:
+				_wake.clear()
+				try:
+					purge_deleted_users(batch_size=int(self.app.config.get("USER_PURGE_BATCH_SIZE", DEFAULT_BATCH_SIZE)))
+				except Exception as exc:
+					db.session.rollback()
+					self.app.logger.error("User purge failed: %s", exc)
+				finally:
+					db.session.remove()
+
+				with _worker_lock:
+					# A delete that arrived during the run set _wake; go round again.
+					if not _wake.is_set():
+						_worker = None
+						return
+
+
+def start_purge_worker(app):
+	global _worker
+	with _worker_lock:
+		_wake.set()
+		if _worker is None or not _worker.is_alive():
+			_worker = PurgeWorker(app)
+			_worker.start()
+		return _worker
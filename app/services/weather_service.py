@@ -0,0 +1,235 @@
+from datetime import datetime, timedelta
+import json
+from math import floor
+import threading
+import time
+
+from flask import current_app
+import requests
+
+from app import db
+from app.models.surplus import Surplus
+from app.models.weather import WeatherTile
+from app.services.metrics_service import inc
+from app.services.profiling_service import external_call
+
+
+OPEN_METEO_BASE = "https://api.open-meteo.com/v1/forecast"
+NEUTRAL_RISK = 1.0
+PREFETCH_BATCH_SIZE = 50
+
+_memory_cache = {}
+_memory_lock = threading.Lock()
+
+
+class OpenMeteoProvider:
+	"""Current conditions from Open-Meteo; one HTTP call per batch of tiles."""
+
+	def fetch_many(self, points):
+		if not points:
+			return {}
+
+		try:
+			with external_call("open-meteo"):
+				response = requests.get(
+					OPEN_METEO_BASE,
+					params={
+						"latitude": ",".join(f"{lat:.4f}" for lat, _ in points),
+						"longitude": ",".join(f"{lon:.4f}" for _, lon in points),
+						"current": "temperature_2m,relative_humidity_2m,precipitation",
+					},
+					timeout=12,
+				)
+			response.raise_for_status()
+		except requests.RequestException:
+			return {}
+
+		payload = response.json()
+		items = payload if isinstance(payload, list) else [payload]
+		output = {}
+		for point, item in zip(points, items):
+			current = (item or {}).get("current") or {}
+			output[point] = {
+				"temperature_c": current.get("temperature_2m"),
+				"humidity_pct": current.get("relative_humidity_2m"),
+				"precipitation_mm": current.get("precipitation"),
+			}
+		return output
+
+
+class FixtureFileProvider:
+	"""Reads observations from a JSON file, for tests and offline development.
+
+	Format: {"default": {...}, "tiles": {"52:321": {...}}} where each
+	observation has temperature_c, humidity_pct and precipitation_mm. Tiles
+	are keyed like tile_for, "row:col" at WEATHER_TILE_DEGREES (so "52:321"
+	covers 13.00-13.25 N, 80.25-80.50 E at the default 0.25 degrees).
+	"""
+
+	def __init__(self, path, tile_degrees):
+		self.path = path
+		self.tile_degrees = tile_degrees
+
+	def fetch_many(self, points):
+		with open(self.path, "r", encoding="utf-8") as handle:
+			data = json.load(handle)
+
+		tiles = data.get("tiles") or {}
+		default = data.get("default")
+		output = {}
+		for lat, lon in points:
+			tile_key, _ = tile_for(lat, lon, self.tile_degrees)
+			observation = tiles.get(tile_key, default)
+			if observation:
+				output[(lat, lon)] = observation
+		return output
+
+
+def get_weather_provider(app=None):
+	app = app or current_app
+	name = (app.config.get("WEATHER_PROVIDER") or "").strip().lower()
+	if name == "fixture":
+		return FixtureFileProvider(app.config.get("WEATHER_FIXTURE_PATH", ""), _tile_degrees(app))
+	if name == "open-meteo":
+		return OpenMeteoProvider()
+	return None
+
+
+def tile_for(lat: float, lon: float, tile_degrees: float):
+	"""Snap a coordinate to the centre of its weather tile."""
+	row = floor(lat / tile_degrees)
+	col = floor(lon / tile_degrees)
+	center_lat = round((row + 0.5) * tile_degrees, 4)
+	center_lon = round((col + 0.5) * tile_degrees, 4)
+	return f"{row}:{col}", (center_lat, center_lon)
+
+
+def compute_risk_factor(temperature_c=None, humidity_pct=None, precipitation_mm=None):
+	"""Multiplier >= 1 for how much faster food spoils or pickups slow down."""
+	risk = NEUTRAL_RISK
+	if temperature_c is not None and temperature_c > 25:
+		risk += min(temperature_c - 25, 15) * 0.04
+	if humidity_pct is not None and humidity_pct > 70:
+		risk += min(humidity_pct - 70, 30) * 0.005
+	if precipitation_mm:
+		risk += 0.1
+	return round(min(risk, 2.0), 3)
+
+
+def _ttl(app=None):
+	app = app or current_app
+	return int(app.config.get("WEATHER_CACHE_TTL_SECONDS", 1800))
+
+
+def _tile_degrees(app=None):
+	app = app or current_app
+	return float(app.config.get("WEATHER_TILE_DEGREES", 0.25))
+
+
+def risk_factors_for(points):
+	"""Cached risk factor per (lat, lon); never calls the upstream provider.
+
+	Looks in the process cache first, then the weather_tiles table in one
+	query for the remaining tiles. Unknown or stale tiles are neutral.
+	"""
+	tile_degrees = _tile_degrees()
+	ttl = _ttl()
+	now = time.monotonic()
+	point_tiles = {point: tile_for(point[0], point[1], tile_degrees)[0] for point in points}
+
+	resolved = {}
+	with _memory_lock:
+		for tile_key in set(point_tiles.values()):
+			cached = _memory_cache.get(tile_key)
+			if cached and now - cached[0] < ttl:
+				resolved[tile_key] = cached[1]
+
+	missing = [tile_key for tile_key in set(point_tiles.values()) if tile_key not in resolved]
+	inc("kalyana_cache_lookups_total", ("weather_tile", "hit"), len(resolved))
+	inc("kalyana_cache_lookups_total", ("weather_tile", "miss"), len(missing))
+	if missing:
+		fresh_after = datetime.utcnow() - timedelta(seconds=ttl)
+		rows = (
+			db.session.query(WeatherTile.tile_key, WeatherTile.risk_factor, WeatherTile.fetched_at)
+			.filter(WeatherTile.tile_key.in_(missing))
+			.all()
+		)
+		with _memory_lock:
+			for tile_key, risk_factor, fetched_at in rows:
+				if fetched_at >= fresh_after:
+					age = (datetime.utcnow() - fetched_at).total_seconds()
+					_memory_cache[tile_key] = (now - age, risk_factor)
+					resolved[tile_key] = risk_factor
+
+	return {point: resolved.get(tile_key, NEUTRAL_RISK) for point, tile_key in point_tiles.items()}
+
+
+def risk_factor_for(lat, lon):
+	if lat is None or lon is None:
+		return NEUTRAL_RISK
+	return risk_factors_for([(lat, lon)])[(lat, lon)]
+
+
+def prefetch_open_surplus_weather(provider=None, force: bool = False):
+	"""Fetch weather for every tile that has open surplus. Returns tiles fetched."""
+	provider = provider or get_weather_provider()
+	if provider is None:
+		return 0
+
+	tile_degrees = _tile_degrees()
+	coordinates = (
+		db.session.query(Surplus.provider_latitude, Surplus.provider_longitude)
+		.filter(
+			Surplus.status.in_(["pending", "available", "requested"]),
+			Surplus.provider_latitude.isnot(None),
+			Surplus.provider_longitude.isnot(None),
+		)
+		.distinct()
+		.all()
+	)
+
+	tiles = {}
+	for lat, lon in coordinates:
+		tile_key, center = tile_for(lat, lon, tile_degrees)
+		tiles[tile_key] = center
+
+	if not force:
+		fresh_after = datetime.utcnow() - timedelta(seconds=_ttl())
+		fresh = {
+			tile_key
+			for (tile_key,) in db.session.query(WeatherTile.tile_key).filter(
+				WeatherTile.tile_key.in_(list(tiles)),
+				WeatherTile.fetched_at >= fresh_after,
+			)
+		} if tiles else set()
+		tiles = {tile_key: center for tile_key, center in tiles.items() if tile_key not in fresh}
+
+	fetched = 0
+	items = list(tiles.items())
+	for start in range(0, len(items), PREFETCH_BATCH_SIZE):
+		batch = items[start:start + PREFETCH_BATCH_SIZE]
+		observations = provider.fetch_many([center for _, center in batch])
+		now = datetime.utcnow()
+		for tile_key, center in batch:
+			observation = observations.get(center)
+			if not observation:
+				continue
+			values = {
+				"temperature_c": observation.get("temperature_c"),
+				"humidity_pct": observation.get("humidity_pct"),
+				"precipitation_mm": observation.get("precipitation_mm"),
+			}
+			row = db.session.get(WeatherTile, tile_key) or WeatherTile(tile_key=tile_key)
+			row.latitude, row.longitude = center
+			row.temperature_c = values["temperature_c"]
+			row.humidity_pct = values["humidity_pct"]
+			row.precipitation_mm = values["precipitation_mm"]
+			row.risk_factor = compute_risk_factor(**values)
+			row.fetched_at = now
+			db.session.add(row)
+			fetched += 1
+		db.session.commit()
+
+	with _memory_lock:
+		_memory_cache.clear()
+	return fetched
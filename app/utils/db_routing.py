@@ -0,0 +1,163 @@
+"""Read-replica routing and per-route statement timeouts.
+
+Views decorated with @read_replica send their ORM reads to the "replica"
+bind (DATABASE_REPLICA_URL). They fall back to the primary when:
+
+- no replica is configured,
+- the replica failed its last health check or lags more than
+  REPLICA_MAX_LAG_SECONDS (checked at most every REPLICA_LAG_CHECK_SECONDS
+  per process),
+- the same browser session wrote within REPLICA_STICKY_SECONDS, so users
+  see their own writes,
+- the statement is a write, or the session is flushing.
+
+Statement timeouts (REPLICA_STATEMENT_TIMEOUT_MS on @read_replica views, or
+@statement_timeout on heavy views that stay on the primary) are applied
+with SET LOCAL when a transaction begins on PostgreSQL. Other dialects have no per-statement timeout and ignore them.
+"""
+from functools import wraps
+import threading
+import time
+
+from flask import current_app, g, has_app_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+
+REPLICA_BIND = "replica"
+
+_health_lock = threading.Lock()
+_replica_health = {"checked_at": 0.0, "healthy": False, "lag_seconds": None, "error": None}
+
+
+def read_replica(statement_timeout_ms=None):
+	"""Route this view's reads to the replica bind when it is safe to."""
+	def decorator(view_func):
+		@wraps(view_func)
+		def wrapper(*args, **kwargs):
+			g._db_route = {
+				"replica": True,
+				"statement_timeout_ms": statement_timeout_ms or current_app.config["REPLICA_STATEMENT_TIMEOUT_MS"],
+			}
+			return view_func(*args, **kwargs)
+
+		return wrapper
+
+	return decorator
+
+
+def statement_timeout(milliseconds):
+	"""Cap every statement this view runs on PostgreSQL."""
+	def decorator(view_func):
+		@wraps(view_func)
+		def wrapper(*args, **kwargs):
+			g._db_route = {**g.get("_db_route", {}), "statement_timeout_ms": milliseconds}
+			return view_func(*args, **kwargs)
+
+		return wrapper
+
+	return decorator
+
+
+def _lag_seconds(engine):
+	with engine.connect() as connection:
+		if engine.dialect.name == "postgresql":
+			# The replay timestamp is the last replayed commit, so on a quiet primary it keeps
+			# ageing; a replica that has replayed everything it received is not behind at all.
+			# Both are NULL on a primary, so a replica URL pointing at the primary reports 0.
+			lag = connection.execute(
+				text(
+					"SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+					" ELSE EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())) END"
+				)
+			).scalar()
+			return max(float(lag), 0.0) if lag is not None else 0.0
+		connection.execute(text("SELECT 1"))
+		return 0.0
+
+
+def replica_health(engine, force=False):
+	"""Cached health of the replica: {"healthy", "lag_seconds", "error", "checked_at"}."""
+	config = current_app.config
+	now = time.monotonic()
+	with _health_lock:
+		if not force and now - _replica_health["checked_at"] < config["REPLICA_LAG_CHECK_SECONDS"]:
+			return dict(_replica_health)
+		# Claim the check so concurrent requests keep using the previous answer.
+		_replica_health["checked_at"] = now
+
+	try:
+		lag = _lag_seconds(engine)
+		healthy = lag <= config["REPLICA_MAX_LAG_SECONDS"]
+		error = None if healthy else f"lag {lag:.1f}s exceeds {config['REPLICA_MAX_LAG_SECONDS']}s"
+	except Exception as exc:
+		lag, healthy, error = None, False, str(exc)
+		current_app.logger.warning("Read replica unavailable, using primary: %s", exc)
+
+	with _health_lock:
+		_replica_health.update(healthy=healthy, lag_seconds=lag, error=error)
+		return dict(_replica_health)
+
+
+def _wrote_recently():
+	written_at = session.get("_db_write_at")
+	return bool(written_at) and time.time() - written_at < current_app.config["REPLICA_STICKY_SECONDS"]
+
+
+def _replica_for_request(engines):
+	route = g.get("_db_route")
+	if not route or not route.get("replica"):
+		return None
+	if "_db_replica" not in g:
+		engine = engines.get(REPLICA_BIND)
+		use_replica = engine is not None and not _wrote_recently() and replica_health(engine)["healthy"]
+		g._db_replica = engine if use_replica else None
+		from app.services.metrics_service import inc  # metrics_service imports app, which imports this module
+		inc("kalyana_db_read_routing_total", ("replica" if use_replica else "primary",))
+	return g._db_replica
+
+
+class RoutingSession(Session):
+	def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+		if bind is None and not self._flushing and has_app_context() and not getattr(clause, "is_dml", False):
+			replica = _replica_for_request(self._db.engines)
+			if replica is not None:
+				return replica
+		return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _apply_statement_timeout(db_session, transaction, connection):
+	if connection.dialect.name != "postgresql" or not has_app_context():
+		return
+	milliseconds = (g.get("_db_route") or {}).get("statement_timeout_ms")
+	if milliseconds:
+		connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(milliseconds)}")
+
+
+def _mark_flush(db_session, flush_context, instances):
+	if has_app_context() and (db_session.new or db_session.dirty or db_session.deleted):
+		g._db_wrote = True
+
+
+def _mark_bulk_write(orm_execute_state):
+	if has_app_context() and (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+		g._db_wrote = True
+
+
+def _remember_write(response):
+	if g.pop("_db_wrote", False) and current_app.config["REPLICA_STICKY_SECONDS"] > 0:
+		session["_db_write_at"] = time.time()
+	return response
+
+
+def _listen_once(identifier, listener):
+	if not event.contains(RoutingSession, identifier, listener):
+		event.listen(RoutingSession, identifier, listener)
+
+
+def init_db_routing(app):
+	_listen_once("after_begin", _apply_statement_timeout)
+	if app.config.get("SQLALCHEMY_BINDS", {}).get(REPLICA_BIND):
+		_listen_once("before_flush", _mark_flush)
+		_listen_once("do_orm_execute", _mark_bulk_write)
+		app.after_request(_remember_write)
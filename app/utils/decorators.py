@@ -1,12 +1,47 @@
 from functools import wraps
+import time
 
-from flask import flash, redirect, session, url_for
+from flask import current_app, flash, jsonify, redirect, session, url_for
+
+from app import db
+from app.models.user import User
+
+
+ACCOUNT_CHECKED_KEY = "account_checked_at"
+
+
+def mark_account_checked():
+	"""Call after loading a live user at login, so the first page skips the recheck."""
+	session[ACCOUNT_CHECKED_KEY] = time.time()
+
+
+def _account_active():
+	"""False once the session's user is deleted, which also ends the session.
+
+	Checked against the database at most every ACCOUNT_RECHECK_SECONDS per
+	session, so authenticated pages do not pay an extra query each time.
+	"""
+	now = time.time()
+	interval = current_app.config.get("ACCOUNT_RECHECK_SECONDS", 60)
+	if now - session.get(ACCOUNT_CHECKED_KEY, 0) < interval:
+		return True
+
+	active = db.session.query(User.id).filter(User.id == session["user_id"], User.deleted_at.is_(None)).first() is not None
+	if active:
+		session[ACCOUNT_CHECKED_KEY] = now
+	else:
+		session.clear()
+	return active
+
+
+def _logged_in():
+	return bool(session.get("user_id")) and _account_active()
 
 
 def login_required(view_func):
 	@wraps(view_func)
 	def wrapper(*args, **kwargs):
-		if not session.get("user_id"):
+		if not _logged_in():
 			flash("Please login to continue.", "warning")
 			return redirect(url_for("auth.login"))
 		return view_func(*args, **kwargs)
@@ -18,7 +53,7 @@ def role_required(required_role):
 	def decorator(view_func):
 		@wraps(view_func)
 		def wrapper(*args, **kwargs):
-			if not session.get("user_id"):
+			if not _logged_in():
 				flash("Please login to continue.", "warning")
 				return redirect(url_for("auth.login"))
 
@@ -32,3 +67,30 @@ def role_required(required_role):
 		return wrapper
 
 	return decorator
+
+
+def api_login_required(view_func):
+	@wraps(view_func)
+	def wrapper(*args, **kwargs):
+		if not _logged_in():
+			return jsonify({"ok": False, "message": "Login required"}), 401
+		return view_func(*args, **kwargs)
+
+	return wrapper
+
+
+def api_role_required(required_role):
+	def decorator(view_func):
+		@wraps(view_func)
+		def wrapper(*args, **kwargs):
+			if not _logged_in():
+				return jsonify({"ok": False, "message": "Login required"}), 401
+
+			if session.get("role") != required_role:
+				return jsonify({"ok": False, "message": "Not authorized"}), 403
+
+			return view_func(*args, **kwargs)
+
+		return wrapper
+
+	return decorator
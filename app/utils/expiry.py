@@ -0,0 +1,23 @@
+import re
+from datetime import timedelta
+
+
+_EXPIRY_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(h|hr|hrs|hour|hours|m|min|mins|minute|minutes)\b", re.IGNORECASE)
+
+
+def parse_expiry_hours(estimated_expiry: str):
+	match = _EXPIRY_PATTERN.search(estimated_expiry or "")
+	if not match:
+		return None
+
+	value = float(match.group(1))
+	if match.group(2).lower().startswith("m"):
+		return value / 60.0
+	return value
+
+
+def expiry_deadline(created_at, estimated_expiry: str):
+	hours = parse_expiry_hours(estimated_expiry)
+	if hours is None or created_at is None:
+		return None
+	return created_at + timedelta(hours=hours)
@@ -14,3 +14,10 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 	arc = 2 * asin(sqrt(value))
 	return radius_km * arc
+
+
+def bounding_box(lat: float, lon: float, radius_km: float):
+	lat_delta = radius_km / 111.0
+	lon_scale = max(cos(radians(lat)), 0.01)
+	lon_delta = radius_km / (111.0 * lon_scale)
+	return lat - lat_delta, lat + lat_delta, lon - lon_delta, lon + lon_delta
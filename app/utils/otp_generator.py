@@ -2,9 +2,9 @@ import hashlib
 import hmac
 import os
 import random
-import smtplib
 from datetime import datetime, timedelta, timezone
-from email.message import EmailMessage
+
+from app.services.mail_service import enqueue_email, smtp_configured
 
 
 def generate_otp(length: int = 6) -> str:
@@ -46,44 +46,27 @@ def verify_hashed_otp(stored_hash: str, entered_otp: str, email: str, secret_key
 
 
 def send_otp_email(app, recipient_email: str, otp: str, purpose: str) -> bool:
-	host = app.config.get("SMTP_HOST", "")
-	port = int(app.config.get("SMTP_PORT", 587) or 587)
-	username = app.config.get("SMTP_USER", "")
-	password = app.config.get("SMTP_PASSWORD", "")
-	from_email = app.config.get("SMTP_FROM_EMAIL", username)
-	use_tls = str(app.config.get("SMTP_USE_TLS", "true")).lower() == "true"
-
-	if not host or not from_email:
+	"""Queue the OTP email; the mail worker delivers it over a pooled SMTP session."""
+	if not smtp_configured(app):
 		app.logger.warning("OTP email skipped because SMTP is not configured for recipient=%s", recipient_email)
 		return False
 
-	message = EmailMessage()
-	message["Subject"] = f"Kalyana Connection OTP for {purpose}"
-	message["From"] = from_email
-	message["To"] = recipient_email
-	message.set_content(
-		"\n".join(
-			[
-				"Hello,",
-				"",
-				f"Your OTP for {purpose} is: {otp}",
-				"This OTP is valid for 10 minutes.",
-				"",
-				"If you did not request this, please ignore this email.",
-				"",
-				"- Kalyana Connection",
-			]
-		)
+	body = "\n".join(
+		[
+			"Hello,",
+			"",
+			f"Your OTP for {purpose} is: {otp}",
+			"This OTP is valid for 10 minutes.",
+			"",
+			"If you did not request this, please ignore this email.",
+			"",
+			"- Kalyana Connection",
+		]
 	)
 
 	try:
-		with smtplib.SMTP(host, port, timeout=15) as server:
-			if use_tls:
-				server.starttls()
-			if username and password:
-				server.login(username, password)
-			server.send_message(message)
+		enqueue_email(recipient_email, f"Kalyana Connection OTP for {purpose}", body)
 		return True
 	except Exception as exc:
-		app.logger.error("Failed to send OTP email to %s: %s", recipient_email, exc)
+		app.logger.error("Failed to queue OTP email to %s: %s", recipient_email, exc)
 		return False
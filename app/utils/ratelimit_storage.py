@@ -0,0 +1,166 @@
+"""SQLite rate-limit storage shared by every worker on a host.
+
+Flask-Limiter's memory:// storage is per process, so each worker enforced
+its own copy of every limit. This backend keeps counters in one SQLite file
+in WAL mode. Each hit is a single UPSERT, and sliding-window acquisition
+runs inside one BEGIN IMMEDIATE transaction, so concurrent workers can't
+both take the last slot. Importing the module registers the ``sqlite``
+scheme with ``limits``; use e.g. ``sqlite:////var/run/kalyana/ratelimit.db``.
+"""
+from math import floor
+import os
+import sqlite3
+import threading
+import time
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+
+PURGE_INTERVAL_SECONDS = 60
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = (
+	"CREATE TABLE IF NOT EXISTS ratelimit_counters ("
+	" key TEXT PRIMARY KEY,"
+	" value INTEGER NOT NULL,"
+	" expires_at REAL NOT NULL"
+	") WITHOUT ROWID"
+)
+
+_INCR_SQL = (
+	"INSERT INTO ratelimit_counters (key, value, expires_at) VALUES (?1, ?2, ?3) "
+	"ON CONFLICT(key) DO UPDATE SET "
+	"value = CASE WHEN expires_at <= ?4 THEN excluded.value ELSE value + excluded.value END, "
+	"expires_at = CASE WHEN expires_at <= ?4 THEN excluded.expires_at ELSE expires_at END "
+	"RETURNING value"
+)
+
+
+def database_path_from_uri(uri: str) -> str:
+	"""sqlite:///relative.db or sqlite:////absolute/path.db, as with SQLAlchemy URLs."""
+	path = (uri or "")[len("sqlite:///"):] if (uri or "").startswith("sqlite:///") else ""
+	return path.split("?", 1)[0]
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+	STORAGE_SCHEME = ["sqlite"]
+
+	def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+		self.path = database_path_from_uri(uri)
+		if not self.path:
+			raise ValueError(f"Rate limit storage URI needs a file path: {uri!r}")
+		directory = os.path.dirname(os.path.abspath(self.path))
+		os.makedirs(directory, exist_ok=True)
+
+		self._local = threading.local()
+		self._last_purge = 0.0
+		super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+		self._connection()
+
+	@property
+	def base_exceptions(self):
+		return sqlite3.Error
+
+	def _connection(self):
+		# One connection per thread and per process, so forked workers never share a handle.
+		connection = getattr(self._local, "connection", None)
+		if connection is not None and self._local.pid == os.getpid():
+			return connection
+
+		connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None, check_same_thread=False)
+		connection.execute("PRAGMA journal_mode=WAL")
+		connection.execute("PRAGMA synchronous=NORMAL")
+		connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+		connection.execute(_SCHEMA)
+		self._local.connection = connection
+		self._local.pid = os.getpid()
+		return connection
+
+	def _maybe_purge(self, connection, now):
+		if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+			return
+		self._last_purge = now
+		connection.execute("DELETE FROM ratelimit_counters WHERE expires_at <= ?", (now,))
+
+	def _incr(self, connection, key, expiry, amount, now):
+		return connection.execute(_INCR_SQL, (key, amount, now + expiry, now)).fetchone()[0]
+
+	def _get(self, connection, key, now):
+		row = connection.execute(
+			"SELECT value FROM ratelimit_counters WHERE key = ? AND expires_at > ?",
+			(key, now),
+		).fetchone()
+		return row[0] if row else 0
+
+	def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+		now = time.time()
+		connection = self._connection()
+		self._maybe_purge(connection, now)
+		return self._incr(connection, key, expiry, amount, now)
+
+	def get(self, key: str) -> int:
+		return self._get(self._connection(), key, time.time())
+
+	def get_expiry(self, key: str) -> float:
+		now = time.time()
+		row = self._connection().execute(
+			"SELECT expires_at FROM ratelimit_counters WHERE key = ? AND expires_at > ?",
+			(key, now),
+		).fetchone()
+		return row[0] if row else now
+
+	def check(self) -> bool:
+		try:
+			self._connection().execute("SELECT 1").fetchone()
+			return True
+		except sqlite3.Error:
+			return False
+
+	def reset(self) -> int:
+		return self._connection().execute("DELETE FROM ratelimit_counters").rowcount
+
+	def clear(self, key: str) -> None:
+		self._connection().execute("DELETE FROM ratelimit_counters WHERE key = ?", (key,))
+
+	def _window_info(self, connection, key, expiry, now):
+		previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+		previous_count = self._get(connection, previous_key, now)
+		current_count = self._get(connection, current_key, now)
+		previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+		current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+		return current_key, previous_count, previous_ttl, current_count, current_ttl
+
+	def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+		if amount > limit:
+			return False
+
+		now = time.time()
+		connection = self._connection()
+		self._maybe_purge(connection, now)
+		connection.execute("BEGIN IMMEDIATE")
+		try:
+			current_key, previous_count, previous_ttl, current_count, _ = self._window_info(connection, key, expiry, now)
+			if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+				connection.execute("ROLLBACK")
+				return False
+			# Twice the window, so the counter is still readable as "previous" next window.
+			self._incr(connection, current_key, 2 * expiry, amount, now)
+			connection.execute("COMMIT")
+			return True
+		except BaseException:
+			connection.execute("ROLLBACK")
+			raise
+
+	def get_sliding_window(self, key: str, expiry: int):
+		_, previous_count, previous_ttl, current_count, current_ttl = self._window_info(
+			self._connection(), key, expiry, time.time()
+		)
+		return previous_count, previous_ttl, current_count, current_ttl
+
+	def clear_sliding_window(self, key: str, expiry: int) -> None:
+		previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+		self._connection().execute(
+			"DELETE FROM ratelimit_counters WHERE key IN (?, ?)",
+			(previous_key, current_key),
+		)
@@ -0,0 +1,30 @@
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+
+
+_DIALECT_INSERTS = {
+	"postgresql": postgresql.insert,
+	"sqlite": sqlite.insert,
+}
+
+
+def insert_missing(model, **values):
+	"""INSERT the row unless one with the same key already exists.
+
+	Call before SELECT ... FOR UPDATE when the row may not exist yet: two
+	transactions creating it at once then both end up locking the one row,
+	instead of the second failing on the primary key.
+	"""
+	dialect_insert = _DIALECT_INSERTS.get(db.engine.dialect.name)
+	if dialect_insert is not None:
+		db.session.execute(dialect_insert(model).values(**values).on_conflict_do_nothing())
+		return
+
+	try:
+		with db.session.begin_nested():
+			db.session.execute(insert(model).values(**values))
+	except IntegrityError:
+		pass
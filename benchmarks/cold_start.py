@@ -0,0 +1,69 @@
+"""Cold-start budget for the serverless entry point (api/index.py).
+
+Run from the project root after ``flask --app run.py serverless build``:
+
+    python -m benchmarks.cold_start
+
+Imports api.index in fresh interpreters under ``python -X importtime`` and
+takes the median cumulative import time, which includes create_app. It
+fails if that exceeds the budget, or if the serverless build (route
+manifest and compiled templates) is missing or older than the code.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+
+BUDGET_MS = float(os.getenv("COLD_START_BUDGET_MS", "600"))
+RUNS = 5
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_time_ms(module):
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {module}"],
+		cwd=PROJECT_ROOT,
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	for line in result.stderr.splitlines():
+		parts = [part.strip() for part in line.split("|")]
+		if len(parts) == 3 and parts[2] == module:
+			return int(parts[1]) / 1000
+	raise RuntimeError(f"No import time reported for {module}")
+
+
+def _build_is_fresh():
+	from app import create_app
+	from app.serverless import build_fingerprint, load_manifest
+
+	app = create_app(profile="full")
+	manifest = load_manifest(app.config["SERVERLESS_BUILD_DIR"])
+	return manifest is not None and manifest.get("fingerprint") == build_fingerprint(app)
+
+
+def main():
+	print(f"{'profile':<12} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+	medians = {}
+	for label, module in (("full", "run"), ("serverless", "api.index")):
+		timings = [_import_time_ms(module) for _ in range(RUNS)]
+		medians[label] = statistics.median(timings)
+		print(f"{label:<12} {medians[label]:>10.1f} {min(timings):>8.1f} {max(timings):>8.1f}")
+
+	failed = False
+	if not _build_is_fresh():
+		print("FAIL: serverless build is missing or stale; run `flask --app run.py serverless build`")
+		failed = True
+	if medians["serverless"] > BUDGET_MS:
+		print(f"FAIL: serverless cold start {medians['serverless']:.0f} ms (budget {BUDGET_MS:.0f} ms)")
+		failed = True
+	if failed:
+		return 1
+	print(f"OK: serverless cold start within {BUDGET_MS:.0f} ms budget")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,192 @@
+"""Benchmark the streaming admin exports on a synthetic dataset.
+
+Run from the project root:
+
+    python -m benchmarks.export_stream                  # ~35k allocations, quick check
+    python -m benchmarks.export_stream --scale 60       # ~2M allocations and ~1.2M surplus batches
+    python -m benchmarks.export_stream --database-url postgresql://localhost/kalyana_export
+
+The dataset comes from `flask dataset generate` (app/services/dataset_service.py)
+and part of it is archived first, so exports read the hot + archive union.
+Every export is streamed through the test client without keeping the body;
+for each one we report rows, bytes, time to first byte, throughput and the
+peak RSS growth while it ran (sampled from /proc). For contrast, the same
+allocation rows are then loaded the naive way, with .all().
+
+Fails (exit 1) when a streamed export grows RSS by more than
+EXPORT_MEMORY_BUDGET_MB, or when its row count does not match the table.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+
+EXPORT_MEMORY_BUDGET_MB = 64.0
+CASES = (
+	("allocations", "csv", False),
+	("allocations", "ndjson", False),
+	("allocations", "csv", True),
+	("surplus", "csv", False),
+	("surplus", "ndjson", True),
+	("complaints", "csv", False),
+)
+
+
+def _rss_bytes():
+	try:
+		with open("/proc/self/statm") as handle:
+			return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError):
+		return None
+
+
+class PeakRss:
+	"""Samples RSS in a background thread; growth_mb is the peak over the starting value."""
+
+	def __init__(self, interval=0.01):
+		self.interval = interval
+		self.start = None
+		self.peak = None
+		self._stop = threading.Event()
+		self._thread = None
+
+	def __enter__(self):
+		self.start = self.peak = _rss_bytes()
+		if self.start is not None:
+			self._thread = threading.Thread(target=self._sample, daemon=True)
+			self._thread.start()
+		return self
+
+	def _sample(self):
+		while not self._stop.wait(self.interval):
+			self.peak = max(self.peak, _rss_bytes() or 0)
+
+	def __exit__(self, *exc):
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join()
+			self.peak = max(self.peak, _rss_bytes() or 0)
+
+	@property
+	def growth_mb(self):
+		if self.start is None:
+			return None
+		return (self.peak - self.start) / (1024 * 1024)
+
+
+def _stream(client, url):
+	started = time.perf_counter()
+	response = client.get(url, buffered=False)
+	first_byte = None
+	size = 0
+	lines = 0
+	for chunk in response.response:
+		if first_byte is None:
+			first_byte = time.perf_counter() - started
+		size += len(chunk)
+		lines += chunk.count(b"\n")
+	response.close()
+	return response.status_code, size, lines, first_byte or 0.0, time.perf_counter() - started
+
+
+def run(args):
+	database_dir = tempfile.mkdtemp(prefix="export-bench-")
+	os.environ.update({
+		"DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(database_dir, 'export.db')}",
+		"WEATHER_PROVIDER": "",
+		"MAIL_WORKER_ENABLED": "false",
+		"RATELIMIT_STORAGE_URI": "memory://",
+	})
+
+	from app import create_app, db
+	from app.models.archive import AllocationHistory, SurplusHistory
+	from app.models.complaint import Complaint
+	from app.models.user import User
+	from app.services.archive_service import archive_completed
+	from app.services.dataset_service import DatasetSpec, generate_dataset
+	from config import Config
+
+	class ExportBenchConfig(Config):
+		WTF_CSRF_ENABLED = False
+		RATELIMIT_ENABLED = False
+
+	app = create_app(ExportBenchConfig)
+	with app.app_context():
+		db.create_all()
+		if not db.session.query(AllocationHistory.id).first():
+			started = time.perf_counter()
+			written = generate_dataset(DatasetSpec(seed=args.seed).scaled(args.scale))
+			print(", ".join(f"{count} {table}" for table, count in written.items()) + f" generated in {time.perf_counter() - started:.1f}s")
+			if args.archive_days:
+				moved = archive_completed(args.archive_days, batch_size=2000)
+				print(f"archived {moved['surplus']} surplus and {moved['allocations']} allocations")
+		expected = {
+			"allocations": AllocationHistory.query.count(),
+			"surplus": SurplusHistory.query.count(),
+			"complaints": Complaint.query.count(),
+		}
+		admin = User.query.filter_by(role="admin").first()
+		if admin is None:
+			admin = User(full_name="Export Bench", email="export-bench@bench.test", role="admin")
+			admin.set_password("export-bench")
+			db.session.add(admin)
+			db.session.commit()
+		admin_id = admin.id
+
+	client = app.test_client()
+	with client.session_transaction() as session:
+		session["user_id"] = admin_id
+		session["role"] = "admin"
+
+	failures = []
+	print(f"{'export':<26} {'rows':>10} {'MB':>8} {'ttfb ms':>8} {'s':>7} {'rows/s':>10} {'peak +MB':>9}")
+	for kind, fmt, gzip in CASES:
+		url = f"/admin/export/{kind}?format={fmt}" + ("&gzip=1" if gzip else "")
+		with PeakRss() as rss:
+			status, size, lines, first_byte, seconds = _stream(client, url)
+		label = f"{kind}.{fmt}" + (".gz" if gzip else "")
+		rows = lines - (1 if fmt == "csv" else 0)
+		growth = rss.growth_mb
+		print(
+			f"{label:<26} {rows if not gzip else '-':>10} {size / 1e6:>8.1f} {first_byte * 1000:>8.1f} "
+			f"{seconds:>7.2f} {expected[kind] / seconds:>10.0f} {growth if growth is not None else float('nan'):>9.1f}"
+		)
+		if status != 200:
+			failures.append(f"{label}: HTTP {status}")
+		elif not gzip and fmt == "ndjson" and rows != expected[kind]:
+			failures.append(f"{label}: {rows} rows, expected {expected[kind]}")
+		if growth is not None and growth > EXPORT_MEMORY_BUDGET_MB:
+			failures.append(f"{label}: RSS grew {growth:.1f} MB (budget {EXPORT_MEMORY_BUDGET_MB:.0f} MB)")
+
+	if not args.skip_naive:
+		with app.app_context(), PeakRss() as rss:
+			started = time.perf_counter()
+			rows = AllocationHistory.query.all()
+			seconds = time.perf_counter() - started
+			loaded = len(rows)
+			del rows
+		growth = rss.growth_mb
+		print(f"{'naive .all() allocations':<26} {loaded:>10} {'-':>8} {'-':>8} {seconds:>7.2f} {loaded / seconds:>10.0f} {growth if growth is not None else float('nan'):>9.1f}")
+
+	for failure in failures:
+		print(f"FAIL: {failure}")
+	if not failures:
+		print(f"OK: every export streamed within {EXPORT_MEMORY_BUDGET_MB:.0f} MB of RSS growth")
+	return 1 if failures else 0
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Streaming export benchmark.")
+	parser.add_argument("--database-url", default="", help="Defaults to a throwaway SQLite file.")
+	parser.add_argument("--scale", type=float, default=1.0, help="Dataset scale (1 = 10,000 events).")
+	parser.add_argument("--seed", type=int, default=42)
+	parser.add_argument("--archive-days", type=int, default=180, help="Archive batches older than this first (0 = skip).")
+	parser.add_argument("--skip-naive", action="store_true", help="Skip the .all() comparison.")
+	return run(parser.parse_args())
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,441 @@
+"""Mixed-workload load test with per-route latency, throughput and SQL counts.
+
+Run from the project root:
+
+    python -m benchmarks.load_test                      # compare with the stored baseline
+    python -m benchmarks.load_test --update-baseline    # record a new baseline
+    python -m benchmarks.load_test --database-url postgresql://localhost/kalyana_load
+
+The app is booted in-process against a throwaway SQLite file (or the given
+database, whose tables are created if missing). Nominatim and SMTP are
+replaced by local stub servers, so nothing leaves the machine. Virtual
+users run concurrently:
+
+- providers add a batch with a photo, mark it ready, and open their dashboard;
+- NGOs search nearby (HTML and JSON), request a slice of a batch, and now
+  and then start a password reset (which goes through the mail queue);
+- admins poll /admin/dashboard/live;
+- Socket.IO test clients count the platform_update events they receive.
+
+Each route gets p50/p95/p99 latency and mean SQL statements per request.
+The run fails (exit 1) on server errors, on socket clients that missed
+updates, or when a route regresses against benchmarks/baselines/load_test.json:
+SQL per request more than 10% (min +0.5) over baseline, or p95 latency or
+overall throughput worse than --latency-tolerance allows.
+"""
+import argparse
+from collections import defaultdict
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+import os
+import random
+import socketserver
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "load_test.json")
+CITY_CENTERS = {
+	"Chennai": (13.0827, 80.2707),
+	"Bengaluru": (12.9716, 77.5946),
+	"Hyderabad": (17.3850, 78.4867),
+}
+SQL_TOLERANCE = 0.10
+SQL_MIN_SLACK = 0.5
+LATENCY_FLOOR_MS = 5.0
+
+
+def _png_bytes():
+	"""1x1 PNG; every upload dedupes to one content-addressed file."""
+	def chunk(kind, data):
+		return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+	header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+	return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(b"\x00\xf0\xa0\x40")) + chunk(b"IEND", b"")
+
+
+def _place_for(query):
+	"""Deterministic point within ~8 km of the city named in the query."""
+	city = next((name for name in CITY_CENTERS if name.lower() in query.lower()), "Chennai")
+	lat, lon = CITY_CENTERS[city]
+	digest = hashlib.sha256(query.encode("utf-8")).digest()
+	return lat + (digest[0] - 128) / 128 * 0.07, lon + (digest[1] - 128) / 128 * 0.07
+
+
+class _NominatimStub(BaseHTTPRequestHandler):
+	def do_GET(self):
+		from urllib.parse import parse_qs, urlparse
+
+		query = (parse_qs(urlparse(self.path).query).get("q") or [""])[0]
+		lat, lon = _place_for(query)
+		body = json.dumps([{"display_name": query, "lat": str(lat), "lon": str(lon)}]).encode("utf-8")
+		self.send_response(200)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, *args):
+		pass
+
+
+class _SMTPStub(socketserver.StreamRequestHandler):
+	"""Just enough SMTP to accept messages; counts deliveries."""
+
+	delivered = 0
+	lock = threading.Lock()
+
+	def _reply(self, line):
+		self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+	def handle(self):
+		self._reply("220 stub ESMTP")
+		while True:
+			line = self.rfile.readline()
+			if not line:
+				return
+			command = line.decode("ascii", "replace").strip().upper()
+			if command.startswith("EHLO") or command.startswith("HELO"):
+				self._reply("250 stub")
+			elif command.startswith("DATA"):
+				self._reply("354 end with .")
+				while self.rfile.readline() not in (b".\r\n", b""):
+					pass
+				with _SMTPStub.lock:
+					_SMTPStub.delivered += 1
+				self._reply("250 queued")
+			elif command.startswith("QUIT"):
+				self._reply("221 bye")
+				return
+			else:
+				self._reply("250 ok")
+
+
+def _start_stub(server):
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	return server
+
+
+class Recorder:
+	def __init__(self):
+		self.local = threading.local()
+		self.lock = threading.Lock()
+		self.latencies = defaultdict(list)
+		self.sql_counts = defaultdict(list)
+		self.errors = defaultdict(int)
+
+	def on_sql(self, *args, **kwargs):
+		if getattr(self.local, "label", None) is not None:
+			self.local.statements += 1
+
+	def call(self, label, send, expect=(200, 302)):
+		self.local.label = label
+		self.local.statements = 0
+		started = time.perf_counter()
+		try:
+			response = send()
+		finally:
+			elapsed = (time.perf_counter() - started) * 1000
+			statements = self.local.statements
+			self.local.label = None
+		with self.lock:
+			self.latencies[label].append(elapsed)
+			self.sql_counts[label].append(statements)
+			if response.status_code not in expect:
+				self.errors[label] += 1
+		return response
+
+
+def _percentile(values, fraction):
+	ordered = sorted(values)
+	index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+	return ordered[index]
+
+
+def _login(client, user_id, role):
+	with client.session_transaction() as session:
+		session["user_id"] = user_id
+		session["role"] = role
+
+
+def _seed(app, db, rng, providers, ngos, admins, batches):
+	from werkzeug.security import generate_password_hash
+
+	from app.models.event import Event
+	from app.models.surplus import Surplus
+	from app.models.user import User
+
+	password_hash = generate_password_hash("loadtest123")
+	users = {"provider": [], "ngo": [], "admin": []}
+	for role, count in (("provider", providers), ("ngo", ngos), ("admin", admins)):
+		for index in range(count):
+			user = User(
+				full_name=f"{role.title()} {index}",
+				email=f"{role}{index}.{rng.randrange(10**9)}@load.test",
+				role=role,
+				capacity_kg=50.0 if role == "ngo" else None,
+			)
+			user.password_hash = password_hash
+			db.session.add(user)
+			users[role].append(user)
+	db.session.flush()
+
+	cities = list(CITY_CENTERS)
+	for provider in users["provider"]:
+		event = Event(provider_id=provider.id, event_name="Load wedding", guest_count=rng.randint(100, 800))
+		db.session.add(event)
+		db.session.flush()
+		for index in range(batches):
+			lat, lon = _place_for(f"{cities[index % len(cities)]} seed {provider.id}-{index}")
+			kg = float(rng.randint(20, 120))
+			db.session.add(Surplus(
+				provider_id=provider.id, event_id=event.id, event_name=event.event_name,
+				mahal_name=f"Seed Mahal {provider.id}-{index}", provider_name=provider.full_name,
+				food_type=rng.choice(["Biryani", "Rice", "Sambar", "Sweets"]), quantity=kg, quantity_kg=kg,
+				remaining_kg=kg, estimated_expiry="4 hours", provider_latitude=lat, provider_longitude=lon,
+				photo_path="uploads/food_images/seed.jpg", status="available",
+			))
+	db.session.commit()
+	return {role: [(user.id, user.email) for user in members] for role, members in users.items()}
+
+
+def _provider_user(app, recorder, user_id, iterations, rng):
+	from app.models.surplus import Surplus
+
+	client = app.test_client()
+	_login(client, user_id, "provider")
+	city = rng.choice(list(CITY_CENTERS))
+	for iteration in range(iterations):
+		recorder.call("POST /provider/add-surplus", lambda: client.post(
+			"/provider/add-surplus",
+			data={
+				"event_name": "Load wedding",
+				"mahal_name": f"Mahal {user_id}-{iteration}",
+				"food_type": rng.choice(["Biryani", "Rice", "Curd rice"]),
+				"quantity_kg": str(rng.randint(10, 80)),
+				"estimated_expiry": "3 hours",
+				"mahal_location": f"{city} hall {user_id}-{iteration}",
+				"food_photo": (io.BytesIO(_png_bytes()), "food.png"),
+			},
+			content_type="multipart/form-data",
+		))
+		with app.app_context():
+			surplus = (
+				Surplus.query.filter_by(provider_id=user_id, status="pending")
+				.order_by(Surplus.id.desc())
+				.first()
+			)
+			surplus_id = surplus.id if surplus else None
+		if surplus_id:
+			recorder.call("POST /provider/surplus/<id>/mark-ready", lambda: client.post(f"/provider/surplus/{surplus_id}/mark-ready"))
+		if iteration % 2 == 0:
+			recorder.call("GET /provider/dashboard", lambda: client.get("/provider/dashboard"), expect=(200,))
+
+
+def _ngo_user(app, recorder, user_id, email, iterations, rng):
+	client = app.test_client()
+	_login(client, user_id, "ngo")
+	city = rng.choice(list(CITY_CENTERS))
+	lat, lon = CITY_CENTERS[city]
+	for iteration in range(iterations):
+		recorder.call("GET /ngo/nearby-surplus", lambda: client.get(
+			"/ngo/nearby-surplus", query_string={"receiver_location": f"{city} ngo {user_id}", "radius_km": "10"}
+		), expect=(200,))
+		response = recorder.call("GET /api/v1/ngo/nearby-surplus", lambda: client.get(
+			"/api/v1/ngo/nearby-surplus", query_string={"lat": lat, "lon": lon, "radius_km": "10", "limit": "20"}
+		), expect=(200,))
+		items = (response.get_json() or {}).get("items") or []
+		if items:
+			surplus_id = rng.choice(items)["id"]
+			recorder.call("POST /ngo/request-food/<id>", lambda: client.post(
+				f"/ngo/request-food/{surplus_id}", data={"quantity_kg": str(rng.randint(1, 5))}
+			))
+		if iteration % 5 == 0:
+			recorder.call("GET /ngo/dashboard", lambda: client.get("/ngo/dashboard"), expect=(200,))
+		if iteration % 10 == 0:
+			reset_client = app.test_client()
+			recorder.call("POST /forgot-password", lambda: reset_client.post("/forgot-password", data={"email": email}))
+
+
+def _admin_user(app, recorder, user_id, iterations):
+	client = app.test_client()
+	_login(client, user_id, "admin")
+	for _ in range(iterations * 2):
+		recorder.call("GET /admin/dashboard/live", lambda: client.get("/admin/dashboard/live"), expect=(200,))
+
+
+def run(args):
+	database_dir = tempfile.mkdtemp(prefix="load-test-")
+	nominatim = _start_stub(ThreadingHTTPServer(("127.0.0.1", 0), _NominatimStub))
+	smtp = _start_stub(socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPStub))
+
+	os.environ.update({
+		"DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(database_dir, 'load.db')}",
+		"NOMINATIM_BASE_URL": f"http://127.0.0.1:{nominatim.server_address[1]}",
+		"SMTP_HOST": "127.0.0.1",
+		"SMTP_PORT": str(smtp.server_address[1]),
+		"SMTP_USER": "",
+		"SMTP_FROM_EMAIL": "noreply@load.test",
+		"SMTP_USE_TLS": "false",
+		"MAIL_POLL_SECONDS": "0.2",
+		"WEATHER_PROVIDER": "",
+		"RATELIMIT_STORAGE_URI": "memory://",
+	})
+
+	from sqlalchemy import event
+
+	from app import create_app, db, socketio
+	from config import Config
+
+	class LoadTestConfig(Config):
+		WTF_CSRF_ENABLED = False
+		RATELIMIT_ENABLED = False
+		SQLALCHEMY_ENGINE_OPTIONS = (
+			{"connect_args": {"timeout": 30}} if Config.SQLALCHEMY_DATABASE_URI.startswith("sqlite") else {}
+		)
+
+	app = create_app(LoadTestConfig)
+	app.static_folder = os.path.join(database_dir, "static")
+	rng = random.Random(args.seed)
+	recorder = Recorder()
+
+	with app.app_context():
+		db.create_all()
+		users = _seed(app, db, rng, args.providers, args.ngos, args.admins, args.batches)
+		event.listen(db.engine, "before_cursor_execute", recorder.on_sql)
+
+	socket_clients = [socketio.test_client(app) for _ in range(args.sockets)]
+
+	threads = []
+	for user_id, _ in users["provider"]:
+		threads.append(threading.Thread(target=_provider_user, args=(app, recorder, user_id, args.iterations, random.Random(rng.random()))))
+	for user_id, email in users["ngo"]:
+		threads.append(threading.Thread(target=_ngo_user, args=(app, recorder, user_id, email, args.iterations, random.Random(rng.random()))))
+	for user_id, _ in users["admin"]:
+		threads.append(threading.Thread(target=_admin_user, args=(app, recorder, user_id, args.iterations)))
+
+	started = time.perf_counter()
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	wall = time.perf_counter() - started
+	time.sleep(1.0)
+
+	received = [
+		sum(1 for packet in client.get_received() if packet["name"] == "platform_update")
+		for client in socket_clients
+	]
+	for client in socket_clients:
+		client.disconnect()
+
+	with app.app_context():
+		event.remove(db.engine, "before_cursor_execute", recorder.on_sql)
+	nominatim.shutdown()
+	smtp.shutdown()
+
+	routes = {}
+	for label in sorted(recorder.latencies):
+		latencies = recorder.latencies[label]
+		routes[label] = {
+			"requests": len(latencies),
+			"p50_ms": round(_percentile(latencies, 0.50), 2),
+			"p95_ms": round(_percentile(latencies, 0.95), 2),
+			"p99_ms": round(_percentile(latencies, 0.99), 2),
+			"sql_per_request": round(statistics.mean(recorder.sql_counts[label]), 2),
+			"errors": recorder.errors[label],
+		}
+	total = sum(route["requests"] for route in routes.values())
+	return {
+		"routes": routes,
+		"requests": total,
+		"throughput_rps": round(total / wall, 1),
+		"socket_updates_min": min(received) if received else 0,
+		"socket_updates_max": max(received) if received else 0,
+		"emails_delivered": _SMTPStub.delivered,
+	}
+
+
+def _compare(result, baseline, latency_tolerance):
+	problems = []
+	for label, route in result["routes"].items():
+		if route["errors"]:
+			problems.append(f"{label}: {route['errors']} unexpected response(s)")
+		base = (baseline or {}).get("routes", {}).get(label)
+		if not base:
+			continue
+		sql_limit = base["sql_per_request"] + max(SQL_MIN_SLACK, base["sql_per_request"] * SQL_TOLERANCE)
+		if route["sql_per_request"] > sql_limit:
+			problems.append(f"{label}: {route['sql_per_request']} SQL/request (baseline {base['sql_per_request']})")
+		latency_limit = base["p95_ms"] * (1 + latency_tolerance) + LATENCY_FLOOR_MS
+		if route["p95_ms"] > latency_limit:
+			problems.append(f"{label}: p95 {route['p95_ms']} ms (baseline {base['p95_ms']} ms)")
+	if baseline and result["throughput_rps"] < baseline["throughput_rps"] / (1 + latency_tolerance):
+		problems.append(f"throughput {result['throughput_rps']} req/s (baseline {baseline['throughput_rps']} req/s)")
+	if result["socket_updates_min"] != result["socket_updates_max"]:
+		problems.append(
+			f"socket clients missed updates ({result['socket_updates_min']}-{result['socket_updates_max']} received)"
+		)
+	return problems
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Mixed-workload load test.")
+	parser.add_argument("--database-url", default="", help="Defaults to a throwaway SQLite file.")
+	parser.add_argument("--providers", type=int, default=4)
+	parser.add_argument("--ngos", type=int, default=8)
+	parser.add_argument("--admins", type=int, default=2)
+	parser.add_argument("--batches", type=int, default=25, help="Seeded open batches per provider.")
+	parser.add_argument("--iterations", type=int, default=20, help="Scenario loops per virtual user.")
+	parser.add_argument("--sockets", type=int, default=10)
+	parser.add_argument("--seed", type=int, default=7)
+	parser.add_argument("--baseline", default=BASELINE_PATH)
+	parser.add_argument("--update-baseline", action="store_true")
+	parser.add_argument("--latency-tolerance", type=float, default=1.0, help="Allowed p95 growth as a fraction (1.0 = 2x).")
+	args = parser.parse_args()
+
+	result = run(args)
+
+	print(f"{'route':<38} {'n':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'sql/req':>8} {'err':>4}")
+	for label, route in result["routes"].items():
+		print(
+			f"{label:<38} {route['requests']:>5} {route['p50_ms']:>8.1f} {route['p95_ms']:>8.1f} "
+			f"{route['p99_ms']:>8.1f} {route['sql_per_request']:>8.2f} {route['errors']:>4}"
+		)
+	print(
+		f"{result['requests']} requests at {result['throughput_rps']} req/s; "
+		f"socket updates per client {result['socket_updates_min']}-{result['socket_updates_max']}; "
+		f"{result['emails_delivered']} email(s) delivered to the SMTP stub"
+	)
+
+	if args.update_baseline:
+		os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+		with open(args.baseline, "w", encoding="utf-8") as handle:
+			json.dump({"routes": result["routes"], "throughput_rps": result["throughput_rps"]}, handle, indent=2, sort_keys=True)
+			handle.write("\n")
+		print(f"Baseline written to {args.baseline}")
+		return 0
+
+	baseline = None
+	if os.path.exists(args.baseline):
+		with open(args.baseline, "r", encoding="utf-8") as handle:
+			baseline = json.load(handle)
+	problems = _compare(result, baseline, args.latency_tolerance)
+	if problems:
+		for problem in problems:
+			print(f"FAIL: {problem}")
+		return 1
+	print("OK: no regressions against baseline" if baseline else "OK: no baseline to compare against")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,91 @@
+"""Benchmark the SQLite rate-limit storage against memory://.
+
+Run from the project root:
+
+    python -m benchmarks.ratelimit_storage
+
+Measures the cost of one sliding-window hit (what Flask-Limiter does per
+limited request) for memory:// and the shared sqlite:// backend, first in
+one process and then with several processes hammering the same file. It
+also checks that processes sharing one key admit exactly `limit` hits in
+total. It fails if a sqlite hit costs more than the budget, or if the
+shared limit is over-admitted.
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+import app.utils.ratelimit_storage  # noqa: F401  (registers sqlite://)
+
+
+BUDGET_US = 500.0
+HITS = 20000
+PROCESSES = 4
+SHARED_LIMIT = 500
+
+
+def _hit_loop(uri, hits, key_prefix):
+	limiter = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+	# High enough that every hit is admitted and written, the expensive path.
+	item = parse(f"{hits * 10} per minute")
+	started = time.perf_counter()
+	for index in range(hits):
+		limiter.hit(item, key_prefix, str(index % 50))
+	return time.perf_counter() - started
+
+
+def _worker(args):
+	uri, hits, key_prefix = args
+	return _hit_loop(uri, hits, key_prefix)
+
+
+def _shared_worker(args):
+	uri, attempts = args
+	limiter = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+	item = parse(f"{SHARED_LIMIT} per hour")
+	return sum(1 for _ in range(attempts) if limiter.hit(item, "shared", "login"))
+
+
+def main():
+	directory = tempfile.mkdtemp(prefix="ratelimit-bench-")
+	sqlite_uri = f"sqlite:///{os.path.join(directory, 'limits.sqlite3')}"
+
+	print(f"{'backend':<22} {'hits':>7} {'us/hit':>9} {'hits/s':>10}")
+	results = {}
+	for label, uri in (("memory (1 process)", "memory://"), ("sqlite (1 process)", sqlite_uri)):
+		elapsed = _hit_loop(uri, HITS, label)
+		results[label] = elapsed / HITS * 1e6
+		print(f"{label:<22} {HITS:>7} {results[label]:>9.1f} {HITS / elapsed:>10.0f}")
+
+	per_process = HITS // PROCESSES
+	with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+		# Slowest worker's loop time; process spawn and imports are excluded.
+		wall = max(pool.map(_worker, [(sqlite_uri, per_process, f"p{index}") for index in range(PROCESSES)]))
+	label = f"sqlite ({PROCESSES} processes)"
+	print(f"{label:<22} {per_process * PROCESSES:>7} {wall / (per_process * PROCESSES) * 1e6:>9.1f} {per_process * PROCESSES / wall:>10.0f}")
+
+	with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+		admitted = sum(pool.map(_shared_worker, [(sqlite_uri, SHARED_LIMIT) for _ in range(PROCESSES)]))
+	print(f"shared key: {admitted} admitted across {PROCESSES} processes (limit {SHARED_LIMIT})")
+
+	failed = False
+	if results["sqlite (1 process)"] > BUDGET_US:
+		print(f"FAIL: sqlite hit took {results['sqlite (1 process)']:.0f} us (budget {BUDGET_US:.0f} us)")
+		failed = True
+	if admitted != SHARED_LIMIT:
+		print(f"FAIL: shared limit admitted {admitted} hits, expected {SHARED_LIMIT}")
+		failed = True
+	if failed:
+		return 1
+	print(f"OK: sqlite hit within {BUDGET_US:.0f} us budget and shared limit exact")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,62 @@
+"""Benchmark the NGO pickup route planner.
+
+Run from the project root:
+
+    python -m benchmarks.route_planner
+
+Plans routes for 5 to 50 stops scattered around Chennai and fails if the
+50-stop case exceeds the 100 ms budget.
+"""
+import random
+import sys
+import time
+
+from app.services.route_service import plan_pickup_route
+
+
+BUDGET_MS = 100.0
+STOP_COUNTS = (5, 10, 20, 35, 50)
+RUNS = 20
+
+
+def _random_stops(rng, count):
+	stops = []
+	for index in range(count):
+		deadline = rng.choice([None, rng.uniform(30, 360)])
+		stops.append({
+			"id": index,
+			"lat": 13.06 + rng.uniform(-0.15, 0.15),
+			"lon": 80.24 + rng.uniform(-0.15, 0.15),
+			"deadline_minutes": deadline,
+		})
+	return stops
+
+
+def main():
+	rng = random.Random(42)
+	start = (13.06, 80.24)
+	worst_ms = 0.0
+
+	print(f"{'stops':>6} {'p50 ms':>9} {'max ms':>9} {'km':>8}")
+	for count in STOP_COUNTS:
+		timings = []
+		distance = 0.0
+		for _ in range(RUNS):
+			stops = _random_stops(rng, count)
+			started = time.perf_counter()
+			route = plan_pickup_route(start, stops)
+			timings.append((time.perf_counter() - started) * 1000)
+			distance = route[-1]["cumulative_km"]
+		timings.sort()
+		worst_ms = max(worst_ms, timings[-1]) if count == STOP_COUNTS[-1] else worst_ms
+		print(f"{count:>6} {timings[len(timings) // 2]:>9.2f} {timings[-1]:>9.2f} {distance:>8.1f}")
+
+	if worst_ms > BUDGET_MS:
+		print(f"FAIL: {STOP_COUNTS[-1]} stops took {worst_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)")
+		return 1
+	print(f"OK: {STOP_COUNTS[-1]} stops within {BUDGET_MS:.0f} ms budget")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,275 @@
+"""Compare the threading dev server with the gunicorn + gevent profile.
+
+Run from the project root:
+
+    python -m benchmarks.server_profiles [--sockets 2000] [--seconds 5]
+
+Boots each server against a throwaway SQLite database, then:
+
+1. opens --sockets idle Socket.IO websocket connections (Engine.IO
+   handshake plus a Socket.IO namespace connect) and holds them,
+2. measures HTTP throughput for GET /login from 16 keep-alive clients while
+   those sockets stay open,
+3. reports the server's resident memory (master plus workers).
+
+It fails if the gevent profile cannot hold every requested socket.
+"""
+import argparse
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HTTP_CLIENTS = 16
+CONNECT_WORKERS = 64
+
+
+def _free_port():
+	with socket.socket() as probe:
+		probe.bind(("127.0.0.1", 0))
+		return probe.getsockname()[1]
+
+
+def _server_command(profile, port):
+	if profile == "threading":
+		code = (
+			"from wsgi import app; from app import socketio; "
+			f"socketio.run(app, host='127.0.0.1', port={port}, allow_unsafe_werkzeug=True, log_output=False)"
+		)
+		return [sys.executable, "-c", code]
+	return [
+		sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+		"--bind", f"127.0.0.1:{port}", "--access-logfile", "/dev/null", "--log-level", "warning",
+		"wsgi:app",
+	]
+
+
+def _wait_until_up(port, timeout=30):
+	deadline = time.time() + timeout
+	while time.time() < deadline:
+		try:
+			connection = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+			connection.request("GET", "/login")
+			connection.getresponse().read()
+			return True
+		except OSError:
+			time.sleep(0.2)
+	return False
+
+
+def _rss_mb(pid):
+	pids = [pid]
+	for entry in os.listdir("/proc"):
+		if entry.isdigit():
+			try:
+				with open(f"/proc/{entry}/stat", "r", encoding="utf-8") as handle:
+					if int(handle.read().rsplit(")", 1)[1].split()[1]) == pid:
+						pids.append(int(entry))
+			except (OSError, ValueError, IndexError):
+				continue
+
+	total_kb = 0
+	for item in pids:
+		try:
+			with open(f"/proc/{item}/status", "r", encoding="utf-8") as handle:
+				for line in handle:
+					if line.startswith("VmRSS:"):
+						total_kb += int(line.split()[1])
+		except OSError:
+			continue
+	return total_kb / 1024
+
+
+class _Reader:
+	"""Buffered reads, so bytes that arrive with the HTTP 101 response are kept."""
+
+	def __init__(self, sock):
+		self.sock = sock
+		self.buffer = b""
+
+	def read_exact(self, size):
+		while len(self.buffer) < size:
+			chunk = self.sock.recv(4096)
+			if not chunk:
+				raise ConnectionError("closed")
+			self.buffer += chunk
+		data, self.buffer = self.buffer[:size], self.buffer[size:]
+		return data
+
+	def read_until(self, marker):
+		while marker not in self.buffer:
+			chunk = self.sock.recv(4096)
+			if not chunk:
+				raise ConnectionError("closed during handshake")
+			self.buffer += chunk
+		data, self.buffer = self.buffer.split(marker, 1)
+		return data
+
+	def read_frame(self):
+		header = self.read_exact(2)
+		length = header[1] & 0x7F
+		if length == 126:
+			length = int.from_bytes(self.read_exact(2), "big")
+		return self.read_exact(length)
+
+
+def _send_text(sock, text):
+	data = text.encode("utf-8")
+	mask = os.urandom(4)
+	masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(data))
+	sock.sendall(bytes([0x81, 0x80 | len(data)]) + mask + masked)
+
+
+def _open_socket(port):
+	sock = socket.create_connection(("127.0.0.1", port), timeout=15)
+	key = base64.b64encode(os.urandom(16)).decode("ascii")
+	sock.sendall(
+		(
+			"GET /socket.io/?EIO=4&transport=websocket HTTP/1.1\r\n"
+			f"Host: 127.0.0.1:{port}\r\n"
+			"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+			f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+		).encode("ascii")
+	)
+	reader = _Reader(sock)
+	status_line = reader.read_until(b"\r\n\r\n").split(b"\r\n", 1)[0]
+	if b" 101 " not in status_line:
+		raise ConnectionError(status_line.decode("ascii", "replace"))
+	if not reader.read_frame().startswith(b"0"):
+		raise ConnectionError("no Engine.IO open packet")
+	_send_text(sock, "40")
+	if not reader.read_frame().startswith(b"40"):
+		raise ConnectionError("no Socket.IO connect ack")
+	return sock
+
+
+def _hold_sockets(port, count):
+	sockets = []
+	failures = 0
+	lock = threading.Lock()
+
+	def attempt(_):
+		nonlocal failures
+		try:
+			sock = _open_socket(port)
+		except OSError:
+			with lock:
+				failures += 1
+			return
+		with lock:
+			sockets.append(sock)
+
+	started = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=CONNECT_WORKERS) as pool:
+		list(pool.map(attempt, range(count)))
+	return sockets, failures, time.perf_counter() - started
+
+
+def _http_rps(port, seconds):
+	deadline = time.perf_counter() + seconds
+	counts = [0] * HTTP_CLIENTS
+	errors = [0] * HTTP_CLIENTS
+
+	def client(index):
+		connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+		while time.perf_counter() < deadline:
+			try:
+				connection.request("GET", "/login")
+				response = connection.getresponse()
+				response.read()
+				if response.status == 200:
+					counts[index] += 1
+				else:
+					errors[index] += 1
+			except OSError:
+				errors[index] += 1
+				connection.close()
+				connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+		connection.close()
+
+	threads = [threading.Thread(target=client, args=(index,)) for index in range(HTTP_CLIENTS)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	return sum(counts) / seconds, sum(errors)
+
+
+def run_profile(profile, sockets_wanted, seconds, database_dir):
+	port = _free_port()
+	env = dict(
+		os.environ,
+		DATABASE_URL=f"sqlite:///{os.path.join(database_dir, profile + '.db')}",
+		RATELIMIT_STORAGE_URI=f"sqlite:///{os.path.join(database_dir, profile + '-limits.db')}",
+		MAIL_WORKER_ENABLED="false",
+		WEB_CONCURRENCY="1",
+	)
+	server = subprocess.Popen(
+		_server_command(profile, port),
+		cwd=PROJECT_ROOT,
+		env=env,
+		stdout=subprocess.DEVNULL,
+		stderr=subprocess.DEVNULL,
+		start_new_session=True,
+	)
+	try:
+		if not _wait_until_up(port):
+			raise RuntimeError(f"{profile} server did not start")
+		idle_rss = _rss_mb(server.pid)
+		sockets, failures, connect_seconds = _hold_sockets(port, sockets_wanted)
+		rps, http_errors = _http_rps(port, seconds)
+		loaded_rss = _rss_mb(server.pid)
+		for sock in sockets:
+			sock.close()
+		return {
+			"connected": len(sockets),
+			"failed": failures,
+			"connect_s": connect_seconds,
+			"rps": rps,
+			"http_errors": http_errors,
+			"idle_rss": idle_rss,
+			"loaded_rss": loaded_rss,
+		}
+	finally:
+		os.killpg(server.pid, signal.SIGTERM)
+		try:
+			server.wait(timeout=15)
+		except subprocess.TimeoutExpired:
+			os.killpg(server.pid, signal.SIGKILL)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--sockets", type=int, default=2000)
+	parser.add_argument("--seconds", type=float, default=5.0)
+	args = parser.parse_args()
+
+	database_dir = tempfile.mkdtemp(prefix="server-bench-")
+	results = {}
+	print(f"{'profile':<10} {'sockets':>9} {'failed':>7} {'connect s':>10} {'GET rps':>9} {'errors':>7} {'idle MB':>8} {'held MB':>8}")
+	for profile in ("threading", "gevent"):
+		result = run_profile(profile, args.sockets, args.seconds, database_dir)
+		results[profile] = result
+		print(
+			f"{profile:<10} {result['connected']:>9} {result['failed']:>7} {result['connect_s']:>10.1f} "
+			f"{result['rps']:>9.0f} {result['http_errors']:>7} {result['idle_rss']:>8.0f} {result['loaded_rss']:>8.0f}"
+		)
+
+	if results["gevent"]["connected"] < args.sockets:
+		print(f"FAIL: gevent profile held {results['gevent']['connected']} of {args.sockets} sockets")
+		return 1
+	print(f"OK: gevent profile held all {args.sockets} sockets")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from datetime import timedelta
 
 from dotenv import load_dotenv
@@ -7,6 +8,26 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _engine_options(database_url):
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
+    if database_url.startswith("sqlite"):
+        # SQLite pools are per-file/thread; sizing options do not apply.
+        return options
+
+    options.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    )
+    statement_timeout_ms = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+    if statement_timeout_ms and database_url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout_ms}"}
+    return options
+
+
 class Config:
     database_url = os.getenv("DATABASE_URL", "sqlite:///kalyana_local.db")
     if database_url.startswith("postgres://"):
@@ -15,17 +36,65 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-change-this-secret")
     SQLALCHEMY_DATABASE_URI = database_url
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(database_url)
+    replica_url = os.getenv("DATABASE_REPLICA_URL", "").replace("postgres://", "postgresql://", 1)
+    SQLALCHEMY_BINDS = {"replica": replica_url} if replica_url else {}
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+    REPLICA_LAG_CHECK_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "10"))
+    REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+    REPLICA_STATEMENT_TIMEOUT_MS = int(os.getenv("REPLICA_STATEMENT_TIMEOUT_MS", "15000"))
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = "Lax"
     SESSION_COOKIE_SECURE = os.getenv("COOKIE_SECURE", "false").lower() == "true"
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     PREFERRED_URL_SCHEME = os.getenv("PREFERRED_URL_SCHEME", "http")
     WTF_CSRF_TIME_LIMIT = 3600
-    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STORAGE_URI = os.getenv(
+        "RATELIMIT_STORAGE_URI",
+        f"sqlite:///{os.path.join(tempfile.gettempdir(), 'kalyana-ratelimit.sqlite3')}",
+    )
+    RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "sliding-window-counter")
     RATELIMIT_HEADERS_ENABLED = True
+    NEARBY_API_PAGE_SIZE = int(os.getenv("NEARBY_API_PAGE_SIZE", "20"))
+    NEARBY_API_MAX_PAGE_SIZE = int(os.getenv("NEARBY_API_MAX_PAGE_SIZE", "100"))
+    PICKUP_AVG_SPEED_KMPH = float(os.getenv("PICKUP_AVG_SPEED_KMPH", "20"))
+    ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "180"))
+    ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+    USER_PURGE_BATCH_SIZE = int(os.getenv("USER_PURGE_BATCH_SIZE", "500"))
+    USER_PURGE_WORKER_ENABLED = os.getenv("USER_PURGE_WORKER_ENABLED", "true").lower() == "true"
+    ACCOUNT_RECHECK_SECONDS = int(os.getenv("ACCOUNT_RECHECK_SECONDS", "60"))
+    WEATHER_PROVIDER = os.getenv("WEATHER_PROVIDER", "open-meteo")
+    WEATHER_FIXTURE_PATH = os.getenv("WEATHER_FIXTURE_PATH", "")
+    WEATHER_TILE_DEGREES = float(os.getenv("WEATHER_TILE_DEGREES", "0.25"))
+    WEATHER_CACHE_TTL_SECONDS = int(os.getenv("WEATHER_CACHE_TTL_SECONDS", "1800"))
+    SURPLUS_FORECAST_MODEL_PATH = os.getenv(
+        "SURPLUS_FORECAST_MODEL_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "ml", "surplus_forecast.json"),
+    )
+    MAX_CONTENT_LENGTH = int(os.getenv("MAX_UPLOAD_MB", "8")) * 1024 * 1024
+    IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+    MEDIA_SENDFILE_MODE = os.getenv("MEDIA_SENDFILE_MODE", "").strip().lower()
+    MEDIA_ACCEL_PREFIX = os.getenv("MEDIA_ACCEL_PREFIX", "/_media/")
+    USE_X_SENDFILE = MEDIA_SENDFILE_MODE == "x-sendfile"
+    APP_PROFILE = os.getenv("APP_PROFILE", "full")
+    SOCKETIO_ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading")
+    SOCKETIO_MESSAGE_QUEUE = os.getenv("SOCKETIO_MESSAGE_QUEUE", "")
+    SERVERLESS_BUILD_DIR = os.getenv(
+        "SERVERLESS_BUILD_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "serverless_build"),
+    )
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_SLOW_REQUEST_MS = float(os.getenv("PROFILING_SLOW_REQUEST_MS", "500"))
+    PROFILING_SLOW_QUERY_MS = float(os.getenv("PROFILING_SLOW_QUERY_MS", "100"))
+    PROFILING_RING_SIZE = int(os.getenv("PROFILING_RING_SIZE", "100"))
     SMTP_HOST = os.getenv("SMTP_HOST", "")
     SMTP_PORT = os.getenv("SMTP_PORT", "587")
     SMTP_USER = os.getenv("SMTP_USER", "")
     SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
     SMTP_FROM_EMAIL = os.getenv("SMTP_FROM_EMAIL", "")
-    SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true")
\ No newline at end of file
+    SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true")
+    SMTP_IDLE_SECONDS = int(os.getenv("SMTP_IDLE_SECONDS", "60"))
+    MAIL_WORKER_ENABLED = os.getenv("MAIL_WORKER_ENABLED", "true").lower() == "true"
+    MAIL_POLL_SECONDS = float(os.getenv("MAIL_POLL_SECONDS", "5"))
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Production serving profile for Gunicorn.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Uses the cooperative gevent worker, so one process holds thousands of idle
+Socket.IO websockets (a greenlet each instead of an OS thread in the
+threading dev server). The app is loaded once in the master before forking
+(preload_app), and workers are recycled after a jittered request count to
+cap slow memory growth.
+
+Flask-SocketIO needs sticky sessions to run more than one worker. Keep
+WEB_CONCURRENCY=1 unless SOCKETIO_MESSAGE_QUEUE points at a shared queue and
+the load balancer pins clients to a worker.
+
+Environment overrides: PORT, WEB_CONCURRENCY, GUNICORN_WORKER_CLASS,
+GUNICORN_WORKER_CONNECTIONS, GUNICORN_MAX_REQUESTS,
+GUNICORN_MAX_REQUESTS_JITTER, GUNICORN_TIMEOUT.
+"""
+import os
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+
+if worker_class == "gevent":
+    # Patch before the app is imported in the master (preload_app), not
+    # later in the worker, so locks, sockets and ssl are all cooperative.
+    from gevent import monkey
+
+    monkey.patch_all()
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        # Without psycogreen every psycopg2 query blocks the worker's event
+        # loop, and with it every connection the worker holds.
+        from dotenv import load_dotenv
+
+        load_dotenv()  # DATABASE_URL may only be set in .env, which config.py reads later.
+        if os.getenv("DATABASE_URL", "").startswith("postgres"):
+            raise RuntimeError(
+                "The gevent worker needs psycogreen to run against PostgreSQL; "
+                "pip install psycogreen or set GUNICORN_WORKER_CLASS=sync."
+            ) from None
+    else:
+        patch_psycopg()
+    os.environ.setdefault("SOCKETIO_ASYNC_MODE", "gevent")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "4000"))
+preload_app = True
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Pooled DB connections opened in the master must not be shared by workers,
+    # on any bind (the read replica included).
+    from wsgi import app
+    from app import db
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
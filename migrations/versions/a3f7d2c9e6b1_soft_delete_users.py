@@ -0,0 +1,69 @@
+"""soft delete users and index owner columns for the purge
+
+Revision ID: a3f7d2c9e6b1
+Revises: e5b7c3d9a1f4
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a3f7d2c9e6b1"
+down_revision = "e5b7c3d9a1f4"
+branch_labels = None
+depends_on = None
+
+
+OWNER_INDEXES = (
+    ("ix_surplus_provider_id", "surplus", "provider_id"),
+    ("ix_allocations_provider_id", "allocations", "provider_id"),
+    ("ix_allocations_ngo_id", "allocations", "ngo_id"),
+    ("ix_events_provider_id", "events", "provider_id"),
+)
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _column_names(inspector, table_name):
+    return {col["name"] for col in inspector.get_columns(table_name)}
+
+
+def _index_exists(inspector, table_name, index_name):
+    return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "users"):
+        if "deleted_at" not in _column_names(inspector, "users"):
+            with op.batch_alter_table("users") as batch_op:
+                batch_op.add_column(sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        if not _index_exists(inspector, "users", "ix_users_deleted_at"):
+            op.create_index("ix_users_deleted_at", "users", ["deleted_at"])
+
+    for index_name, table_name, column_name in OWNER_INDEXES:
+        if _table_exists(inspector, table_name) and not _index_exists(inspector, table_name, index_name):
+            op.create_index(index_name, table_name, [column_name])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for index_name, table_name, _ in OWNER_INDEXES:
+        if _table_exists(inspector, table_name) and _index_exists(inspector, table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
+
+    if not _table_exists(inspector, "users"):
+        return
+
+    if _index_exists(inspector, "users", "ix_users_deleted_at"):
+        op.drop_index("ix_users_deleted_at", table_name="users")
+    if "deleted_at" in _column_names(inspector, "users"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.drop_column("deleted_at")
@@ -0,0 +1,50 @@
+"""add outbound email queue
+
+Revision ID: a8d2f6c4e9b1
+Revises: f4c9e1b7a3d6
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a8d2f6c4e9b1"
+down_revision = "f4c9e1b7a3d6"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "outbound_emails"):
+        op.create_table(
+            "outbound_emails",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("recipient", sa.String(length=255), nullable=False),
+            sa.Column("subject", sa.String(length=255), nullable=False),
+            sa.Column("body", sa.Text(), nullable=False, server_default=""),
+            sa.Column("status", sa.String(length=20), nullable=False, server_default="queued"),
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+            sa.Column("claimed_at", sa.DateTime(), nullable=True),
+            sa.Column("last_error", sa.String(length=500), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("sent_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_outbound_emails_status_next_attempt", "outbound_emails", ["status", "next_attempt_at"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "outbound_emails"):
+        op.drop_index("ix_outbound_emails_status_next_attempt", table_name="outbound_emails")
+        op.drop_table("outbound_emails")
@@ -0,0 +1,55 @@
+"""partial quantity allocations and ngo capacity
+
+Revision ID: b3d8e2f71c4a
+Revises: f9a4c2d8b1e6
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b3d8e2f71c4a"
+down_revision = "f9a4c2d8b1e6"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _column_names(inspector, table_name):
+    return {col["name"] for col in inspector.get_columns(table_name)}
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "surplus") and "remaining_kg" not in _column_names(inspector, "surplus"):
+        with op.batch_alter_table("surplus") as batch_op:
+            batch_op.add_column(sa.Column("remaining_kg", sa.Float(), nullable=True))
+        op.execute(
+            "UPDATE surplus SET remaining_kg = COALESCE(quantity, quantity_kg) "
+            "WHERE status IN ('pending', 'available')"
+        )
+        op.execute("UPDATE surplus SET remaining_kg = 0 WHERE remaining_kg IS NULL")
+
+    if _table_exists(inspector, "allocations") and "quantity_kg" not in _column_names(inspector, "allocations"):
+        with op.batch_alter_table("allocations") as batch_op:
+            batch_op.add_column(sa.Column("quantity_kg", sa.Float(), nullable=True))
+
+    if _table_exists(inspector, "users") and "capacity_kg" not in _column_names(inspector, "users"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("capacity_kg", sa.Float(), nullable=True))
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table_name, column_name in [("users", "capacity_kg"), ("allocations", "quantity_kg"), ("surplus", "remaining_kg")]:
+        if _table_exists(inspector, table_name) and column_name in _column_names(inspector, table_name):
+            with op.batch_alter_table(table_name) as batch_op:
+                batch_op.drop_column(column_name)
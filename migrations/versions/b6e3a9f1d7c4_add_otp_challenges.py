@@ -0,0 +1,47 @@
+"""add server-side otp challenges
+
+Revision ID: b6e3a9f1d7c4
+Revises: a8d2f6c4e9b1
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b6e3a9f1d7c4"
+down_revision = "a8d2f6c4e9b1"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "otp_challenges"):
+        op.create_table(
+            "otp_challenges",
+            sa.Column("id", sa.String(length=64), primary_key=True),
+            sa.Column("purpose", sa.String(length=20), nullable=False),
+            sa.Column("email", sa.String(length=255), nullable=False),
+            sa.Column("otp_hash", sa.String(length=128), nullable=False),
+            sa.Column("payload", sa.Text(), nullable=False, server_default="{}"),
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("expires_at", sa.DateTime(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_otp_challenges_expires_at", "otp_challenges", ["expires_at"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "otp_challenges"):
+        op.drop_index("ix_otp_challenges_expires_at", table_name="otp_challenges")
+        op.drop_table("otp_challenges")
@@ -0,0 +1,148 @@
+"""add provider ngo affinity rollup and allocation completed_at
+
+Revision ID: c5e1a9d3f7b2
+Revises: b3d8e2f71c4a
+Create Date: 2026-10-19
+
+"""
+from collections import defaultdict
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c5e1a9d3f7b2"
+down_revision = "b3d8e2f71c4a"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _column_names(inspector, table_name):
+    return {col["name"] for col in inspector.get_columns(table_name)}
+
+
+# Frozen copy of affinity_service.compute_affinity_score as of this revision.
+RATING_PRIOR_MEAN = 3.5
+RATING_PRIOR_WEIGHT = 3
+
+
+def _clamp(value, low=-1.0, high=1.0):
+    return max(low, min(high, value))
+
+
+def _affinity_score(completed_pickups, rating_sum, rating_count, complaint_count):
+    # completed_at was added by this revision, so there is no handover time to score yet.
+    smoothed_rating = (rating_sum + RATING_PRIOR_MEAN * RATING_PRIOR_WEIGHT) / (rating_count + RATING_PRIOR_WEIGHT)
+    rating_term = _clamp((smoothed_rating - RATING_PRIOR_MEAN) / 1.5)
+    history_term = min(completed_pickups, 10) / 10.0
+    complaint_term = min(complaint_count, 5) / 5.0
+    return round(_clamp(0.4 * rating_term + 0.3 * history_term - 0.5 * complaint_term), 4)
+
+
+def _backfill(bind, inspector):
+    """Seed pairs from existing pickups, reviews and complaints, as `flask rebuild-affinity` would."""
+    pairs = defaultdict(lambda: {"completed_pickups": 0, "rating_sum": 0, "rating_count": 0, "complaint_count": 0})
+
+    if _table_exists(inspector, "allocations"):
+        allocations = sa.table("allocations", sa.column("id"), sa.column("provider_id"), sa.column("ngo_id"), sa.column("status"))
+        rows = bind.execute(
+            sa.select(allocations.c.provider_id, allocations.c.ngo_id, sa.func.count(allocations.c.id))
+            .where(sa.func.lower(allocations.c.status) == "completed")
+            .group_by(allocations.c.provider_id, allocations.c.ngo_id)
+        )
+        for provider_id, ngo_id, completed in rows:
+            pairs[(provider_id, ngo_id)]["completed_pickups"] = int(completed or 0)
+
+    if _table_exists(inspector, "reviews"):
+        reviews = sa.table("reviews", sa.column("id"), sa.column("provider_id"), sa.column("ngo_id"), sa.column("rating"))
+        rows = bind.execute(
+            sa.select(reviews.c.provider_id, reviews.c.ngo_id, sa.func.sum(reviews.c.rating), sa.func.count(reviews.c.id))
+            .group_by(reviews.c.provider_id, reviews.c.ngo_id)
+        )
+        for provider_id, ngo_id, rating_sum, rating_count in rows:
+            pairs[(provider_id, ngo_id)]["rating_sum"] = int(rating_sum or 0)
+            pairs[(provider_id, ngo_id)]["rating_count"] = int(rating_count or 0)
+
+    if _table_exists(inspector, "complaints"):
+        complaints = sa.table("complaints", sa.column("id"), sa.column("provider_id"), sa.column("ngo_id"), sa.column("status"))
+        rows = bind.execute(
+            sa.select(complaints.c.provider_id, complaints.c.ngo_id, sa.func.count(complaints.c.id))
+            .where(complaints.c.provider_id.isnot(None), complaints.c.status != "Rejected")
+            .group_by(complaints.c.provider_id, complaints.c.ngo_id)
+        )
+        for provider_id, ngo_id, complaint_count in rows:
+            pairs[(provider_id, ngo_id)]["complaint_count"] = int(complaint_count or 0)
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "provider_id": provider_id,
+            "ngo_id": ngo_id,
+            **pair,
+            "recent_handover_minutes": [],
+            "median_handover_minutes": None,
+            "score": _affinity_score(pair["completed_pickups"], pair["rating_sum"], pair["rating_count"], pair["complaint_count"]),
+            "updated_at": now,
+        }
+        for (provider_id, ngo_id), pair in pairs.items()
+        if provider_id is not None and ngo_id is not None
+    ]
+    if rows:
+        affinity = sa.table(
+            "provider_ngo_affinity",
+            sa.column("provider_id", sa.Integer()),
+            sa.column("ngo_id", sa.Integer()),
+            sa.column("completed_pickups", sa.Integer()),
+            sa.column("rating_sum", sa.Integer()),
+            sa.column("rating_count", sa.Integer()),
+            sa.column("complaint_count", sa.Integer()),
+            sa.column("recent_handover_minutes", sa.JSON()),
+            sa.column("median_handover_minutes", sa.Float()),
+            sa.column("score", sa.Float()),
+            sa.column("updated_at", sa.DateTime()),
+        )
+        op.bulk_insert(affinity, rows)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "allocations") and "completed_at" not in _column_names(inspector, "allocations"):
+        with op.batch_alter_table("allocations") as batch_op:
+            batch_op.add_column(sa.Column("completed_at", sa.DateTime(), nullable=True))
+
+    if not _table_exists(inspector, "provider_ngo_affinity"):
+        op.create_table(
+            "provider_ngo_affinity",
+            sa.Column("provider_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("ngo_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("completed_pickups", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("rating_sum", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("complaint_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("recent_handover_minutes", sa.JSON(), nullable=False),
+            sa.Column("median_handover_minutes", sa.Float(), nullable=True),
+            sa.Column("score", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_provider_ngo_affinity_ngo_id", "provider_ngo_affinity", ["ngo_id"])
+        _backfill(bind, inspector)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "provider_ngo_affinity"):
+        op.drop_index("ix_provider_ngo_affinity_ngo_id", table_name="provider_ngo_affinity")
+        op.drop_table("provider_ngo_affinity")
+
+    if _table_exists(inspector, "allocations") and "completed_at" in _column_names(inspector, "allocations"):
+        with op.batch_alter_table("allocations") as batch_op:
+            batch_op.drop_column("completed_at")
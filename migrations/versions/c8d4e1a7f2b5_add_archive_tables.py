@@ -0,0 +1,102 @@
+"""add archive tables for completed surplus and allocations
+
+Revision ID: c8d4e1a7f2b5
+Revises: b6e3a9f1d7c4
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c8d4e1a7f2b5"
+down_revision = "b6e3a9f1d7c4"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "archived_surplus"):
+        op.create_table(
+            "archived_surplus",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("provider_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("event_id", sa.Integer(), sa.ForeignKey("events.id"), nullable=True),
+            sa.Column("event_name", sa.String(length=150), nullable=False),
+            sa.Column("mahal_name", sa.String(length=160), nullable=True),
+            sa.Column("provider_name", sa.String(length=120), nullable=False),
+            sa.Column("food_type", sa.String(length=150), nullable=False),
+            sa.Column("quantity", sa.Float(), nullable=False),
+            sa.Column("quantity_kg", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("remaining_kg", sa.Float(), nullable=True),
+            sa.Column("estimated_expiry", sa.String(length=80), nullable=True),
+            sa.Column("distance_km", sa.Float(), nullable=True),
+            sa.Column("provider_location", sa.String(length=180), nullable=True),
+            sa.Column("provider_latitude", sa.Float(), nullable=True),
+            sa.Column("provider_longitude", sa.Float(), nullable=True),
+            sa.Column("photo_path", sa.String(length=255), nullable=True),
+            sa.Column("status", sa.String(length=30), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("archived_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_archived_surplus_provider_id", "archived_surplus", ["provider_id"])
+        op.create_index("ix_archived_surplus_event_id", "archived_surplus", ["event_id"])
+
+    if not _table_exists(inspector, "archived_allocations"):
+        op.create_table(
+            "archived_allocations",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("surplus_id", sa.Integer(), sa.ForeignKey("archived_surplus.id"), nullable=False),
+            sa.Column("provider_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("ngo_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("quantity_kg", sa.Float(), nullable=True),
+            sa.Column("status", sa.String(length=30), nullable=False),
+            sa.Column("pickup_time", sa.DateTime(), nullable=True),
+            sa.Column("otp_code", sa.String(length=6), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+            sa.Column("archived_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_archived_allocations_surplus_id", "archived_allocations", ["surplus_id"])
+        op.create_index("ix_archived_allocations_provider_id", "archived_allocations", ["provider_id"])
+        op.create_index("ix_archived_allocations_ngo_id", "archived_allocations", ["ngo_id"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # Put archived rows back first so a downgrade loses no history.
+    if _table_exists(inspector, "archived_allocations") and _table_exists(inspector, "archived_surplus"):
+        op.execute(
+            "INSERT INTO surplus (id, provider_id, event_id, event_name, mahal_name, provider_name, food_type, quantity, "
+            "quantity_kg, remaining_kg, estimated_expiry, distance_km, provider_location, provider_latitude, "
+            "provider_longitude, photo_path, status, created_at) "
+            "SELECT id, provider_id, event_id, event_name, mahal_name, provider_name, food_type, quantity, "
+            "quantity_kg, remaining_kg, estimated_expiry, distance_km, provider_location, provider_latitude, "
+            "provider_longitude, photo_path, status, created_at FROM archived_surplus"
+        )
+        op.execute(
+            "INSERT INTO allocations (id, surplus_id, provider_id, ngo_id, quantity_kg, status, pickup_time, otp_code, "
+            "created_at, completed_at) "
+            "SELECT id, surplus_id, provider_id, ngo_id, quantity_kg, status, pickup_time, otp_code, created_at, "
+            "completed_at FROM archived_allocations"
+        )
+
+    if _table_exists(inspector, "archived_allocations"):
+        op.drop_index("ix_archived_allocations_ngo_id", table_name="archived_allocations")
+        op.drop_index("ix_archived_allocations_provider_id", table_name="archived_allocations")
+        op.drop_index("ix_archived_allocations_surplus_id", table_name="archived_allocations")
+        op.drop_table("archived_allocations")
+
+    if _table_exists(inspector, "archived_surplus"):
+        op.drop_index("ix_archived_surplus_event_id", table_name="archived_surplus")
+        op.drop_index("ix_archived_surplus_provider_id", table_name="archived_surplus")
+        op.drop_table("archived_surplus")
@@ -0,0 +1,48 @@
+"""index status columns used by listings, claim counts and the complaint queue
+
+Revision ID: d2c7e9a5b3f8
+Revises: f6b2d8a4c1e7
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d2c7e9a5b3f8"
+down_revision = "f6b2d8a4c1e7"
+branch_labels = None
+depends_on = None
+
+
+STATUS_INDEXES = (
+    ("ix_surplus_status", "surplus", "status"),
+    ("ix_allocations_status", "allocations", "status"),
+    ("ix_complaints_status", "complaints", "status"),
+)
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _index_exists(inspector, table_name, index_name):
+    return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for index_name, table_name, column_name in STATUS_INDEXES:
+        if _table_exists(inspector, table_name) and not _index_exists(inspector, table_name, index_name):
+            op.create_index(index_name, table_name, [column_name])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for index_name, table_name, _ in STATUS_INDEXES:
+        if _table_exists(inspector, table_name) and _index_exists(inspector, table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
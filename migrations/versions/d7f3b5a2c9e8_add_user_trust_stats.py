@@ -0,0 +1,116 @@
+"""add user trust stats
+
+Revision ID: d7f3b5a2c9e8
+Revises: c5e1a9d3f7b2
+Create Date: 2026-10-19
+
+"""
+from collections import defaultdict
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d7f3b5a2c9e8"
+down_revision = "c5e1a9d3f7b2"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of trust_service.compute_trust_score as of this revision.
+PRIOR_MEAN_RATING = 3.5
+PRIOR_WEIGHT = 5
+COMPLAINT_PENALTY = 0.25
+MAX_COMPLAINT_PENALTY = 2.0
+
+COUNTER_FIELDS = (
+    "received_rating_sum",
+    "received_rating_count",
+    "given_rating_sum",
+    "given_rating_count",
+    "complaint_count",
+)
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _trust_score(received_rating_sum, received_rating_count, complaint_count):
+    smoothed = (received_rating_sum + PRIOR_MEAN_RATING * PRIOR_WEIGHT) / (received_rating_count + PRIOR_WEIGHT)
+    penalty = min(complaint_count * COMPLAINT_PENALTY, MAX_COMPLAINT_PENALTY)
+    return round(max(0.0, min(5.0, smoothed - penalty)), 2)
+
+
+def _backfill(bind, inspector):
+    """Seed the table from existing reviews and complaints, as `flask trust rebuild` would."""
+    counters = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+
+    if _table_exists(inspector, "reviews"):
+        reviews = sa.table("reviews", sa.column("id"), sa.column("provider_id"), sa.column("ngo_id"), sa.column("rating"))
+        for column, prefix in ((reviews.c.provider_id, "received"), (reviews.c.ngo_id, "given")):
+            rows = bind.execute(
+                sa.select(column, sa.func.sum(reviews.c.rating), sa.func.count(reviews.c.id)).group_by(column)
+            )
+            for user_id, rating_sum, rating_count in rows:
+                counters[user_id][f"{prefix}_rating_sum"] = int(rating_sum or 0)
+                counters[user_id][f"{prefix}_rating_count"] = int(rating_count or 0)
+
+    if _table_exists(inspector, "complaints"):
+        complaints = sa.table("complaints", sa.column("id"), sa.column("provider_id"), sa.column("status"))
+        rows = bind.execute(
+            sa.select(complaints.c.provider_id, sa.func.count(complaints.c.id))
+            .where(complaints.c.provider_id.isnot(None), complaints.c.status != "Rejected")
+            .group_by(complaints.c.provider_id)
+        )
+        for user_id, complaint_count in rows:
+            counters[user_id]["complaint_count"] = int(complaint_count or 0)
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": user_id,
+            **values,
+            "trust_score": _trust_score(values["received_rating_sum"], values["received_rating_count"], values["complaint_count"]),
+            "updated_at": now,
+        }
+        for user_id, values in counters.items()
+        if user_id is not None
+    ]
+    if rows:
+        stats = sa.table(
+            "user_trust_stats",
+            sa.column("user_id", sa.Integer()),
+            *(sa.column(field, sa.Integer()) for field in COUNTER_FIELDS),
+            sa.column("trust_score", sa.Float()),
+            sa.column("updated_at", sa.DateTime()),
+        )
+        op.bulk_insert(stats, rows)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "user_trust_stats"):
+        op.create_table(
+            "user_trust_stats",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("received_rating_sum", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("received_rating_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("given_rating_sum", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("given_rating_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("complaint_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("trust_score", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        _backfill(bind, inspector)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "user_trust_stats"):
+        op.drop_table("user_trust_stats")
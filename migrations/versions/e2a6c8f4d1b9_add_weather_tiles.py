@@ -0,0 +1,45 @@
+"""add weather tiles cache
+
+Revision ID: e2a6c8f4d1b9
+Revises: d7f3b5a2c9e8
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e2a6c8f4d1b9"
+down_revision = "d7f3b5a2c9e8"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "weather_tiles"):
+        op.create_table(
+            "weather_tiles",
+            sa.Column("tile_key", sa.String(length=32), primary_key=True),
+            sa.Column("latitude", sa.Float(), nullable=False),
+            sa.Column("longitude", sa.Float(), nullable=False),
+            sa.Column("temperature_c", sa.Float(), nullable=True),
+            sa.Column("humidity_pct", sa.Float(), nullable=True),
+            sa.Column("precipitation_mm", sa.Float(), nullable=True),
+            sa.Column("risk_factor", sa.Float(), nullable=False, server_default="1"),
+            sa.Column("fetched_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "weather_tiles"):
+        op.drop_table("weather_tiles")
@@ -0,0 +1,35 @@
+"""index allocations.surplus_id
+
+Revision ID: e5b7c3d9a1f4
+Revises: c8d4e1a7f2b5
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e5b7c3d9a1f4"
+down_revision = "c8d4e1a7f2b5"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(inspector, table_name, index_name):
+    return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _index_exists(inspector, "allocations", "ix_allocations_surplus_id"):
+        op.create_index("ix_allocations_surplus_id", "allocations", ["surplus_id"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _index_exists(inspector, "allocations", "ix_allocations_surplus_id"):
+        op.drop_index("ix_allocations_surplus_id", table_name="allocations")
@@ -0,0 +1,45 @@
+"""add ngo demand forecast
+
+Revision ID: f4c9e1b7a3d6
+Revises: e2a6c8f4d1b9
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f4c9e1b7a3d6"
+down_revision = "e2a6c8f4d1b9"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "ngo_demand_forecast"):
+        op.create_table(
+            "ngo_demand_forecast",
+            sa.Column("ngo_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("hour_of_week", sa.Integer(), primary_key=True),
+            sa.Column("request_rate", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("completion_rate", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("score", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_ngo_demand_forecast_hour_of_week", "ngo_demand_forecast", ["hour_of_week"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "ngo_demand_forecast"):
+        op.drop_index("ix_ngo_demand_forecast_hour_of_week", table_name="ngo_demand_forecast")
+        op.drop_table("ngo_demand_forecast")
@@ -0,0 +1,75 @@
+"""never reuse surplus and allocation ids on sqlite
+
+Revision ID: f6b2d8a4c1e7
+Revises: a3f7d2c9e6b1
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f6b2d8a4c1e7"
+down_revision = "a3f7d2c9e6b1"
+branch_labels = None
+depends_on = None
+
+
+# Hot table -> archive table whose rows keep their ids.
+HOT_TABLES = (
+    ("surplus", "archived_surplus"),
+    ("allocations", "archived_allocations"),
+)
+
+
+def _table_exists(inspector, table_name):
+    return table_name in inspector.get_table_names()
+
+
+def _max_id(bind, inspector, table_name):
+    if not _table_exists(inspector, table_name):
+        return 0
+    table = sa.table(table_name, sa.column("id", sa.Integer()))
+    return bind.execute(sa.select(sa.func.max(table.c.id))).scalar() or 0
+
+
+def _rebuild(table_name, autoincrement):
+    # SQLite only takes AUTOINCREMENT in CREATE TABLE, so the table is copied.
+    with op.batch_alter_table(
+        table_name,
+        recreate="always",
+        table_kwargs={"sqlite_autoincrement": autoincrement},
+    ):
+        pass
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        # PostgreSQL ids come from sequences, which never go backwards.
+        return
+
+    inspector = sa.inspect(bind)
+    for table_name, archive_name in HOT_TABLES:
+        if not _table_exists(inspector, table_name):
+            continue
+        _rebuild(table_name, True)
+        # Archived ids may be above every hot row, and rows already purged
+        # are lost; start the counter past everything still on record.
+        high_water = max(_max_id(bind, inspector, table_name), _max_id(bind, inspector, archive_name))
+        bind.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = :name"), {"name": table_name})
+        bind.execute(
+            sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+            {"name": table_name, "seq": high_water},
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    inspector = sa.inspect(bind)
+    for table_name, _ in HOT_TABLES:
+        if _table_exists(inspector, table_name):
+            _rebuild(table_name, False)